@@ -10,6 +10,7 @@ from datetime import datetime, timezone
 from uuid import uuid4
 from alembic import op
 import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
 
 
 # revision identifiers, used by Alembic.
@@ -18,6 +19,9 @@ down_revision: Union[str, Sequence[str], None] = '4ec8169a994c'
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
+# Ids: native UUID on PostgreSQL, String(36) elsewhere (models/base.py GUID)
+GUID = sa.String(length=36).with_variant(postgresql.UUID(as_uuid=False), 'postgresql')
+
 # Asset types reference data
 ASSET_TYPES = [
     {'code': 'CASH', 'label': 'Cash'},
@@ -58,11 +62,11 @@ def upgrade() -> None:
     # Bulk insert using op.bulk_insert
     asset_types_table = sa.table(
         'asset_types',
-        sa.column('id', sa.String),
+        sa.column('id', GUID),
         sa.column('code', sa.String),
         sa.column('label', sa.String),
-        sa.column('created_at', sa.DateTime),
-        sa.column('updated_at', sa.DateTime),
+        sa.column('created_at', sa.DateTime(timezone=True)),
+        sa.column('updated_at', sa.DateTime(timezone=True)),
     )
 
     op.bulk_insert(asset_types_table, data)
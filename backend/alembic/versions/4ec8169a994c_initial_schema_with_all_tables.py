@@ -9,6 +9,7 @@ from typing import Sequence, Union
 
 from alembic import op
 import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
 
 
 # revision identifiers, used by Alembic.
@@ -17,12 +18,15 @@ down_revision: Union[str, Sequence[str], None] = None
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
+# Ids: native UUID on PostgreSQL, String(36) elsewhere (models/base.py GUID)
+GUID = sa.String(length=36).with_variant(postgresql.UUID(as_uuid=False), 'postgresql')
+
 
 def upgrade() -> None:
     """Upgrade schema."""
     # ### commands auto generated by Alembic - please adjust! ###
     op.create_table('asset_types',
-    sa.Column('id', sa.String(length=36), nullable=False),
+    sa.Column('id', GUID, nullable=False),
     sa.Column('code', sa.String(length=50), nullable=False),
     sa.Column('label', sa.String(length=255), nullable=False),
     sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
@@ -31,15 +35,15 @@ def upgrade() -> None:
     )
     op.create_index(op.f('ix_asset_types_code'), 'asset_types', ['code'], unique=True)
     op.create_table('categories',
-    sa.Column('id', sa.String(length=36), nullable=False),
+    sa.Column('id', GUID, nullable=False),
     sa.Column('name', sa.String(length=255), nullable=False),
-    sa.Column('parent_id', sa.String(length=36), nullable=True),
+    sa.Column('parent_id', GUID, nullable=True),
     sa.ForeignKeyConstraint(['parent_id'], ['categories.id'], ),
     sa.PrimaryKeyConstraint('id')
     )
     op.create_index(op.f('ix_categories_name'), 'categories', ['name'], unique=True)
     op.create_table('portfolios',
-    sa.Column('id', sa.String(length=36), nullable=False),
+    sa.Column('id', GUID, nullable=False),
     sa.Column('name', sa.String(length=255), nullable=False),
     sa.Column('base_currency', sa.String(length=3), nullable=False),
     sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
@@ -47,15 +51,15 @@ def upgrade() -> None:
     sa.PrimaryKeyConstraint('id')
     )
     op.create_table('tags',
-    sa.Column('id', sa.String(length=36), nullable=False),
+    sa.Column('id', GUID, nullable=False),
     sa.Column('name', sa.String(length=100), nullable=False),
     sa.PrimaryKeyConstraint('id')
     )
     op.create_index(op.f('ix_tags_name'), 'tags', ['name'], unique=True)
     op.create_table('assets',
-    sa.Column('id', sa.String(length=36), nullable=False),
-    sa.Column('portfolio_id', sa.String(length=36), nullable=False),
-    sa.Column('asset_type_id', sa.String(length=36), nullable=False),
+    sa.Column('id', GUID, nullable=False),
+    sa.Column('portfolio_id', GUID, nullable=False),
+    sa.Column('asset_type_id', GUID, nullable=False),
     sa.Column('name', sa.String(length=255), nullable=False),
     sa.Column('quantity', sa.Numeric(precision=20, scale=8), nullable=True),
     sa.Column('disposed', sa.Boolean(), nullable=False),
@@ -71,8 +75,8 @@ def upgrade() -> None:
     op.create_index(op.f('ix_assets_disposed'), 'assets', ['disposed'], unique=False)
     op.create_index(op.f('ix_assets_portfolio_id'), 'assets', ['portfolio_id'], unique=False)
     op.create_table('portfolio_snapshots',
-    sa.Column('id', sa.String(length=36), nullable=False),
-    sa.Column('portfolio_id', sa.String(length=36), nullable=False),
+    sa.Column('id', GUID, nullable=False),
+    sa.Column('portfolio_id', GUID, nullable=False),
     sa.Column('value', sa.Numeric(precision=20, scale=2), nullable=False),
     sa.Column('observed_at', sa.DateTime(timezone=True), nullable=False),
     sa.ForeignKeyConstraint(['portfolio_id'], ['portfolios.id'], ),
@@ -81,15 +85,15 @@ def upgrade() -> None:
     op.create_index(op.f('ix_portfolio_snapshots_observed_at'), 'portfolio_snapshots', ['observed_at'], unique=False)
     op.create_index(op.f('ix_portfolio_snapshots_portfolio_id'), 'portfolio_snapshots', ['portfolio_id'], unique=False)
     op.create_table('asset_categories',
-    sa.Column('asset_id', sa.String(length=36), nullable=False),
-    sa.Column('category_id', sa.String(length=36), nullable=False),
+    sa.Column('asset_id', GUID, nullable=False),
+    sa.Column('category_id', GUID, nullable=False),
     sa.ForeignKeyConstraint(['asset_id'], ['assets.id'], ondelete='CASCADE'),
     sa.ForeignKeyConstraint(['category_id'], ['categories.id'], ondelete='CASCADE'),
     sa.PrimaryKeyConstraint('asset_id', 'category_id')
     )
     op.create_table('asset_snapshots',
-    sa.Column('id', sa.String(length=36), nullable=False),
-    sa.Column('asset_id', sa.String(length=36), nullable=False),
+    sa.Column('id', GUID, nullable=False),
+    sa.Column('asset_id', GUID, nullable=False),
     sa.Column('value', sa.Numeric(precision=20, scale=2), nullable=False),
     sa.Column('observed_at', sa.DateTime(timezone=True), nullable=False),
     sa.ForeignKeyConstraint(['asset_id'], ['assets.id'], ),
@@ -98,15 +102,15 @@ def upgrade() -> None:
     op.create_index(op.f('ix_asset_snapshots_asset_id'), 'asset_snapshots', ['asset_id'], unique=False)
     op.create_index(op.f('ix_asset_snapshots_observed_at'), 'asset_snapshots', ['observed_at'], unique=False)
     op.create_table('asset_tags',
-    sa.Column('asset_id', sa.String(length=36), nullable=False),
-    sa.Column('tag_id', sa.String(length=36), nullable=False),
+    sa.Column('asset_id', GUID, nullable=False),
+    sa.Column('tag_id', GUID, nullable=False),
     sa.ForeignKeyConstraint(['asset_id'], ['assets.id'], ondelete='CASCADE'),
     sa.ForeignKeyConstraint(['tag_id'], ['tags.id'], ondelete='CASCADE'),
     sa.PrimaryKeyConstraint('asset_id', 'tag_id')
     )
     op.create_table('transactions',
-    sa.Column('id', sa.String(length=36), nullable=False),
-    sa.Column('asset_id', sa.String(length=36), nullable=False),
+    sa.Column('id', GUID, nullable=False),
+    sa.Column('asset_id', GUID, nullable=False),
     sa.Column('type', sa.String(length=50), nullable=False),
     sa.Column('unit_price', sa.Numeric(precision=20, scale=8), nullable=False),
     sa.Column('quantity', sa.Numeric(precision=20, scale=8), nullable=False),
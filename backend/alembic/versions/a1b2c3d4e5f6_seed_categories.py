@@ -8,6 +8,7 @@ Create Date: 2026-01-26 10:00:00.000000
 from typing import Sequence, Union
 from alembic import op
 import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
 
 
 # revision identifiers, used by Alembic.
@@ -16,6 +17,9 @@ down_revision: Union[str, Sequence[str], None] = '4a3618ddf9e4'
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
+# Ids: native UUID on PostgreSQL, String(36) elsewhere (models/base.py GUID)
+GUID = sa.String(length=36).with_variant(postgresql.UUID(as_uuid=False), 'postgresql')
+
 # Fixed UUIDs for idempotent downgrade
 # Roots
 CAT_FINANCIAL_ASSETS   = '205ed564-dfe1-4ecb-befe-1c4275fd549d'
@@ -62,9 +66,9 @@ def upgrade() -> None:
 
     categories_table = sa.table(
         'categories',
-        sa.column('id', sa.String),
+        sa.column('id', GUID),
         sa.column('name', sa.String),
-        sa.column('parent_id', sa.String),
+        sa.column('parent_id', GUID),
     )
 
     # Insert roots first (no parent_id)
@@ -8,6 +8,7 @@ Create Date: 2026-01-26 10:01:00.000000
 from typing import Sequence, Union
 from alembic import op
 import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
 
 
 # revision identifiers, used by Alembic.
@@ -16,6 +17,9 @@ down_revision: Union[str, Sequence[str], None] = 'a1b2c3d4e5f6'
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
+# Ids: native UUID on PostgreSQL, String(36) elsewhere (models/base.py GUID)
+GUID = sa.String(length=36).with_variant(postgresql.UUID(as_uuid=False), 'postgresql')
+
 # Fixed UUIDs for idempotent downgrade
 TAG_LIQUID             = '11668c10-673a-41d0-835a-36c1dc9a810e'
 TAG_LONG_TERM          = '7e7bfc70-6b27-4a63-a4d4-8c891d6c7f64'
@@ -48,7 +52,7 @@ def upgrade() -> None:
 
     tags_table = sa.table(
         'tags',
-        sa.column('id', sa.String),
+        sa.column('id', GUID),
         sa.column('name', sa.String),
     )
 
@@ -10,6 +10,7 @@ from datetime import datetime, timezone
 from decimal import Decimal
 from alembic import op
 import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
 
 
 # revision identifiers, used by Alembic.
@@ -18,6 +19,9 @@ down_revision: Union[str, Sequence[str], None] = 'b2c3d4e5f6a7'
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
+# Ids: native UUID on PostgreSQL, String(36) elsewhere (models/base.py GUID)
+GUID = sa.String(length=36).with_variant(postgresql.UUID(as_uuid=False), 'postgresql')
+
 # ---------------------------------------------------------------------------
 # Fixed UUIDs (all module-level so downgrade() can delete by known IDs)
 # ---------------------------------------------------------------------------
@@ -82,11 +86,11 @@ def upgrade() -> None:
     # ------------------------------------------------------------------
     portfolios_table = sa.table(
         'portfolios',
-        sa.column('id', sa.String),
+        sa.column('id', GUID),
         sa.column('name', sa.String),
         sa.column('base_currency', sa.String),
-        sa.column('created_at', sa.DateTime),
-        sa.column('updated_at', sa.DateTime),
+        sa.column('created_at', sa.DateTime(timezone=True)),
+        sa.column('updated_at', sa.DateTime(timezone=True)),
     )
     op.bulk_insert(portfolios_table, [
         {
@@ -103,16 +107,16 @@ def upgrade() -> None:
     # ------------------------------------------------------------------
     assets_table = sa.table(
         'assets',
-        sa.column('id', sa.String),
-        sa.column('portfolio_id', sa.String),
-        sa.column('asset_type_id', sa.String),
+        sa.column('id', GUID),
+        sa.column('portfolio_id', GUID),
+        sa.column('asset_type_id', GUID),
         sa.column('name', sa.String),
         sa.column('quantity', sa.Numeric),
         sa.column('disposed', sa.Boolean),
         sa.column('created_by', sa.String),
         sa.column('updated_by', sa.String),
-        sa.column('created_at', sa.DateTime),
-        sa.column('updated_at', sa.DateTime),
+        sa.column('created_at', sa.DateTime(timezone=True)),
+        sa.column('updated_at', sa.DateTime(timezone=True)),
     )
 
     def _asset(asset_id, type_code, name, quantity=None):
@@ -145,8 +149,8 @@ def upgrade() -> None:
     # ------------------------------------------------------------------
     asset_categories_table = sa.table(
         'asset_categories',
-        sa.column('asset_id', sa.String),
-        sa.column('category_id', sa.String),
+        sa.column('asset_id', GUID),
+        sa.column('category_id', GUID),
     )
     op.bulk_insert(asset_categories_table, [
         {'asset_id': ASSET_CHECKING,  'category_id': CAT_FINANCIAL_ASSETS},
@@ -172,8 +176,8 @@ def upgrade() -> None:
     # ------------------------------------------------------------------
     asset_tags_table = sa.table(
         'asset_tags',
-        sa.column('asset_id', sa.String),
-        sa.column('tag_id', sa.String),
+        sa.column('asset_id', GUID),
+        sa.column('tag_id', GUID),
     )
     op.bulk_insert(asset_tags_table, [
         {'asset_id': ASSET_CHECKING,  'tag_id': TAG_LIQUID},
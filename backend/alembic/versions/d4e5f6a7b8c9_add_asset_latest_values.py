@@ -0,0 +1,58 @@
+"""Add asset_latest_values table and backfill it from asset_snapshots
+
+Revision ID: d4e5f6a7b8c9
+Revises: c3d4e5f6a7b8
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4e5f6a7b8c9'
+down_revision: Union[str, Sequence[str], None] = 'c3d4e5f6a7b8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Ids: native UUID on PostgreSQL, String(36) elsewhere (models/base.py GUID)
+GUID = sa.String(length=36).with_variant(postgresql.UUID(as_uuid=False), 'postgresql')
+
+
+def upgrade() -> None:
+    """
+    Create the denormalized latest-value table (one row per asset) and fill
+    it with each asset's newest snapshot. Ties on observed_at are broken by
+    snapshot id, as in the repository's refresh logic.
+    """
+    op.create_table('asset_latest_values',
+    sa.Column('asset_id', GUID, nullable=False),
+    sa.Column('snapshot_id', GUID, nullable=False),
+    sa.Column('value', sa.Numeric(precision=20, scale=2), nullable=False),
+    sa.Column('observed_at', sa.DateTime(timezone=True), nullable=False),
+    sa.ForeignKeyConstraint(['asset_id'], ['assets.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('asset_id')
+    )
+
+    op.execute(
+        """
+        INSERT INTO asset_latest_values (asset_id, snapshot_id, value, observed_at)
+        SELECT asset_id, id, value, observed_at
+        FROM (
+            SELECT asset_id, id, value, observed_at,
+                   ROW_NUMBER() OVER (
+                       PARTITION BY asset_id ORDER BY observed_at DESC, id DESC
+                   ) AS rank
+            FROM asset_snapshots
+        ) ranked
+        WHERE rank = 1
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop the denormalized latest-value table."""
+    op.drop_table('asset_latest_values')
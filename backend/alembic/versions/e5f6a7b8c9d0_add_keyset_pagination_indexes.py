@@ -0,0 +1,43 @@
+"""Add composite indexes backing keyset pagination of listings
+
+Revision ID: e5f6a7b8c9d0
+Revises: d4e5f6a7b8c9
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5f6a7b8c9d0'
+down_revision: Union[str, Sequence[str], None] = 'd4e5f6a7b8c9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Index each listing's sort key so a page is an index range scan that
+    stops after `limit` rows: assets by (name, id), globally and within a
+    portfolio; snapshots by (observed_at, id) within their owner.
+    """
+    op.create_index('ix_assets_name_id', 'assets', ['name', 'id'])
+    op.create_index('ix_assets_portfolio_id_name_id', 'assets', ['portfolio_id', 'name', 'id'])
+    op.create_index(
+        'ix_asset_snapshots_asset_id_observed_at_id', 'asset_snapshots', ['asset_id', 'observed_at', 'id']
+    )
+    op.create_index(
+        'ix_portfolio_snapshots_portfolio_id_observed_at_id',
+        'portfolio_snapshots',
+        ['portfolio_id', 'observed_at', 'id'],
+    )
+
+
+def downgrade() -> None:
+    """Drop the keyset pagination indexes."""
+    op.drop_index('ix_portfolio_snapshots_portfolio_id_observed_at_id', table_name='portfolio_snapshots')
+    op.drop_index('ix_asset_snapshots_asset_id_observed_at_id', table_name='asset_snapshots')
+    op.drop_index('ix_assets_portfolio_id_name_id', table_name='assets')
+    op.drop_index('ix_assets_name_id', table_name='assets')
@@ -0,0 +1,87 @@
+"""Replace single-column indexes with covering composite indexes
+
+Revision ID: f6a7b8c9d0e1
+Revises: e5f6a7b8c9d0
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f6a7b8c9d0e1'
+down_revision: Union[str, Sequence[str], None] = 'e5f6a7b8c9d0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Serve every repository query from one index range scan. The snapshot
+    histories get (owner, observed_at, id, value) indexes, so reads never
+    visit the table and are walked in either direction (newest first for
+    latest values). The single-column indexes they make redundant are
+    dropped, and lookups of labels by tag, by category and of category
+    children get their own indexes.
+    """
+    op.drop_index('ix_asset_snapshots_asset_id_observed_at_id', table_name='asset_snapshots')
+    op.drop_index('ix_asset_snapshots_observed_at', table_name='asset_snapshots')
+    op.drop_index('ix_asset_snapshots_asset_id', table_name='asset_snapshots')
+    op.create_index(
+        'ix_asset_snapshots_asset_id_observed_at_id_value',
+        'asset_snapshots',
+        ['asset_id', 'observed_at', 'id', 'value'],
+    )
+
+    op.drop_index('ix_portfolio_snapshots_portfolio_id_observed_at_id', table_name='portfolio_snapshots')
+    op.drop_index('ix_portfolio_snapshots_observed_at', table_name='portfolio_snapshots')
+    op.drop_index('ix_portfolio_snapshots_portfolio_id', table_name='portfolio_snapshots')
+    op.create_index(
+        'ix_portfolio_snapshots_portfolio_id_observed_at_id_value',
+        'portfolio_snapshots',
+        ['portfolio_id', 'observed_at', 'id', 'value'],
+    )
+
+    op.drop_index('ix_transactions_asset_id', table_name='transactions')
+    op.create_index(
+        'ix_transactions_asset_id_occurred_at_id', 'transactions', ['asset_id', 'occurred_at', 'id']
+    )
+
+    # Covered by ix_assets_portfolio_id_name_id
+    op.drop_index('ix_assets_portfolio_id', table_name='assets')
+
+    op.create_index('ix_asset_tags_tag_id_asset_id', 'asset_tags', ['tag_id', 'asset_id'])
+    op.create_index('ix_asset_categories_category_id_asset_id', 'asset_categories', ['category_id', 'asset_id'])
+    op.create_index(op.f('ix_categories_parent_id'), 'categories', ['parent_id'], unique=False)
+    op.create_index(op.f('ix_portfolios_name'), 'portfolios', ['name'], unique=False)
+
+
+def downgrade() -> None:
+    """Restore the single-column and keyset pagination indexes."""
+    op.drop_index(op.f('ix_portfolios_name'), table_name='portfolios')
+    op.drop_index(op.f('ix_categories_parent_id'), table_name='categories')
+    op.drop_index('ix_asset_categories_category_id_asset_id', table_name='asset_categories')
+    op.drop_index('ix_asset_tags_tag_id_asset_id', table_name='asset_tags')
+
+    op.create_index(op.f('ix_assets_portfolio_id'), 'assets', ['portfolio_id'], unique=False)
+
+    op.drop_index('ix_transactions_asset_id_occurred_at_id', table_name='transactions')
+    op.create_index(op.f('ix_transactions_asset_id'), 'transactions', ['asset_id'], unique=False)
+
+    op.drop_index('ix_portfolio_snapshots_portfolio_id_observed_at_id_value', table_name='portfolio_snapshots')
+    op.create_index(op.f('ix_portfolio_snapshots_portfolio_id'), 'portfolio_snapshots', ['portfolio_id'], unique=False)
+    op.create_index(op.f('ix_portfolio_snapshots_observed_at'), 'portfolio_snapshots', ['observed_at'], unique=False)
+    op.create_index(
+        'ix_portfolio_snapshots_portfolio_id_observed_at_id',
+        'portfolio_snapshots',
+        ['portfolio_id', 'observed_at', 'id'],
+    )
+
+    op.drop_index('ix_asset_snapshots_asset_id_observed_at_id_value', table_name='asset_snapshots')
+    op.create_index(op.f('ix_asset_snapshots_asset_id'), 'asset_snapshots', ['asset_id'], unique=False)
+    op.create_index(op.f('ix_asset_snapshots_observed_at'), 'asset_snapshots', ['observed_at'], unique=False)
+    op.create_index(
+        'ix_asset_snapshots_asset_id_observed_at_id', 'asset_snapshots', ['asset_id', 'observed_at', 'id']
+    )
@@ -2,10 +2,14 @@
 from fastapi import Depends
 from sqlalchemy.orm import Session
 
+from app.application.use_cases.asset_snapshot.bulk_create_asset_snapshots import BulkCreateAssetSnapshotsUseCase
 from app.application.use_cases.asset_snapshot.create_asset_snapshot import CreateAssetSnapshotUseCase
+from app.application.use_cases.asset_snapshot.export_asset_snapshots import ExportAssetSnapshotsUseCase
 from app.application.use_cases.asset_snapshot.get_asset_snapshots import GetAssetSnapshotsUseCase
-from app.domain.ports.repository import IAssetRepository, IAssetSnapshotRepository
-from app.adapters.incoming.api.dependencies.assets import get_db_session, get_asset_repository
+from app.application.use_cases.asset_snapshot.get_asset_snapshot_series import GetAssetSnapshotSeriesUseCase
+from app.domain.ports.repository import IAssetRepository, IAssetSnapshotRepository, IUnitOfWork
+from app.adapters.incoming.api.metrics import counted
+from app.adapters.incoming.api.dependencies.assets import get_db_session, get_asset_repository, get_unit_of_work
 from app.adapters.outgoing.persistence.repository.sqlalchemy_asset_snapshot_repository import SQLAlchemyAssetSnapshotRepository
 
 
@@ -13,13 +17,16 @@ def get_asset_snapshot_repository(db: Session = Depends(get_db_session)) -> IAss
     return SQLAlchemyAssetSnapshotRepository(db)
 
 
+@counted
 def create_asset_snapshot_use_case(
     snapshot_repo: IAssetSnapshotRepository = Depends(get_asset_snapshot_repository),
     asset_repo: IAssetRepository = Depends(get_asset_repository),
+    uow: IUnitOfWork = Depends(get_unit_of_work),
 ) -> CreateAssetSnapshotUseCase:
-    return CreateAssetSnapshotUseCase(snapshot_repo, asset_repo)
+    return CreateAssetSnapshotUseCase(snapshot_repo, asset_repo, uow)
 
 
+@counted
 def get_asset_snapshots_use_case(
     snapshot_repo: IAssetSnapshotRepository = Depends(get_asset_snapshot_repository),
     asset_repo: IAssetRepository = Depends(get_asset_repository),
@@ -27,8 +34,36 @@ def get_asset_snapshots_use_case(
     return GetAssetSnapshotsUseCase(snapshot_repo, asset_repo)
 
 
+@counted
+def get_asset_snapshot_series_use_case(
+    snapshot_repo: IAssetSnapshotRepository = Depends(get_asset_snapshot_repository),
+    asset_repo: IAssetRepository = Depends(get_asset_repository),
+) -> GetAssetSnapshotSeriesUseCase:
+    return GetAssetSnapshotSeriesUseCase(snapshot_repo, asset_repo)
+
+
+@counted
+def bulk_create_asset_snapshots_use_case(
+    snapshot_repo: IAssetSnapshotRepository = Depends(get_asset_snapshot_repository),
+    asset_repo: IAssetRepository = Depends(get_asset_repository),
+    uow: IUnitOfWork = Depends(get_unit_of_work),
+) -> BulkCreateAssetSnapshotsUseCase:
+    return BulkCreateAssetSnapshotsUseCase(snapshot_repo, asset_repo, uow)
+
+
+@counted
+def export_asset_snapshots_use_case(
+    snapshot_repo: IAssetSnapshotRepository = Depends(get_asset_snapshot_repository),
+    asset_repo: IAssetRepository = Depends(get_asset_repository),
+) -> ExportAssetSnapshotsUseCase:
+    return ExportAssetSnapshotsUseCase(snapshot_repo, asset_repo)
+
+
 __all__ = [
     'get_asset_snapshot_repository',
     'create_asset_snapshot_use_case',
     'get_asset_snapshots_use_case',
+    'get_asset_snapshot_series_use_case',
+    'bulk_create_asset_snapshots_use_case',
+    'export_asset_snapshots_use_case',
 ]
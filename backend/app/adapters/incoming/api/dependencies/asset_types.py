@@ -4,15 +4,18 @@ from fastapi import Depends
 from app.application.use_cases.asset_type.get_all_asset_types import GetAllAssetTypesUseCase
 from app.application.use_cases.asset_type.get_asset_type import GetAssetTypeUseCase
 from app.domain.ports.repository import IAssetTypeRepository
+from app.adapters.incoming.api.metrics import counted
 from app.adapters.incoming.api.dependencies.assets import get_db_session, get_asset_type_repository
 
 
+@counted
 def get_all_asset_types_use_case(
     repo: IAssetTypeRepository = Depends(get_asset_type_repository),
 ) -> GetAllAssetTypesUseCase:
     return GetAllAssetTypesUseCase(repo)
 
 
+@counted
 def get_asset_type_use_case(
     repo: IAssetTypeRepository = Depends(get_asset_type_repository),
 ) -> GetAssetTypeUseCase:
@@ -4,7 +4,7 @@ Single-responsibility: this module only exposes asset-related DI providers.
 """
 from typing import Generator
 
-from fastapi import Depends
+from fastapi import Depends, Request
 from sqlalchemy.orm import Session
 
 from app.application.use_cases.asset.create_asset import CreateAssetUseCase
@@ -14,27 +14,47 @@ from app.application.use_cases.asset.update_asset import UpdateAssetUseCase
 from app.application.use_cases.asset.delete_asset import DeleteAssetUseCase
 from app.application.use_cases.asset.dispose_asset import DisposeAssetUseCase
 from app.application.use_cases.asset.get_assets_by_portfolio import GetAssetsByPortfolioUseCase
-from app.domain.ports.repository import IAssetRepository, IAssetTypeRepository, IPortfolioRepository
-from app.adapters.outgoing.persistence.database import SessionLocal
+from app.domain.ports.repository import (
+    IAssetRepository,
+    IAssetTypeRepository,
+    IPortfolioRepository,
+    ITagRepository,
+    IUnitOfWork,
+)
+from app.adapters.incoming.api.metrics import counted
+from app.adapters.outgoing.persistence.database import READ_ONLY_METHODS, open_session
 from app.adapters.outgoing.persistence.repository.sqlalchemy_asset_repository import SQLAlchemyAssetRepository
 from app.adapters.outgoing.persistence.repository.sqlalchemy_asset_type_repository import SQLAlchemyAssetTypeRepository
 from app.adapters.outgoing.persistence.repository.sqlalchemy_portfolio_repository import SQLAlchemyPortfolioRepository
+from app.adapters.outgoing.persistence.repository.sqlalchemy_tag_repository import SQLAlchemyTagRepository
+from app.adapters.outgoing.persistence.repository.sqlalchemy_unit_of_work import SQLAlchemyUnitOfWork
 
 
-# Dependency to get a DB session
-def get_db_session() -> Generator[Session, None, None]:
-    db = SessionLocal()
+# Dependency to get a DB session: reads go to the replica until the request
+# writes, write requests use the primary throughout
+def get_db_session(request: Request) -> Generator[Session, None, None]:
+    db = open_session(read_only=request.method in READ_ONLY_METHODS)
     try:
         yield db
     finally:
         db.close()
 
 
+def get_unit_of_work(db: Session = Depends(get_db_session)) -> IUnitOfWork:
+    """Unit of work committing the request's DB session, once per use case."""
+    return SQLAlchemyUnitOfWork(db)
+
+
 def _get_portfolio_repository(db: Session = Depends(get_db_session)) -> IPortfolioRepository:
     """Portfolio repository using the assets module's DB session."""
     return SQLAlchemyPortfolioRepository(db)
 
 
+def _get_tag_repository(db: Session = Depends(get_db_session)) -> ITagRepository:
+    """Tag repository using the assets module's DB session."""
+    return SQLAlchemyTagRepository(db)
+
+
 # Repository providers for assets
 def get_asset_repository(db: Session = Depends(get_db_session)) -> IAssetRepository:
     return SQLAlchemyAssetRepository(db)
@@ -45,44 +65,56 @@ def get_asset_type_repository(db: Session = Depends(get_db_session)) -> IAssetTy
 
 
 # Asset use case providers
+@counted
 def get_all_assets_use_case(
     asset_repository: IAssetRepository = Depends(get_asset_repository),
 ) -> GetAllAssetsUseCase:
     return GetAllAssetsUseCase(asset_repository)
 
 
+@counted
 def get_asset_use_case(
     asset_repository: IAssetRepository = Depends(get_asset_repository),
 ) -> GetAssetUseCase:
     return GetAssetUseCase(asset_repository)
 
 
+@counted
 def create_asset_use_case(
     asset_repo: IAssetRepository = Depends(get_asset_repository),
     asset_type_repo: IAssetTypeRepository = Depends(get_asset_type_repository),
     portfolio_repo: IPortfolioRepository = Depends(_get_portfolio_repository),
+    tag_repo: ITagRepository = Depends(_get_tag_repository),
+    uow: IUnitOfWork = Depends(get_unit_of_work),
 ) -> CreateAssetUseCase:
-    return CreateAssetUseCase(asset_repo, portfolio_repo, asset_type_repo)
+    return CreateAssetUseCase(asset_repo, portfolio_repo, asset_type_repo, tag_repo, uow)
 
 
+@counted
 def update_asset_use_case(
     asset_repository: IAssetRepository = Depends(get_asset_repository),
+    uow: IUnitOfWork = Depends(get_unit_of_work),
 ) -> UpdateAssetUseCase:
-    return UpdateAssetUseCase(asset_repository)
+    return UpdateAssetUseCase(asset_repository, uow)
 
 
+@counted
 def delete_asset_use_case(
     asset_repository: IAssetRepository = Depends(get_asset_repository),
+    uow: IUnitOfWork = Depends(get_unit_of_work),
 ) -> DeleteAssetUseCase:
-    return DeleteAssetUseCase(asset_repository)
+    return DeleteAssetUseCase(asset_repository, uow)
 
 
+@counted
 def dispose_asset_use_case(
     asset_repository: IAssetRepository = Depends(get_asset_repository),
+    uow: IUnitOfWork = Depends(get_unit_of_work),
 ) -> DisposeAssetUseCase:
-    return DisposeAssetUseCase(asset_repository)
+    return DisposeAssetUseCase(asset_repository, uow)
 
 
+@counted
 def get_assets_by_portfolio_use_case(
     asset_repo: IAssetRepository = Depends(get_asset_repository),
     portfolio_repo: IPortfolioRepository = Depends(_get_portfolio_repository),
@@ -92,6 +124,7 @@ def get_assets_by_portfolio_use_case(
 
 __all__ = [
     'get_db_session',
+    'get_unit_of_work',
     'get_asset_repository',
     'get_asset_type_repository',
     'get_all_assets_use_case',
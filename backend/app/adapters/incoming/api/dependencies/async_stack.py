@@ -0,0 +1,104 @@
+"""
+Async stack dependency providers (API_STACK=async): AsyncSession, async
+repositories and the async use cases served by routes/async_asset_routes.py
+and routes/async_portfolio_routes.py.
+
+Every provider is `async def`, so FastAPI runs it on the event loop rather
+than handing it to the thread pool.
+"""
+from typing import AsyncIterator
+
+from fastapi import Depends, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.application.use_cases.asset.get_asset import AsyncGetAssetUseCase
+from app.application.use_cases.asset_snapshot.create_asset_snapshot import AsyncCreateAssetSnapshotUseCase
+from app.application.use_cases.asset_snapshot.get_asset_snapshots import AsyncGetAssetSnapshotsUseCase
+from app.application.use_cases.portfolio.get_all_portfolios import AsyncGetAllPortfoliosUseCase
+from app.domain.ports.repository import (
+    IAsyncAssetRepository,
+    IAsyncAssetSnapshotRepository,
+    IAsyncPortfolioRepository,
+    IAsyncUnitOfWork,
+)
+from app.adapters.incoming.api.metrics import counted
+from app.adapters.outgoing.persistence.async_database import open_async_session
+from app.adapters.outgoing.persistence.database import READ_ONLY_METHODS
+from app.adapters.outgoing.persistence.repository.async_sqlalchemy_asset_repository import AsyncSQLAlchemyAssetRepository
+from app.adapters.outgoing.persistence.repository.async_sqlalchemy_asset_snapshot_repository import (
+    AsyncSQLAlchemyAssetSnapshotRepository,
+)
+from app.adapters.outgoing.persistence.repository.async_sqlalchemy_portfolio_repository import (
+    AsyncSQLAlchemyPortfolioRepository,
+)
+from app.adapters.outgoing.persistence.repository.async_sqlalchemy_unit_of_work import AsyncSQLAlchemyUnitOfWork
+
+
+# Request-scoped AsyncSession, routed between the replica and the primary like get_db_session
+async def get_async_session(request: Request) -> AsyncIterator[AsyncSession]:
+    async with open_async_session(read_only=request.method in READ_ONLY_METHODS) as session:
+        yield session
+
+
+async def get_async_unit_of_work(session: AsyncSession = Depends(get_async_session)) -> IAsyncUnitOfWork:
+    return AsyncSQLAlchemyUnitOfWork(session)
+
+
+async def get_async_asset_repository(session: AsyncSession = Depends(get_async_session)) -> IAsyncAssetRepository:
+    return AsyncSQLAlchemyAssetRepository(session)
+
+
+async def get_async_asset_snapshot_repository(
+    session: AsyncSession = Depends(get_async_session),
+) -> IAsyncAssetSnapshotRepository:
+    return AsyncSQLAlchemyAssetSnapshotRepository(session)
+
+
+async def get_async_portfolio_repository(
+    session: AsyncSession = Depends(get_async_session),
+) -> IAsyncPortfolioRepository:
+    return AsyncSQLAlchemyPortfolioRepository(session)
+
+
+@counted
+async def get_async_asset_use_case(
+    asset_repository: IAsyncAssetRepository = Depends(get_async_asset_repository),
+) -> AsyncGetAssetUseCase:
+    return AsyncGetAssetUseCase(asset_repository)
+
+
+@counted
+async def get_async_asset_snapshots_use_case(
+    snapshot_repo: IAsyncAssetSnapshotRepository = Depends(get_async_asset_snapshot_repository),
+    asset_repo: IAsyncAssetRepository = Depends(get_async_asset_repository),
+) -> AsyncGetAssetSnapshotsUseCase:
+    return AsyncGetAssetSnapshotsUseCase(snapshot_repo, asset_repo)
+
+
+@counted
+async def create_async_asset_snapshot_use_case(
+    snapshot_repo: IAsyncAssetSnapshotRepository = Depends(get_async_asset_snapshot_repository),
+    asset_repo: IAsyncAssetRepository = Depends(get_async_asset_repository),
+    uow: IAsyncUnitOfWork = Depends(get_async_unit_of_work),
+) -> AsyncCreateAssetSnapshotUseCase:
+    return AsyncCreateAssetSnapshotUseCase(snapshot_repo, asset_repo, uow)
+
+
+@counted
+async def get_all_async_portfolios_use_case(
+    portfolio_repository: IAsyncPortfolioRepository = Depends(get_async_portfolio_repository),
+) -> AsyncGetAllPortfoliosUseCase:
+    return AsyncGetAllPortfoliosUseCase(portfolio_repository)
+
+
+__all__ = [
+    'get_async_session',
+    'get_async_unit_of_work',
+    'get_async_asset_repository',
+    'get_async_asset_snapshot_repository',
+    'get_async_portfolio_repository',
+    'get_async_asset_use_case',
+    'get_async_asset_snapshots_use_case',
+    'create_async_asset_snapshot_use_case',
+    'get_all_async_portfolios_use_case',
+]
@@ -8,8 +8,9 @@ from app.application.use_cases.category.get_category import GetCategoryUseCase
 from app.application.use_cases.category.delete_category import DeleteCategoryUseCase
 from app.application.use_cases.category.add_asset_to_category import AddAssetToCategoryUseCase
 from app.application.use_cases.category.remove_asset_from_category import RemoveAssetFromCategoryUseCase
-from app.domain.ports.repository import IAssetRepository, ICategoryRepository
-from app.adapters.incoming.api.dependencies.assets import get_db_session, get_asset_repository
+from app.domain.ports.repository import IAssetRepository, ICategoryRepository, IUnitOfWork
+from app.adapters.incoming.api.metrics import counted
+from app.adapters.incoming.api.dependencies.assets import get_db_session, get_asset_repository, get_unit_of_work
 from app.adapters.outgoing.persistence.repository.sqlalchemy_category_repository import SQLAlchemyCategoryRepository
 
 
@@ -17,42 +18,52 @@ def get_category_repository(db: Session = Depends(get_db_session)) -> ICategoryR
     return SQLAlchemyCategoryRepository(db)
 
 
+@counted
 def create_category_use_case(
     repo: ICategoryRepository = Depends(get_category_repository),
+    uow: IUnitOfWork = Depends(get_unit_of_work),
 ) -> CreateCategoryUseCase:
-    return CreateCategoryUseCase(repo)
+    return CreateCategoryUseCase(repo, uow)
 
 
+@counted
 def get_all_categories_use_case(
     repo: ICategoryRepository = Depends(get_category_repository),
 ) -> GetAllCategoriesUseCase:
     return GetAllCategoriesUseCase(repo)
 
 
+@counted
 def get_category_use_case(
     repo: ICategoryRepository = Depends(get_category_repository),
 ) -> GetCategoryUseCase:
     return GetCategoryUseCase(repo)
 
 
+@counted
 def delete_category_use_case(
     repo: ICategoryRepository = Depends(get_category_repository),
+    uow: IUnitOfWork = Depends(get_unit_of_work),
 ) -> DeleteCategoryUseCase:
-    return DeleteCategoryUseCase(repo)
+    return DeleteCategoryUseCase(repo, uow)
 
 
+@counted
 def add_asset_to_category_use_case(
     asset_repo: IAssetRepository = Depends(get_asset_repository),
     category_repo: ICategoryRepository = Depends(get_category_repository),
+    uow: IUnitOfWork = Depends(get_unit_of_work),
 ) -> AddAssetToCategoryUseCase:
-    return AddAssetToCategoryUseCase(asset_repo, category_repo)
+    return AddAssetToCategoryUseCase(asset_repo, category_repo, uow)
 
 
+@counted
 def remove_asset_from_category_use_case(
     asset_repo: IAssetRepository = Depends(get_asset_repository),
     category_repo: ICategoryRepository = Depends(get_category_repository),
+    uow: IUnitOfWork = Depends(get_unit_of_work),
 ) -> RemoveAssetFromCategoryUseCase:
-    return RemoveAssetFromCategoryUseCase(asset_repo, category_repo)
+    return RemoveAssetFromCategoryUseCase(asset_repo, category_repo, uow)
 
 
 __all__ = [
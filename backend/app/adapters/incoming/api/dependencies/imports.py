@@ -0,0 +1,24 @@
+"""History import dependency providers."""
+from fastapi import Depends
+
+from app.application.use_cases.history.import_history import ImportHistoryUseCase
+from app.domain.ports.repository import IAssetRepository, IAssetSnapshotRepository, ITransactionRepository, IUnitOfWork
+from app.adapters.incoming.api.metrics import counted
+from app.adapters.incoming.api.dependencies.assets import get_asset_repository, get_unit_of_work
+from app.adapters.incoming.api.dependencies.asset_snapshots import get_asset_snapshot_repository
+from app.adapters.incoming.api.dependencies.transactions import get_transaction_repository
+
+
+@counted
+def import_history_use_case(
+    snapshot_repo: IAssetSnapshotRepository = Depends(get_asset_snapshot_repository),
+    transaction_repo: ITransactionRepository = Depends(get_transaction_repository),
+    asset_repo: IAssetRepository = Depends(get_asset_repository),
+    uow: IUnitOfWork = Depends(get_unit_of_work),
+) -> ImportHistoryUseCase:
+    return ImportHistoryUseCase(snapshot_repo, transaction_repo, asset_repo, uow)
+
+
+__all__ = [
+    'import_history_use_case',
+]
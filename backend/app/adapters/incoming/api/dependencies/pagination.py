@@ -0,0 +1,30 @@
+"""Pagination query parameters shared by the listing endpoints."""
+from typing import Optional
+
+from fastapi import Query
+from pydantic import BaseModel
+
+from app.application.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+
+# Response header carrying the cursor of the following page, absent on the last page
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+class PageParams(BaseModel):
+    limit: int
+    cursor: Optional[str] = None
+
+
+# async, so it is resolved on the event loop rather than the thread pool, whatever stack serves the route
+async def page_params(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Maximum number of items to return"),
+    cursor: Optional[str] = Query(None, description=f"Value of the {NEXT_CURSOR_HEADER} header of the previous page"),
+) -> PageParams:
+    return PageParams(limit=limit, cursor=cursor)
+
+
+__all__ = [
+    'NEXT_CURSOR_HEADER',
+    'PageParams',
+    'page_params',
+]
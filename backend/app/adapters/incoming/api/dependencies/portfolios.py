@@ -4,7 +4,7 @@ Single-responsibility: this module only exposes portfolio-related DI providers.
 """
 from typing import Generator
 
-from fastapi import Depends
+from fastapi import Depends, Request
 from sqlalchemy.orm import Session
 
 from app.application.use_cases.portfolio.create_portfolio import CreatePortfolioUseCase
@@ -13,77 +13,144 @@ from app.application.use_cases.portfolio.delete_portfolio import DeletePortfolio
 from app.application.use_cases.portfolio.get_all_portfolios import GetAllPortfoliosUseCase
 from app.application.use_cases.portfolio.take_portfolio_snapshot import TakePortfolioSnapshotUseCase
 from app.application.use_cases.portfolio.get_portfolio_snapshots import GetPortfolioSnapshotsUseCase
+from app.application.use_cases.portfolio.get_portfolio_snapshot_series import GetPortfolioSnapshotSeriesUseCase
+from app.application.use_cases.portfolio.get_portfolio_history import GetPortfolioHistoryUseCase
+from app.application.use_cases.portfolio.export_portfolio_snapshots import ExportPortfolioSnapshotsUseCase
 from app.application.use_cases.portfolio.update_portfolio import UpdatePortfolioUseCase
-from app.domain.ports.repository import IPortfolioRepository
-from app.adapters.outgoing.persistence.database import SessionLocal
+from app.domain.ports.repository import (
+    IAssetSnapshotRepository,
+    IPortfolioRepository,
+    IPortfolioSnapshotRepository,
+    IUnitOfWork,
+)
+from app.adapters.incoming.api.metrics import counted
+from app.adapters.outgoing.persistence.database import READ_ONLY_METHODS, open_session
+from app.adapters.outgoing.persistence.repository.sqlalchemy_asset_snapshot_repository import SQLAlchemyAssetSnapshotRepository
 from app.adapters.outgoing.persistence.repository.sqlalchemy_portfolio_repository import SQLAlchemyPortfolioRepository
+from app.adapters.outgoing.persistence.repository.sqlalchemy_portfolio_snapshot_repository import SQLAlchemyPortfolioSnapshotRepository
+from app.adapters.outgoing.persistence.repository.sqlalchemy_unit_of_work import SQLAlchemyUnitOfWork
 
 
-# Dependency to get a DB session
-def get_db_session() -> Generator[Session, None, None]:
-    db = SessionLocal()
+# Dependency to get a DB session: reads go to the replica until the request
+# writes, write requests use the primary throughout
+def get_db_session(request: Request) -> Generator[Session, None, None]:
+    db = open_session(read_only=request.method in READ_ONLY_METHODS)
     try:
         yield db
     finally:
         db.close()
 
 
+def _get_unit_of_work(db: Session = Depends(get_db_session)) -> IUnitOfWork:
+    """Unit of work committing the portfolios module's DB session."""
+    return SQLAlchemyUnitOfWork(db)
+
+
 # Repository provider for portfolios
 def get_portfolio_repository(db: Session = Depends(get_db_session)) -> IPortfolioRepository:
     return SQLAlchemyPortfolioRepository(db)
 
 
+def get_portfolio_snapshot_repository(db: Session = Depends(get_db_session)) -> IPortfolioSnapshotRepository:
+    return SQLAlchemyPortfolioSnapshotRepository(db)
+
+
+def _get_asset_snapshot_repository(db: Session = Depends(get_db_session)) -> IAssetSnapshotRepository:
+    """Asset snapshot repository using the portfolios module's DB session."""
+    return SQLAlchemyAssetSnapshotRepository(db)
+
+
 # Portfolio use case providers
+@counted
 def create_portfolio_use_case(
     portfolio_repository: IPortfolioRepository = Depends(get_portfolio_repository),
+    uow: IUnitOfWork = Depends(_get_unit_of_work),
 ) -> CreatePortfolioUseCase:
-    return CreatePortfolioUseCase(portfolio_repository)
+    return CreatePortfolioUseCase(portfolio_repository, uow)
 
 
+@counted
 def get_portfolio_use_case(
     portfolio_repository: IPortfolioRepository = Depends(get_portfolio_repository),
 ) -> GetPortfolioUseCase:
     return GetPortfolioUseCase(portfolio_repository)
 
 
+@counted
 def delete_portfolio_use_case(
     portfolio_repository: IPortfolioRepository = Depends(get_portfolio_repository),
+    uow: IUnitOfWork = Depends(_get_unit_of_work),
 ) -> DeletePortfolioUseCase:
-    return DeletePortfolioUseCase(portfolio_repository)
+    return DeletePortfolioUseCase(portfolio_repository, uow)
 
 
+@counted
 def get_all_portfolios_use_case(
     portfolio_repository: IPortfolioRepository = Depends(get_portfolio_repository),
 ) -> GetAllPortfoliosUseCase:
     return GetAllPortfoliosUseCase(portfolio_repository)
 
 
+@counted
 def take_portfolio_snapshot_use_case(
     portfolio_repository: IPortfolioRepository = Depends(get_portfolio_repository),
+    uow: IUnitOfWork = Depends(_get_unit_of_work),
 ) -> TakePortfolioSnapshotUseCase:
-    return TakePortfolioSnapshotUseCase(portfolio_repository)
+    return TakePortfolioSnapshotUseCase(portfolio_repository, uow)
 
 
+@counted
 def get_portfolio_snapshots_use_case(
     portfolio_repository: IPortfolioRepository = Depends(get_portfolio_repository),
+    snapshot_repository: IPortfolioSnapshotRepository = Depends(get_portfolio_snapshot_repository),
 ) -> GetPortfolioSnapshotsUseCase:
-    return GetPortfolioSnapshotsUseCase(portfolio_repository)
+    return GetPortfolioSnapshotsUseCase(portfolio_repository, snapshot_repository)
+
+
+@counted
+def get_portfolio_snapshot_series_use_case(
+    portfolio_repository: IPortfolioRepository = Depends(get_portfolio_repository),
+    snapshot_repository: IPortfolioSnapshotRepository = Depends(get_portfolio_snapshot_repository),
+) -> GetPortfolioSnapshotSeriesUseCase:
+    return GetPortfolioSnapshotSeriesUseCase(portfolio_repository, snapshot_repository)
+
+
+@counted
+def get_portfolio_history_use_case(
+    portfolio_repository: IPortfolioRepository = Depends(get_portfolio_repository),
+    snapshot_repository: IAssetSnapshotRepository = Depends(_get_asset_snapshot_repository),
+) -> GetPortfolioHistoryUseCase:
+    return GetPortfolioHistoryUseCase(portfolio_repository, snapshot_repository)
+
+
+@counted
+def export_portfolio_snapshots_use_case(
+    portfolio_repository: IPortfolioRepository = Depends(get_portfolio_repository),
+    snapshot_repository: IPortfolioSnapshotRepository = Depends(get_portfolio_snapshot_repository),
+) -> ExportPortfolioSnapshotsUseCase:
+    return ExportPortfolioSnapshotsUseCase(portfolio_repository, snapshot_repository)
 
 
+@counted
 def update_portfolio_use_case(
     portfolio_repository: IPortfolioRepository = Depends(get_portfolio_repository),
+    uow: IUnitOfWork = Depends(_get_unit_of_work),
 ) -> UpdatePortfolioUseCase:
-    return UpdatePortfolioUseCase(portfolio_repository)
+    return UpdatePortfolioUseCase(portfolio_repository, uow)
 
 
 __all__ = [
     'get_db_session',
     'get_portfolio_repository',
+    'get_portfolio_snapshot_repository',
     'create_portfolio_use_case',
     'get_portfolio_use_case',
     'delete_portfolio_use_case',
     'get_all_portfolios_use_case',
     'take_portfolio_snapshot_use_case',
     'get_portfolio_snapshots_use_case',
+    'get_portfolio_snapshot_series_use_case',
+    'get_portfolio_history_use_case',
+    'export_portfolio_snapshots_use_case',
     'update_portfolio_use_case',
 ]
@@ -8,8 +8,9 @@ from app.application.use_cases.tag.get_tag import GetTagUseCase
 from app.application.use_cases.tag.delete_tag import DeleteTagUseCase
 from app.application.use_cases.tag.add_tag_to_asset import AddTagToAssetUseCase
 from app.application.use_cases.tag.remove_tag_from_asset import RemoveTagFromAssetUseCase
-from app.domain.ports.repository import IAssetRepository, ITagRepository
-from app.adapters.incoming.api.dependencies.assets import get_db_session, get_asset_repository
+from app.domain.ports.repository import IAssetRepository, ITagRepository, IUnitOfWork
+from app.adapters.incoming.api.metrics import counted
+from app.adapters.incoming.api.dependencies.assets import get_db_session, get_asset_repository, get_unit_of_work
 from app.adapters.outgoing.persistence.repository.sqlalchemy_tag_repository import SQLAlchemyTagRepository
 
 
@@ -17,42 +18,52 @@ def get_tag_repository(db: Session = Depends(get_db_session)) -> ITagRepository:
     return SQLAlchemyTagRepository(db)
 
 
+@counted
 def create_tag_use_case(
     repo: ITagRepository = Depends(get_tag_repository),
+    uow: IUnitOfWork = Depends(get_unit_of_work),
 ) -> CreateTagUseCase:
-    return CreateTagUseCase(repo)
+    return CreateTagUseCase(repo, uow)
 
 
+@counted
 def get_all_tags_use_case(
     repo: ITagRepository = Depends(get_tag_repository),
 ) -> GetAllTagsUseCase:
     return GetAllTagsUseCase(repo)
 
 
+@counted
 def get_tag_use_case(
     repo: ITagRepository = Depends(get_tag_repository),
 ) -> GetTagUseCase:
     return GetTagUseCase(repo)
 
 
+@counted
 def delete_tag_use_case(
     repo: ITagRepository = Depends(get_tag_repository),
+    uow: IUnitOfWork = Depends(get_unit_of_work),
 ) -> DeleteTagUseCase:
-    return DeleteTagUseCase(repo)
+    return DeleteTagUseCase(repo, uow)
 
 
+@counted
 def add_tag_to_asset_use_case(
     asset_repo: IAssetRepository = Depends(get_asset_repository),
     tag_repo: ITagRepository = Depends(get_tag_repository),
+    uow: IUnitOfWork = Depends(get_unit_of_work),
 ) -> AddTagToAssetUseCase:
-    return AddTagToAssetUseCase(asset_repo, tag_repo)
+    return AddTagToAssetUseCase(asset_repo, tag_repo, uow)
 
 
+@counted
 def remove_tag_from_asset_use_case(
     asset_repo: IAssetRepository = Depends(get_asset_repository),
     tag_repo: ITagRepository = Depends(get_tag_repository),
+    uow: IUnitOfWork = Depends(get_unit_of_work),
 ) -> RemoveTagFromAssetUseCase:
-    return RemoveTagFromAssetUseCase(asset_repo, tag_repo)
+    return RemoveTagFromAssetUseCase(asset_repo, tag_repo, uow)
 
 
 __all__ = [
@@ -0,0 +1,27 @@
+"""Transaction dependency providers."""
+from fastapi import Depends
+from sqlalchemy.orm import Session
+
+from app.application.use_cases.transaction.export_transactions import ExportAssetTransactionsUseCase
+from app.domain.ports.repository import IAssetRepository, ITransactionRepository
+from app.adapters.incoming.api.metrics import counted
+from app.adapters.incoming.api.dependencies.assets import get_db_session, get_asset_repository
+from app.adapters.outgoing.persistence.repository.sqlalchemy_transaction_repository import SQLAlchemyTransactionRepository
+
+
+def get_transaction_repository(db: Session = Depends(get_db_session)) -> ITransactionRepository:
+    return SQLAlchemyTransactionRepository(db)
+
+
+@counted
+def export_asset_transactions_use_case(
+    transaction_repo: ITransactionRepository = Depends(get_transaction_repository),
+    asset_repo: IAssetRepository = Depends(get_asset_repository),
+) -> ExportAssetTransactionsUseCase:
+    return ExportAssetTransactionsUseCase(transaction_repo, asset_repo)
+
+
+__all__ = [
+    'get_transaction_repository',
+    'export_asset_transactions_use_case',
+]
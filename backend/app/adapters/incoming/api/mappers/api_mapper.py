@@ -1,24 +1,41 @@
 """
 Maps domain entities to API response schemas.
 """
-from typing import List, Optional
+from typing import Iterable, List, Optional, Sequence
 from uuid import UUID
 
+from fastapi import Response
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, TypeAdapter
+
 from app.domain.entities.asset import Asset
 from app.domain.entities.asset_snapshot import AssetSnapshot
+from app.domain.entities.asset_summary import AssetSummary
 from app.domain.entities.asset_type import AssetType
 from app.domain.entities.category import Category
 from app.domain.entities.portfolio import Portfolio
 from app.domain.entities.portfolio_snapshot import PortfolioSnapshot
+from app.domain.entities.portfolio_summary import PortfolioSummary
 from app.domain.entities.tag import Tag
+from app.domain.entities.value_series import SeriesPoint, ValuePoint
+from app.application.pagination import Page
+from app.application.use_cases.asset_snapshot.bulk_create_asset_snapshots import BulkSnapshotResult
+from app.application.use_cases.history.import_history import ImportReport
+from app.adapters.incoming.exporters.history_writer import ExportFormat, write_records
+from ..dependencies.pagination import NEXT_CURSOR_HEADER
 from ..schemas.asset_response import AssetResponse
-from ..schemas.asset_snapshot_response import AssetSnapshotResponse
+from ..schemas.asset_snapshot_response import AssetSnapshotResponse, AssetSnapshotBulkCreateResponse
 from ..schemas.asset_type_response import AssetTypeResponse
 from ..schemas.category_response import CategoryResponse
-from ..schemas.portfolio_response import PortfolioResponse
+from ..schemas.import_response import ImportReportResponse
+from ..schemas.portfolio_response import PortfolioResponse, PortfolioSummaryResponse
 from ..schemas.portfolio_snapshot_response import PortfolioSnapshotResponse
+from ..schemas.series_response import SeriesAggregate, SeriesPointResponse, ValuePointResponse
 from ..schemas.tag_response import TagResponse
 
+# Serialises asset summaries straight to JSON, in the AssetResponse format
+_ASSET_SUMMARY_LIST = TypeAdapter(List[AssetSummary])
+
 
 class ApiMapper:
     """Translates domain entities to API response DTOs."""
@@ -31,6 +48,17 @@ class ApiMapper:
     def to_asset_response_list(assets: List[Asset]) -> List[AssetResponse]:
         return [ApiMapper.to_asset_response(a) for a in assets]
 
+    @staticmethod
+    def to_asset_summary_page_response(page: Page[AssetSummary]) -> Response:
+        """
+        Render a listing page as JSON without validating it again: summaries are
+        built from typed columns, so neither AssetResponse models nor FastAPI's
+        response_model check are needed.
+        """
+        response = Response(content=_ASSET_SUMMARY_LIST.dump_json(page.items), media_type="application/json")
+        ApiMapper.set_next_cursor(response, page)
+        return response
+
     @staticmethod
     def to_portfolio_response(portfolio: Portfolio) -> PortfolioResponse:
         return PortfolioResponse(
@@ -46,6 +74,14 @@ class ApiMapper:
     def to_portfolio_response_list(portfolios: List[Portfolio]) -> List[PortfolioResponse]:
         return [ApiMapper.to_portfolio_response(p) for p in portfolios]
 
+    @staticmethod
+    def to_portfolio_summary_response(summary: PortfolioSummary) -> PortfolioSummaryResponse:
+        return PortfolioSummaryResponse.model_validate(summary)
+
+    @staticmethod
+    def to_portfolio_summary_response_list(summaries: List[PortfolioSummary]) -> List[PortfolioSummaryResponse]:
+        return [ApiMapper.to_portfolio_summary_response(s) for s in summaries]
+
     @staticmethod
     def to_portfolio_snapshot_response(snapshot: PortfolioSnapshot) -> PortfolioSnapshotResponse:
         return PortfolioSnapshotResponse.model_validate(snapshot)
@@ -86,3 +122,51 @@ class ApiMapper:
     @staticmethod
     def to_asset_snapshot_response_list(snapshots: List[AssetSnapshot]) -> List[AssetSnapshotResponse]:
         return [ApiMapper.to_asset_snapshot_response(s) for s in snapshots]
+
+    @staticmethod
+    def to_series_response_list(points: List[SeriesPoint], agg: SeriesAggregate) -> List[SeriesPointResponse]:
+        """Project each bucket onto the requested aggregate."""
+        if agg is SeriesAggregate.OHLC:
+            return [
+                SeriesPointResponse(
+                    period_start=p.period_start, count=p.count, open=p.open, high=p.high, low=p.low, close=p.close
+                )
+                for p in points
+            ]
+        attribute = "close" if agg is SeriesAggregate.LAST else "average"
+        return [
+            SeriesPointResponse(period_start=p.period_start, count=p.count, value=getattr(p, attribute))
+            for p in points
+        ]
+
+    @staticmethod
+    def to_value_point_response_list(points: List[ValuePoint]) -> List[ValuePointResponse]:
+        return [ValuePointResponse(observed_at=p.observed_at, value=p.value) for p in points]
+
+    @staticmethod
+    def to_asset_snapshot_bulk_response(result: BulkSnapshotResult) -> AssetSnapshotBulkCreateResponse:
+        return AssetSnapshotBulkCreateResponse.model_validate(result.model_dump())
+
+    @staticmethod
+    def to_import_report_response(report: ImportReport) -> ImportReportResponse:
+        return ImportReportResponse.model_validate(report.model_dump(mode="json"))
+
+    @staticmethod
+    def to_export_response(
+        records: Iterable[BaseModel],
+        fields: Sequence[str],
+        fmt: ExportFormat,
+        filename: str,
+    ) -> StreamingResponse:
+        """Stream entities as a CSV/NDJSON download; rows are encoded as they are read."""
+        return StreamingResponse(
+            write_records(records, fields, fmt),
+            media_type=fmt.media_type,
+            headers={"Content-Disposition": f'attachment; filename="{filename}.{fmt.value}"'},
+        )
+
+    @staticmethod
+    def set_next_cursor(response: Response, page: Page) -> None:
+        """Expose the cursor of the following page, if any, as a response header."""
+        if page.next_cursor:
+            response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
@@ -0,0 +1,269 @@
+"""
+Prometheus metrics, served at GET /metrics.
+
+Metrics live in an in-process registry (REGISTRY) and are rendered in the
+Prometheus text format when scraped; nothing is sent anywhere. Recording
+happens at three points:
+
+- MetricsMiddleware, a plain ASGI middleware: request latency per method,
+  route template and status code, and the requests in flight;
+- observe_engine(): statement durations per engine and operation, and
+  connection checkouts, from the engine's events. Pool occupancy is read
+  from the pools themselves at scrape time (PoolCollector);
+- @counted, on the use case providers in dependencies/: executions of the
+  use cases the API runs, per class and outcome. The use case classes are
+  not touched, so code that runs them outside the API (tests, CLI) is not
+  counted.
+
+Each process has its own registry: with several uvicorn workers, a scrape
+reaches one of them. METRICS=0 turns all of it off.
+"""
+import functools
+import inspect
+import os
+import time
+import weakref
+from typing import Awaitable, Callable, Dict, Iterator, Tuple, TypeVar
+
+from fastapi import APIRouter, Response
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    disable_created_metrics,
+    generate_latest,
+)
+from prometheus_client.core import GaugeMetricFamily
+from prometheus_client.registry import Collector
+from sqlalchemy import Engine, event
+
+# On unless METRICS=0; off, nothing is recorded and /metrics is not served
+ENABLED = os.getenv("METRICS", "1").lower() not in ("0", "false", "no")
+
+U = TypeVar("U")
+
+# No *_created series: one timestamp per label set would double the size of every scrape
+disable_created_metrics()
+
+REGISTRY = CollectorRegistry()
+
+HTTP_REQUEST_DURATION = Histogram(
+    "strata_http_request_duration_seconds",
+    "HTTP request latency, from the first byte received to the last byte sent.",
+    ["method", "route", "status"],
+    registry=REGISTRY,
+)
+HTTP_REQUESTS_IN_PROGRESS = Gauge(
+    "strata_http_requests_in_progress",
+    "HTTP requests being served.",
+    registry=REGISTRY,
+)
+DB_QUERY_DURATION = Histogram(
+    "strata_db_query_duration_seconds",
+    "SQL statement execution time, per engine and operation.",
+    ["engine", "operation"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+    registry=REGISTRY,
+)
+DB_POOL_CHECKOUTS = Counter(
+    "strata_db_pool_checkouts",
+    "Connections checked out of the engine's pool.",
+    ["engine"],
+    registry=REGISTRY,
+)
+USE_CASE_EXECUTIONS = Counter(
+    "strata_use_case_executions",
+    "Use case executions, per use case class and outcome (success or error).",
+    ["use_case", "outcome"],
+    registry=REGISTRY,
+)
+
+# Route label of requests that matched no route, so unknown paths cannot grow the label set
+UNMATCHED_ROUTE = "unmatched"
+
+# SQL verbs reported as the operation label; any other statement counts as "other"
+_OPERATIONS = frozenset({"SELECT", "INSERT", "UPDATE", "DELETE", "BEGIN", "COMMIT", "ROLLBACK", "SAVEPOINT", "RELEASE"})
+
+
+class MetricsMiddleware:
+    """Observe the latency of every HTTP request under the template of the route it matched."""
+
+    # Requests in flight. Only changed on the event loop, so a plain int does
+    # without the gauge's lock; it is read when scraped.
+    in_progress = 0
+
+    def __init__(self, app):
+        self.app = app
+        # (method, route, status) -> its histogram's observe, skipping the labels() lookup
+        self._observers: Dict[Tuple[str, str, str], Callable[[float], None]] = {}
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_observing_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        MetricsMiddleware.in_progress += 1
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_observing_status)
+        finally:
+            elapsed = time.perf_counter() - started
+            MetricsMiddleware.in_progress -= 1
+            # The router records the matched route in the scope it shares with the middlewares
+            key = (scope["method"], getattr(scope.get("route"), "path_format", UNMATCHED_ROUTE), str(status))
+            observe = self._observers.get(key)
+            if observe is None:
+                observe = self._observers[key] = HTTP_REQUEST_DURATION.labels(*key).observe
+            observe(elapsed)
+
+
+HTTP_REQUESTS_IN_PROGRESS.set_function(lambda: MetricsMiddleware.in_progress)
+
+
+class PoolCollector(Collector):
+    """Occupancy of the engines' connection pools, read when scraped."""
+
+    def __init__(self):
+        self._engines: Dict[str, Engine] = {}
+
+    def add(self, name: str, engine: Engine) -> None:
+        self._engines[name] = engine
+
+    def collect(self) -> Iterator:
+        size = GaugeMetricFamily("strata_db_pool_size", "Connections the pool keeps open.", labels=["engine"])
+        checked_out = GaugeMetricFamily(
+            "strata_db_pool_checked_out", "Connections in use by a request.", labels=["engine"]
+        )
+        overflow = GaugeMetricFamily(
+            "strata_db_pool_overflow", "Connections open beyond the pool size.", labels=["engine"]
+        )
+        for name, engine in self._engines.items():
+            # Dispose() replaces the pool, so look it up on every scrape
+            pool = engine.pool
+            if not hasattr(pool, "checkedout"):
+                continue  # StaticPool, NullPool: nothing to report
+            size.add_metric([name], pool.size())
+            checked_out.add_metric([name], pool.checkedout())
+            # Negative while the pool has not opened all of its connections yet
+            overflow.add_metric([name], max(pool.overflow(), 0))
+        yield size
+        yield checked_out
+        yield overflow
+
+
+POOLS = PoolCollector()
+REGISTRY.register(POOLS)
+
+_instrumented_engines = weakref.WeakSet()
+
+
+def observe_engine(engine: Engine, name: str) -> Engine:
+    """Observe the statement durations, pool checkouts and pool occupancy of `engine` under the label `name`."""
+    if engine in _instrumented_engines:
+        return engine
+    _instrumented_engines.add(engine)
+    durations = {op: DB_QUERY_DURATION.labels(name, op.lower()) for op in _OPERATIONS}
+    other = DB_QUERY_DURATION.labels(name, "other")
+    checkouts = DB_POOL_CHECKOUTS.labels(name)
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _start(conn, cursor, statement, parameters, context, executemany):
+        context._metrics_started = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _observe(conn, cursor, statement, parameters, context, executemany):
+        operation = (statement.lstrip()[:10].split(None, 1) or [""])[0].upper()
+        durations.get(operation, other).observe(time.perf_counter() - context._metrics_started)
+
+    @event.listens_for(engine, "checkout")
+    def _checkout(dbapi_connection, connection_record, connection_proxy):
+        checkouts.inc()
+
+    POOLS.add(name, engine)
+    return engine
+
+
+class _CountedExecute:
+    """A use case's bound `execute`, counting its calls by outcome."""
+
+    __slots__ = ("_execute", "_success", "_error")
+
+    # Use case class name -> its (success, error) counters, skipping the labels() lookups per request
+    _outcomes: Dict[str, Tuple[Counter, Counter]] = {}
+
+    def __init__(self, execute: Callable, name: str):
+        self._execute = execute
+        outcomes = self._outcomes.get(name)
+        if outcomes is None:
+            outcomes = self._outcomes[name] = (
+                USE_CASE_EXECUTIONS.labels(name, "success"), USE_CASE_EXECUTIONS.labels(name, "error")
+            )
+        self._success, self._error = outcomes
+
+    def __call__(self, *args, **kwargs):
+        try:
+            result = self._execute(*args, **kwargs)
+        except Exception:
+            self._error.inc()
+            raise
+        if inspect.isawaitable(result):
+            # Async use cases (API_STACK=async) succeed or fail when awaited
+            return self._awaited(result)
+        self._success.inc()
+        return result
+
+    async def _awaited(self, result: Awaitable):
+        try:
+            result = await result
+        except Exception:
+            self._error.inc()
+            raise
+        self._success.inc()
+        return result
+
+
+def _counting(use_case: U) -> U:
+    use_case.execute = _CountedExecute(use_case.execute, type(use_case).__name__)
+    return use_case
+
+
+def counted(provider: Callable[..., U]) -> Callable[..., U]:
+    """
+    Count the executions of the use cases `provider` returns, per class and
+    outcome. The provider keeps its signature, so FastAPI resolves its
+    dependencies as before, and only the instance it returns has its
+    `execute` wrapped. Overriding the provider replaces the counting with it.
+    """
+    if not ENABLED:
+        return provider
+
+    if inspect.iscoroutinefunction(provider):
+        @functools.wraps(provider)
+        async def provide_on_loop(*args, **kwargs) -> U:
+            return _counting(await provider(*args, **kwargs))
+
+        return provide_on_loop
+
+    @functools.wraps(provider)
+    def provide(*args, **kwargs) -> U:
+        return _counting(provider(*args, **kwargs))
+
+    return provide
+
+
+router = APIRouter()
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics() -> Response:
+    return Response(generate_latest(REGISTRY), media_type=CONTENT_TYPE_LATEST)
@@ -1,7 +1,8 @@
+from datetime import datetime
 from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Response, status
 from app.application.use_cases.asset.create_asset import (
     CreateAssetRequest,
     CreateAssetUseCase,
@@ -14,6 +15,9 @@ from app.application.use_cases.asset.dispose_asset import DisposeAssetUseCase
 from app.application.use_cases.asset.get_assets_by_portfolio import GetAssetsByPortfolioUseCase
 from app.application.use_cases.asset_snapshot.create_asset_snapshot import CreateAssetSnapshotUseCase
 from app.application.use_cases.asset_snapshot.get_asset_snapshots import GetAssetSnapshotsUseCase
+from app.application.use_cases.asset_snapshot.get_asset_snapshot_series import GetAssetSnapshotSeriesUseCase
+from app.application.use_cases.asset_snapshot.export_asset_snapshots import ExportAssetSnapshotsUseCase
+from app.application.use_cases.transaction.export_transactions import ExportAssetTransactionsUseCase
 from app.application.use_cases.tag.add_tag_to_asset import AddTagToAssetCommand, AddTagToAssetUseCase
 from app.application.use_cases.tag.remove_tag_from_asset import RemoveTagFromAssetCommand, RemoveTagFromAssetUseCase
 from app.application.use_cases.category.add_asset_to_category import AddAssetToCategoryCommand, AddAssetToCategoryUseCase
@@ -30,7 +34,10 @@ from app.adapters.incoming.api.dependencies.assets import (
 from app.adapters.incoming.api.dependencies.asset_snapshots import (
     create_asset_snapshot_use_case,
     get_asset_snapshots_use_case,
+    get_asset_snapshot_series_use_case,
+    export_asset_snapshots_use_case,
 )
+from app.adapters.incoming.api.dependencies.transactions import export_asset_transactions_use_case
 from app.adapters.incoming.api.dependencies.tags import (
     add_tag_to_asset_use_case,
     remove_tag_from_asset_use_case,
@@ -39,11 +46,16 @@ from app.adapters.incoming.api.dependencies.categories import (
     add_asset_to_category_use_case,
     remove_asset_from_category_use_case,
 )
+from app.adapters.incoming.api.dependencies.pagination import PageParams, page_params
 from app.adapters.incoming.api.mappers.api_mapper import ApiMapper
 from app.adapters.incoming.api.schemas.asset_request import AssetCreateRequest, AssetUpdateRequest
 from app.adapters.incoming.api.schemas.asset_response import AssetResponse
 from app.adapters.incoming.api.schemas.asset_snapshot_request import AssetSnapshotCreateRequest
 from app.adapters.incoming.api.schemas.asset_snapshot_response import AssetSnapshotResponse
+from app.adapters.incoming.api.schemas.series_response import SeriesAggregate, SeriesPointResponse
+from app.adapters.incoming.api.schemas.transaction_response import TransactionResponse
+from app.adapters.incoming.exporters.history_writer import ExportFormat
+from app.domain.entities.value_series import SeriesBucket
 from app.adapters.incoming.api.schemas.error_response import ErrorResponse
 
 class AssetRoutes:
@@ -55,14 +67,15 @@ class AssetRoutes:
         @router.get("/", response_model=List[AssetResponse])
         def get_all_assets(
             portfolio_id: Optional[UUID] = None,
+            page: PageParams = Depends(page_params),
             get_all_use_case: GetAllAssetsUseCase = Depends(get_all_assets_use_case),
             get_by_portfolio_use_case: GetAssetsByPortfolioUseCase = Depends(get_assets_by_portfolio_use_case),
         ):
             if portfolio_id:
-                assets = get_by_portfolio_use_case.execute(portfolio_id)
+                assets = get_by_portfolio_use_case.execute(portfolio_id, page.limit, page.cursor)
             else:
-                assets = get_all_use_case.execute()
-            return ApiMapper.to_asset_response_list(assets)
+                assets = get_all_use_case.execute(page.limit, page.cursor)
+            return ApiMapper.to_asset_summary_page_response(assets)
 
         @router.get("/{asset_id}", response_model=AssetResponse, responses={404: {"model": ErrorResponse}})
         def get_asset_by_id(
@@ -109,10 +122,59 @@ class AssetRoutes:
         @router.get("/{asset_id}/snapshots", response_model=List[AssetSnapshotResponse], responses={404: {"model": ErrorResponse}})
         def get_asset_snapshots(
             asset_id: UUID,
+            response: Response,
+            start_date: Optional[datetime] = None,
+            end_date: Optional[datetime] = None,
+            page: PageParams = Depends(page_params),
             use_case: GetAssetSnapshotsUseCase = Depends(get_asset_snapshots_use_case),
         ):
-            snapshots = use_case.execute(asset_id)
-            return ApiMapper.to_asset_snapshot_response_list(snapshots)
+            snapshots = use_case.execute(asset_id, start_date, end_date, limit=page.limit, cursor=page.cursor)
+            ApiMapper.set_next_cursor(response, snapshots)
+            return ApiMapper.to_asset_snapshot_response_list(snapshots.items)
+
+        @router.get(
+            "/{asset_id}/snapshots/series",
+            response_model=List[SeriesPointResponse],
+            response_model_exclude_none=True,
+            responses={404: {"model": ErrorResponse}},
+        )
+        def get_asset_snapshot_series(
+            asset_id: UUID,
+            bucket: SeriesBucket = SeriesBucket.DAY,
+            agg: SeriesAggregate = SeriesAggregate.LAST,
+            start_date: Optional[datetime] = None,
+            end_date: Optional[datetime] = None,
+            use_case: GetAssetSnapshotSeriesUseCase = Depends(get_asset_snapshot_series_use_case),
+        ):
+            """Asset value history downsampled to one point per day, week or month."""
+            points = use_case.execute(asset_id, bucket, start_date, end_date)
+            return ApiMapper.to_series_response_list(points, agg)
+
+        @router.get("/{asset_id}/snapshots/export", responses={404: {"model": ErrorResponse}})
+        def export_asset_snapshots(
+            asset_id: UUID,
+            format: ExportFormat = ExportFormat.NDJSON,
+            start_date: Optional[datetime] = None,
+            end_date: Optional[datetime] = None,
+            use_case: ExportAssetSnapshotsUseCase = Depends(export_asset_snapshots_use_case),
+        ):
+            snapshots = use_case.execute(asset_id, start_date, end_date)
+            return ApiMapper.to_export_response(
+                snapshots, list(AssetSnapshotResponse.model_fields), format, f"asset-{asset_id}-snapshots"
+            )
+
+        @router.get("/{asset_id}/transactions/export", responses={404: {"model": ErrorResponse}})
+        def export_asset_transactions(
+            asset_id: UUID,
+            format: ExportFormat = ExportFormat.NDJSON,
+            start_date: Optional[datetime] = None,
+            end_date: Optional[datetime] = None,
+            use_case: ExportAssetTransactionsUseCase = Depends(export_asset_transactions_use_case),
+        ):
+            transactions = use_case.execute(asset_id, start_date, end_date)
+            return ApiMapper.to_export_response(
+                transactions, list(TransactionResponse.model_fields), format, f"asset-{asset_id}-transactions"
+            )
 
         @router.post("/{asset_id}/snapshots", response_model=AssetSnapshotResponse, status_code=status.HTTP_201_CREATED, responses={404: {"model": ErrorResponse}})
         def create_asset_snapshot(
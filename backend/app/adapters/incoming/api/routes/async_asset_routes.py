@@ -0,0 +1,62 @@
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Response, status
+from app.application.use_cases.asset.get_asset import AsyncGetAssetUseCase
+from app.application.use_cases.asset_snapshot.create_asset_snapshot import AsyncCreateAssetSnapshotUseCase
+from app.application.use_cases.asset_snapshot.get_asset_snapshots import AsyncGetAssetSnapshotsUseCase
+from app.adapters.incoming.api.dependencies.async_stack import (
+    create_async_asset_snapshot_use_case,
+    get_async_asset_snapshots_use_case,
+    get_async_asset_use_case,
+)
+from app.adapters.incoming.api.dependencies.pagination import PageParams, page_params
+from app.adapters.incoming.api.mappers.api_mapper import ApiMapper
+from app.adapters.incoming.api.schemas.asset_response import AssetResponse
+from app.adapters.incoming.api.schemas.asset_snapshot_request import AssetSnapshotCreateRequest
+from app.adapters.incoming.api.schemas.asset_snapshot_response import AssetSnapshotResponse
+from app.adapters.incoming.api.schemas.error_response import ErrorResponse
+
+
+class AsyncAssetRoutes:
+    """The AssetRoutes endpoints served from the event loop on the async stack (API_STACK=async)."""
+
+    @staticmethod
+    def get_router() -> APIRouter:
+        router = APIRouter(prefix="/assets", tags=["Assets"])
+
+        @router.get("/{asset_id}", response_model=AssetResponse, responses={404: {"model": ErrorResponse}})
+        async def get_asset_by_id(
+            asset_id: UUID, use_case: AsyncGetAssetUseCase = Depends(get_async_asset_use_case)
+        ):
+            asset = await use_case.execute(asset_id)
+            return ApiMapper.to_asset_response(asset)
+
+        @router.get("/{asset_id}/snapshots", response_model=List[AssetSnapshotResponse], responses={404: {"model": ErrorResponse}})
+        async def get_asset_snapshots(
+            asset_id: UUID,
+            response: Response,
+            start_date: Optional[datetime] = None,
+            end_date: Optional[datetime] = None,
+            page: PageParams = Depends(page_params),
+            use_case: AsyncGetAssetSnapshotsUseCase = Depends(get_async_asset_snapshots_use_case),
+        ):
+            snapshots = await use_case.execute(asset_id, start_date, end_date, limit=page.limit, cursor=page.cursor)
+            ApiMapper.set_next_cursor(response, snapshots)
+            return ApiMapper.to_asset_snapshot_response_list(snapshots.items)
+
+        @router.post("/{asset_id}/snapshots", response_model=AssetSnapshotResponse, status_code=status.HTTP_201_CREATED, responses={404: {"model": ErrorResponse}})
+        async def create_asset_snapshot(
+            asset_id: UUID,
+            request: AssetSnapshotCreateRequest,
+            use_case: AsyncCreateAssetSnapshotUseCase = Depends(create_async_asset_snapshot_use_case),
+        ):
+            snapshot = await use_case.execute(
+                asset_id=str(asset_id),
+                value=request.value,
+                observed_at=request.observed_at,
+            )
+            return ApiMapper.to_asset_snapshot_response(snapshot)
+
+        return router
@@ -0,0 +1,22 @@
+from fastapi import APIRouter, Depends
+from app.application.use_cases.portfolio.get_all_portfolios import AsyncGetAllPortfoliosUseCase
+from app.adapters.incoming.api.dependencies.async_stack import get_all_async_portfolios_use_case
+from app.adapters.incoming.api.mappers.api_mapper import ApiMapper
+from app.adapters.incoming.api.schemas.portfolio_response import PortfolioSummaryResponse
+
+
+class AsyncPortfolioRoutes:
+    """The PortfolioRoutes endpoints served from the event loop on the async stack (API_STACK=async)."""
+
+    @staticmethod
+    def get_router() -> APIRouter:
+        router = APIRouter(prefix="/portfolios", tags=["Portfolios"])
+
+        @router.get("/", response_model=list[PortfolioSummaryResponse])
+        async def get_all_portfolios(
+            use_case: AsyncGetAllPortfoliosUseCase = Depends(get_all_async_portfolios_use_case),
+        ) -> list[PortfolioSummaryResponse]:
+            summaries = await use_case.execute()
+            return ApiMapper.to_portfolio_summary_response_list(summaries)
+
+        return router
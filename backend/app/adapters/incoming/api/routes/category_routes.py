@@ -1,7 +1,7 @@
 from typing import List
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Response, status
 
 from app.application.use_cases.category.create_category import CreateCategoryCommand, CreateCategoryUseCase
 from app.application.use_cases.category.get_all_categories import GetAllCategoriesUseCase
@@ -18,6 +18,7 @@ from app.adapters.incoming.api.dependencies.categories import (
     delete_category_use_case,
     add_asset_to_category_use_case,
 )
+from app.adapters.incoming.api.dependencies.pagination import PageParams, page_params
 from app.adapters.incoming.api.mappers.api_mapper import ApiMapper
 from app.adapters.incoming.api.schemas.category_request import CategoryCreateRequest, CategoryAssetAssignRequest
 from app.adapters.incoming.api.schemas.category_response import CategoryResponse
@@ -32,10 +33,13 @@ class CategoryRoutes:
 
         @router.get("/", response_model=List[CategoryResponse])
         def get_all_categories(
+            response: Response,
+            page: PageParams = Depends(page_params),
             use_case: GetAllCategoriesUseCase = Depends(get_all_categories_use_case),
         ):
-            categories = use_case.execute()
-            return ApiMapper.to_category_response_list(categories)
+            categories = use_case.execute(page.limit, page.cursor)
+            ApiMapper.set_next_cursor(response, categories)
+            return ApiMapper.to_category_response_list(categories.items)
 
         @router.post(
             "/",
@@ -0,0 +1,54 @@
+from tempfile import SpooledTemporaryFile
+from typing import Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Request
+from fastapi.concurrency import run_in_threadpool
+
+from app.application.use_cases.history.import_history import ImportHistoryUseCase, ImportKind
+from app.adapters.incoming.api.dependencies.imports import import_history_use_case
+from app.adapters.incoming.importers.history_reader import ImportFormat, read_records
+from app.adapters.incoming.api.mappers.api_mapper import ApiMapper
+from app.adapters.incoming.api.schemas.import_response import ImportReportResponse
+
+# Uploads larger than this are spooled to a temporary file instead of memory
+SPOOL_MAX_MEMORY = 8 * 1024 * 1024
+
+
+class ImportRoutes:
+
+    @staticmethod
+    def get_router() -> APIRouter:
+        router = APIRouter(prefix="/imports", tags=["Imports"])
+
+        @router.post(
+            "/{kind}",
+            response_model=ImportReportResponse,
+            openapi_extra={"requestBody": {"content": {
+                "text/csv": {"schema": {"type": "string"}},
+                "application/x-ndjson": {"schema": {"type": "string"}},
+            }}},
+        )
+        async def import_history(
+            kind: ImportKind,
+            request: Request,
+            format: ImportFormat = ImportFormat.CSV,
+            portfolio_id: Optional[UUID] = None,
+            use_case: ImportHistoryUseCase = Depends(import_history_use_case),
+        ):
+            # The raw body is spooled rather than parsed as it arrives: the
+            # use case and repositories are synchronous and run in a worker
+            # thread, and spooling keeps memory bounded for large uploads.
+            # Rows are committed chunk by chunk (see ImportHistoryUseCase):
+            # rejected rows are reported, but an error partway through leaves
+            # the chunks before it imported.
+            with SpooledTemporaryFile(max_size=SPOOL_MAX_MEMORY) as spool:
+                async for chunk in request.stream():
+                    await run_in_threadpool(spool.write, chunk)
+                spool.seek(0)
+                report = await run_in_threadpool(
+                    use_case.execute, kind, read_records(spool, format), portfolio_id
+                )
+            return ApiMapper.to_import_report_response(report)
+
+        return router
@@ -1,5 +1,7 @@
+from datetime import datetime, timedelta
+from typing import List, Optional
 from uuid import UUID
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, Response, status
 from app.application.use_cases.portfolio.create_portfolio import (
     CreatePortfolioCommand,
     CreatePortfolioUseCase,
@@ -9,6 +11,9 @@ from app.application.use_cases.portfolio.delete_portfolio import DeletePortfolio
 from app.application.use_cases.portfolio.get_all_portfolios import GetAllPortfoliosUseCase
 from app.application.use_cases.portfolio.take_portfolio_snapshot import TakePortfolioSnapshotUseCase
 from app.application.use_cases.portfolio.get_portfolio_snapshots import GetPortfolioSnapshotsUseCase
+from app.application.use_cases.portfolio.get_portfolio_snapshot_series import GetPortfolioSnapshotSeriesUseCase
+from app.application.use_cases.portfolio.get_portfolio_history import DEFAULT_HISTORY_STEP, GetPortfolioHistoryUseCase
+from app.application.use_cases.portfolio.export_portfolio_snapshots import ExportPortfolioSnapshotsUseCase
 from app.application.use_cases.portfolio.update_portfolio import UpdatePortfolioCommand, UpdatePortfolioUseCase
 from app.adapters.incoming.api.dependencies.portfolios import (
     create_portfolio_use_case,
@@ -17,13 +22,20 @@ from app.adapters.incoming.api.dependencies.portfolios import (
     get_all_portfolios_use_case,
     take_portfolio_snapshot_use_case,
     get_portfolio_snapshots_use_case,
+    get_portfolio_snapshot_series_use_case,
+    get_portfolio_history_use_case,
+    export_portfolio_snapshots_use_case,
     update_portfolio_use_case,
 )
+from app.adapters.incoming.api.dependencies.pagination import PageParams, page_params
 from app.adapters.incoming.api.mappers.api_mapper import ApiMapper
 from app.adapters.incoming.api.schemas.portfolio_request import PortfolioCreateRequest, PortfolioUpdateRequest
-from app.adapters.incoming.api.schemas.portfolio_response import PortfolioResponse
+from app.adapters.incoming.api.schemas.portfolio_response import PortfolioResponse, PortfolioSummaryResponse
 from app.adapters.incoming.api.schemas.portfolio_snapshot_response import PortfolioSnapshotResponse
+from app.adapters.incoming.api.schemas.series_response import SeriesAggregate, SeriesPointResponse, ValuePointResponse
 from app.adapters.incoming.api.schemas.error_response import ErrorResponse
+from app.adapters.incoming.exporters.history_writer import ExportFormat
+from app.domain.entities.value_series import SeriesBucket
 
 
 class PortfolioRoutes:
@@ -41,19 +53,19 @@ class PortfolioRoutes:
             created = create_use_case.execute(command)
             return ApiMapper.to_portfolio_response(created)
 
-        @router.get("/", response_model=list[PortfolioResponse])
+        @router.get("/", response_model=list[PortfolioSummaryResponse])
         def get_all_portfolios(
             use_case: GetAllPortfoliosUseCase = Depends(get_all_portfolios_use_case),
-        ) -> list[PortfolioResponse]:
-            portfolios = use_case.execute()
-            return [ApiMapper.to_portfolio_response(p) for p in portfolios]
+        ) -> list[PortfolioSummaryResponse]:
+            summaries = use_case.execute()
+            return ApiMapper.to_portfolio_summary_response_list(summaries)
 
-        @router.get("/{portfolio_id}", response_model=PortfolioResponse)
+        @router.get("/{portfolio_id}", response_model=PortfolioSummaryResponse)
         def get_portfolio(
             portfolio_id: UUID, use_case: GetPortfolioUseCase = Depends(get_portfolio_use_case)
-        ) -> PortfolioResponse:
-            portfolio = use_case.execute(portfolio_id)
-            return ApiMapper.to_portfolio_response(portfolio)
+        ) -> PortfolioSummaryResponse:
+            summary = use_case.execute(portfolio_id)
+            return ApiMapper.to_portfolio_summary_response(summary)
 
         @router.delete("/{portfolio_id}", status_code=status.HTTP_204_NO_CONTENT)
         def delete_portfolio(
@@ -77,10 +89,62 @@ class PortfolioRoutes:
         @router.get("/{portfolio_id}/snapshots", response_model=list[PortfolioSnapshotResponse])
         def get_portfolio_snapshots(
             portfolio_id: UUID,
+            response: Response,
+            start_date: Optional[datetime] = None,
+            end_date: Optional[datetime] = None,
+            page: PageParams = Depends(page_params),
             use_case: GetPortfolioSnapshotsUseCase = Depends(get_portfolio_snapshots_use_case),
         ) -> list[PortfolioSnapshotResponse]:
-            portfolio = use_case.execute(portfolio_id)
-            return ApiMapper.to_portfolio_snapshot_response_list(portfolio.snapshots or [])
+            snapshots = use_case.execute(portfolio_id, start_date, end_date, limit=page.limit, cursor=page.cursor)
+            ApiMapper.set_next_cursor(response, snapshots)
+            return ApiMapper.to_portfolio_snapshot_response_list(snapshots.items)
+
+        @router.get(
+            "/{portfolio_id}/snapshots/series",
+            response_model=List[SeriesPointResponse],
+            response_model_exclude_none=True,
+            responses={404: {"model": ErrorResponse}},
+        )
+        def get_portfolio_snapshot_series(
+            portfolio_id: UUID,
+            bucket: SeriesBucket = SeriesBucket.DAY,
+            agg: SeriesAggregate = SeriesAggregate.LAST,
+            start_date: Optional[datetime] = None,
+            end_date: Optional[datetime] = None,
+            use_case: GetPortfolioSnapshotSeriesUseCase = Depends(get_portfolio_snapshot_series_use_case),
+        ):
+            """Net worth history downsampled to one point per day, week or month."""
+            points = use_case.execute(portfolio_id, bucket, start_date, end_date)
+            return ApiMapper.to_series_response_list(points, agg)
+
+        @router.get(
+            "/{portfolio_id}/history",
+            response_model=List[ValuePointResponse],
+            responses={400: {"model": ErrorResponse}, 404: {"model": ErrorResponse}},
+        )
+        def get_portfolio_history(
+            portfolio_id: UUID,
+            start: Optional[datetime] = Query(None, alias="from"),
+            end: Optional[datetime] = Query(None, alias="to"),
+            step: timedelta = Query(DEFAULT_HISTORY_STEP, description="ISO 8601 duration, e.g. P1D or PT6H"),
+            use_case: GetPortfolioHistoryUseCase = Depends(get_portfolio_history_use_case),
+        ):
+            """Portfolio value at every `step` from `from` to `to`, using each asset's latest snapshot."""
+            points = use_case.execute(portfolio_id, start, end, step)
+            return ApiMapper.to_value_point_response_list(points)
+
+        @router.get("/{portfolio_id}/snapshots/export", responses={404: {"model": ErrorResponse}})
+        def export_portfolio_snapshots(
+            portfolio_id: UUID,
+            format: ExportFormat = ExportFormat.NDJSON,
+            start_date: Optional[datetime] = None,
+            end_date: Optional[datetime] = None,
+            use_case: ExportPortfolioSnapshotsUseCase = Depends(export_portfolio_snapshots_use_case),
+        ):
+            snapshots = use_case.execute(portfolio_id, start_date, end_date)
+            return ApiMapper.to_export_response(
+                snapshots, list(PortfolioSnapshotResponse.model_fields), format, f"portfolio-{portfolio_id}-snapshots"
+            )
 
         @router.put("/{portfolio_id}", response_model=PortfolioResponse, responses={404: {"model": ErrorResponse}})
         def update_portfolio(
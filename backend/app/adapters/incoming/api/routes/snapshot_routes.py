@@ -0,0 +1,29 @@
+from fastapi import APIRouter, Depends
+
+from app.application.use_cases.asset_snapshot.bulk_create_asset_snapshots import (
+    BulkCreateAssetSnapshotsUseCase,
+    BulkSnapshotItem,
+)
+from app.adapters.incoming.api.dependencies.asset_snapshots import bulk_create_asset_snapshots_use_case
+from app.adapters.incoming.api.mappers.api_mapper import ApiMapper
+from app.adapters.incoming.api.schemas.asset_snapshot_request import AssetSnapshotBulkCreateRequest
+from app.adapters.incoming.api.schemas.asset_snapshot_response import AssetSnapshotBulkCreateResponse
+
+
+class SnapshotRoutes:
+
+    @staticmethod
+    def get_router() -> APIRouter:
+        router = APIRouter(tags=["Snapshots"])
+
+        @router.post("/snapshots:bulk", response_model=AssetSnapshotBulkCreateResponse)
+        def bulk_create_asset_snapshots(
+            request: AssetSnapshotBulkCreateRequest,
+            use_case: BulkCreateAssetSnapshotsUseCase = Depends(bulk_create_asset_snapshots_use_case),
+        ):
+            # The request model validated every row: hand the use case the values as they are
+            items = [BulkSnapshotItem(s.asset_id, s.value, s.observed_at) for s in request.snapshots]
+            result = use_case.execute(items)
+            return ApiMapper.to_asset_snapshot_bulk_response(result)
+
+        return router
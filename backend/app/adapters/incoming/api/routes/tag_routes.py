@@ -1,7 +1,7 @@
 from typing import List
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Response, status
 
 from app.application.use_cases.tag.create_tag import CreateTagCommand, CreateTagUseCase
 from app.application.use_cases.tag.get_all_tags import GetAllTagsUseCase
@@ -13,6 +13,7 @@ from app.adapters.incoming.api.dependencies.tags import (
     get_tag_use_case,
     delete_tag_use_case,
 )
+from app.adapters.incoming.api.dependencies.pagination import PageParams, page_params
 from app.adapters.incoming.api.mappers.api_mapper import ApiMapper
 from app.adapters.incoming.api.schemas.tag_request import TagCreateRequest
 from app.adapters.incoming.api.schemas.tag_response import TagResponse
@@ -27,10 +28,13 @@ class TagRoutes:
 
         @router.get("/", response_model=List[TagResponse])
         def get_all_tags(
+            response: Response,
+            page: PageParams = Depends(page_params),
             use_case: GetAllTagsUseCase = Depends(get_all_tags_use_case),
         ):
-            tags = use_case.execute()
-            return ApiMapper.to_tag_response_list(tags)
+            tags = use_case.execute(page.limit, page.cursor)
+            ApiMapper.set_next_cursor(response, tags)
+            return ApiMapper.to_tag_response_list(tags.items)
 
         @router.post(
             "/",
@@ -15,6 +15,8 @@ class AssetCreateRequest(BaseModel):
     name: str
     quantity: Optional[Decimal] = None
     created_by: str
+    # Tags attached to the new asset in the same transaction
+    tag_ids: List[UUID] = []
 
 
 class AssetUpdateRequest(BaseModel):
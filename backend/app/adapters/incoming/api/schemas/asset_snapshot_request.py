@@ -1,10 +1,24 @@
 """Pydantic schemas for AssetSnapshot API requests."""
 from datetime import datetime
 from decimal import Decimal
-from typing import Optional
-from pydantic import BaseModel
+from typing import List, Optional
+from uuid import UUID
+from pydantic import BaseModel, Field
+
+# Upper bound on rows accepted by a single bulk request
+MAX_BULK_SNAPSHOTS = 100_000
 
 
 class AssetSnapshotCreateRequest(BaseModel):
     value: Decimal
     observed_at: Optional[datetime] = None
+
+
+class AssetSnapshotBulkItem(BaseModel):
+    asset_id: UUID
+    value: Decimal
+    observed_at: Optional[datetime] = None
+
+
+class AssetSnapshotBulkCreateRequest(BaseModel):
+    snapshots: List[AssetSnapshotBulkItem] = Field(min_length=1, max_length=MAX_BULK_SNAPSHOTS)
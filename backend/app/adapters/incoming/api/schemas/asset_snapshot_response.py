@@ -1,6 +1,7 @@
 """Pydantic schema for AssetSnapshot API response."""
 from datetime import datetime
 from decimal import Decimal
+from typing import List
 from uuid import UUID
 from pydantic import BaseModel
 from pydantic.config import ConfigDict
@@ -13,3 +14,15 @@ class AssetSnapshotResponse(BaseModel):
     observed_at: datetime
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class AssetSnapshotBulkError(BaseModel):
+    index: int     # Position of the rejected row in the request
+    asset_id: UUID
+    code: str      # Machine-readable error code, e.g. "ASSET_NOT_FOUND"
+    message: str
+
+
+class AssetSnapshotBulkCreateResponse(BaseModel):
+    created: int
+    errors: List[AssetSnapshotBulkError]
@@ -0,0 +1,19 @@
+"""Pydantic schemas for history import API responses."""
+from typing import List
+from pydantic import BaseModel
+
+
+class ImportRowErrorResponse(BaseModel):
+    line: int      # Line of the rejected record in the uploaded file
+    code: str      # Machine-readable error code, e.g. "ASSET_NOT_FOUND"
+    message: str
+
+
+class ImportReportResponse(BaseModel):
+    kind: str
+    rows_read: int
+    imported: int
+    failed: int
+    errors: List[ImportRowErrorResponse]  # First rejected rows only; see `failed` for the total
+    elapsed_seconds: float
+    rows_per_second: float
@@ -15,3 +15,8 @@ class PortfolioResponse(BaseModel):
     updated_at: datetime
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class PortfolioSummaryResponse(PortfolioResponse):
+    """Portfolio listing entry, including the number of active (not disposed) assets it holds."""
+    asset_count: int = 0
@@ -0,0 +1,30 @@
+"""Pydantic schemas for bucketed snapshot series API responses."""
+from datetime import datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Optional
+from pydantic import BaseModel
+
+
+class SeriesAggregate(str, Enum):
+    """Value reported for each bucket of a series."""
+    LAST = "last"  # Last value observed in the bucket
+    AVG = "avg"    # Mean of the bucket's values
+    OHLC = "ohlc"  # First, highest, lowest and last value
+
+
+class SeriesPointResponse(BaseModel):
+    period_start: datetime
+    count: int  # Snapshots in the bucket
+    # Set for agg=last and agg=avg
+    value: Optional[Decimal] = None
+    # Set for agg=ohlc
+    open: Optional[Decimal] = None
+    high: Optional[Decimal] = None
+    low: Optional[Decimal] = None
+    close: Optional[Decimal] = None
+
+
+class ValuePointResponse(BaseModel):
+    observed_at: datetime
+    value: Decimal
@@ -0,0 +1,19 @@
+"""Pydantic schema for Transaction API responses."""
+from datetime import datetime
+from decimal import Decimal
+from typing import Optional
+from uuid import UUID
+from pydantic import BaseModel
+from pydantic.config import ConfigDict
+
+
+class TransactionResponse(BaseModel):
+    id: UUID
+    asset_id: Optional[UUID] = None
+    type: str
+    quantity: Decimal
+    unit_price: Decimal
+    currency: str
+    occurred_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
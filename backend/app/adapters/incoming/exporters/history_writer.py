@@ -0,0 +1,72 @@
+"""
+Streaming writers for history exports.
+
+Encode an iterator of domain entities as CSV or NDJSON bytes, a batch of
+rows at a time, so exports can be sent through a StreamingResponse while
+the repository is still reading from its cursor.
+"""
+import csv
+import io
+import json
+from datetime import datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Iterable, Iterator, Sequence
+from uuid import UUID
+
+from pydantic import BaseModel
+
+# Rows encoded per chunk handed to the response
+ROWS_PER_CHUNK = 500
+
+
+class ExportFormat(str, Enum):
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+    @property
+    def media_type(self) -> str:
+        return "text/csv" if self is ExportFormat.CSV else "application/x-ndjson"
+
+
+def _scalar(value: Any) -> Any:
+    """Render ids, amounts and timestamps as strings (amounts keep their exact digits)."""
+    if isinstance(value, (UUID, Decimal)):
+        return str(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def write_ndjson(records: Iterable[BaseModel], fields: Sequence[str]) -> Iterator[bytes]:
+    """Yield NDJSON chunks, one JSON object per record."""
+    lines = []
+    for record in records:
+        lines.append(json.dumps({f: _scalar(getattr(record, f)) for f in fields}))
+        if len(lines) == ROWS_PER_CHUNK:
+            yield ("\n".join(lines) + "\n").encode()
+            lines.clear()
+    if lines:
+        yield ("\n".join(lines) + "\n").encode()
+
+
+def write_csv(records: Iterable[BaseModel], fields: Sequence[str]) -> Iterator[bytes]:
+    """Yield CSV chunks, starting with the header row."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(fields)
+    rows = 0
+    for record in records:
+        writer.writerow([_scalar(getattr(record, f)) for f in fields])
+        rows += 1
+        if rows % ROWS_PER_CHUNK == 0:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue().encode()
+
+
+def write_records(records: Iterable[BaseModel], fields: Sequence[str], fmt: ExportFormat) -> Iterator[bytes]:
+    if fmt is ExportFormat.NDJSON:
+        return write_ndjson(records, fields)
+    return write_csv(records, fields)
@@ -0,0 +1,95 @@
+"""
+Streaming readers for history imports.
+
+Turn a binary CSV or NDJSON stream into ImportRecord tuples one line at a
+time, so files of any size can be fed to ImportHistoryUseCase without being
+loaded in memory. Records that are not valid UTF-8 or cannot be parsed are
+yielded with None fields, and reported by line like any other rejected row,
+rather than failing the import halfway through.
+"""
+import csv
+import io
+import json
+import re
+from enum import Enum
+from pathlib import Path
+from typing import BinaryIO, Iterator, TextIO
+
+from app.application.use_cases.history.import_history import ImportRecord
+
+# Bytes that are not valid UTF-8 decode to lone surrogates (errors="surrogateescape")
+_UNDECODABLE = re.compile("[\udc80-\udcff]")
+
+
+class ImportFormat(str, Enum):
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+    @classmethod
+    def from_path(cls, path: Path) -> "ImportFormat":
+        """Guess the format from a file extension (.csv, .ndjson / .jsonl)."""
+        suffix = path.suffix.lower()
+        if suffix in (".ndjson", ".jsonl"):
+            return cls.NDJSON
+        if suffix == ".csv":
+            return cls.CSV
+        raise ValueError(f"Cannot infer import format from '{path.name}'; expected .csv, .ndjson or .jsonl.")
+
+
+def read_csv(stream: TextIO) -> Iterator[ImportRecord]:
+    """Yield one record per CSV row, keyed by the header row; malformed rows yield None fields."""
+    line_num = 0
+    # Last line that held undecodable bytes
+    undecodable = 0
+
+    def lines() -> Iterator[str]:
+        nonlocal line_num, undecodable
+        for line in stream:
+            line_num += 1
+            if _UNDECODABLE.search(line):
+                undecodable = line_num
+            yield line
+
+    reader = csv.DictReader(lines())
+    rows = iter(reader)
+    row_start = 2  # line 1 is the header
+    while True:
+        try:
+            row = next(rows)
+        except StopIteration:
+            return
+        except csv.Error:
+            # The reader resumes at the line after the malformed one
+            row = None
+        # A quoted cell can span lines: the record ends on the last line read
+        if row is None or undecodable >= row_start:
+            yield line_num, None
+        else:
+            # Extra cells beyond the header are collected under the None key
+            yield line_num, {k.strip(): v for k, v in row.items() if k is not None}
+        row_start = line_num + 1
+
+
+def read_ndjson(stream: TextIO) -> Iterator[ImportRecord]:
+    """Yield one record per non-blank line; malformed lines yield None fields."""
+    for line_no, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            fields = None if _UNDECODABLE.search(line) else json.loads(line)
+        except json.JSONDecodeError:
+            fields = None
+        yield line_no, fields if isinstance(fields, dict) else None
+
+
+def read_records(stream: BinaryIO, fmt: ImportFormat) -> Iterator[ImportRecord]:
+    """Decode a UTF-8 binary stream (BOM tolerated) and parse it lazily."""
+    text = io.TextIOWrapper(stream, encoding="utf-8-sig", errors="surrogateescape", newline="")
+    try:
+        if fmt is ImportFormat.NDJSON:
+            yield from read_ndjson(text)
+        else:
+            yield from read_csv(text)
+    finally:
+        # Leave the underlying stream to its owner
+        text.detach()
@@ -0,0 +1,87 @@
+"""
+Async engines and sessions for the async request stack (API_STACK=async).
+
+Same database, replica, SQLite profile and read/write routing as
+database.py, reached through the async drivers: aiosqlite for SQLite, asyncpg for PostgreSQL.
+Only imported when the async stack is selected, so the sync stack does not
+need the async drivers installed.
+"""
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.adapters.outgoing.persistence.database import DATABASE_REPLICA_URL, DATABASE_URL, POOL_SETTINGS, SQLITE_PROFILE
+from app.adapters.outgoing.persistence.query_stats import instrument_engine
+from app.adapters.outgoing.persistence.routing import RoutingSession
+from app.adapters.outgoing.persistence.sqlite import (
+    apply_sqlite_profile,
+    begin_immediate,
+    enforce_foreign_keys,
+    writer_pool_options,
+)
+
+# Dialect -> async driver
+ASYNC_DRIVERS = {
+    "sqlite": "aiosqlite",
+    "postgresql": "asyncpg",
+}
+
+
+def to_async_url(url: str) -> str:
+    """
+    Swap the driver of a database URL for its async counterpart,
+    e.g. sqlite:///strata.db -> sqlite+aiosqlite:///strata.db.
+
+    Raises:
+        ValueError: If the dialect has no supported async driver
+    """
+    scheme, separator, rest = url.partition("://")
+    dialect = scheme.split("+", 1)[0]
+    if not separator or dialect not in ASYNC_DRIVERS:
+        raise ValueError(f"No async driver for database URL: {url}")
+    return f"{dialect}+{ASYNC_DRIVERS[dialect]}://{rest}"
+
+
+ASYNC_DATABASE_URL = to_async_url(DATABASE_URL)
+
+_pool_options = POOL_SETTINGS.engine_options() if POOL_SETTINGS is not None else {}
+
+async_engine = create_async_engine(ASYNC_DATABASE_URL, **_pool_options)
+async_replica_engine = (
+    create_async_engine(to_async_url(DATABASE_REPLICA_URL), **_pool_options) if DATABASE_REPLICA_URL else async_engine
+)
+
+if SQLITE_PROFILE is not None:
+    apply_sqlite_profile(async_engine.sync_engine, SQLITE_PROFILE)
+    if async_replica_engine is not async_engine:
+        apply_sqlite_profile(async_replica_engine.sync_engine, SQLITE_PROFILE)
+    async_write_engine = create_async_engine(ASYNC_DATABASE_URL, **writer_pool_options(SQLITE_PROFILE))
+    begin_immediate(apply_sqlite_profile(async_write_engine.sync_engine, SQLITE_PROFILE))
+else:
+    async_write_engine = async_engine
+
+for _engine in {async_engine, async_replica_engine, async_write_engine}:
+    instrument_engine(_engine.sync_engine)
+    if _engine.dialect.name == "sqlite":
+        enforce_foreign_keys(_engine.sync_engine)
+
+
+# Routing happens in the sync session the AsyncSession wraps, on the sync
+# facades of the async engines
+AsyncRoutingSessionLocal = async_sessionmaker(
+    sync_session_class=RoutingSession,
+    primary=async_write_engine.sync_engine,
+    replica=async_replica_engine.sync_engine,
+    autoflush=False,
+)
+
+
+def open_async_session(read_only: bool) -> AsyncSession:
+    """Open an async routing session, pinned to the primary from the start when `read_only` is False."""
+    return AsyncRoutingSessionLocal(read_only=read_only)
+
+
+async def dispose_async_engines() -> None:
+    await async_engine.dispose()
+    if async_replica_engine is not async_engine:
+        await async_replica_engine.dispose()
+    if async_write_engine is not async_engine:
+        await async_write_engine.dispose()
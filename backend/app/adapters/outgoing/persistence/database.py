@@ -7,8 +7,18 @@ import os
 import logging
 
 from dotenv import load_dotenv
-from sqlalchemy import create_engine
-from sqlalchemy.orm import DeclarativeBase, sessionmaker
+from sqlalchemy import Engine, create_engine
+from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
+
+from app.adapters.outgoing.persistence.pool import PoolSettings
+from app.adapters.outgoing.persistence.query_stats import instrument_engine
+from app.adapters.outgoing.persistence.routing import RoutingSession
+from app.adapters.outgoing.persistence.sqlite import (
+    SQLiteProfile,
+    apply_sqlite_profile,
+    create_sqlite_write_engine,
+    enforce_foreign_keys,
+)
 
 
 def _load_backend_dotenv_if_needed() -> None:
@@ -43,6 +53,21 @@ DEFAULT_DATABASE_URL = f"sqlite:///{_default_db_path.as_posix()}"
 # Read environment or fallback to default
 DATABASE_URL: str = os.getenv("DATABASE_URL", DEFAULT_DATABASE_URL)
 
+
+def _normalize_url(url: str) -> str:
+    # Hosting providers often hand out postgres:// URLs, which SQLAlchemy rejects
+    if url.startswith("postgres://"):
+        return url.replace("postgres://", "postgresql://", 1)
+    return url
+
+
+DATABASE_URL = _normalize_url(DATABASE_URL)
+
+# Optional read replica of DATABASE_URL, same dialect (see persistence/routing.py)
+DATABASE_REPLICA_URL: Optional[str] = (
+    _normalize_url(os.environ["DATABASE_REPLICA_URL"]) if os.getenv("DATABASE_REPLICA_URL") else None
+)
+
 # If the env provided a Docker-style path (e.g. sqlite:////app/.data/...),
 # and we are running outside Docker where /app may be read-only or missing,
 # try to create the parent dir; if that fails, fall back to the repo-local DB.
@@ -81,7 +106,36 @@ _connect_args: Optional[dict] = (
     {"check_same_thread": False} if DATABASE_URL.startswith("sqlite") else None
 )
 
-engine = create_engine(DATABASE_URL, connect_args=_connect_args or {})
+# Server databases: QueuePool sized from the environment (see persistence/pool.py)
+POOL_SETTINGS: Optional[PoolSettings] = (
+    None if DATABASE_URL.startswith("sqlite") else PoolSettings.from_env()
+)
+
+
+def _create_read_engine(url: str) -> Engine:
+    engine = instrument_engine(create_engine(
+        url,
+        connect_args=_connect_args or {},
+        **(POOL_SETTINGS.engine_options() if POOL_SETTINGS is not None else {}),
+    ))
+    return enforce_foreign_keys(engine) if url.startswith("sqlite") else engine
+
+
+engine = _create_read_engine(DATABASE_URL)
+replica_engine = _create_read_engine(DATABASE_REPLICA_URL) if DATABASE_REPLICA_URL else engine
+
+# SQLite: pragmas on every connection and a single-writer engine for writes
+# (see persistence/sqlite.py). Other databases write through the main engine.
+SQLITE_PROFILE: Optional[SQLiteProfile] = (
+    SQLiteProfile.from_env() if DATABASE_URL.startswith("sqlite") else None
+)
+if SQLITE_PROFILE is not None:
+    apply_sqlite_profile(engine, SQLITE_PROFILE)
+    if replica_engine is not engine:
+        apply_sqlite_profile(replica_engine, SQLITE_PROFILE)
+    write_engine = instrument_engine(create_sqlite_write_engine(DATABASE_URL, SQLITE_PROFILE, _connect_args))
+else:
+    write_engine = engine
 
 
 # -------------------------------------------------------------------
@@ -103,6 +157,30 @@ SessionLocal = sessionmaker(
     autocommit=False,
 )
 
+WriteSessionLocal = sessionmaker(
+    bind=write_engine,
+    autoflush=False,
+    autocommit=False,
+)
+
+# Reads go to the replica (the read pool when there is none) until the
+# session writes, writes go to the writer
+RoutingSessionLocal = sessionmaker(
+    class_=RoutingSession,
+    primary=write_engine,
+    replica=replica_engine,
+    autoflush=False,
+    autocommit=False,
+)
+
+# HTTP methods served from the replica; any other request writes
+READ_ONLY_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+def open_session(read_only: bool) -> Session:
+    """Open a routing session, pinned to the primary from the start when `read_only` is False."""
+    return RoutingSessionLocal(read_only=read_only)
+
 
 # -------------------------------------------------------------------
 # FastAPI dependency
@@ -7,19 +7,35 @@ Rules:
 - ORM models never leave this layer (only domain entities are returned from repositories)
 - Domain entities never depend on SQLAlchemy; this module is the only bridge
 - Monetary amounts use 2 decimal places; asset quantities use 8 (crypto precision)
+- Mapping a list of rows shares one MappingContext, so a portfolio, asset type,
+  tag or category referenced by many rows becomes one domain object
+- Column values go to the entities as read, ids included (GUID columns hold
+  strings), and are validated. In benchmarks/bench_mapper.py this maps tags,
+  snapshots and transactions 1.3-1.6x faster than parsing ids with UUID()
+  first, and portfolios about as fast; the trusted alternatives (model_construct
+  or strict validation of pre-typed values) were slower for every entity, so
+  there is no non-validating read path
 """
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
-from uuid import UUID
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Tuple, TypeVar
 
 from app.domain.entities.asset import Asset
 from app.domain.entities.asset_snapshot import AssetSnapshot
 from app.domain.entities.asset_type import AssetType
 from app.domain.entities.category import Category
+from app.domain.entities.money import from_cents
 from app.domain.entities.portfolio import Portfolio
 from app.domain.entities.portfolio_snapshot import PortfolioSnapshot
+from app.domain.entities.portfolio_summary import PortfolioSummary
+from app.domain.entities.snapshot_series import to_utc
+from app.domain.entities.snapshot_timeline import SnapshotTimeline
 from app.domain.entities.tag import Tag
+from app.domain.entities.value_series import SeriesPoint
+from app.domain.entities.transaction import Transaction
+from pydantic import BaseModel
 
 if TYPE_CHECKING:
     from app.adapters.outgoing.persistence.models.asset import AssetModel
@@ -29,6 +45,37 @@ if TYPE_CHECKING:
     from app.adapters.outgoing.persistence.models.portfolio import PortfolioModel
     from app.adapters.outgoing.persistence.models.portfolio_snapshot import PortfolioSnapshotModel
     from app.adapters.outgoing.persistence.models.tag import TagModel
+    from app.adapters.outgoing.persistence.models.transaction import TransactionModel
+
+E = TypeVar("E", bound=BaseModel)
+
+
+class MappingContext:
+    """
+    Identity map for one mapping call.
+
+    Entities shared between rows (an asset's portfolio, asset type, tags and
+    category chains) are built on first sight and reused for every later row
+    carrying the same id, instead of once per reference.
+    """
+
+    def __init__(self) -> None:
+        self._entities: Dict[Tuple[type, str], BaseModel] = {}
+
+    def __len__(self) -> int:
+        return len(self._entities)
+
+    def intern(self, entity_type: type[E], entity_id: str, build: Callable[[], E]) -> E:
+        """Return the entity already built for `entity_id`, or build and remember it."""
+        key = (entity_type, entity_id)
+        entity = self._entities.get(key)
+        if entity is None:
+            entity = self._entities[key] = build()
+        return entity
+
+
+def _interned(context: Optional[MappingContext], entity_type: type[E], entity_id: str, build: Callable[[], E]) -> E:
+    return build() if context is None else context.intern(entity_type, entity_id, build)
 
 
 class PersistenceMapper:
@@ -39,20 +86,31 @@ class PersistenceMapper:
     # ------------------------------------------------------------------
 
     @staticmethod
-    def tag_to_domain(model: "TagModel") -> Tag:
-        return Tag(id=UUID(model.id), name=model.name)
+    def tag_to_domain(model: "TagModel", context: Optional[MappingContext] = None) -> Tag:
+        return _interned(context, Tag, model.id, lambda: Tag(id=model.id, name=model.name))
 
     @staticmethod
-    def asset_type_to_domain(model: "AssetTypeModel") -> AssetType:
-        return AssetType(id=UUID(model.id), code=model.code, label=model.label)
+    def asset_type_to_domain(model: "AssetTypeModel", context: Optional[MappingContext] = None) -> AssetType:
+        return _interned(
+            context, AssetType, model.id, lambda: AssetType(id=model.id, code=model.code, label=model.label)
+        )
 
     @staticmethod
-    def category_to_domain(model: "CategoryModel") -> Category:
+    def category_to_domain(model: "CategoryModel", context: Optional[MappingContext] = None) -> Category:
         """Shallow mapping — parent is included if the relationship is already loaded."""
-        parent: Category | None = None
-        if model.parent is not None:
-            parent = PersistenceMapper.category_to_domain(model.parent)
-        return Category(id=UUID(model.id), name=model.name, parent=parent)
+        def build() -> Category:
+            parent: Category | None = None
+            if model.parent is not None:
+                parent = PersistenceMapper.category_to_domain(model.parent, context)
+            return Category(id=model.id, name=model.name, parent=parent)
+
+        return _interned(context, Category, model.id, build)
+
+    @staticmethod
+    def categories_to_domain(models: Iterable["CategoryModel"]) -> List[Category]:
+        """Map a list of categories, building each shared parent once."""
+        context = MappingContext()
+        return [PersistenceMapper.category_to_domain(m, context) for m in models]
 
     # ------------------------------------------------------------------
     # ORM → Domain (aggregate root: Portfolio + Asset, breaks circular ref)
@@ -63,43 +121,61 @@ class PersistenceMapper:
         model: "AssetModel",
         portfolio: Portfolio,
         load_snapshots: bool = False,
+        context: Optional[MappingContext] = None,
     ) -> Asset:
         """
         Build an Asset domain entity using a pre-constructed Portfolio to avoid
         the circular Portfolio → assets → Asset → portfolio → Portfolio loop.
         """
         asset = Asset(
-            id=UUID(model.id),
+            id=model.id,
             name=model.name,
             portfolio=portfolio,
-            asset_type=PersistenceMapper.asset_type_to_domain(model.asset_type),
+            asset_type=PersistenceMapper.asset_type_to_domain(model.asset_type, context),
             quantity=model.quantity,
             disposed=model.disposed,
-            tags=set(PersistenceMapper.tag_to_domain(t) for t in (model.tags or [])),
-            categories=set(PersistenceMapper.category_to_domain(c) for c in (model.categories or [])),
+            tags=set(PersistenceMapper.tag_to_domain(t, context) for t in (model.tags or [])),
+            categories=set(PersistenceMapper.category_to_domain(c, context) for c in (model.categories or [])),
             created_at=model.created_at,
             updated_at=model.updated_at,
             created_by=model.created_by,
             updated_by=model.updated_by,
         )
         if load_snapshots and model.snapshots:
-            asset.snapshots = [
+            # Sorted and bisect-indexed once here, whatever order the ORM loaded them in
+            asset.snapshots = SnapshotTimeline(
                 PersistenceMapper.asset_snapshot_to_domain(s)
                 for s in model.snapshots
-            ]
+            )
         return asset
 
     @staticmethod
-    def asset_to_domain(model: "AssetModel", load_snapshots: bool = False) -> Asset:
+    def asset_to_domain(
+        model: "AssetModel",
+        load_snapshots: bool = False,
+        context: Optional[MappingContext] = None,
+    ) -> Asset:
         """
         Map AssetModel → Asset domain entity.
         Requires model.portfolio and model.asset_type to be eagerly loaded.
         """
-        portfolio = PersistenceMapper.portfolio_to_domain(model.portfolio)
-        return PersistenceMapper._asset_with_portfolio(model, portfolio, load_snapshots)
+        portfolio = _interned(
+            context, Portfolio, model.portfolio.id, lambda: PersistenceMapper.portfolio_to_domain(model.portfolio)
+        )
+        return PersistenceMapper._asset_with_portfolio(model, portfolio, load_snapshots, context)
 
     @staticmethod
-    def portfolio_to_domain(model: "PortfolioModel", load_assets: bool = False) -> Portfolio:
+    def assets_to_domain(models: Iterable["AssetModel"]) -> List[Asset]:
+        """Map a list of assets, building each shared portfolio, type, tag and category once."""
+        context = MappingContext()
+        return [PersistenceMapper.asset_to_domain(m, context=context) for m in models]
+
+    @staticmethod
+    def portfolio_to_domain(
+        model: "PortfolioModel",
+        load_assets: bool = False,
+        context: Optional[MappingContext] = None,
+    ) -> Portfolio:
         """
         Map PortfolioModel → Portfolio domain entity.
         When load_assets=True, also maps nested assets (with their snapshots).
@@ -107,15 +183,17 @@ class PersistenceMapper:
         when load_assets=True.
         """
         portfolio = Portfolio(
-            id=UUID(model.id),
+            id=model.id,
             name=model.name,
             base_currency=model.base_currency,
             created_at=model.created_at,
             updated_at=model.updated_at,
         )
         if load_assets and model.assets:
+            if context is None:
+                context = MappingContext()
             portfolio.assets = [
-                PersistenceMapper._asset_with_portfolio(a, portfolio, load_snapshots=True)
+                PersistenceMapper._asset_with_portfolio(a, portfolio, load_snapshots=True, context=context)
                 for a in model.assets
             ]
         return portfolio
@@ -123,8 +201,8 @@ class PersistenceMapper:
     @staticmethod
     def asset_snapshot_to_domain(model: "AssetSnapshotModel") -> AssetSnapshot:
         return AssetSnapshot(
-            id=UUID(model.id),
-            asset_id=UUID(model.asset_id),
+            id=model.id,
+            asset_id=model.asset_id,
             value=model.value,
             observed_at=model.observed_at,
         )
@@ -132,12 +210,58 @@ class PersistenceMapper:
     @staticmethod
     def portfolio_snapshot_to_domain(model: "PortfolioSnapshotModel") -> PortfolioSnapshot:
         return PortfolioSnapshot(
-            id=UUID(model.id),
-            portfolio_id=UUID(model.portfolio_id),
+            id=model.id,
+            portfolio_id=model.portfolio_id,
             value=model.value,
             observed_at=model.observed_at,
         )
 
+    @staticmethod
+    def transaction_to_domain(model: "TransactionModel") -> Transaction:
+        return Transaction(
+            id=model.id,
+            asset_id=model.asset_id,
+            type=model.type,
+            quantity=model.quantity,
+            unit_price=model.unit_price,
+            currency=model.currency,
+            occurred_at=model.occurred_at,
+        )
+
+    # ------------------------------------------------------------------
+    # Row → Read model (projection queries)
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def portfolio_summary_to_domain(row: Any) -> PortfolioSummary:
+        """Map a grouped (portfolio columns, asset_count, total_cents) row."""
+        return PortfolioSummary(
+            id=row.id,
+            name=row.name,
+            base_currency=row.base_currency,
+            asset_count=row.asset_count,
+            total_value=from_cents(int(row.total_cents or 0)),
+            created_at=row.created_at,
+            updated_at=row.updated_at,
+        )
+
+    @staticmethod
+    def series_point_to_domain(row: Any) -> SeriesPoint:
+        """Map a bucketed (period_start, open, high, low, close, total_cents, count) row."""
+        period_start = row.period_start
+        if isinstance(period_start, str):
+            # SQLite returns the truncated timestamp as text
+            period_start = datetime.fromisoformat(period_start)
+        return SeriesPoint(
+            period_start=period_start.replace(tzinfo=timezone.utc),
+            open=row.open,
+            high=row.high,
+            low=row.low,
+            close=row.close,
+            average=(from_cents(int(row.total_cents)) / row.count).quantize(Decimal("0.01")),
+            count=row.count,
+        )
+
     # ------------------------------------------------------------------
     # Domain → ORM (for save operations)
     # ------------------------------------------------------------------
@@ -190,7 +314,7 @@ class PersistenceMapper:
             id=str(entity.id),
             asset_id=str(entity.asset_id),
             value=entity.value,
-            observed_at=entity.observed_at,
+            observed_at=to_utc(entity.observed_at),
         )
 
     @staticmethod
@@ -202,3 +326,28 @@ class PersistenceMapper:
             value=entity.value,
             observed_at=entity.observed_at,
         )
+
+    # ------------------------------------------------------------------
+    # Domain → Core rows (bulk executemany inserts)
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def asset_snapshot_to_row(entity: AssetSnapshot) -> dict:
+        return {
+            "id": str(entity.id),
+            "asset_id": str(entity.asset_id),
+            "value": entity.value,
+            "observed_at": to_utc(entity.observed_at),
+        }
+
+    @staticmethod
+    def transaction_to_row(entity: Transaction) -> dict:
+        return {
+            "id": str(entity.id),
+            "asset_id": str(entity.asset_id),
+            "type": entity.type,
+            "quantity": entity.quantity,
+            "unit_price": entity.unit_price,
+            "currency": entity.currency,
+            "occurred_at": entity.occurred_at,
+        }
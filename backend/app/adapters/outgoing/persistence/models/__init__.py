@@ -17,6 +17,7 @@ from .tag import TagModel
 from .asset import AssetModel
 from .transaction import TransactionModel
 from .asset_snapshot import AssetSnapshotModel
+from .asset_latest_value import AssetLatestValueModel
 from .portfolio_snapshot import PortfolioSnapshotModel
 
 __all__ = [
@@ -28,6 +29,7 @@ __all__ = [
     "AssetModel",
     "TransactionModel",
     "AssetSnapshotModel",
+    "AssetLatestValueModel",
     "PortfolioSnapshotModel",
     "asset_category",
     "asset_tag",
@@ -2,17 +2,18 @@
 Asset SQLAlchemy Model
 """
 from decimal import Decimal
-from sqlalchemy import String, ForeignKey, Boolean, Numeric
+from sqlalchemy import String, ForeignKey, Boolean, Numeric, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing import Optional, TYPE_CHECKING
 
-from .base import Base, TimestampMixin, AuditMixin, generate_uuid
+from .base import Base, GUID, TimestampMixin, AuditMixin, generate_uuid
 
 if TYPE_CHECKING:
     from .portfolio import PortfolioModel
     from .asset_type import AssetTypeModel
     from .transaction import TransactionModel
     from .asset_snapshot import AssetSnapshotModel
+    from .asset_latest_value import AssetLatestValueModel
     from .category import CategoryModel
     from .tag import TagModel
 
@@ -22,22 +23,27 @@ class AssetModel(Base, TimestampMixin, AuditMixin):
     Asset - anything you own (stocks, real estate, LEGO, clothes, etc.)
     """
     __tablename__ = "assets"  # The table name remains 'assets'
+    __table_args__ = (
+        # Keyset pagination of asset listings by (name, id)
+        Index("ix_assets_name_id", "name", "id"),
+        # Also serves every lookup of a portfolio's assets
+        Index("ix_assets_portfolio_id_name_id", "portfolio_id", "name", "id"),
+    )
 
     id: Mapped[str] = mapped_column(
-        String(36),
+        GUID,
         primary_key=True,
         default=generate_uuid
     )
 
     portfolio_id: Mapped[str] = mapped_column(
-        String(36),
+        GUID,
         ForeignKey("portfolios.id"),
-        nullable=False,
-        index=True
+        nullable=False
     )
 
     asset_type_id: Mapped[str] = mapped_column(
-        String(36),
+        GUID,
         ForeignKey("asset_types.id"),
         nullable=False,
         index=True
@@ -78,11 +84,18 @@ class AssetModel(Base, TimestampMixin, AuditMixin):
         order_by="TransactionModel.occurred_at.desc()"
     )
 
+    # Unordered: SnapshotTimeline sorts on the way into the domain, so bulk
+    # loads of many assets' snapshots need no database sort
     snapshots: Mapped[list["AssetSnapshotModel"]] = relationship(
         "AssetSnapshotModel",
         back_populates="asset",
+        cascade="all, delete-orphan"
+    )
+
+    latest_value: Mapped[Optional["AssetLatestValueModel"]] = relationship(
+        "AssetLatestValueModel",
         cascade="all, delete-orphan",
-        order_by="AssetSnapshotModel.observed_at.desc()"
+        uselist=False
     )
 
     categories: Mapped[list["CategoryModel"]] = relationship(
@@ -1,9 +1,9 @@
 """
 Asset-Category Association Table (Many-to-Many)
 """
-from sqlalchemy import Table, Column, String, ForeignKey
+from sqlalchemy import Table, Column, ForeignKey, Index
 
-from .base import Base
+from .base import Base, GUID
 
 
 # Asset <-> Category (Many-to-Many)
@@ -12,14 +12,16 @@ asset_category = Table(
     Base.metadata,
     Column(
         "asset_id",
-        String(36),
+        GUID,
         ForeignKey("assets.id", ondelete="CASCADE"),
         primary_key=True
     ),
     Column(
         "category_id",
-        String(36),
+        GUID,
         ForeignKey("categories.id", ondelete="CASCADE"),
         primary_key=True
-    )
+    ),
+    # The primary key leads with asset_id; this serves lookups by category
+    Index("ix_asset_categories_category_id_asset_id", "category_id", "asset_id"),
 )
\ No newline at end of file
@@ -0,0 +1,42 @@
+"""
+AssetLatestValue SQLAlchemy Model
+"""
+from datetime import datetime
+from decimal import Decimal
+from sqlalchemy import ForeignKey, Numeric, DateTime
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base, GUID
+
+
+class AssetLatestValueModel(Base):
+    """
+    Asset Latest Value - denormalized copy of each asset's newest snapshot.
+    Maintained by the asset snapshot repository on every write so valuations
+    read one row per asset instead of scanning snapshot history.
+    """
+    __tablename__ = "asset_latest_values"
+
+    asset_id: Mapped[str] = mapped_column(
+        GUID,
+        ForeignKey("assets.id", ondelete="CASCADE"),
+        primary_key=True
+    )
+
+    snapshot_id: Mapped[str] = mapped_column(
+        GUID,
+        nullable=False
+    )
+
+    value: Mapped[Decimal] = mapped_column(
+        Numeric(20, 2),
+        nullable=False
+    )
+
+    observed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False
+    )
+
+    def __repr__(self) -> str:
+        return f"<AssetLatestValueModel(asset_id={self.asset_id}, value={self.value})>"
@@ -3,11 +3,11 @@ AssetSnapshot SQLAlchemy Model
 """
 from datetime import datetime
 from decimal import Decimal
-from sqlalchemy import String, ForeignKey, Numeric, DateTime
+from sqlalchemy import ForeignKey, Numeric, DateTime, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing import TYPE_CHECKING
 
-from .base import Base, generate_uuid
+from .base import Base, GUID, generate_uuid
 
 if TYPE_CHECKING:
     from .asset import AssetModel
@@ -18,18 +18,23 @@ class AssetSnapshotModel(Base):
     Asset Snapshot - manually entered value of an asset at a point in time
     """
     __tablename__ = "asset_snapshots"
+    __table_args__ = (
+        # An asset's history in (observed_at, id) order, either way: keyset
+        # pages, ranges and latest-value lookups. Covering (value included),
+        # so history reads never visit the table.
+        Index("ix_asset_snapshots_asset_id_observed_at_id_value", "asset_id", "observed_at", "id", "value"),
+    )
 
     id: Mapped[str] = mapped_column(
-        String(36),
+        GUID,
         primary_key=True,
         default=generate_uuid
     )
 
     asset_id: Mapped[str] = mapped_column(
-        String(36),
+        GUID,
         ForeignKey("assets.id"),
-        nullable=False,
-        index=True
+        nullable=False
     )
 
     value: Mapped[Decimal] = mapped_column(
@@ -39,8 +44,7 @@ class AssetSnapshotModel(Base):
 
     observed_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        nullable=False,
-        index=True
+        nullable=False
     )
 
     # Relationships
@@ -1,9 +1,9 @@
 """
 Asset-Tag Association Table (Many-to-Many)
 """
-from sqlalchemy import Table, Column, String, ForeignKey
+from sqlalchemy import Table, Column, ForeignKey, Index
 
-from .base import Base
+from .base import Base, GUID
 
 
 # Asset <-> Tag (Many-to-Many)
@@ -12,14 +12,16 @@ asset_tag = Table(
     Base.metadata,
     Column(
         "asset_id",
-        String(36),
+        GUID,
         ForeignKey("assets.id", ondelete="CASCADE"),
         primary_key=True
     ),
     Column(
         "tag_id",
-        String(36),
+        GUID,
         ForeignKey("tags.id", ondelete="CASCADE"),
         primary_key=True
-    )
+    ),
+    # The primary key leads with asset_id; this serves lookups by tag
+    Index("ix_asset_tags_tag_id_asset_id", "tag_id", "asset_id"),
 )
\ No newline at end of file
@@ -5,7 +5,7 @@ from sqlalchemy import String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing import TYPE_CHECKING
 
-from .base import Base, TimestampMixin, generate_uuid
+from .base import Base, GUID, TimestampMixin, generate_uuid
 
 if TYPE_CHECKING:
     from .asset import AssetModel
@@ -19,7 +19,7 @@ class AssetTypeModel(Base, TimestampMixin):
     __tablename__ = "asset_types"
 
     id: Mapped[str] = mapped_column(
-        String(36),
+        GUID,
         primary_key=True,
         default=generate_uuid
     )
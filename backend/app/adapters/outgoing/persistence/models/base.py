@@ -4,12 +4,18 @@ SQLAlchemy declarative base and common utilities
 from datetime import datetime, timezone
 from uuid import uuid4
 from sqlalchemy import DateTime, String
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.orm import Mapped, mapped_column
 
 # ✅ Import Base from database.py instead of creating a new one
 from ..database import Base
 
 
+# Primary and foreign keys: native UUID on PostgreSQL, String(36) elsewhere.
+# Values are canonical UUID strings on every dialect.
+GUID = String(36).with_variant(postgresql.UUID(as_uuid=False), "postgresql")
+
+
 def utc_now() -> datetime:
     """Return current UTC time (timezone-aware)"""
     return datetime.now(timezone.utc)
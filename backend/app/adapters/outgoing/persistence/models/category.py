@@ -5,7 +5,7 @@ from sqlalchemy import String, ForeignKey
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing import Optional, TYPE_CHECKING
 
-from .base import Base, generate_uuid
+from .base import Base, GUID, generate_uuid
 
 if TYPE_CHECKING:
     from .asset import AssetModel
@@ -19,7 +19,7 @@ class CategoryModel(Base):
     __tablename__ = "categories"
 
     id: Mapped[str] = mapped_column(
-        String(36),
+        GUID,
         primary_key=True,
         default=generate_uuid
     )
@@ -32,9 +32,10 @@ class CategoryModel(Base):
     )
 
     parent_id: Mapped[Optional[str]] = mapped_column(
-        String(36),
+        GUID,
         ForeignKey("categories.id"),
-        nullable=True
+        nullable=True,
+        index=True
     )
 
     # Relationships
@@ -5,7 +5,7 @@ from sqlalchemy import String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing import TYPE_CHECKING
 
-from .base import Base, TimestampMixin, generate_uuid
+from .base import Base, GUID, TimestampMixin, generate_uuid
 
 if TYPE_CHECKING:
     from .asset import AssetModel
@@ -19,14 +19,15 @@ class PortfolioModel(Base, TimestampMixin):
     __tablename__ = "portfolios"
 
     id: Mapped[str] = mapped_column(
-        String(36),
+        GUID,
         primary_key=True,
         default=generate_uuid
     )
 
     name: Mapped[str] = mapped_column(
         String(255),
-        nullable=False
+        nullable=False,
+        index=True
     )
 
     base_currency: Mapped[str] = mapped_column(
@@ -3,11 +3,11 @@ PortfolioSnapshot SQLAlchemy Model
 """
 from datetime import datetime
 from decimal import Decimal
-from sqlalchemy import String, ForeignKey, Numeric, DateTime
+from sqlalchemy import ForeignKey, Numeric, DateTime, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing import TYPE_CHECKING
 
-from .base import Base, generate_uuid
+from .base import Base, GUID, generate_uuid
 
 if TYPE_CHECKING:
     from .portfolio import PortfolioModel
@@ -18,18 +18,23 @@ class PortfolioSnapshotModel(Base):
     Portfolio Snapshot - auto-calculated total value of all assets at a point in time
     """
     __tablename__ = "portfolio_snapshots"
+    __table_args__ = (
+        # A portfolio's history in (observed_at, id) order, either way; covering
+        Index(
+            "ix_portfolio_snapshots_portfolio_id_observed_at_id_value", "portfolio_id", "observed_at", "id", "value"
+        ),
+    )
 
     id: Mapped[str] = mapped_column(
-        String(36),
+        GUID,
         primary_key=True,
         default=generate_uuid
     )
 
     portfolio_id: Mapped[str] = mapped_column(
-        String(36),
+        GUID,
         ForeignKey("portfolios.id"),
-        nullable=False,
-        index=True
+        nullable=False
     )
 
     value: Mapped[Decimal] = mapped_column(
@@ -39,8 +44,7 @@ class PortfolioSnapshotModel(Base):
 
     observed_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        nullable=False,
-        index=True
+        nullable=False
     )
 
     # Relationships
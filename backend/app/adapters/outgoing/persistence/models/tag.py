@@ -5,7 +5,7 @@ from sqlalchemy import String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing import TYPE_CHECKING
 
-from .base import Base, generate_uuid
+from .base import Base, GUID, generate_uuid
 
 if TYPE_CHECKING:
     from .asset import AssetModel
@@ -19,7 +19,7 @@ class TagModel(Base):
     __tablename__ = "tags"
 
     id: Mapped[str] = mapped_column(
-        String(36),
+        GUID,
         primary_key=True,
         default=generate_uuid
     )
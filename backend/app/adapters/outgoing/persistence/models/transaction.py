@@ -4,12 +4,11 @@ Transaction SQLAlchemy Model
 from datetime import datetime
 from decimal import Decimal
 
-from annotated_types import Timezone
-from sqlalchemy import String, ForeignKey, Numeric, DateTime
+from sqlalchemy import String, ForeignKey, Numeric, DateTime, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing import TYPE_CHECKING
 
-from .base import Base, generate_uuid
+from .base import Base, GUID, generate_uuid
 
 if TYPE_CHECKING:
     from .asset import AssetModel
@@ -21,18 +20,21 @@ class TransactionModel(Base):
     Types: ACQUIRE, DISPOSE, ADJUST
     """
     __tablename__ = "transactions"
+    __table_args__ = (
+        # An asset's transactions in (occurred_at, id) order, either way
+        Index("ix_transactions_asset_id_occurred_at_id", "asset_id", "occurred_at", "id"),
+    )
 
     id: Mapped[str] = mapped_column(
-        String(36),
+        GUID,
         primary_key=True,
         default=generate_uuid
     )
 
     asset_id: Mapped[str] = mapped_column(
-        String(36),
+        GUID,
         ForeignKey("assets.id"),
-        nullable=False,
-        index=True
+        nullable=False
     )
 
     type: Mapped[str] = mapped_column(
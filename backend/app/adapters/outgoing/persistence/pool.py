@@ -0,0 +1,51 @@
+"""
+Connection pool settings for server databases (PostgreSQL).
+
+SQLite connections are local files and keep their own profile (see
+persistence/sqlite.py); a database server is reached over the network
+through a QueuePool sized here. Connections are pinged on checkout, so one
+dropped by the server or a proxy is replaced instead of failing the request,
+and recycled after `pool_recycle` seconds, before server-side idle timeouts.
+
+Every setting can be overridden from the environment (DB_POOL_SIZE,
+DB_MAX_OVERFLOW, DB_POOL_TIMEOUT, DB_POOL_RECYCLE, DB_POOL_PRE_PING).
+"""
+import os
+
+from pydantic import BaseModel
+
+# Field name -> environment variable overriding it
+_ENV_OVERRIDES = {
+    "pool_size": "DB_POOL_SIZE",
+    "max_overflow": "DB_MAX_OVERFLOW",
+    "pool_timeout": "DB_POOL_TIMEOUT",
+    "pool_recycle": "DB_POOL_RECYCLE",
+    "pool_pre_ping": "DB_POOL_PRE_PING",
+}
+
+
+class PoolSettings(BaseModel):
+    # Connections kept open per process
+    pool_size: int = 10
+    # Extra connections opened under load, closed once returned
+    max_overflow: int = 20
+    # Seconds a request waits for a connection before failing
+    pool_timeout: float = 30.0
+    # Seconds after which a connection is replaced (-1 to never recycle)
+    pool_recycle: int = 1_800
+    pool_pre_ping: bool = True
+
+    @classmethod
+    def from_env(cls) -> "PoolSettings":
+        """
+        Build the settings from the environment.
+
+        Raises:
+            ValueError: If an override is invalid
+        """
+        overrides = {field: os.environ[var] for field, var in _ENV_OVERRIDES.items() if var in os.environ}
+        return cls.model_validate(overrides)
+
+    def engine_options(self) -> dict:
+        """Keyword arguments for create_engine / create_async_engine."""
+        return self.model_dump()
@@ -0,0 +1,78 @@
+"""
+Per-request SQL statement statistics.
+
+instrument_engine() hooks the cursor events of an engine. Every statement
+it executes is counted and timed in each QueryStats tracked in the current
+context (see track_queries()). With DEBUG=1 the API tracks every request
+and reports the figures in response headers. Tests track a block of code to
+bound the statements an endpoint or repository call runs.
+
+The same statement text executed again and again within one block is the
+signature of an N+1 load: a lazy relationship fetched row by row, with new
+parameters but the same SQL each time. QueryStats.repeated() lists those.
+
+The tracked stats live in a context variable: the thread pool runs the
+request in a copy of the context, which still holds the same QueryStats
+objects, and the async drivers run their cursors in the request's context.
+"""
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, Tuple
+
+from sqlalchemy import Engine, event
+
+# A statement run this many times in one block is reported as repeated
+REPEATED_THRESHOLD = 3
+
+_tracked: ContextVar[Tuple["QueryStats", ...]] = ContextVar("tracked_query_stats", default=())
+
+
+class QueryStats:
+    """Statements executed while tracked, with their total database time."""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.statements: Counter = Counter()
+
+    def record(self, statement: str, duration: float) -> None:
+        self.count += 1
+        self.duration += duration
+        self.statements[statement] += 1
+
+    def repeated(self, threshold: int = REPEATED_THRESHOLD) -> Dict[str, int]:
+        """Statements executed at least `threshold` times, most frequent first."""
+        return {statement: n for statement, n in self.statements.most_common() if n >= threshold}
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """Collect the statements of instrumented engines executed within the block, nested blocks included."""
+    stats = QueryStats()
+    token = _tracked.set(_tracked.get() + (stats,))
+    try:
+        yield stats
+    finally:
+        _tracked.reset(token)
+
+
+def instrument_engine(engine: Engine) -> Engine:
+    """Record every statement of `engine` in the stats tracked when it runs."""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _start(conn, cursor, statement, parameters, context, executemany):
+        # Kept on the execution context: a statement that fails leaves nothing behind
+        context._query_stats_started = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        tracked = _tracked.get()
+        if not tracked:
+            return
+        duration = time.perf_counter() - context._query_stats_started
+        for stats in tracked:
+            stats.record(statement, duration)
+
+    return engine
@@ -14,6 +14,7 @@ from .sqlalchemy_portfolio_snapshot_repository import SQLAlchemyPortfolioSnapsho
 from .sqlalchemy_asset_snapshot_repository import SQLAlchemyAssetSnapshotRepository
 from .sqlalchemy_transaction_repository import SQLAlchemyTransactionRepository
 from .sqlalchemy_tag_repository import SQLAlchemyTagRepository
+from .sqlalchemy_unit_of_work import SQLAlchemyUnitOfWork
 
 __all__ = [
     "SQLAlchemyPortfolioRepository",
@@ -24,4 +25,5 @@ __all__ = [
     "SQLAlchemyAssetSnapshotRepository",
     "SQLAlchemyTransactionRepository",
     "SQLAlchemyTagRepository",
+    "SQLAlchemyUnitOfWork",
 ]
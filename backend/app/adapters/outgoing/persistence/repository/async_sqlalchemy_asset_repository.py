@@ -0,0 +1,38 @@
+"""
+Async SQLAlchemy Asset Repository Implementation (API_STACK=async)
+"""
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, selectinload
+
+from app.domain.entities.asset import Asset
+from app.domain.ports.repository.async_asset_repository import IAsyncAssetRepository
+from app.adapters.outgoing.persistence.models import AssetModel, CategoryModel
+from app.adapters.outgoing.persistence.mappers.persistence_mapper import PersistenceMapper
+
+
+def full_asset_select(asset_id: str):
+    """
+    An asset with everything PersistenceMapper.asset_to_domain reads. Lazy
+    loads cannot run on an AsyncSession, so category chains are loaded to
+    their root here rather than one parent at a time on access.
+    """
+    return select(AssetModel).options(
+        joinedload(AssetModel.portfolio),
+        joinedload(AssetModel.asset_type),
+        selectinload(AssetModel.tags),
+        selectinload(AssetModel.categories).selectinload(CategoryModel.parent, recursion_depth=-1),
+    ).where(AssetModel.id == asset_id)
+
+
+class AsyncSQLAlchemyAssetRepository(IAsyncAssetRepository):
+    """SQLAlchemy implementation of IAsyncAssetRepository, on an AsyncSession."""
+
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def find_by_id(self, entity_id: str) -> Optional[Asset]:
+        orm_obj = (await self._session.scalars(full_asset_select(str(entity_id)))).first()
+        return PersistenceMapper.asset_to_domain(orm_obj) if orm_obj else None
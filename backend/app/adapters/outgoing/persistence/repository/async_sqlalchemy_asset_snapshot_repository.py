@@ -0,0 +1,58 @@
+"""
+Async SQLAlchemy AssetSnapshot Repository Implementation (API_STACK=async)
+
+Statements are shared with SQLAlchemyAssetSnapshotRepository, so both stacks
+page snapshots and maintain latest values the same way.
+"""
+from datetime import datetime
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.entities.asset_snapshot import AssetSnapshot
+from app.domain.ports.repository.async_asset_snapshot_repository import IAsyncAssetSnapshotRepository
+from app.adapters.outgoing.persistence.models import AssetLatestValueModel, AssetSnapshotModel
+from app.adapters.outgoing.persistence.mappers.persistence_mapper import PersistenceMapper
+from app.adapters.outgoing.persistence.repository.sqlalchemy_asset_snapshot_repository import (
+    ADVANCE_LATEST_VALUE,
+    latest_value_params,
+    latest_value_row,
+    page_select,
+)
+
+
+class AsyncSQLAlchemyAssetSnapshotRepository(IAsyncAssetSnapshotRepository):
+    """SQLAlchemy implementation of IAsyncAssetSnapshotRepository, on an AsyncSession."""
+
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def add(self, snapshot: AssetSnapshot) -> AssetSnapshot:
+        row = PersistenceMapper.asset_snapshot_to_row(snapshot)
+        await self._session.execute(insert(AssetSnapshotModel), [row])
+        await self._advance_latest_value(row)
+        return snapshot
+
+    async def _advance_latest_value(self, row: dict) -> None:
+        """Point the asset's latest value at a freshly inserted snapshot row, unless a newer one is recorded."""
+        recorded = await self._session.scalar(
+            select(AssetLatestValueModel.asset_id).where(AssetLatestValueModel.asset_id == row["asset_id"])
+        )
+        if recorded is None:
+            await self._session.execute(insert(AssetLatestValueModel), [latest_value_row(row)])
+        else:
+            connection = await self._session.connection()
+            await connection.execute(ADVANCE_LATEST_VALUE, [latest_value_params(row)])
+
+    async def get_snapshots_page(
+        self,
+        asset_id: UUID,
+        limit: int,
+        after: Optional[Tuple[datetime, str]] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> List[AssetSnapshot]:
+        rows = await self._session.execute(page_select(asset_id, limit, after, start_date, end_date))
+        return [PersistenceMapper.asset_snapshot_to_domain(r) for r in rows]
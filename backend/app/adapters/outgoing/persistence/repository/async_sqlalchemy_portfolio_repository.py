@@ -0,0 +1,22 @@
+"""
+Async SQLAlchemy Portfolio Repository Implementation (API_STACK=async)
+"""
+from typing import List
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.entities.portfolio_summary import PortfolioSummary
+from app.domain.ports.repository.async_portfolio_repository import IAsyncPortfolioRepository
+from app.adapters.outgoing.persistence.mappers.persistence_mapper import PersistenceMapper
+from app.adapters.outgoing.persistence.repository.sqlalchemy_portfolio_repository import all_summaries_select
+
+
+class AsyncSQLAlchemyPortfolioRepository(IAsyncPortfolioRepository):
+    """SQLAlchemy implementation of IAsyncPortfolioRepository, on an AsyncSession."""
+
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def find_all_summaries(self) -> List[PortfolioSummary]:
+        rows = await self._session.execute(all_summaries_select())
+        return [PersistenceMapper.portfolio_summary_to_domain(r) for r in rows]
@@ -0,0 +1,19 @@
+"""
+Async SQLAlchemy Unit of Work Implementation (API_STACK=async)
+"""
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.ports.repository.async_unit_of_work import IAsyncUnitOfWork
+
+
+class AsyncSQLAlchemyUnitOfWork(IAsyncUnitOfWork):
+    """Commits or rolls back the AsyncSession its use case's async repositories share."""
+
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def commit(self) -> None:
+        await self._session.commit()
+
+    async def rollback(self) -> None:
+        await self._session.rollback()
@@ -2,14 +2,24 @@
 SQLAlchemy Asset Repository Implementation
 """
 from datetime import datetime
-from typing import Optional, List
-from sqlalchemy.orm import Session, joinedload, subqueryload
+from typing import Dict, Iterable, Optional, List, Set, Tuple
+from sqlalchemy import select, tuple_
+from sqlalchemy.orm import Session, contains_eager, joinedload, selectinload, subqueryload
 
 from app.domain.entities.asset import Asset
+from app.domain.entities.asset_summary import AssetSummary
 from app.domain.ports.repository.asset_repository import IAssetRepository
 from app.adapters.outgoing.persistence.models.asset import AssetModel
-from app.adapters.outgoing.persistence.models import CategoryModel, TagModel
+from app.adapters.outgoing.persistence.models import (
+    AssetTypeModel,
+    CategoryModel,
+    PortfolioModel,
+    TagModel,
+    asset_category,
+    asset_tag,
+)
 from app.adapters.outgoing.persistence.mappers.persistence_mapper import PersistenceMapper
+from app.adapters.outgoing.persistence.utils.utils import chunked
 
 
 class SQLAlchemyAssetRepository(IAssetRepository):
@@ -20,11 +30,14 @@ class SQLAlchemyAssetRepository(IAssetRepository):
 
     def _load_full(self, asset_id: str) -> Optional[AssetModel]:
         """Load an AssetModel with all required eager relationships."""
+        # Collections are selectin-loaded: joined into a first() query they turn it
+        # into a LIMIT subquery that SQLite outer-joins against the whole
+        # association table
         return self._session.query(AssetModel).options(
             joinedload(AssetModel.portfolio),
             joinedload(AssetModel.asset_type),
-            joinedload(AssetModel.tags),
-            joinedload(AssetModel.categories).joinedload(CategoryModel.parent),
+            selectinload(AssetModel.tags),
+            selectinload(AssetModel.categories).joinedload(CategoryModel.parent),
         ).filter(AssetModel.id == str(asset_id)).first()
 
     def save(self, entity: Asset) -> Asset:
@@ -54,7 +67,7 @@ class SQLAlchemyAssetRepository(IAssetRepository):
             subqueryload(AssetModel.tags),
             subqueryload(AssetModel.categories).joinedload(CategoryModel.parent),
         ).all()
-        return [PersistenceMapper.asset_to_domain(r) for r in rows]
+        return PersistenceMapper.assets_to_domain(rows)
 
     def delete(self, entity_id: str) -> bool:
         orm_obj = self._session.query(AssetModel).filter(
@@ -72,6 +85,104 @@ class SQLAlchemyAssetRepository(IAssetRepository):
             self._session.query(AssetModel).filter(AssetModel.id == entity_id).exists()
         ).scalar()
 
+    def find_page(
+        self,
+        limit: int,
+        after: Optional[Tuple[str, str]] = None,
+        portfolio_id: Optional[str] = None,
+    ) -> List[Asset]:
+        # selectinload keeps the collections out of the LIMITed query
+        query = self._session.query(AssetModel).options(
+            joinedload(AssetModel.portfolio),
+            joinedload(AssetModel.asset_type),
+            selectinload(AssetModel.tags),
+            selectinload(AssetModel.categories).joinedload(CategoryModel.parent),
+        )
+        if portfolio_id:
+            query = query.filter(AssetModel.portfolio_id == str(portfolio_id))
+        if after:
+            query = query.filter(tuple_(AssetModel.name, AssetModel.id) > tuple(after))
+        rows = query.order_by(AssetModel.name, AssetModel.id).limit(limit).all()
+        return PersistenceMapper.assets_to_domain(rows)
+
+    def find_summary_page(
+        self,
+        limit: int,
+        after: Optional[Tuple[str, str]] = None,
+        portfolio_id: Optional[str] = None,
+    ) -> List[AssetSummary]:
+        # Query side of find_page: plain column selects, rows become the
+        # response dicts directly, with no ORM identity map or domain graph
+        query = select(
+            AssetModel.id,
+            AssetModel.name,
+            AssetModel.disposed,
+            AssetModel.quantity,
+            AssetModel.created_at,
+            AssetModel.updated_at,
+            AssetTypeModel.code,
+            AssetTypeModel.label,
+            PortfolioModel.id,
+            PortfolioModel.name,
+        ).join(
+            AssetTypeModel, AssetTypeModel.id == AssetModel.asset_type_id
+        ).join(
+            PortfolioModel, PortfolioModel.id == AssetModel.portfolio_id
+        )
+        if portfolio_id:
+            query = query.where(AssetModel.portfolio_id == str(portfolio_id))
+        if after:
+            query = query.where(tuple_(AssetModel.name, AssetModel.id) > tuple(after))
+        query = query.order_by(AssetModel.name, AssetModel.id).limit(limit)
+
+        summaries: Dict[str, AssetSummary] = {}
+        for (asset_id, name, disposed, quantity, created_at, updated_at,
+             type_code, type_label, portfolio_id, portfolio_name) in self._session.execute(query):
+            summaries[asset_id] = {
+                "id": asset_id,
+                "name": name,
+                "disposed": disposed,
+                "quantity": quantity,
+                "created_at": created_at,
+                "updated_at": updated_at,
+                "asset_type": {"code": type_code, "label": type_label},
+                "portfolio": {"id": portfolio_id, "name": portfolio_name},
+                "tags": [],
+                "categories": [],
+            }
+        for chunk in chunked(summaries):
+            tags = select(asset_tag.c.asset_id, TagModel.id, TagModel.name).join(
+                TagModel, TagModel.id == asset_tag.c.tag_id
+            ).where(asset_tag.c.asset_id.in_(chunk)).order_by(TagModel.name, TagModel.id)
+            for asset_id, tag_id, name in self._session.execute(tags):
+                summaries[asset_id]["tags"].append({"id": tag_id, "name": name})
+            categories = select(
+                asset_category.c.asset_id, CategoryModel.id, CategoryModel.name, CategoryModel.parent_id
+            ).join(
+                CategoryModel, CategoryModel.id == asset_category.c.category_id
+            ).where(asset_category.c.asset_id.in_(chunk)).order_by(CategoryModel.name, CategoryModel.id)
+            for asset_id, category_id, name, parent_id in self._session.execute(categories):
+                summaries[asset_id]["categories"].append({"id": category_id, "name": name, "parent_id": parent_id})
+        return list(summaries.values())
+
+    def find_existing_ids(self, asset_ids: Iterable[str]) -> Set[str]:
+        existing = set()
+        for chunk in chunked({str(a) for a in asset_ids}):
+            existing.update(
+                row.id for row in self._session.query(AssetModel.id).filter(AssetModel.id.in_(chunk))
+            )
+        return existing
+
+    def find_ids_by_names(self, names: Iterable[str], portfolio_id: Optional[str] = None) -> Dict[str, List[str]]:
+        found: Dict[str, List[str]] = {}
+        for chunk in chunked(set(names)):
+            query = self._session.query(AssetModel.name, AssetModel.id).filter(AssetModel.name.in_(chunk))
+            if portfolio_id:
+                query = query.filter(AssetModel.portfolio_id == str(portfolio_id))
+            for row in query.order_by(AssetModel.id):
+                found.setdefault(row.name, []).append(row.id)
+        return found
+
     def find_by_portfolio(self, portfolio_id: str) -> List[Asset]:
         rows = self._session.query(AssetModel).options(
             joinedload(AssetModel.portfolio),
@@ -79,48 +190,59 @@ class SQLAlchemyAssetRepository(IAssetRepository):
             subqueryload(AssetModel.tags),
             subqueryload(AssetModel.categories).joinedload(CategoryModel.parent),
         ).filter(AssetModel.portfolio_id == str(portfolio_id)).all()
-        return [PersistenceMapper.asset_to_domain(r) for r in rows]
+        return PersistenceMapper.assets_to_domain(rows)
 
     def find_by_type(self, asset_type_code: str) -> List[Asset]:
-        rows = self._session.query(AssetModel).options(
+        # Join rather than .has(): a correlated EXISTS is checked per asset row
+        rows = self._session.query(AssetModel).join(AssetModel.asset_type).options(
             joinedload(AssetModel.portfolio),
-            joinedload(AssetModel.asset_type),
-        ).filter(AssetModel.asset_type.has(code=asset_type_code)).all()
-        return [PersistenceMapper.asset_to_domain(r) for r in rows]
+            contains_eager(AssetModel.asset_type),
+            subqueryload(AssetModel.tags),
+            subqueryload(AssetModel.categories).joinedload(CategoryModel.parent),
+        ).filter(AssetTypeModel.code == asset_type_code).all()
+        return PersistenceMapper.assets_to_domain(rows)
 
     def find_by_category(self, category_id: str) -> List[Asset]:
         rows = self._session.query(AssetModel).options(
             joinedload(AssetModel.portfolio),
             joinedload(AssetModel.asset_type),
+            subqueryload(AssetModel.tags),
+            subqueryload(AssetModel.categories).joinedload(CategoryModel.parent),
         ).join(AssetModel.categories).filter(CategoryModel.id == str(category_id)).all()
-        return [PersistenceMapper.asset_to_domain(r) for r in rows]
+        return PersistenceMapper.assets_to_domain(rows)
 
     def find_by_tag(self, tag_id: str) -> List[Asset]:
         rows = self._session.query(AssetModel).options(
             joinedload(AssetModel.portfolio),
             joinedload(AssetModel.asset_type),
+            subqueryload(AssetModel.tags),
+            subqueryload(AssetModel.categories).joinedload(CategoryModel.parent),
         ).join(AssetModel.tags).filter(TagModel.id == str(tag_id)).all()
-        return [PersistenceMapper.asset_to_domain(r) for r in rows]
+        return PersistenceMapper.assets_to_domain(rows)
 
     def find_active(self, portfolio_id: str) -> List[Asset]:
         rows = self._session.query(AssetModel).options(
             joinedload(AssetModel.portfolio),
             joinedload(AssetModel.asset_type),
+            subqueryload(AssetModel.tags),
+            subqueryload(AssetModel.categories).joinedload(CategoryModel.parent),
         ).filter(
             AssetModel.portfolio_id == str(portfolio_id),
             AssetModel.disposed == False,
         ).all()
-        return [PersistenceMapper.asset_to_domain(r) for r in rows]
+        return PersistenceMapper.assets_to_domain(rows)
 
     def find_disposed(self, portfolio_id: str) -> List[Asset]:
         rows = self._session.query(AssetModel).options(
             joinedload(AssetModel.portfolio),
             joinedload(AssetModel.asset_type),
+            subqueryload(AssetModel.tags),
+            subqueryload(AssetModel.categories).joinedload(CategoryModel.parent),
         ).filter(
             AssetModel.portfolio_id == str(portfolio_id),
             AssetModel.disposed == True,
         ).all()
-        return [PersistenceMapper.asset_to_domain(r) for r in rows]
+        return PersistenceMapper.assets_to_domain(rows)
 
     def find_with_snapshots(
         self,
@@ -147,9 +269,10 @@ class SQLAlchemyAssetRepository(IAssetRepository):
         domain_asset = PersistenceMapper.asset_to_domain(orm_obj, load_snapshots=True)
         return domain_asset
 
+    # The association methods select-in load their collection too, see _load_full
     def add_category(self, asset_id: str, category_id: str) -> bool:
         asset = self._session.query(AssetModel).options(
-            joinedload(AssetModel.categories)
+            selectinload(AssetModel.categories)
         ).filter(AssetModel.id == str(asset_id)).first()
         if asset:
             if category_id in {c.id for c in asset.categories}:
@@ -165,7 +288,7 @@ class SQLAlchemyAssetRepository(IAssetRepository):
 
     def remove_category(self, asset_id: str, category_id: str) -> bool:
         asset = self._session.query(AssetModel).options(
-            joinedload(AssetModel.categories)
+            selectinload(AssetModel.categories)
         ).filter(AssetModel.id == str(asset_id)).first()
         if asset:
             cat = next((c for c in asset.categories if c.id == str(category_id)), None)
@@ -177,7 +300,7 @@ class SQLAlchemyAssetRepository(IAssetRepository):
 
     def add_tag(self, asset_id: str, tag_id: str) -> bool:
         asset = self._session.query(AssetModel).options(
-            joinedload(AssetModel.tags)
+            selectinload(AssetModel.tags)
         ).filter(AssetModel.id == str(asset_id)).first()
         if asset:
             if str(tag_id) not in {t.id for t in asset.tags}:
@@ -193,7 +316,7 @@ class SQLAlchemyAssetRepository(IAssetRepository):
 
     def remove_tag(self, asset_id: str, tag_id: str) -> bool:
         asset = self._session.query(AssetModel).options(
-            joinedload(AssetModel.tags)
+            selectinload(AssetModel.tags)
         ).filter(AssetModel.id == str(asset_id)).first()
         if asset:
             tag = next((t for t in asset.tags if t.id == str(tag_id)), None)
@@ -1,14 +1,100 @@
 """
 SQLAlchemy AssetSnapshot Repository Implementation
 """
-from typing import Optional, List
+from datetime import datetime
+from itertools import groupby
+from operator import itemgetter
+from typing import Dict, Iterable, Iterator, Optional, List, Tuple
 from uuid import UUID
+from sqlalchemy import and_, bindparam, delete, func, insert, or_, select, tuple_, update
 from sqlalchemy.orm import Session
 
 from app.domain.entities.asset_snapshot import AssetSnapshot
-from app.domain.ports.repository.asset_snapshot_repository import IAssetSnapshotRepository
-from app.adapters.outgoing.persistence.models import AssetSnapshotModel
+from app.domain.entities.snapshot_series import SnapshotSeries, to_utc
+from app.domain.entities.value_series import SeriesBucket, SeriesPoint
+from app.domain.ports.repository.asset_snapshot_repository import IAssetSnapshotRepository, SnapshotValues
+from app.adapters.outgoing.persistence.models import AssetModel, AssetSnapshotModel, AssetLatestValueModel
 from app.adapters.outgoing.persistence.mappers.persistence_mapper import PersistenceMapper
+from app.adapters.outgoing.persistence.utils.utils import STREAM_BATCH_SIZE, chunked, series_select
+
+
+def _recency(row: dict) -> Tuple[datetime, str]:
+    """Sort key of a snapshot row for latest-value selection (naive times read as UTC)."""
+    return to_utc(row["observed_at"]), row["id"]
+
+
+def newest_per_asset(rows: Iterable[dict]) -> Dict[str, dict]:
+    """The newest of the given snapshot rows of each asset, ties on observed_at broken by snapshot id."""
+    newest = {}
+    for row in rows:
+        current = newest.get(row["asset_id"])
+        if current is None or _recency(row) > _recency(current):
+            newest[row["asset_id"]] = row
+    return newest
+
+
+def latest_value_row(row: dict) -> dict:
+    """AssetLatestValueModel columns pointing at a snapshot row."""
+    return dict(asset_id=row["asset_id"], snapshot_id=row["id"], value=row["value"], observed_at=row["observed_at"])
+
+
+# Conditional UPDATE of an asset's latest value, run as a Core executemany
+# over latest_value_params(): only newer snapshots replace the recorded one
+ADVANCE_LATEST_VALUE = update(AssetLatestValueModel).where(
+    AssetLatestValueModel.asset_id == bindparam("b_asset_id"),
+    or_(
+        AssetLatestValueModel.observed_at < bindparam("b_observed_at"),
+        and_(
+            AssetLatestValueModel.observed_at == bindparam("b_observed_at"),
+            AssetLatestValueModel.snapshot_id < bindparam("b_snapshot_id"),
+        ),
+    ),
+).values(
+    snapshot_id=bindparam("b_snapshot_id"),
+    value=bindparam("b_value"),
+    observed_at=bindparam("b_observed_at"),
+)
+
+
+def latest_value_params(row: dict) -> dict:
+    """ADVANCE_LATEST_VALUE parameters for a snapshot row."""
+    return dict(b_asset_id=row["asset_id"], b_snapshot_id=row["id"], b_value=row["value"], b_observed_at=row["observed_at"])
+
+
+def history_select(
+    asset_id: UUID,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+):
+    """Snapshot columns of an asset within an inclusive date range, oldest first."""
+    query = select(
+        AssetSnapshotModel.id,
+        AssetSnapshotModel.asset_id,
+        AssetSnapshotModel.value,
+        AssetSnapshotModel.observed_at,
+    ).where(AssetSnapshotModel.asset_id == str(asset_id))
+    if start_date:
+        query = query.where(AssetSnapshotModel.observed_at >= start_date)
+    if end_date:
+        query = query.where(AssetSnapshotModel.observed_at <= end_date)
+    return query.order_by(AssetSnapshotModel.observed_at, AssetSnapshotModel.id)
+
+
+def page_select(
+    asset_id: UUID,
+    limit: int,
+    after: Optional[Tuple[datetime, str]] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+):
+    """A page of an asset's snapshots, newest first, like the portfolio's snapshot listing."""
+    key = tuple_(AssetSnapshotModel.observed_at, AssetSnapshotModel.id)
+    query = history_select(asset_id, start_date, end_date).order_by(None).order_by(
+        AssetSnapshotModel.observed_at.desc(), AssetSnapshotModel.id.desc()
+    )
+    if after:
+        query = query.where(key < tuple(after))
+    return query.limit(limit)
 
 
 class SQLAlchemyAssetSnapshotRepository(IAssetSnapshotRepository):
@@ -21,13 +107,89 @@ class SQLAlchemyAssetSnapshotRepository(IAssetSnapshotRepository):
         orm_obj = self._session.get(AssetSnapshotModel, str(entity.id))
         if orm_obj:
             orm_obj.value = entity.value
-            orm_obj.observed_at = entity.observed_at
+            # Stored in UTC, as inserts are: SQLite keeps the wall time and drops the offset
+            orm_obj.observed_at = to_utc(entity.observed_at)
+            self._session.flush()
+            # An edited snapshot may stop (or start) being the newest one
+            self.refresh_latest_values([orm_obj.asset_id])
         else:
             orm_obj = PersistenceMapper.asset_snapshot_to_orm(entity)
             self._session.add(orm_obj)
-        self._session.flush()
+            self._session.flush()
+            self._advance_latest_values([PersistenceMapper.asset_snapshot_to_row(entity)])
         return entity
 
+    def _advance_latest_values(self, rows: List[dict]) -> None:
+        """
+        Point each asset's latest value at the newest of the given freshly
+        inserted snapshot rows, unless a newer one is already recorded
+        (backdated snapshots). Ties on observed_at are broken by snapshot id,
+        matching refresh_latest_values(). Cost is proportional to the batch,
+        not to the assets' history.
+        """
+        newest = newest_per_asset(rows)
+
+        recorded = set()
+        for chunk in chunked(newest):
+            recorded.update(
+                r.asset_id for r in self._session.query(AssetLatestValueModel.asset_id).filter(
+                    AssetLatestValueModel.asset_id.in_(chunk)
+                )
+            )
+
+        missing = [row for asset_id, row in newest.items() if asset_id not in recorded]
+        if missing:
+            self._session.execute(insert(AssetLatestValueModel), [latest_value_row(r) for r in missing])
+        present = [row for asset_id, row in newest.items() if asset_id in recorded]
+        if present:
+            # Core executemany: a conditional UPDATE per asset, in one round trip
+            self._session.connection().execute(ADVANCE_LATEST_VALUE, [latest_value_params(r) for r in present])
+
+    def refresh_latest_values(self, asset_ids: Iterable[str]) -> None:
+        """
+        Recompute the latest value of the given assets from their snapshot
+        history. Used after edits/deletes and by bulk writers that bypass save().
+        """
+        for chunk in chunked(sorted({str(a) for a in asset_ids})):
+            ranked = select(
+                AssetSnapshotModel.asset_id,
+                AssetSnapshotModel.id.label("snapshot_id"),
+                AssetSnapshotModel.value,
+                AssetSnapshotModel.observed_at,
+                func.row_number().over(
+                    partition_by=AssetSnapshotModel.asset_id,
+                    order_by=(AssetSnapshotModel.observed_at.desc(), AssetSnapshotModel.id.desc()),
+                ).label("rank"),
+            ).where(AssetSnapshotModel.asset_id.in_(chunk)).subquery()
+            self._session.execute(
+                delete(AssetLatestValueModel).where(AssetLatestValueModel.asset_id.in_(chunk)),
+                execution_options={"synchronize_session": False},
+            )
+            self._session.execute(
+                insert(AssetLatestValueModel).from_select(
+                    ["asset_id", "snapshot_id", "value", "observed_at"],
+                    select(ranked.c.asset_id, ranked.c.snapshot_id, ranked.c.value, ranked.c.observed_at)
+                    .where(ranked.c.rank == 1),
+                )
+            )
+
+    def save_many(self, snapshots: List[AssetSnapshot]) -> int:
+        return self._insert([PersistenceMapper.asset_snapshot_to_row(s) for s in snapshots])
+
+    def save_values(self, rows: List[SnapshotValues]) -> int:
+        return self._insert([
+            {"id": id_, "asset_id": asset_id, "value": value, "observed_at": to_utc(observed_at)}
+            for id_, asset_id, value, observed_at in rows
+        ])
+
+    def _insert(self, rows: List[dict]) -> int:
+        if not rows:
+            return 0
+        # Core executemany: no per-row ORM unit-of-work bookkeeping
+        self._session.execute(insert(AssetSnapshotModel), rows)
+        self._advance_latest_values(rows)
+        return len(rows)
+
     def find_by_id(self, entity_id: str) -> Optional[AssetSnapshot]:
         entity_id = str(entity_id)
         orm_obj = self._session.query(AssetSnapshotModel).filter(
@@ -47,8 +209,15 @@ class SQLAlchemyAssetSnapshotRepository(IAssetSnapshotRepository):
             AssetSnapshotModel.id == entity_id
         ).first()
         if orm_obj:
+            asset_id = orm_obj.asset_id
             self._session.delete(orm_obj)
             self._session.flush()
+            was_latest = self._session.query(AssetLatestValueModel.asset_id).filter(
+                AssetLatestValueModel.asset_id == asset_id,
+                AssetLatestValueModel.snapshot_id == entity_id,
+            ).first()
+            if was_latest:
+                self.refresh_latest_values([asset_id])
             return True
         return False
 
@@ -60,11 +229,89 @@ class SQLAlchemyAssetSnapshotRepository(IAssetSnapshotRepository):
             ).exists()
         ).scalar()
 
-    def get_snapshots(self, asset_id: UUID) -> List[AssetSnapshot]:
-        rows = self._session.query(AssetSnapshotModel).filter(
-            AssetSnapshotModel.asset_id == str(asset_id)
-        ).all()
-        return [PersistenceMapper.asset_snapshot_to_domain(s) for s in rows]
+    def get_snapshots(
+        self,
+        asset_id: UUID,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> List[AssetSnapshot]:
+        rows = self._session.execute(history_select(asset_id, start_date, end_date))
+        return [PersistenceMapper.asset_snapshot_to_domain(r) for r in rows]
+
+    def get_snapshots_page(
+        self,
+        asset_id: UUID,
+        limit: int,
+        after: Optional[Tuple[datetime, str]] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> List[AssetSnapshot]:
+        rows = self._session.execute(page_select(asset_id, limit, after, start_date, end_date))
+        return [PersistenceMapper.asset_snapshot_to_domain(r) for r in rows]
+
+    def iter_snapshots(
+        self,
+        asset_id: UUID,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> Iterator[AssetSnapshot]:
+        # yield_per streams from a server-side cursor, STREAM_BATCH_SIZE rows at a time
+        rows = self._session.execute(
+            history_select(asset_id, start_date, end_date).execution_options(yield_per=STREAM_BATCH_SIZE)
+        )
+        for row in rows:
+            yield PersistenceMapper.asset_snapshot_to_domain(row)
+
+    def get_series(
+        self,
+        asset_id: UUID,
+        bucket: SeriesBucket,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> List[SeriesPoint]:
+        query = series_select(
+            history_select(asset_id, start_date, end_date), bucket, self._session.get_bind().dialect.name
+        )
+        return [PersistenceMapper.series_point_to_domain(r) for r in self._session.execute(query)]
+
+    def get_snapshot_series(
+        self,
+        asset_id: UUID,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> SnapshotSeries:
+        query = history_select(asset_id, start_date, end_date).with_only_columns(
+            AssetSnapshotModel.id, AssetSnapshotModel.observed_at, AssetSnapshotModel.value
+        )
+        return SnapshotSeries.from_rows(asset_id, self._session.execute(query))
+
+    def get_portfolio_snapshot_series(
+        self,
+        portfolio_id: UUID,
+        end_date: Optional[datetime] = None,
+    ) -> List[SnapshotSeries]:
+        query = select(
+            AssetSnapshotModel.asset_id,
+            AssetSnapshotModel.id,
+            AssetSnapshotModel.observed_at,
+            AssetSnapshotModel.value,
+        ).join(AssetModel, AssetModel.id == AssetSnapshotModel.asset_id).where(
+            AssetModel.portfolio_id == str(portfolio_id),
+            # Disposed assets no longer count toward the portfolio, as in its valuation
+            AssetModel.disposed == False,
+        )
+        if end_date:
+            query = query.where(AssetSnapshotModel.observed_at <= end_date)
+        # Assets in the (portfolio_id, name, id) index order, so both indexes
+        # are walked in order and the database never sorts the histories
+        query = query.order_by(
+            AssetModel.name, AssetModel.id, AssetSnapshotModel.observed_at, AssetSnapshotModel.id
+        )
+        rows = self._session.execute(query)
+        return [
+            SnapshotSeries.from_rows(UUID(str(asset_id)), (row[1:] for row in group))
+            for asset_id, group in groupby(rows, key=itemgetter(0))
+        ]
 
     def get_latest_snapshot(self, asset_id: UUID) -> Optional[AssetSnapshot]:
         from app.adapters.outgoing.persistence.models.asset_snapshot import AssetSnapshotModel as ASM
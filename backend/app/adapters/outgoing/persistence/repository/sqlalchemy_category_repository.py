@@ -1,12 +1,13 @@
 """
 SQLAlchemy Category Repository Implementation
 """
-from typing import Optional, List
+from typing import Optional, List, Tuple
+from sqlalchemy import tuple_
 from sqlalchemy.orm import Session, joinedload
 
 from app.domain.entities.category import Category
 from app.domain.ports.repository.category_repository import ICategoryRepository
-from app.adapters.outgoing.persistence.models import CategoryModel, AssetModel
+from app.adapters.outgoing.persistence.models import CategoryModel, AssetModel, asset_category
 from app.adapters.outgoing.persistence.mappers.persistence_mapper import PersistenceMapper
 
 
@@ -35,12 +36,9 @@ class SQLAlchemyCategoryRepository(ICategoryRepository):
         return PersistenceMapper.category_to_domain(orm_obj) if orm_obj else None
 
     def find_all(self) -> List[Category]:
-        return [
-            PersistenceMapper.category_to_domain(c)
-            for c in self._session.query(CategoryModel).options(
-                joinedload(CategoryModel.parent)
-            ).all()
-        ]
+        return PersistenceMapper.categories_to_domain(
+            self._session.query(CategoryModel).options(joinedload(CategoryModel.parent)).all()
+        )
 
     def delete(self, entity_id: str) -> bool:
         entity_id = str(entity_id)
@@ -63,11 +61,18 @@ class SQLAlchemyCategoryRepository(ICategoryRepository):
         ).filter(CategoryModel.name == name).first()
         return PersistenceMapper.category_to_domain(orm_obj) if orm_obj else None
 
+    def find_page(self, limit: int, after: Optional[Tuple[str, str]] = None) -> List[Category]:
+        query = self._session.query(CategoryModel).options(joinedload(CategoryModel.parent))
+        if after:
+            query = query.filter(tuple_(CategoryModel.name, CategoryModel.id) > tuple(after))
+        rows = query.order_by(CategoryModel.name, CategoryModel.id).limit(limit).all()
+        return PersistenceMapper.categories_to_domain(rows)
+
     def find_by_asset(self, asset_id: str) -> List[Category]:
-        asset = self._session.query(AssetModel).options(
-            joinedload(AssetModel.categories).joinedload(CategoryModel.parent)
-        ).filter(AssetModel.id == str(asset_id)).first()
-        return [PersistenceMapper.category_to_domain(c) for c in asset.categories] if asset else []
+        rows = self._session.query(CategoryModel).options(
+            joinedload(CategoryModel.parent)
+        ).join(asset_category).filter(asset_category.c.asset_id == str(asset_id)).all()
+        return PersistenceMapper.categories_to_domain(rows)
 
     def attach_to_asset(self, asset_id: str, category_id: str) -> bool:
         asset = self._session.query(AssetModel).filter(AssetModel.id == str(asset_id)).first()
@@ -79,9 +84,7 @@ class SQLAlchemyCategoryRepository(ICategoryRepository):
         return False
 
     def detach_from_asset(self, asset_id: str, category_id: str) -> bool:
-        asset = self._session.query(AssetModel).options(
-            joinedload(AssetModel.categories)
-        ).filter(AssetModel.id == str(asset_id)).first()
+        asset = self._session.query(AssetModel).filter(AssetModel.id == str(asset_id)).first()
         cat = self._session.query(CategoryModel).filter(CategoryModel.id == str(category_id)).first()
         if asset and cat and cat in asset.categories:
             asset.categories.remove(cat)
@@ -93,13 +96,13 @@ class SQLAlchemyCategoryRepository(ICategoryRepository):
         rows = self._session.query(CategoryModel).filter(
             CategoryModel.parent_id == None
         ).all()
-        return [PersistenceMapper.category_to_domain(c) for c in rows]
+        return PersistenceMapper.categories_to_domain(rows)
 
     def find_children(self, parent_id) -> List[Category]:
         rows = self._session.query(CategoryModel).options(
             joinedload(CategoryModel.parent)
         ).filter(CategoryModel.parent_id == str(parent_id)).all()
-        return [PersistenceMapper.category_to_domain(c) for c in rows]
+        return PersistenceMapper.categories_to_domain(rows)
 
     def count_assets(self, category_id) -> int:
         return self._session.query(AssetModel).join(
@@ -3,17 +3,55 @@ SQLAlchemy Portfolio Repository Implementation
 """
 from typing import Optional, List
 from datetime import datetime
+from decimal import Decimal
+from sqlalchemy import case, func, select
 from sqlalchemy.orm import Session, joinedload, subqueryload
 
+from app.domain.entities.money import from_cents
 from app.domain.entities.portfolio import Portfolio
 from app.domain.entities.portfolio_snapshot import PortfolioSnapshot
+from app.domain.entities.portfolio_summary import PortfolioSummary
 from app.domain.ports.repository.portfolio_repository import IPortfolioRepository
 from app.adapters.outgoing.persistence.models import PortfolioModel
 from app.adapters.outgoing.persistence.models.asset import AssetModel
+from app.adapters.outgoing.persistence.models.asset_snapshot import AssetSnapshotModel
+from app.adapters.outgoing.persistence.models.asset_latest_value import AssetLatestValueModel
 from app.adapters.outgoing.persistence.models.asset_type import AssetTypeModel
 from app.adapters.outgoing.persistence.models.category import CategoryModel
 from app.adapters.outgoing.persistence.models.portfolio_snapshot import PortfolioSnapshotModel
-from app.adapters.outgoing.persistence.mappers.persistence_mapper import PersistenceMapper
+from app.adapters.outgoing.persistence.mappers.persistence_mapper import MappingContext, PersistenceMapper
+from app.adapters.outgoing.persistence.utils.utils import to_cents
+
+
+def summaries_select():
+    """Portfolios grouped with the count and the total latest value of their active (not disposed) assets."""
+    active = AssetModel.disposed == False
+    active_cents = case((active, to_cents(AssetLatestValueModel.value)))
+    return select(
+        PortfolioModel.id,
+        PortfolioModel.name,
+        PortfolioModel.base_currency,
+        PortfolioModel.created_at,
+        PortfolioModel.updated_at,
+        # Disposed assets count neither in the total nor in the asset count
+        func.count(case((active, AssetModel.id))).label("asset_count"),
+        func.sum(active_cents).label("total_cents"),
+    ).outerjoin(
+        AssetModel, AssetModel.portfolio_id == PortfolioModel.id
+    ).outerjoin(
+        AssetLatestValueModel, AssetLatestValueModel.asset_id == AssetModel.id
+    ).group_by(
+        PortfolioModel.id,
+        PortfolioModel.name,
+        PortfolioModel.base_currency,
+        PortfolioModel.created_at,
+        PortfolioModel.updated_at,
+    )
+
+
+def all_summaries_select():
+    """Every portfolio's summary, by name."""
+    return summaries_select().order_by(PortfolioModel.name, PortfolioModel.id)
 
 
 class SQLAlchemyPortfolioRepository(IPortfolioRepository):
@@ -31,7 +69,7 @@ class SQLAlchemyPortfolioRepository(IPortfolioRepository):
         else:
             orm_obj = PersistenceMapper.portfolio_to_orm(entity)
             self._session.add(orm_obj)
-        self._session.commit()
+        self._session.flush()
         return entity
 
     def find_by_id(self, entity_id: str) -> Optional[Portfolio]:
@@ -45,8 +83,12 @@ class SQLAlchemyPortfolioRepository(IPortfolioRepository):
         rows = self._session.query(PortfolioModel).options(
             joinedload(PortfolioModel.assets).joinedload(AssetModel.asset_type),
             joinedload(PortfolioModel.assets).subqueryload(AssetModel.snapshots),
+            joinedload(PortfolioModel.assets).subqueryload(AssetModel.tags),
+            joinedload(PortfolioModel.assets).subqueryload(AssetModel.categories).joinedload(CategoryModel.parent),
         ).all()
-        return [PersistenceMapper.portfolio_to_domain(r, load_assets=True) for r in rows]
+        # One context across portfolios: they share asset types
+        context = MappingContext()
+        return [PersistenceMapper.portfolio_to_domain(r, load_assets=True, context=context) for r in rows]
 
     def delete(self, entity_id: str) -> bool:
         entity_id = str(entity_id)
@@ -55,7 +97,7 @@ class SQLAlchemyPortfolioRepository(IPortfolioRepository):
         ).first()
         if orm_obj:
             self._session.delete(orm_obj)
-            self._session.commit()
+            self._session.flush()
             return True
         return False
 
@@ -111,10 +153,50 @@ class SQLAlchemyPortfolioRepository(IPortfolioRepository):
         ]
         return portfolio
 
+    @staticmethod
+    def _latest_asset_value(at: Optional[datetime] = None):
+        """
+        Correlated scalar subquery returning the newest snapshot value (at or
+        before `at`, when given) of the enclosing query's AssetModel row
+        (greatest-per-group, resolved per asset with ORDER BY ... LIMIT 1).
+        """
+        latest = select(AssetSnapshotModel.value).where(
+            AssetSnapshotModel.asset_id == AssetModel.id
+        )
+        if at:
+            latest = latest.where(AssetSnapshotModel.observed_at <= at)
+        return latest.order_by(
+            AssetSnapshotModel.observed_at.desc(), AssetSnapshotModel.id.desc()
+        ).limit(1).correlate(AssetModel).scalar_subquery()
+
+    def get_total_value(self, portfolio_id: str, at: Optional[datetime] = None) -> Decimal:
+        if at:
+            # Point-in-time valuations resolve each asset's value from history
+            query = self._session.query(func.sum(to_cents(self._latest_asset_value(at))))
+        else:
+            query = self._session.query(func.sum(to_cents(AssetLatestValueModel.value))).join(
+                AssetModel, AssetModel.id == AssetLatestValueModel.asset_id
+            )
+        total_cents = query.filter(
+            AssetModel.portfolio_id == str(portfolio_id),
+            AssetModel.disposed == False,
+        ).scalar()
+        return from_cents(int(total_cents or 0))
+
+    def find_summary(self, portfolio_id: str) -> Optional[PortfolioSummary]:
+        row = self._session.execute(
+            summaries_select().where(PortfolioModel.id == str(portfolio_id)).limit(1)
+        ).first()
+        return PersistenceMapper.portfolio_summary_to_domain(row) if row else None
+
+    def find_all_summaries(self) -> List[PortfolioSummary]:
+        rows = self._session.execute(all_summaries_select())
+        return [PersistenceMapper.portfolio_summary_to_domain(r) for r in rows]
+
     def save_snapshot(self, snapshot: PortfolioSnapshot) -> None:
         orm_obj = PersistenceMapper.portfolio_snapshot_to_orm(snapshot)
         self._session.add(orm_obj)
-        self._session.commit()
+        self._session.flush()
 
     def count_assets(self, portfolio_id: str) -> int:
         portfolio_id = str(portfolio_id)
@@ -1,14 +1,18 @@
 """
 SQLAlchemy PortfolioSnapshot Repository Implementation
 """
-from typing import Optional, List
+from datetime import datetime
+from typing import Iterator, Optional, List, Tuple
 from uuid import UUID
+from sqlalchemy import select, tuple_
 from sqlalchemy.orm import Session
 
 from app.domain.entities.portfolio_snapshot import PortfolioSnapshot
+from app.domain.entities.value_series import SeriesBucket, SeriesPoint
 from app.domain.ports.repository.portfolio_snapshot_repository import IPortfolioSnapshotRepository
 from app.adapters.outgoing.persistence.models import PortfolioSnapshotModel
 from app.adapters.outgoing.persistence.mappers.persistence_mapper import PersistenceMapper
+from app.adapters.outgoing.persistence.utils.utils import STREAM_BATCH_SIZE, series_select
 
 
 class SQLAlchemyPortfolioSnapshotRepository(IPortfolioSnapshotRepository):
@@ -60,8 +64,79 @@ class SQLAlchemyPortfolioSnapshotRepository(IPortfolioSnapshotRepository):
             ).exists()
         ).scalar()
 
-    def get_snapshots(self, portfolio_id: UUID) -> List[PortfolioSnapshot]:
-        rows = self._session.query(PortfolioSnapshotModel).filter(
-            PortfolioSnapshotModel.portfolio_id == str(portfolio_id)
-        ).all()
+    @staticmethod
+    def _history(
+        portfolio_id: UUID,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ):
+        """Snapshot columns of a portfolio within an inclusive date range, oldest first."""
+        query = select(
+            PortfolioSnapshotModel.id,
+            PortfolioSnapshotModel.portfolio_id,
+            PortfolioSnapshotModel.value,
+            PortfolioSnapshotModel.observed_at,
+        ).where(PortfolioSnapshotModel.portfolio_id == str(portfolio_id))
+        if start_date:
+            query = query.where(PortfolioSnapshotModel.observed_at >= start_date)
+        if end_date:
+            query = query.where(PortfolioSnapshotModel.observed_at <= end_date)
+        return query.order_by(PortfolioSnapshotModel.observed_at, PortfolioSnapshotModel.id)
+
+    def get_snapshots(
+        self,
+        portfolio_id: UUID,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> List[PortfolioSnapshot]:
+        rows = self._session.execute(self._history(portfolio_id, start_date, end_date))
         return [PersistenceMapper.portfolio_snapshot_to_domain(s) for s in rows]
+
+    def get_snapshots_page(
+        self,
+        portfolio_id: UUID,
+        limit: int,
+        after: Optional[Tuple[datetime, str]] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> List[PortfolioSnapshot]:
+        # Newest first, like the portfolio's snapshot listing
+        key = tuple_(PortfolioSnapshotModel.observed_at, PortfolioSnapshotModel.id)
+        query = self._history(portfolio_id, start_date, end_date).order_by(None).order_by(
+            PortfolioSnapshotModel.observed_at.desc(), PortfolioSnapshotModel.id.desc()
+        )
+        if after:
+            query = query.where(key < tuple(after))
+        rows = self._session.execute(query.limit(limit))
+        return [PersistenceMapper.portfolio_snapshot_to_domain(s) for s in rows]
+
+    def get_series(
+        self,
+        portfolio_id: UUID,
+        bucket: SeriesBucket,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> List[SeriesPoint]:
+        query = series_select(
+            self._history(portfolio_id, start_date, end_date), bucket, self._session.get_bind().dialect.name
+        )
+        return [PersistenceMapper.series_point_to_domain(r) for r in self._session.execute(query)]
+
+    def get_latest_snapshot(self, portfolio_id: UUID) -> Optional[PortfolioSnapshot]:
+        orm_obj = self._session.query(PortfolioSnapshotModel).filter(
+            PortfolioSnapshotModel.portfolio_id == str(portfolio_id)
+        ).order_by(PortfolioSnapshotModel.observed_at.desc(), PortfolioSnapshotModel.id.desc()).first()
+        return PersistenceMapper.portfolio_snapshot_to_domain(orm_obj) if orm_obj else None
+
+    def iter_snapshots(
+        self,
+        portfolio_id: UUID,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> Iterator[PortfolioSnapshot]:
+        # yield_per streams from a server-side cursor, STREAM_BATCH_SIZE rows at a time
+        rows = self._session.execute(
+            self._history(portfolio_id, start_date, end_date).execution_options(yield_per=STREAM_BATCH_SIZE)
+        )
+        for row in rows:
+            yield PersistenceMapper.portfolio_snapshot_to_domain(row)
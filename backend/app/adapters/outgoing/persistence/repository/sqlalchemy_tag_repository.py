@@ -1,12 +1,13 @@
 """
 SQLAlchemy Tag Repository Implementation
 """
-from typing import Optional, List
-from sqlalchemy.orm import Session, joinedload
+from typing import Optional, List, Tuple
+from sqlalchemy import tuple_
+from sqlalchemy.orm import Session
 
 from app.domain.entities.tag import Tag
 from app.domain.ports.repository.tag_repository import ITagRepository
-from app.adapters.outgoing.persistence.models import TagModel, AssetModel
+from app.adapters.outgoing.persistence.models import TagModel, AssetModel, asset_tag
 from app.adapters.outgoing.persistence.mappers.persistence_mapper import PersistenceMapper
 
 
@@ -50,11 +51,16 @@ class SQLAlchemyTagRepository(ITagRepository):
         orm_obj = self._session.query(TagModel).filter(TagModel.name == name).first()
         return PersistenceMapper.tag_to_domain(orm_obj) if orm_obj else None
 
+    def find_page(self, limit: int, after: Optional[Tuple[str, str]] = None) -> List[Tag]:
+        query = self._session.query(TagModel)
+        if after:
+            query = query.filter(tuple_(TagModel.name, TagModel.id) > tuple(after))
+        rows = query.order_by(TagModel.name, TagModel.id).limit(limit).all()
+        return [PersistenceMapper.tag_to_domain(t) for t in rows]
+
     def find_by_asset(self, asset_id: str) -> List[Tag]:
-        asset = self._session.query(AssetModel).options(
-            joinedload(AssetModel.tags)
-        ).filter(AssetModel.id == str(asset_id)).first()
-        return [PersistenceMapper.tag_to_domain(t) for t in asset.tags] if asset else []
+        rows = self._session.query(TagModel).join(asset_tag).filter(asset_tag.c.asset_id == str(asset_id)).all()
+        return [PersistenceMapper.tag_to_domain(t) for t in rows]
 
     def attach_to_asset(self, asset_id: str, tag_id: str) -> bool:
         asset = self._session.query(AssetModel).filter(AssetModel.id == str(asset_id)).first()
@@ -66,9 +72,7 @@ class SQLAlchemyTagRepository(ITagRepository):
         return False
 
     def detach_from_asset(self, asset_id: str, tag_id: str) -> bool:
-        asset = self._session.query(AssetModel).options(
-            joinedload(AssetModel.tags)
-        ).filter(AssetModel.id == str(asset_id)).first()
+        asset = self._session.query(AssetModel).filter(AssetModel.id == str(asset_id)).first()
         tag_orm = self._session.query(TagModel).filter(TagModel.id == str(tag_id)).first()
         if asset and tag_orm and tag_orm in asset.tags:
             asset.tags.remove(tag_orm)
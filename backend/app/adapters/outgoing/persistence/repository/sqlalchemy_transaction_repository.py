@@ -3,12 +3,17 @@ SQLAlchemy Transaction Repository Implementation
 
 Concrete implementation of TransactionRepository using SQLAlchemy.
 """
-from typing import Optional, cast
+from typing import Iterator, List, Optional, cast
 from datetime import datetime
+from uuid import UUID
+from sqlalchemy import insert, select
 from sqlalchemy.orm import Session
 
+from app.domain.entities.transaction import Transaction
 from app.domain.ports.repository.transaction_repository import ITransactionRepository
 from app.adapters.outgoing.persistence.models import TransactionModel
+from app.adapters.outgoing.persistence.mappers.persistence_mapper import PersistenceMapper
+from app.adapters.outgoing.persistence.utils.utils import STREAM_BATCH_SIZE
 
 
 class SQLAlchemyTransactionRepository(ITransactionRepository):
@@ -60,3 +65,37 @@ class SQLAlchemyTransactionRepository(ITransactionRepository):
         q = q.filter(TransactionModel.occurred_at >= start_date)
         q = q.filter(TransactionModel.occurred_at <= end_date)
         return cast(list[TransactionModel], q.all())
+
+    def save_many(self, transactions: List[Transaction]) -> int:
+        """Insert a batch of transactions with one executemany."""
+        if not transactions:
+            return 0
+        self._session.execute(
+            insert(TransactionModel),
+            [PersistenceMapper.transaction_to_row(t) for t in transactions],
+        )
+        return len(transactions)
+
+    def iter_by_asset(
+        self,
+        asset_id: UUID,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> Iterator[Transaction]:
+        """Stream an asset's transactions, oldest first, from a server-side cursor."""
+        query = select(
+            TransactionModel.id,
+            TransactionModel.asset_id,
+            TransactionModel.type,
+            TransactionModel.quantity,
+            TransactionModel.unit_price,
+            TransactionModel.currency,
+            TransactionModel.occurred_at,
+        ).where(TransactionModel.asset_id == str(asset_id))
+        if start_date:
+            query = query.where(TransactionModel.occurred_at >= start_date)
+        if end_date:
+            query = query.where(TransactionModel.occurred_at <= end_date)
+        query = query.order_by(TransactionModel.occurred_at, TransactionModel.id)
+        for row in self._session.execute(query.execution_options(yield_per=STREAM_BATCH_SIZE)):
+            yield PersistenceMapper.transaction_to_domain(row)
@@ -0,0 +1,24 @@
+"""
+SQLAlchemy Unit of Work Implementation
+"""
+from sqlalchemy.orm import Session
+
+from app.domain.ports.repository.unit_of_work import IUnitOfWork
+
+
+class SQLAlchemyUnitOfWork(IUnitOfWork):
+    """
+    SQLAlchemy implementation of UnitOfWork.
+
+    Owns the transaction of the session its use case's repositories share:
+    they only flush, and this is the one place that commits or rolls back.
+    """
+
+    def __init__(self, session: Session):
+        self._session = session
+
+    def commit(self) -> None:
+        self._session.commit()
+
+    def rollback(self) -> None:
+        self._session.rollback()
@@ -0,0 +1,32 @@
+"""
+Read/write routing between the primary database and a read replica.
+
+A RoutingSession sends its statements to the replica until it writes, i.e.
+flushes or executes an INSERT, UPDATE or DELETE; from then on every
+statement, reads included, goes to the primary, so a request always reads
+its own writes. Sessions opened for write requests start on the primary,
+so the reads that validate a write see the same data the write commits
+against.
+
+Reads from the replica may lag behind the primary by the replication delay:
+a write made by one request can be missing from the next request's reads.
+"""
+from typing import Any, Optional
+
+from sqlalchemy import Engine
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.dml import UpdateBase
+
+
+class RoutingSession(Session):
+
+    def __init__(self, primary: Engine, replica: Engine, read_only: bool = True, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.primary = primary
+        self.replica = replica
+        self.on_primary = not read_only
+
+    def get_bind(self, mapper: Optional[Any] = None, *, clause: Optional[Any] = None, **kwargs: Any) -> Engine:
+        if not self.on_primary and (self._flushing or isinstance(clause, UpdateBase)):
+            self.on_primary = True
+        return self.primary if self.on_primary else self.replica
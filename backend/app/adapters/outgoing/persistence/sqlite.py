@@ -0,0 +1,151 @@
+"""
+SQLite engine profile.
+
+SQLite serves any number of readers but a single writer. Every pooled
+connection is tuned for that on connect: WAL journal so readers never block
+the writer, NORMAL fsync, a busy timeout instead of immediate "database is
+locked" errors, a larger page cache, memory-mapped reads and in-memory temp
+tables.
+
+Writes are funneled through a separate engine holding one connection per
+process. Write requests queue for it, and its transactions start with
+BEGIN IMMEDIATE so the write lock is taken up front: a deferred transaction
+that read first would have to upgrade its lock and fails outright when
+another writer committed in between, busy timeout or not. Across uvicorn
+workers the busy timeout then orders the writers of each process.
+
+Every setting can be overridden from the environment (SQLITE_JOURNAL_MODE,
+SQLITE_SYNCHRONOUS, SQLITE_BUSY_TIMEOUT_MS, SQLITE_CACHE_SIZE,
+SQLITE_MMAP_SIZE, SQLITE_TEMP_STORE, SQLITE_WRITE_QUEUE_TIMEOUT), and
+SQLITE_PROFILE=legacy keeps the driver defaults with no writer queue.
+
+Foreign keys are enforced on every SQLite connection, whatever the profile:
+SQLite ignores ON DELETE CASCADE otherwise, and deleting an asset outside
+the ORM would leave its rows in asset_latest_values, asset_categories and
+asset_tags behind.
+"""
+import os
+from typing import List, Literal, Optional
+
+from pydantic import BaseModel, field_validator
+from sqlalchemy import Engine, create_engine, event
+
+PROFILE_PRODUCTION = "production"
+PROFILE_LEGACY = "legacy"
+
+# Field name -> environment variable overriding it
+_ENV_OVERRIDES = {
+    "journal_mode": "SQLITE_JOURNAL_MODE",
+    "synchronous": "SQLITE_SYNCHRONOUS",
+    "busy_timeout_ms": "SQLITE_BUSY_TIMEOUT_MS",
+    "cache_size": "SQLITE_CACHE_SIZE",
+    "mmap_size": "SQLITE_MMAP_SIZE",
+    "temp_store": "SQLITE_TEMP_STORE",
+    "write_queue_timeout": "SQLITE_WRITE_QUEUE_TIMEOUT",
+}
+
+
+class SQLiteProfile(BaseModel):
+    journal_mode: Literal["WAL", "DELETE", "TRUNCATE", "PERSIST", "MEMORY", "OFF"] = "WAL"
+    synchronous: Literal["OFF", "NORMAL", "FULL", "EXTRA"] = "NORMAL"
+    busy_timeout_ms: int = 5_000
+    # Negative values are in KiB: 64 MiB of page cache per connection
+    cache_size: int = -65_536
+    mmap_size: int = 256 * 1024 * 1024
+    temp_store: Literal["DEFAULT", "FILE", "MEMORY"] = "MEMORY"
+    # Seconds a write request waits for the writer connection before failing
+    write_queue_timeout: float = 30.0
+
+    @field_validator("journal_mode", "synchronous", "temp_store", mode="before")
+    @classmethod
+    def _upper(cls, value):
+        return value.upper() if isinstance(value, str) else value
+
+    @classmethod
+    def from_env(cls) -> Optional["SQLiteProfile"]:
+        """
+        Build the profile from the environment.
+
+        Returns:
+            The profile, or None when SQLITE_PROFILE=legacy
+
+        Raises:
+            ValueError: If SQLITE_PROFILE or an override is invalid
+        """
+        name = os.getenv("SQLITE_PROFILE", PROFILE_PRODUCTION).lower()
+        if name == PROFILE_LEGACY:
+            return None
+        if name != PROFILE_PRODUCTION:
+            raise ValueError(f"Unknown SQLITE_PROFILE '{name}' (expected '{PROFILE_PRODUCTION}' or '{PROFILE_LEGACY}')")
+        overrides = {field: os.environ[var] for field, var in _ENV_OVERRIDES.items() if var in os.environ}
+        return cls.model_validate(overrides)
+
+    def pragmas(self) -> List[str]:
+        return [
+            f"PRAGMA journal_mode={self.journal_mode}",
+            f"PRAGMA synchronous={self.synchronous}",
+            f"PRAGMA busy_timeout={self.busy_timeout_ms}",
+            f"PRAGMA cache_size={self.cache_size}",
+            f"PRAGMA mmap_size={self.mmap_size}",
+            f"PRAGMA temp_store={self.temp_store}",
+        ]
+
+
+def apply_sqlite_profile(engine: Engine, profile: SQLiteProfile) -> Engine:
+    """Run the profile's pragmas on every new connection of `engine`."""
+
+    @event.listens_for(engine, "connect")
+    def _set_pragmas(dbapi_connection, _connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in profile.pragmas():
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+    return engine
+
+
+def enforce_foreign_keys(engine: Engine) -> Engine:
+    """Turn on foreign key enforcement, and with it ON DELETE CASCADE, on every new connection of `engine`."""
+
+    @event.listens_for(engine, "connect")
+    def _enforce_foreign_keys(dbapi_connection, _connection_record):
+        # A no-op inside a transaction: run on connect, before the first BEGIN
+        cursor = dbapi_connection.cursor()
+        try:
+            cursor.execute("PRAGMA foreign_keys=ON")
+        finally:
+            cursor.close()
+
+    return engine
+
+
+def writer_pool_options(profile: SQLiteProfile) -> dict:
+    """Engine options for the single-connection writer pool."""
+    return {"pool_size": 1, "max_overflow": 0, "pool_timeout": profile.write_queue_timeout}
+
+
+def begin_immediate(engine: Engine) -> Engine:
+    """Start every transaction of `engine` with BEGIN IMMEDIATE."""
+
+    @event.listens_for(engine, "connect")
+    def _disable_driver_transactions(dbapi_connection, _connection_record):
+        # The driver would otherwise emit its own deferred BEGIN before the first write
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _begin_immediate(connection):
+        connection.exec_driver_sql("BEGIN IMMEDIATE")
+
+    return engine
+
+
+def create_sqlite_write_engine(url: str, profile: SQLiteProfile, connect_args: Optional[dict] = None) -> Engine:
+    """
+    Create the engine that serializes this process's writes: a single pooled
+    connection, waited for up to `profile.write_queue_timeout` seconds, whose
+    transactions begin with BEGIN IMMEDIATE.
+    """
+    engine = create_engine(url, connect_args=connect_args or {}, **writer_pool_options(profile))
+    return begin_immediate(apply_sqlite_profile(enforce_foreign_keys(engine), profile))
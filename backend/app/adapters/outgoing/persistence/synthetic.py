@@ -0,0 +1,311 @@
+"""
+Synthetic data sets for load tests and benchmarks.
+
+generate_dataset() fills a database with portfolios of assets, each with a
+random-walk snapshot history, a few transactions, categories from a deep
+category tree and tags, plus the portfolios' daily totals and the assets'
+latest values, so every read path has data at realistic scale.
+
+The data set is a pure function of its DatasetSpec: every id, name and
+value is drawn from one random.Random(seed), in a fixed order, and all
+timestamps derive from `start`. The same spec gives the same rows on any
+database, whatever the chunk size.
+
+Rows are generated asset by asset and written with Core executemany
+inserts, one transaction per `chunk_size` rows, so memory stays bounded
+and ten million snapshots take minutes. Run it against an empty schema:
+names and ids of a second run would collide with the first.
+"""
+from __future__ import annotations
+
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Callable, Dict, List, Optional
+from uuid import UUID
+
+from pydantic import BaseModel, Field, model_validator
+from sqlalchemy import Engine, insert, select
+
+from app.adapters.outgoing.persistence.models import (
+    AssetLatestValueModel,
+    AssetModel,
+    AssetSnapshotModel,
+    AssetTypeModel,
+    CategoryModel,
+    PortfolioModel,
+    PortfolioSnapshotModel,
+    TagModel,
+    TransactionModel,
+    asset_category,
+    asset_tag,
+)
+from app.domain.entities.money import from_cents
+
+# Used when the database has no asset types yet (no seed migration)
+DEFAULT_ASSET_TYPES = {
+    "CASH": "Cash",
+    "STOCKS": "Stocks & Funds",
+    "BONDS": "Bonds",
+    "REAL_ESTATE": "Real Estate",
+    "CRYPTO": "Cryptocurrency",
+}
+CURRENCIES = ("EUR", "USD", "GBP", "CHF")
+CREATED_BY = "generator"
+
+# Daily drift and volatility of the snapshot random walk
+DRIFT = 0.0002
+VOLATILITY = 0.01
+
+
+class DatasetSpec(BaseModel):
+    """Shape of a synthetic data set. Counts are per parent row."""
+    seed: int = 0
+    portfolios: int = Field(default=10, ge=0)
+    assets_per_portfolio: int = Field(default=100, ge=0)
+    snapshots_per_asset: int = Field(default=365, ge=0)
+    transactions_per_asset: int = Field(default=4, ge=0)
+    # Category tree: `category_fanout` roots, each node with `category_fanout`
+    # children, `category_depth` levels deep. Assets are filed under leaves.
+    category_depth: int = Field(default=4, ge=0)
+    category_fanout: int = Field(default=4, ge=1)
+    categories_per_asset: int = Field(default=2, ge=0)
+    tags: int = Field(default=200, ge=0)
+    tags_per_asset: int = Field(default=5, ge=0)
+    disposed_ratio: float = Field(default=0.05, ge=0, le=1)
+    start: datetime = datetime(2015, 1, 1, tzinfo=timezone.utc)
+    step: timedelta = timedelta(days=1)
+    chunk_size: int = Field(default=50_000, ge=1)
+
+    @model_validator(mode="after")
+    def _fits(self) -> "DatasetSpec":
+        if self.tags_per_asset > self.tags:
+            raise ValueError(f"tags_per_asset ({self.tags_per_asset}) exceeds tags ({self.tags})")
+        if self.categories_per_asset > self.leaf_categories:
+            raise ValueError(
+                f"categories_per_asset ({self.categories_per_asset}) exceeds the "
+                f"{self.leaf_categories} leaf categories"
+            )
+        if self.step <= timedelta(0):
+            raise ValueError("step must be positive")
+        return self
+
+    @property
+    def leaf_categories(self) -> int:
+        return self.category_fanout ** self.category_depth if self.category_depth else 0
+
+    @property
+    def assets(self) -> int:
+        return self.portfolios * self.assets_per_portfolio
+
+    @property
+    def snapshots(self) -> int:
+        return self.assets * self.snapshots_per_asset
+
+
+class DatasetReport(BaseModel):
+    portfolios: int = 0
+    assets: int = 0
+    snapshots: int = 0
+    portfolio_snapshots: int = 0
+    transactions: int = 0
+    categories: int = 0
+    tags: int = 0
+    labels: int = 0
+    elapsed_seconds: float = 0.0
+    rows_per_second: float = 0.0
+
+    @property
+    def rows(self) -> int:
+        return (
+            self.portfolios + self.assets + self.snapshots + self.portfolio_snapshots
+            + self.transactions + self.categories + self.tags + self.labels
+        )
+
+
+def _uuid(rng: random.Random) -> str:
+    return str(UUID(int=rng.getrandbits(128), version=4))
+
+
+# Snapshot ids lead with the row number, like time-ordered UUIDs, so the
+# primary key index is appended to instead of written at random pages: with
+# random ids, inserts slow down as that index outgrows the page cache.
+ORDERED_ID_SHIFT = 80
+
+
+class _Writer:
+    """Buffers rows per table and inserts them in FK order, one transaction per chunk."""
+
+    # Parents first, so every foreign key exists by the time it is inserted
+    TABLES = (
+        AssetModel.__table__,
+        asset_tag,
+        asset_category,
+        AssetSnapshotModel.__table__,
+        AssetLatestValueModel.__table__,
+        TransactionModel.__table__,
+        PortfolioSnapshotModel.__table__,
+    )
+
+    def __init__(self, engine: Engine, chunk_size: int, report: DatasetReport,
+                 on_progress: Optional[Callable[[DatasetReport], None]], started: float):
+        self._engine = engine
+        self._chunk_size = chunk_size
+        self._report = report
+        self._on_progress = on_progress
+        self._started = started
+        self._pending = 0
+        self.rows: Dict[object, List[dict]] = {table: [] for table in self.TABLES}
+
+    def added(self, count: int) -> None:
+        self._pending += count
+        if self._pending >= self._chunk_size:
+            self.flush()
+
+    def flush(self) -> None:
+        with self._engine.begin() as conn:
+            for table, rows in self.rows.items():
+                if rows:
+                    conn.execute(insert(table), rows)
+                    rows.clear()
+        self._pending = 0
+        elapsed = time.perf_counter() - self._started
+        self._report.elapsed_seconds = elapsed
+        self._report.rows_per_second = self._report.rows / elapsed if elapsed else 0.0
+        if self._on_progress:
+            self._on_progress(self._report)
+
+
+def _asset_type_ids(engine: Engine, created_at: datetime) -> List[str]:
+    """Ids of the existing asset types by code, after inserting the defaults into an empty table."""
+    with engine.begin() as conn:
+        ids = conn.execute(select(AssetTypeModel.id).order_by(AssetTypeModel.code)).scalars().all()
+        if ids:
+            return [str(i) for i in ids]
+        rows = [
+            dict(id=_uuid(random.Random(code)), code=code, label=label, created_at=created_at, updated_at=created_at)
+            for code, label in sorted(DEFAULT_ASSET_TYPES.items())
+        ]
+        conn.execute(insert(AssetTypeModel), rows)
+    return [row["id"] for row in rows]
+
+
+def generate_dataset(
+    engine: Engine,
+    spec: DatasetSpec,
+    on_progress: Optional[Callable[[DatasetReport], None]] = None,
+) -> DatasetReport:
+    """
+    Insert the data set described by `spec`.
+
+    Args:
+        engine: Engine of a database whose schema exists
+        spec: Shape and seed of the data set
+        on_progress: Called with the running report after each chunk
+
+    Returns:
+        Row counts and throughput
+    """
+    started = time.perf_counter()
+    rng = random.Random(spec.seed)
+    report = DatasetReport()
+    created_at = spec.start
+    asset_types = _asset_type_ids(engine, created_at)
+    moments = [spec.start + spec.step * k for k in range(spec.snapshots_per_asset)]
+
+    # Labels and portfolios first: a few rows, inserted before any asset
+    tags = [dict(id=_uuid(rng), name=f"tag-{t + 1:05d}") for t in range(spec.tags)]
+    # Named by their path in the tree: "Category 3", "Category 3.1", ...
+    categories, level = [], [(None, "")]
+    for _ in range(spec.category_depth):
+        level = [
+            (_uuid(rng), f"{path}.{c + 1}" if path else str(c + 1), parent_id)
+            for parent_id, path in level for c in range(spec.category_fanout)
+        ]
+        categories.append([dict(id=id_, name=f"Category {path}", parent_id=parent_id) for id_, path, parent_id in level])
+        level = [(id_, path) for id_, path, _ in level]
+    leaves = [id_ for id_, _ in level] if spec.category_depth else []
+    portfolios = [
+        dict(id=_uuid(rng), name=f"Portfolio {p + 1}", base_currency=rng.choice(CURRENCIES),
+             created_at=created_at, updated_at=created_at)
+        for p in range(spec.portfolios)
+    ]
+    with engine.begin() as conn:
+        if tags:
+            conn.execute(insert(TagModel), tags)
+        # One level at a time, so parents exist before their children
+        for level_rows in categories:
+            conn.execute(insert(CategoryModel), level_rows)
+        if portfolios:
+            conn.execute(insert(PortfolioModel), portfolios)
+    report.tags = len(tags)
+    report.categories = sum(len(level_rows) for level_rows in categories)
+    report.portfolios = len(portfolios)
+
+    writer = _Writer(engine, spec.chunk_size, report, on_progress, started)
+    rows = writer.rows
+    assets_rows, tag_rows, category_rows = rows[AssetModel.__table__], rows[asset_tag], rows[asset_category]
+    snapshot_rows, latest_rows = rows[AssetSnapshotModel.__table__], rows[AssetLatestValueModel.__table__]
+    transaction_rows, total_rows = rows[TransactionModel.__table__], rows[PortfolioSnapshotModel.__table__]
+    tag_ids = [tag["id"] for tag in tags]
+    gauss, getrandbits = rng.gauss, rng.getrandbits
+
+    for portfolio in portfolios:
+        totals = [0] * len(moments)
+        for a in range(spec.assets_per_portfolio):
+            asset_id = _uuid(rng)
+            disposed = rng.random() < spec.disposed_ratio
+            assets_rows.append(dict(
+                id=asset_id, portfolio_id=portfolio["id"], asset_type_id=rng.choice(asset_types),
+                name=f"Asset {a + 1}", quantity=None, disposed=disposed,
+                created_at=created_at, updated_at=created_at, created_by=CREATED_BY, updated_by=CREATED_BY,
+            ))
+            for tag_id in rng.sample(tag_ids, spec.tags_per_asset):
+                tag_rows.append(dict(asset_id=asset_id, tag_id=tag_id))
+            for category_id in rng.sample(leaves, spec.categories_per_asset):
+                category_rows.append(dict(asset_id=asset_id, category_id=category_id))
+
+            # Random walk in cents from 10.00 to 100,000.00, never below 1.00
+            cents = rng.randint(1_000, 10_000_000)
+            snapshot_id = None
+            for k, moment in enumerate(moments):
+                cents = max(100, cents + int(cents * gauss(DRIFT, VOLATILITY)))
+                totals[k] += cents
+                position = (report.snapshots + k) << ORDERED_ID_SHIFT
+                snapshot_id = str(UUID(int=position | getrandbits(ORDERED_ID_SHIFT), version=4))
+                snapshot_rows.append(dict(
+                    id=snapshot_id, asset_id=asset_id, value=from_cents(cents), observed_at=moment,
+                ))
+            if snapshot_id:
+                latest_rows.append(dict(
+                    asset_id=asset_id, snapshot_id=snapshot_id, value=from_cents(cents), observed_at=moments[-1],
+                ))
+
+            # Acquired first, adjusted in between, disposed last if it was
+            days = sorted(rng.randrange(max(len(moments), 1)) for _ in range(spec.transactions_per_asset))
+            for t, day in enumerate(days):
+                kind = "ACQUIRE" if t == 0 else "DISPOSE" if disposed and t == len(days) - 1 else "ADJUST"
+                transaction_rows.append(dict(
+                    id=_uuid(rng), asset_id=asset_id, type=kind,
+                    quantity=Decimal(rng.randint(1, 1_000)), unit_price=from_cents(rng.randint(100, 1_000_000)),
+                    currency=portfolio["base_currency"], occurred_at=spec.start + spec.step * day,
+                ))
+
+            report.assets += 1
+            report.snapshots += len(moments)
+            report.transactions += len(days)
+            report.labels += spec.tags_per_asset + spec.categories_per_asset
+            writer.added(1 + len(moments) + len(days) + spec.tags_per_asset + spec.categories_per_asset)
+
+        # The portfolio's daily totals, once all its assets are valued
+        if spec.assets_per_portfolio:
+            for moment, total in zip(moments, totals):
+                total_rows.append(dict(
+                    id=_uuid(rng), portfolio_id=portfolio["id"], value=from_cents(total), observed_at=moment,
+                ))
+            report.portfolio_snapshots += len(moments)
+            writer.added(len(moments))
+
+    writer.flush()
+    return report
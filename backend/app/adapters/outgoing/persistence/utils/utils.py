@@ -1,30 +1,88 @@
-import time
-import sqlite3
-from functools import wraps
+from typing import Iterable, Iterator, List
 
-def sqlite_retry_on_locked(max_retries=5, initial_delay=0.2, backoff=2):
+from sqlalchemy import BigInteger, Select, cast, func, select
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.domain.entities.money import CENTS
+from app.domain.entities.value_series import SeriesBucket
+
+# Keeps IN (...) lists well below SQLite's bound-parameter limit
+IN_CHUNK_SIZE = 500
+
+# Rows fetched per round trip when streaming query results (yield_per)
+STREAM_BATCH_SIZE = 1000
+
+
+def chunked(values: Iterable[str], size: int = IN_CHUNK_SIZE) -> Iterator[List[str]]:
+    """Yield successive lists of at most `size` values."""
+    values = list(values)
+    for i in range(0, len(values), size):
+        yield values[i:i + size]
+
+
+def to_cents(column: ColumnElement) -> ColumnElement:
+    """
+    SQL expression of a Numeric(20, 2) money column in integer cents. SQLite
+    stores such values as REAL, so money is summed as integers: exact on
+    both databases, where a SUM of the column would add up floats.
+    """
+    return cast(func.round(column * CENTS), BigInteger)
+
+
+def bucket_start(column: ColumnElement, bucket: SeriesBucket, dialect_name: str) -> ColumnElement:
+    """
+    SQL expression truncating a timestamp column to the start of its UTC
+    bucket. SQLite stores naive UTC text and yields text; PostgreSQL yields
+    a naive UTC timestamp.
     """
-    Décorateur pour réessayer une opération si la base SQLite est temporairement verrouillée (persistence is locked).
-    max_retries : nombre maximal de tentatives
-    initial_delay : délai initial en secondes
-    backoff : multiplicateur pour le délai (exponentiel)
+    if dialect_name == "sqlite":
+        if bucket is SeriesBucket.DAY:
+            return func.strftime("%Y-%m-%d 00:00:00", column)
+        if bucket is SeriesBucket.WEEK:
+            # 'weekday 0' moves forward to Sunday (unless already one); 6 days back is that week's Monday
+            return func.strftime("%Y-%m-%d 00:00:00", column, "weekday 0", "-6 days")
+        return func.strftime("%Y-%m-01 00:00:00", column)
+    return func.date_trunc(bucket.value, func.timezone("UTC", column))
+
+
+def series_select(history: Select, bucket: SeriesBucket, dialect_name: str) -> Select:
     """
-    def decorator(func):
-        @wraps(func)
-        def wrapper(self, *args, **kwargs):
-            delay = initial_delay
-            for attempt in range(1, max_retries + 1):
-                try:
-                    return func(self, *args, **kwargs)
-                except sqlite3.OperationalError as e:
-                    self.db.rollback()
-                    if "persistence is locked" in str(e):
-                        if attempt == max_retries:
-                            raise
-                        time.sleep(delay)
-                        delay *= backoff
-                        continue
-                    raise
-        return wrapper
-    return decorator
+    Downsample a snapshot history query (selecting id, value and observed_at)
+    into one row per bucket with period_start, open, high, low, close,
+    total_cents (the sum of the values, in cents) and count columns, oldest
+    bucket first.
+
+    Aggregates are computed by a single GROUP BY in the database, so only one
+    row per bucket crosses the wire however many snapshots it holds. Open and
+    close are then looked up per bucket at its first/last observed_at (ties
+    broken by id), which the (owner, observed_at, id) index serves directly.
+    """
+    snapshots = history.order_by(None).subquery("snapshots")
+    period = bucket_start(snapshots.c.observed_at, bucket, dialect_name)
+    grouped = select(
+        period.label("period_start"),
+        func.min(snapshots.c.observed_at).label("first_at"),
+        func.max(snapshots.c.observed_at).label("last_at"),
+        func.max(snapshots.c.value).label("high"),
+        func.min(snapshots.c.value).label("low"),
+        func.sum(to_cents(snapshots.c.value)).label("total_cents"),
+        func.count().label("count"),
+    ).group_by(period).subquery("buckets")
+
+    def value_at(observed_at: ColumnElement, last: bool) -> ColumnElement:
+        at = history.order_by(None).subquery("at")
+        return (
+            select(at.c.value).where(at.c.observed_at == observed_at)
+            .order_by(at.c.id.desc() if last else at.c.id).limit(1).scalar_subquery()
+        )
+
+    return select(
+        grouped.c.period_start,
+        value_at(grouped.c.first_at, last=False).label("open"),
+        grouped.c.high,
+        grouped.c.low,
+        value_at(grouped.c.last_at, last=True).label("close"),
+        grouped.c.total_cents,
+        grouped.c["count"],
+    ).order_by(grouped.c.period_start)
 
@@ -0,0 +1 @@
+# analytics package
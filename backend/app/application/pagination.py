@@ -0,0 +1,69 @@
+"""
+Keyset pagination shared by the listing use cases.
+
+A page is requested with a `limit` and an optional cursor. The cursor is an
+opaque token wrapping the sort key of the last row already returned, e.g.
+(name, id) for assets or (observed_at, id) for snapshots. Repositories seek
+past that key in SQL, so fetching any page costs the same however deep it is.
+"""
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Callable, Generic, List, Optional, Sequence, Tuple, TypeVar
+
+from pydantic import BaseModel
+
+from app.domain.exceptions import InvalidCursor
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+T = TypeVar("T")
+
+
+class Page(BaseModel, Generic[T]):
+    items: List[T]
+    # Token for the following page; None on the last page
+    next_cursor: Optional[str] = None
+
+
+def encode_cursor(key: Sequence) -> str:
+    """Wrap a sort key (strings and datetimes) into an opaque URL-safe token."""
+    parts = [value.isoformat() if isinstance(value, datetime) else str(value) for value in key]
+    return base64.urlsafe_b64encode(json.dumps(parts).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str], types: Sequence[type]) -> Optional[Tuple]:
+    """
+    Unwrap a token produced by encode_cursor, converting each part to the
+    expected type. Returns None when no cursor was given.
+
+    Raises:
+        InvalidCursor: If the token is malformed or does not match `types`
+    """
+    if cursor is None:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        parts = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(parts, list) or len(parts) != len(types):
+            raise ValueError("unexpected cursor shape")
+        return tuple(
+            datetime.fromisoformat(part) if kind is datetime else kind(part)
+            for part, kind in zip(parts, types)
+        )
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as exc:
+        raise InvalidCursor(f"Invalid pagination cursor: {cursor}") from exc
+
+
+def build_page(rows: List[T], limit: int, key: Callable[[T], Sequence]) -> Page[T]:
+    """
+    Build a page from up to limit + 1 rows fetched in listing order. The
+    extra row only signals that another page exists; the cursor points at
+    the last row kept.
+    """
+    if len(rows) <= limit:
+        return Page(items=rows)
+    items = rows[:limit]
+    return Page(items=items, next_cursor=encode_cursor(key(items[-1])))
@@ -1,12 +1,18 @@
 """Use Case: Create Asset"""
 from datetime import datetime, timezone
 from decimal import Decimal
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID, uuid4
 from pydantic import BaseModel
 from app.domain.entities.asset import Asset
-from app.domain.exceptions.Exceptions import PortfolioNotFound, AssetTypeNotFound
-from app.domain.ports.repository import IAssetRepository, IPortfolioRepository, IAssetTypeRepository
+from app.domain.exceptions.Exceptions import PortfolioNotFound, AssetTypeNotFound, TagNotFound
+from app.domain.ports.repository import (
+    IAssetRepository,
+    IPortfolioRepository,
+    IAssetTypeRepository,
+    ITagRepository,
+    IUnitOfWork,
+)
 
 
 class CreateAssetRequest(BaseModel):
@@ -15,39 +21,60 @@ class CreateAssetRequest(BaseModel):
     name: str
     quantity: Optional[Decimal] = None
     created_by: str
+    tag_ids: List[UUID] = []
 
 
 class CreateAssetUseCase:
+    """
+    Creates an asset, tagged with `tag_ids`, in one transaction: the asset is
+    not created if one of its tags does not exist.
+    """
     def __init__(
         self,
         asset_repository: IAssetRepository,
         portfolio_repository: IPortfolioRepository,
         asset_type_repository: IAssetTypeRepository,
+        tag_repository: ITagRepository,
+        uow: IUnitOfWork,
     ):
         self.asset_repository = asset_repository
         self.portfolio_repository = portfolio_repository
         self.asset_type_repository = asset_type_repository
+        self.tag_repository = tag_repository
+        self.uow = uow
 
     def execute(self, command: CreateAssetRequest) -> Asset:
-        portfolio = self.portfolio_repository.find_by_id(command.portfolio_id)
-        if not portfolio:
-            raise PortfolioNotFound(f"Portfolio with id {command.portfolio_id} not found.")
-
-        asset_type = self.asset_type_repository.find_by_id(command.asset_type_id)
-        if not asset_type:
-            raise AssetTypeNotFound(f"AssetType with id {command.asset_type_id} not found.")
-
-        now = datetime.now(timezone.utc)
-        new_asset = Asset(
-            id=uuid4(),
-            portfolio=portfolio,
-            asset_type=asset_type,
-            name=command.name,
-            quantity=command.quantity,
-            disposed=False,
-            created_at=now,
-            updated_at=now,
-            created_by=command.created_by,
-            updated_by=command.created_by,
-        )
-        return self.asset_repository.save(new_asset)
+        with self.uow:
+            portfolio = self.portfolio_repository.find_by_id(command.portfolio_id)
+            if not portfolio:
+                raise PortfolioNotFound(f"Portfolio with id {command.portfolio_id} not found.")
+
+            asset_type = self.asset_type_repository.find_by_id(command.asset_type_id)
+            if not asset_type:
+                raise AssetTypeNotFound(f"AssetType with id {command.asset_type_id} not found.")
+
+            tags = []
+            for tag_id in dict.fromkeys(command.tag_ids):
+                tag = self.tag_repository.find_by_id(str(tag_id))
+                if not tag:
+                    raise TagNotFound(f"Tag with id {tag_id} not found.")
+                tags.append(tag)
+
+            now = datetime.now(timezone.utc)
+            new_asset = Asset(
+                id=uuid4(),
+                portfolio=portfolio,
+                asset_type=asset_type,
+                name=command.name,
+                quantity=command.quantity,
+                disposed=False,
+                tags=set(tags),
+                created_at=now,
+                updated_at=now,
+                created_by=command.created_by,
+                updated_by=command.created_by,
+            )
+            saved = self.asset_repository.save(new_asset)
+            for tag in tags:
+                self.asset_repository.add_tag(str(saved.id), str(tag.id))
+            return saved
@@ -1,22 +1,25 @@
 """
 Use Case: Get All Assets
 """
-from typing import List
+from typing import Optional
 
-from app.domain.entities.asset import Asset
+from app.application.pagination import DEFAULT_PAGE_SIZE, Page, build_page, decode_cursor
+from app.domain.entities.asset_summary import AssetSummary
 from app.domain.ports.repository import IAssetRepository
 
 
 class GetAllAssetsUseCase:
     """
-    Use case for retrieving all assets.
+    Use case for retrieving all assets, one page at a time.
     """
 
     def __init__(self, asset_repository: IAssetRepository):
         self.asset_repository = asset_repository
 
-    def execute(self) -> List[Asset]:
+    def execute(self, limit: int = DEFAULT_PAGE_SIZE, cursor: Optional[str] = None) -> Page[AssetSummary]:
         """
-        Fetches all assets.
+        Fetches a page of asset summaries ordered by name, continuing after `cursor`.
         """
-        return self.asset_repository.find_all()
+        after = decode_cursor(cursor, (str, str))
+        assets = self.asset_repository.find_summary_page(limit + 1, after)
+        return build_page(assets, limit, lambda a: (a["name"], a["id"]))
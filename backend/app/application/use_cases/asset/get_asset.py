@@ -5,7 +5,7 @@ from uuid import UUID
 
 from app.domain.entities.asset import Asset
 from app.domain.exceptions import AssetNotFound
-from app.domain.ports.repository import IAssetRepository
+from app.domain.ports.repository import IAssetRepository, IAsyncAssetRepository
 
 
 class GetAssetUseCase:
@@ -27,3 +27,24 @@ class GetAssetUseCase:
         if asset is None:
             raise AssetNotFound(f"Asset with id {asset_id} not found.")
         return asset
+
+
+class AsyncGetAssetUseCase:
+    """
+    GetAssetUseCase on async repositories (API_STACK=async).
+    """
+
+    def __init__(self, asset_repository: IAsyncAssetRepository):
+        self.asset_repository = asset_repository
+
+    async def execute(self, asset_id: UUID) -> Asset:
+        """
+        Fetches an asset by its ID.
+
+        Raises:
+            AssetNotFound: If no asset with the given ID is found.
+        """
+        asset = await self.asset_repository.find_by_id(asset_id)
+        if asset is None:
+            raise AssetNotFound(f"Asset with id {asset_id} not found.")
+        return asset
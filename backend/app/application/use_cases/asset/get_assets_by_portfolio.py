@@ -1,6 +1,8 @@
 """Use Case: Get Assets by Portfolio"""
-from typing import List
+from typing import Optional
 from uuid import UUID
+from app.application.pagination import DEFAULT_PAGE_SIZE, Page, build_page, decode_cursor
+from app.domain.entities.asset_summary import AssetSummary
 from app.domain.exceptions import PortfolioNotFound
 from app.domain.ports.repository import IAssetRepository, IPortfolioRepository
 
@@ -10,8 +12,15 @@ class GetAssetsByPortfolioUseCase:
         self.asset_repository = asset_repository
         self.portfolio_repository = portfolio_repository
 
-    def execute(self, portfolio_id: UUID) -> List:
+    def execute(
+        self,
+        portfolio_id: UUID,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: Optional[str] = None,
+    ) -> Page[AssetSummary]:
+        after = decode_cursor(cursor, (str, str))
         portfolio = self.portfolio_repository.find_by_id(str(portfolio_id))
         if not portfolio:
             raise PortfolioNotFound(f"Portfolio with id {portfolio_id} not found.")
-        return self.asset_repository.find_by_portfolio(str(portfolio_id))
+        assets = self.asset_repository.find_summary_page(limit + 1, after, portfolio_id=str(portfolio_id))
+        return build_page(assets, limit, lambda a: (a["name"], a["id"]))
@@ -10,7 +10,7 @@ from pydantic import BaseModel
 
 from app.domain.entities.asset import Asset
 from app.domain.exceptions import AssetNotFound
-from app.domain.ports.repository import IAssetRepository
+from app.domain.ports.repository import IAssetRepository, IUnitOfWork
 
 
 class UpdateAssetCommand(BaseModel):
@@ -27,8 +27,9 @@ class UpdateAssetUseCase:
     """
     Use case for updating an existing asset's details.
     """
-    def __init__(self, asset_repository: IAssetRepository):
+    def __init__(self, asset_repository: IAssetRepository, uow: IUnitOfWork):
         self.asset_repository = asset_repository
+        self.uow = uow
 
     def execute(self, command: UpdateAssetCommand) -> Asset:
         """
@@ -37,14 +38,15 @@ class UpdateAssetUseCase:
         Raises:
             AssetNotFound: If the asset does not exist.
         """
-        asset = self.asset_repository.find_by_id(command.asset_id)
-        if not asset:
-            raise AssetNotFound(f"Asset with id {command.asset_id} not found.")
-
-        # Update fields
-        asset.name = command.name
-        asset.quantity = command.quantity
-        asset.updated_by = command.updated_by
-        asset.updated_at = datetime.now(timezone.utc)
-
-        return self.asset_repository.save(asset)
+        with self.uow:
+            asset = self.asset_repository.find_by_id(command.asset_id)
+            if not asset:
+                raise AssetNotFound(f"Asset with id {command.asset_id} not found.")
+
+            # Update fields
+            asset.name = command.name
+            asset.quantity = command.quantity
+            asset.updated_by = command.updated_by
+            asset.updated_at = datetime.now(timezone.utc)
+
+            return self.asset_repository.save(asset)
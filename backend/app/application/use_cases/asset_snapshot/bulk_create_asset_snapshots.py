@@ -0,0 +1,64 @@
+"""Use Case: Bulk Create Asset Snapshots"""
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import List, NamedTuple, Optional, Sequence
+from uuid import UUID, uuid4
+from pydantic import BaseModel
+from app.domain.ports.repository import IAssetSnapshotRepository, IAssetRepository, IUnitOfWork
+from app.domain.ports.repository.asset_snapshot_repository import SnapshotValues
+
+
+class BulkSnapshotItem(NamedTuple):
+    """One row of a batch, validated by the caller (the API request model) and not again here."""
+    asset_id: UUID
+    value: Decimal
+    observed_at: Optional[datetime] = None
+
+
+class BulkSnapshotError(BaseModel):
+    index: int
+    asset_id: UUID
+    code: str
+    message: str
+
+
+class BulkSnapshotResult(BaseModel):
+    created: int
+    errors: List[BulkSnapshotError]
+
+
+class BulkCreateAssetSnapshotsUseCase:
+    """
+    Creates many asset snapshots at once.
+
+    Asset existence is resolved with a single lookup for the whole batch; rows
+    referencing unknown assets are reported back by index and the remaining
+    rows are inserted together in one transaction.
+    """
+
+    def __init__(self, snapshot_repo: IAssetSnapshotRepository, asset_repo: IAssetRepository, uow: IUnitOfWork):
+        self.snapshot_repo = snapshot_repo
+        self.asset_repo = asset_repo
+        self.uow = uow
+
+    def execute(self, items: Sequence[BulkSnapshotItem]) -> BulkSnapshotResult:
+        asset_ids = [str(item.asset_id) for item in items]
+        existing = self.asset_repo.find_existing_ids(set(asset_ids))
+        now = datetime.now(timezone.utc)
+
+        rows: List[SnapshotValues] = []
+        errors: List[BulkSnapshotError] = []
+        for index, (item, asset_id) in enumerate(zip(items, asset_ids)):
+            if asset_id not in existing:
+                errors.append(BulkSnapshotError(
+                    index=index,
+                    asset_id=item.asset_id,
+                    code="ASSET_NOT_FOUND",
+                    message=f"Asset with id {item.asset_id} not found.",
+                ))
+                continue
+            rows.append((str(uuid4()), asset_id, item.value, item.observed_at or now))
+
+        with self.uow:
+            created = self.snapshot_repo.save_values(rows)
+        return BulkSnapshotResult(created=created, errors=errors)
@@ -0,0 +1,28 @@
+"""Use Case: Export Asset Snapshots"""
+from datetime import datetime
+from typing import Iterator, Optional
+from uuid import UUID
+from app.domain.entities.asset_snapshot import AssetSnapshot
+from app.domain.exceptions import AssetNotFound
+from app.domain.ports.repository import IAssetSnapshotRepository, IAssetRepository
+
+
+class ExportAssetSnapshotsUseCase:
+    """
+    Streams an asset's snapshot history, oldest first. The asset is checked
+    up front; snapshots are only read as the returned iterator is consumed.
+    """
+
+    def __init__(self, snapshot_repo: IAssetSnapshotRepository, asset_repo: IAssetRepository):
+        self.snapshot_repo = snapshot_repo
+        self.asset_repo = asset_repo
+
+    def execute(
+        self,
+        asset_id: UUID,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> Iterator[AssetSnapshot]:
+        if not self.asset_repo.exists(str(asset_id)):
+            raise AssetNotFound(f"Asset with id {asset_id} not found.")
+        return self.snapshot_repo.iter_snapshots(asset_id, start_date, end_date)
@@ -0,0 +1,26 @@
+"""Use Case: Get Asset Snapshot Series"""
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+from app.domain.entities.value_series import SeriesBucket, SeriesPoint
+from app.domain.exceptions import AssetNotFound
+from app.domain.ports.repository import IAssetSnapshotRepository, IAssetRepository
+
+
+class GetAssetSnapshotSeriesUseCase:
+    """Downsamples an asset's snapshot history into day, week or month buckets for charting."""
+
+    def __init__(self, snapshot_repo: IAssetSnapshotRepository, asset_repo: IAssetRepository):
+        self.snapshot_repo = snapshot_repo
+        self.asset_repo = asset_repo
+
+    def execute(
+        self,
+        asset_id: UUID,
+        bucket: SeriesBucket = SeriesBucket.DAY,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> List[SeriesPoint]:
+        if not self.asset_repo.exists(str(asset_id)):
+            raise AssetNotFound(f"Asset with id {asset_id} not found.")
+        return self.snapshot_repo.get_series(str(asset_id), bucket, start_date, end_date)
@@ -1,9 +1,16 @@
 """Use Case: Get Asset Snapshots"""
-from typing import List, Optional
+from typing import Optional
 from datetime import datetime
 from uuid import UUID
+from app.application.pagination import DEFAULT_PAGE_SIZE, Page, build_page, decode_cursor
+from app.domain.entities.asset_snapshot import AssetSnapshot
 from app.domain.exceptions import AssetNotFound
-from app.domain.ports.repository import IAssetSnapshotRepository, IAssetRepository
+from app.domain.ports.repository import (
+    IAssetRepository,
+    IAssetSnapshotRepository,
+    IAsyncAssetRepository,
+    IAsyncAssetSnapshotRepository,
+)
 
 
 class GetAssetSnapshotsUseCase:
@@ -16,8 +23,35 @@ class GetAssetSnapshotsUseCase:
         asset_id: UUID,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
-    ) -> List:
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: Optional[str] = None,
+    ) -> Page[AssetSnapshot]:
+        after = decode_cursor(cursor, (datetime, str))
         asset = self.asset_repo.find_by_id(str(asset_id))
         if not asset:
             raise AssetNotFound(f"Asset with id {asset_id} not found.")
-        return self.snapshot_repo.get_snapshots(str(asset_id), start_date, end_date)
+        snapshots = self.snapshot_repo.get_snapshots_page(str(asset_id), limit + 1, after, start_date, end_date)
+        return build_page(snapshots, limit, lambda s: (s.observed_at, s.id))
+
+
+class AsyncGetAssetSnapshotsUseCase:
+    """GetAssetSnapshotsUseCase on async repositories (API_STACK=async)."""
+
+    def __init__(self, snapshot_repo: IAsyncAssetSnapshotRepository, asset_repo: IAsyncAssetRepository):
+        self.snapshot_repo = snapshot_repo
+        self.asset_repo = asset_repo
+
+    async def execute(
+        self,
+        asset_id: UUID,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: Optional[str] = None,
+    ) -> Page[AssetSnapshot]:
+        after = decode_cursor(cursor, (datetime, str))
+        asset = await self.asset_repo.find_by_id(str(asset_id))
+        if not asset:
+            raise AssetNotFound(f"Asset with id {asset_id} not found.")
+        snapshots = await self.snapshot_repo.get_snapshots_page(str(asset_id), limit + 1, after, start_date, end_date)
+        return build_page(snapshots, limit, lambda s: (s.observed_at, s.id))
@@ -3,7 +3,7 @@ from uuid import UUID
 from pydantic import BaseModel
 from app.domain.entities.asset import Asset
 from app.domain.exceptions import AssetNotFound, CategoryNotFound
-from app.domain.ports.repository import IAssetRepository, ICategoryRepository
+from app.domain.ports.repository import IAssetRepository, ICategoryRepository, IUnitOfWork
 
 
 class AddAssetToCategoryCommand(BaseModel):
@@ -12,18 +12,25 @@ class AddAssetToCategoryCommand(BaseModel):
 
 
 class AddAssetToCategoryUseCase:
-    def __init__(self, asset_repository: IAssetRepository, category_repository: ICategoryRepository):
+    def __init__(
+        self,
+        asset_repository: IAssetRepository,
+        category_repository: ICategoryRepository,
+        uow: IUnitOfWork,
+    ):
         self.asset_repository = asset_repository
         self.category_repository = category_repository
+        self.uow = uow
 
     def execute(self, command: AddAssetToCategoryCommand) -> Asset:
-        asset = self.asset_repository.find_by_id(str(command.asset_id))
-        if not asset:
-            raise AssetNotFound(f"Asset with id {command.asset_id} not found.")
+        with self.uow:
+            asset = self.asset_repository.find_by_id(str(command.asset_id))
+            if not asset:
+                raise AssetNotFound(f"Asset with id {command.asset_id} not found.")
 
-        category = self.category_repository.find_by_id(str(command.category_id))
-        if not category:
-            raise CategoryNotFound(f"Category with id {command.category_id} not found.")
+            category = self.category_repository.find_by_id(str(command.category_id))
+            if not category:
+                raise CategoryNotFound(f"Category with id {command.category_id} not found.")
 
-        self.asset_repository.add_category(str(command.asset_id), str(command.category_id))
-        return asset
+            self.asset_repository.add_category(str(command.asset_id), str(command.category_id))
+            return asset
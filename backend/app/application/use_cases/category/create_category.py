@@ -5,7 +5,7 @@ from pydantic import BaseModel
 from app.domain.entities.category import Category
 from app.domain.exceptions import CategoryNotFound
 from app.domain.exceptions.Exceptions import DuplicateName
-from app.domain.ports.repository import ICategoryRepository
+from app.domain.ports.repository import ICategoryRepository, IUnitOfWork
 
 
 class CreateCategoryCommand(BaseModel):
@@ -14,19 +14,21 @@ class CreateCategoryCommand(BaseModel):
 
 
 class CreateCategoryUseCase:
-    def __init__(self, category_repository: ICategoryRepository):
+    def __init__(self, category_repository: ICategoryRepository, uow: IUnitOfWork):
         self.category_repository = category_repository
+        self.uow = uow
 
     def execute(self, command: CreateCategoryCommand) -> Category:
-        existing = self.category_repository.find_by_name(command.name)
-        if existing:
-            raise DuplicateName(f"Category with name '{command.name}' already exists.")
+        with self.uow:
+            existing = self.category_repository.find_by_name(command.name)
+            if existing:
+                raise DuplicateName(f"Category with name '{command.name}' already exists.")
 
-        parent: Optional[Category] = None
-        if command.parent_id:
-            parent = self.category_repository.find_by_id(str(command.parent_id))
-            if not parent:
-                raise CategoryNotFound(f"Parent category with id {command.parent_id} not found.")
+            parent: Optional[Category] = None
+            if command.parent_id:
+                parent = self.category_repository.find_by_id(str(command.parent_id))
+                if not parent:
+                    raise CategoryNotFound(f"Parent category with id {command.parent_id} not found.")
 
-        new_category = Category(id=uuid4(), name=command.name, parent=parent)
-        return self.category_repository.save(new_category)
+            new_category = Category(id=uuid4(), name=command.name, parent=parent)
+            return self.category_repository.save(new_category)
@@ -1,23 +1,25 @@
 """Use Case: Delete Category"""
 from uuid import UUID
 from app.domain.exceptions import CategoryNotFound, CategoryHasChildren
-from app.domain.ports.repository import ICategoryRepository
+from app.domain.ports.repository import ICategoryRepository, IUnitOfWork
 
 
 class DeleteCategoryUseCase:
-    def __init__(self, category_repository: ICategoryRepository):
+    def __init__(self, category_repository: ICategoryRepository, uow: IUnitOfWork):
         self.category_repository = category_repository
+        self.uow = uow
 
     def execute(self, category_id: UUID) -> None:
-        category = self.category_repository.find_by_id(str(category_id))
-        if not category:
-            raise CategoryNotFound(f"Category with id {category_id} not found.")
-        
-        children = self.category_repository.find_children(str(category_id))
-        if children:
-            raise CategoryHasChildren(
-                f"Cannot delete category '{category.name}' because it has {len(children)} child category(ies). "
-                "Delete or reassign children first."
-            )
-        
-        self.category_repository.delete(str(category_id))
+        with self.uow:
+            category = self.category_repository.find_by_id(str(category_id))
+            if not category:
+                raise CategoryNotFound(f"Category with id {category_id} not found.")
+
+            children = self.category_repository.find_children(str(category_id))
+            if children:
+                raise CategoryHasChildren(
+                    f"Cannot delete category '{category.name}' because it has {len(children)} child category(ies). "
+                    "Delete or reassign children first."
+                )
+
+            self.category_repository.delete(str(category_id))
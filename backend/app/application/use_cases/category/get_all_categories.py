@@ -1,5 +1,7 @@
 """Use Case: Get All Categories"""
-from typing import List
+from typing import Optional
+from app.application.pagination import DEFAULT_PAGE_SIZE, Page, build_page, decode_cursor
+from app.domain.entities.category import Category
 from app.domain.ports.repository import ICategoryRepository
 
 
@@ -7,5 +9,7 @@ class GetAllCategoriesUseCase:
     def __init__(self, category_repository: ICategoryRepository):
         self.category_repository = category_repository
 
-    def execute(self) -> List:
-        return self.category_repository.find_all()
+    def execute(self, limit: int = DEFAULT_PAGE_SIZE, cursor: Optional[str] = None) -> Page[Category]:
+        after = decode_cursor(cursor, (str, str))
+        categories = self.category_repository.find_page(limit + 1, after)
+        return build_page(categories, limit, lambda c: (c.name, c.id))
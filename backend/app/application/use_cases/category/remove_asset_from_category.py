@@ -2,7 +2,7 @@
 from uuid import UUID
 from pydantic import BaseModel
 from app.domain.exceptions import AssetNotFound, CategoryNotFound
-from app.domain.ports.repository import IAssetRepository, ICategoryRepository
+from app.domain.ports.repository import IAssetRepository, ICategoryRepository, IUnitOfWork
 
 
 class RemoveAssetFromCategoryCommand(BaseModel):
@@ -11,17 +11,24 @@ class RemoveAssetFromCategoryCommand(BaseModel):
 
 
 class RemoveAssetFromCategoryUseCase:
-    def __init__(self, asset_repository: IAssetRepository, category_repository: ICategoryRepository):
+    def __init__(
+        self,
+        asset_repository: IAssetRepository,
+        category_repository: ICategoryRepository,
+        uow: IUnitOfWork,
+    ):
         self.asset_repository = asset_repository
         self.category_repository = category_repository
+        self.uow = uow
 
     def execute(self, command: RemoveAssetFromCategoryCommand) -> None:
-        asset = self.asset_repository.find_by_id(str(command.asset_id))
-        if not asset:
-            raise AssetNotFound(f"Asset with id {command.asset_id} not found.")
+        with self.uow:
+            asset = self.asset_repository.find_by_id(str(command.asset_id))
+            if not asset:
+                raise AssetNotFound(f"Asset with id {command.asset_id} not found.")
 
-        category = self.category_repository.find_by_id(str(command.category_id))
-        if not category:
-            raise CategoryNotFound(f"Category with id {command.category_id} not found.")
+            category = self.category_repository.find_by_id(str(command.category_id))
+            if not category:
+                raise CategoryNotFound(f"Category with id {command.category_id} not found.")
 
-        self.asset_repository.remove_category(str(command.asset_id), str(command.category_id))
+            self.asset_repository.remove_category(str(command.asset_id), str(command.category_id))
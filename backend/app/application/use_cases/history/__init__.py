@@ -0,0 +1 @@
+# history use cases package
@@ -0,0 +1,214 @@
+"""Use Case: Import History"""
+import time
+from datetime import datetime
+from decimal import Decimal
+from enum import Enum
+from itertools import islice
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+from uuid import UUID, uuid4
+
+from pydantic import BaseModel, Field, ValidationError, field_validator
+
+from app.domain.entities.asset_snapshot import AssetSnapshot
+from app.domain.entities.transaction import Transaction, TransactionType
+from app.domain.ports.repository import (
+    IAssetRepository,
+    IAssetSnapshotRepository,
+    ITransactionRepository,
+    IUnitOfWork,
+)
+
+# Rows written per database transaction
+IMPORT_CHUNK_SIZE = 5_000
+# Row errors kept in the report; further failures are only counted
+MAX_REPORTED_ERRORS = 100
+
+# (line number, parsed fields) — fields is None when the line could not be parsed
+ImportRecord = Tuple[int, Optional[dict]]
+
+
+class ImportKind(str, Enum):
+    SNAPSHOTS = "snapshots"
+    TRANSACTIONS = "transactions"
+
+
+class SnapshotImportRow(BaseModel):
+    asset: str  # Asset id or name
+    value: Decimal
+    observed_at: datetime
+
+
+class TransactionImportRow(BaseModel):
+    asset: str  # Asset id or name
+    type: TransactionType
+    quantity: Decimal
+    unit_price: Decimal
+    currency: str = Field(min_length=3, max_length=3)
+    occurred_at: datetime
+
+    @field_validator("type", mode="before")
+    @classmethod
+    def _upper(cls, value):
+        return value.upper() if isinstance(value, str) else value
+
+
+class ImportRowError(BaseModel):
+    line: int
+    code: str
+    message: str
+
+
+class ImportReport(BaseModel):
+    kind: ImportKind
+    rows_read: int = 0
+    imported: int = 0
+    failed: int = 0
+    errors: List[ImportRowError] = []
+    elapsed_seconds: float = 0.0
+    rows_per_second: float = 0.0
+
+
+_ROW_MODELS = {
+    ImportKind.SNAPSHOTS: SnapshotImportRow,
+    ImportKind.TRANSACTIONS: TransactionImportRow,
+}
+
+
+class ImportHistoryUseCase:
+    """
+    Imports asset snapshots or transactions from a stream of parsed records.
+
+    Records are consumed chunk by chunk so memory stays bounded whatever the
+    input size: each chunk's asset references (ids or names) are resolved in
+    batch, cached for the following chunks, and the chunk is written in its
+    own database transaction. Rows that could not be parsed, fail validation
+    or reference an unknown/ambiguous asset are counted and reported by line
+    number.
+
+    Each chunk is committed as soon as it is written, so an import is not
+    atomic: if it fails partway (the database goes away, the upload is cut
+    off), the chunks before the failure stay imported.
+    """
+
+    def __init__(
+        self,
+        snapshot_repo: IAssetSnapshotRepository,
+        transaction_repo: ITransactionRepository,
+        asset_repo: IAssetRepository,
+        uow: IUnitOfWork,
+    ):
+        self.snapshot_repo = snapshot_repo
+        self.transaction_repo = transaction_repo
+        self.asset_repo = asset_repo
+        self.uow = uow
+
+    def execute(
+        self,
+        kind: ImportKind,
+        records: Iterable[ImportRecord],
+        portfolio_id: Optional[UUID] = None,
+        chunk_size: int = IMPORT_CHUNK_SIZE,
+        on_progress: Optional[Callable[[ImportReport], None]] = None,
+    ) -> ImportReport:
+        report = ImportReport(kind=kind)
+        # Asset reference -> asset id, or the error code explaining why it did not resolve
+        resolved: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
+        started = time.perf_counter()
+
+        records = iter(records)
+        while chunk := list(islice(records, chunk_size)):
+            report.rows_read += len(chunk)
+            rows = self._validate(kind, chunk, report)
+            self._resolve_assets({row.asset for _, row in rows} - resolved.keys(), portfolio_id, resolved)
+
+            entities = []
+            for line, row in rows:
+                asset_id, error = resolved[row.asset]
+                if error:
+                    self._fail(report, line, error, f"Asset '{row.asset}' could not be resolved ({error}).")
+                    continue
+                entities.append(self._to_entity(kind, row, asset_id))
+
+            with self.uow:
+                if kind is ImportKind.SNAPSHOTS:
+                    report.imported += self.snapshot_repo.save_many(entities)
+                else:
+                    report.imported += self.transaction_repo.save_many(entities)
+
+            self._update_throughput(report, started)
+            if on_progress:
+                on_progress(report)
+
+        self._update_throughput(report, started)
+        return report
+
+    def _validate(
+        self, kind: ImportKind, chunk: List[ImportRecord], report: ImportReport
+    ) -> List[Tuple[int, Union[SnapshotImportRow, TransactionImportRow]]]:
+        row_model = _ROW_MODELS[kind]
+        rows = []
+        for line, fields in chunk:
+            if fields is None:
+                self._fail(report, line, "INVALID_ROW", "Record could not be parsed.")
+                continue
+            try:
+                rows.append((line, row_model.model_validate(fields)))
+            except ValidationError as exc:
+                detail = "; ".join(f"{'.'.join(map(str, e['loc']))}: {e['msg']}" for e in exc.errors())
+                self._fail(report, line, "INVALID_ROW", detail)
+        return rows
+
+    def _resolve_assets(
+        self,
+        refs: Iterable[str],
+        portfolio_id: Optional[UUID],
+        resolved: Dict[str, Tuple[Optional[str], Optional[str]]],
+    ) -> None:
+        """Resolve new asset references: ids with one lookup, names with another."""
+        by_id = {}
+        for ref in refs:
+            try:
+                by_id[ref] = str(UUID(ref))
+            except ValueError:
+                pass
+        existing = self.asset_repo.find_existing_ids(by_id.values()) if by_id else set()
+        for ref, asset_id in by_id.items():
+            if asset_id in existing:
+                resolved[ref] = (asset_id, None)
+
+        names = [ref for ref in refs if ref not in resolved]
+        matches = self.asset_repo.find_ids_by_names(names, portfolio_id) if names else {}
+        for name in names:
+            ids = matches.get(name, [])
+            if len(ids) == 1:
+                resolved[name] = (ids[0], None)
+            elif ids:
+                resolved[name] = (None, "AMBIGUOUS_ASSET")
+            else:
+                resolved[name] = (None, "ASSET_NOT_FOUND")
+
+    @staticmethod
+    def _to_entity(kind: ImportKind, row, asset_id: str):
+        if kind is ImportKind.SNAPSHOTS:
+            return AssetSnapshot(id=uuid4(), asset_id=asset_id, value=row.value, observed_at=row.observed_at)
+        return Transaction(
+            id=uuid4(),
+            asset_id=asset_id,
+            type=row.type.value,
+            quantity=row.quantity,
+            unit_price=row.unit_price,
+            currency=row.currency.upper(),
+            occurred_at=row.occurred_at,
+        )
+
+    @staticmethod
+    def _fail(report: ImportReport, line: int, code: str, message: str) -> None:
+        report.failed += 1
+        if len(report.errors) < MAX_REPORTED_ERRORS:
+            report.errors.append(ImportRowError(line=line, code=code, message=message))
+
+    @staticmethod
+    def _update_throughput(report: ImportReport, started: float) -> None:
+        report.elapsed_seconds = time.perf_counter() - started
+        if report.elapsed_seconds > 0:
+            report.rows_per_second = report.rows_read / report.elapsed_seconds
@@ -3,7 +3,7 @@ from datetime import datetime, timezone
 from uuid import uuid4
 from pydantic import BaseModel
 from app.domain.entities.portfolio import Portfolio
-from app.domain.ports.repository import IPortfolioRepository
+from app.domain.ports.repository import IPortfolioRepository, IUnitOfWork
 
 
 class CreatePortfolioCommand(BaseModel):
@@ -12,16 +12,18 @@ class CreatePortfolioCommand(BaseModel):
 
 
 class CreatePortfolioUseCase:
-    def __init__(self, portfolio_repository: IPortfolioRepository):
+    def __init__(self, portfolio_repository: IPortfolioRepository, uow: IUnitOfWork):
         self.portfolio_repository = portfolio_repository
+        self.uow = uow
 
     def execute(self, command: CreatePortfolioCommand) -> Portfolio:
-        now = datetime.now(timezone.utc)
-        new_portfolio = Portfolio(
-            id=uuid4(),
-            name=command.name,
-            base_currency=command.base_currency,
-            created_at=now,
-            updated_at=now,
-        )
-        return self.portfolio_repository.save(new_portfolio)
+        with self.uow:
+            now = datetime.now(timezone.utc)
+            new_portfolio = Portfolio(
+                id=uuid4(),
+                name=command.name,
+                base_currency=command.base_currency,
+                created_at=now,
+                updated_at=now,
+            )
+            return self.portfolio_repository.save(new_portfolio)
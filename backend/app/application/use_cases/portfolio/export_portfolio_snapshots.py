@@ -0,0 +1,32 @@
+"""Use Case: Export Portfolio Snapshots"""
+from datetime import datetime
+from typing import Iterator, Optional
+from uuid import UUID
+from app.domain.entities.portfolio_snapshot import PortfolioSnapshot
+from app.domain.exceptions import PortfolioNotFound
+from app.domain.ports.repository import IPortfolioRepository, IPortfolioSnapshotRepository
+
+
+class ExportPortfolioSnapshotsUseCase:
+    """
+    Streams a portfolio's snapshot history, oldest first. The portfolio is
+    checked up front; snapshots are only read as the iterator is consumed.
+    """
+
+    def __init__(
+        self,
+        portfolio_repository: IPortfolioRepository,
+        snapshot_repository: IPortfolioSnapshotRepository,
+    ):
+        self.portfolio_repository = portfolio_repository
+        self.snapshot_repository = snapshot_repository
+
+    def execute(
+        self,
+        portfolio_id: UUID,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> Iterator[PortfolioSnapshot]:
+        if not self.portfolio_repository.exists(str(portfolio_id)):
+            raise PortfolioNotFound(f"Portfolio with id {portfolio_id} not found.")
+        return self.snapshot_repository.iter_snapshots(portfolio_id, start_date, end_date)
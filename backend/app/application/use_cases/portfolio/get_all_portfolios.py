@@ -1,14 +1,24 @@
 """Use Case: Get All Portfolios"""
 from typing import List
-from app.domain.entities.portfolio import Portfolio
-from app.domain.ports.repository import IPortfolioRepository
+from app.domain.entities.portfolio_summary import PortfolioSummary
+from app.domain.ports.repository import IAsyncPortfolioRepository, IPortfolioRepository
 
 
 class GetAllPortfoliosUseCase:
-    """Use case for retrieving all portfolios."""
+    """Use case for listing all portfolios with their aggregate figures."""
 
     def __init__(self, portfolio_repository: IPortfolioRepository):
         self.portfolio_repository = portfolio_repository
 
-    def execute(self) -> List[Portfolio]:
-        return self.portfolio_repository.find_all()
+    def execute(self) -> List[PortfolioSummary]:
+        return self.portfolio_repository.find_all_summaries()
+
+
+class AsyncGetAllPortfoliosUseCase:
+    """GetAllPortfoliosUseCase on async repositories (API_STACK=async)."""
+
+    def __init__(self, portfolio_repository: IAsyncPortfolioRepository):
+        self.portfolio_repository = portfolio_repository
+
+    async def execute(self) -> List[PortfolioSummary]:
+        return await self.portfolio_repository.find_all_summaries()
@@ -3,26 +3,27 @@ Use Case: Get Portfolio
 """
 from uuid import UUID
 
-from app.domain.entities.portfolio import Portfolio
+from app.domain.entities.portfolio_summary import PortfolioSummary
 from app.domain.exceptions import PortfolioNotFound
 from app.domain.ports.repository import IPortfolioRepository
 
 
 class GetPortfolioUseCase:
     """
-    Use case for retrieving a single portfolios, including its assets.
+    Use case for retrieving a single portfolios together with its current total value.
     """
     def __init__(self, portfolio_repository: IPortfolioRepository):
         self.portfolio_repository = portfolio_repository
 
-    def execute(self, portfolio_id: UUID) -> Portfolio:
+    def execute(self, portfolio_id: UUID) -> PortfolioSummary:
         """
-        Fetches a portfolios by its ID, eagerly loading its assets.
+        Fetches a portfolios summary by its ID. Its valuation is computed by the
+        repository, so the asset snapshot history is never loaded.
 
         Raises:
             PortfolioNotFound: If no portfolios with the given ID is found.
         """
-        portfolio = self.portfolio_repository.find_with_assets(portfolio_id)
-        if portfolio is None:
+        summary = self.portfolio_repository.find_summary(portfolio_id)
+        if summary is None:
             raise PortfolioNotFound(f"Portfolio with id {portfolio_id} not found.")
-        return portfolio
+        return summary
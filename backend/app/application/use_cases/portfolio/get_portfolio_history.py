@@ -0,0 +1,53 @@
+"""Use Case: Get Portfolio History"""
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
+from uuid import UUID
+from app.application.analytics.as_of import AsOfIndex, sample_moments
+from app.domain.entities.snapshot_series import to_utc
+from app.domain.entities.value_series import ValuePoint
+from app.domain.exceptions import InvalidTimeRange, PortfolioNotFound
+from app.domain.ports.repository import IAssetSnapshotRepository, IPortfolioRepository
+
+DEFAULT_HISTORY_SPAN = timedelta(days=365)
+DEFAULT_HISTORY_STEP = timedelta(days=1)
+# Upper bound on sampled moments per request
+MAX_HISTORY_POINTS = 10_000
+
+
+class GetPortfolioHistoryUseCase:
+    """
+    Values a portfolio at evenly spaced moments: each asset counts with its
+    latest snapshot at or before the moment. All moments are valued at once
+    by the vectorized as-of index, from a single query of the asset histories.
+    """
+
+    def __init__(
+        self,
+        portfolio_repository: IPortfolioRepository,
+        snapshot_repository: IAssetSnapshotRepository,
+    ):
+        self.portfolio_repository = portfolio_repository
+        self.snapshot_repository = snapshot_repository
+
+    def execute(
+        self,
+        portfolio_id: UUID,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        step: timedelta = DEFAULT_HISTORY_STEP,
+    ) -> List[ValuePoint]:
+        end = to_utc(end) if end else datetime.now(timezone.utc)
+        start = to_utc(start) if start else end - DEFAULT_HISTORY_SPAN
+        if step <= timedelta(0):
+            raise InvalidTimeRange("History step must be positive.")
+        if start > end:
+            raise InvalidTimeRange("History start must not be after its end.")
+        if (end - start) // step + 1 > MAX_HISTORY_POINTS:
+            raise InvalidTimeRange(f"History is limited to {MAX_HISTORY_POINTS} points; use a larger step.")
+        if not self.portfolio_repository.exists(str(portfolio_id)):
+            raise PortfolioNotFound(f"Portfolio with id {portfolio_id} not found.")
+
+        series = self.snapshot_repository.get_portfolio_snapshot_series(portfolio_id, end)
+        moments = sample_moments(start, end, step)
+        totals = AsOfIndex.from_series(series).totals_at(moments)
+        return [ValuePoint(observed_at=m, value=v) for m, v in zip(moments, totals)]
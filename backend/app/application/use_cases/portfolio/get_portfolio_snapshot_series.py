@@ -0,0 +1,30 @@
+"""Use Case: Get Portfolio Snapshot Series"""
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+from app.domain.entities.value_series import SeriesBucket, SeriesPoint
+from app.domain.exceptions import PortfolioNotFound
+from app.domain.ports.repository import IPortfolioRepository, IPortfolioSnapshotRepository
+
+
+class GetPortfolioSnapshotSeriesUseCase:
+    """Downsamples a portfolio's net worth history into day, week or month buckets for charting."""
+
+    def __init__(
+        self,
+        portfolio_repository: IPortfolioRepository,
+        snapshot_repository: IPortfolioSnapshotRepository,
+    ):
+        self.portfolio_repository = portfolio_repository
+        self.snapshot_repository = snapshot_repository
+
+    def execute(
+        self,
+        portfolio_id: UUID,
+        bucket: SeriesBucket = SeriesBucket.DAY,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> List[SeriesPoint]:
+        if not self.portfolio_repository.exists(str(portfolio_id)):
+            raise PortfolioNotFound(f"Portfolio with id {portfolio_id} not found.")
+        return self.snapshot_repository.get_series(portfolio_id, bucket, start_date, end_date)
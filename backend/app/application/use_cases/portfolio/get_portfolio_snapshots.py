@@ -2,26 +2,35 @@
 from datetime import datetime
 from typing import Optional
 from uuid import UUID
-from app.domain.entities.portfolio import Portfolio
+from app.application.pagination import DEFAULT_PAGE_SIZE, Page, build_page, decode_cursor
+from app.domain.entities.portfolio_snapshot import PortfolioSnapshot
 from app.domain.exceptions import PortfolioNotFound
-from app.domain.ports.repository import IPortfolioRepository
+from app.domain.ports.repository import IPortfolioRepository, IPortfolioSnapshotRepository
 
 
 class GetPortfolioSnapshotsUseCase:
-    """Retrieves historical portfolio snapshots for charting net worth over time."""
+    """Retrieves historical portfolio snapshots for charting net worth over time, newest first."""
 
-    def __init__(self, portfolio_repository: IPortfolioRepository):
+    def __init__(
+        self,
+        portfolio_repository: IPortfolioRepository,
+        snapshot_repository: IPortfolioSnapshotRepository,
+    ):
         self.portfolio_repository = portfolio_repository
+        self.snapshot_repository = snapshot_repository
 
     def execute(
         self,
         portfolio_id: UUID,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
-    ) -> Portfolio:
-        portfolio = self.portfolio_repository.find_with_snapshots(
-            portfolio_id, start_date=start_date, end_date=end_date
-        )
-        if portfolio is None:
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: Optional[str] = None,
+    ) -> Page[PortfolioSnapshot]:
+        after = decode_cursor(cursor, (datetime, str))
+        if not self.portfolio_repository.exists(str(portfolio_id)):
             raise PortfolioNotFound(f"Portfolio with id {portfolio_id} not found.")
-        return portfolio
+        snapshots = self.snapshot_repository.get_snapshots_page(
+            portfolio_id, limit + 1, after, start_date=start_date, end_date=end_date
+        )
+        return build_page(snapshots, limit, lambda s: (s.observed_at, s.id))
@@ -3,7 +3,7 @@ from datetime import datetime, timezone
 from uuid import UUID, uuid4
 from app.domain.entities.portfolio_snapshot import PortfolioSnapshot
 from app.domain.exceptions import PortfolioNotFound
-from app.domain.ports.repository import IPortfolioRepository
+from app.domain.ports.repository import IPortfolioRepository, IUnitOfWork
 
 
 class TakePortfolioSnapshotUseCase:
@@ -12,21 +12,22 @@ class TakePortfolioSnapshotUseCase:
     and persists it as a PortfolioSnapshot for historical tracking.
     """
 
-    def __init__(self, portfolio_repository: IPortfolioRepository):
+    def __init__(self, portfolio_repository: IPortfolioRepository, uow: IUnitOfWork):
         self.portfolio_repository = portfolio_repository
+        self.uow = uow
 
     def execute(self, portfolio_id: UUID) -> PortfolioSnapshot:
-        portfolio = self.portfolio_repository.find_with_assets(portfolio_id)
-        if portfolio is None:
-            raise PortfolioNotFound(f"Portfolio with id {portfolio_id} not found.")
+        with self.uow:
+            if not self.portfolio_repository.exists(str(portfolio_id)):
+                raise PortfolioNotFound(f"Portfolio with id {portfolio_id} not found.")
 
-        total_value = portfolio.total_value()
+            total_value = self.portfolio_repository.get_total_value(portfolio_id)
 
-        snapshot = PortfolioSnapshot(
-            id=uuid4(),
-            portfolio_id=portfolio.id,
-            value=total_value,
-            observed_at=datetime.now(timezone.utc),
-        )
-        self.portfolio_repository.save_snapshot(snapshot)
-        return snapshot
+            snapshot = PortfolioSnapshot(
+                id=uuid4(),
+                portfolio_id=portfolio_id,
+                value=total_value,
+                observed_at=datetime.now(timezone.utc),
+            )
+            self.portfolio_repository.save_snapshot(snapshot)
+            return snapshot
@@ -3,7 +3,7 @@ from datetime import datetime, timezone
 from uuid import UUID
 from pydantic import BaseModel
 from app.domain.exceptions import PortfolioNotFound
-from app.domain.ports.repository import IPortfolioRepository
+from app.domain.ports.repository import IPortfolioRepository, IUnitOfWork
 
 
 class UpdatePortfolioCommand(BaseModel):
@@ -13,15 +13,17 @@ class UpdatePortfolioCommand(BaseModel):
 
 
 class UpdatePortfolioUseCase:
-    def __init__(self, portfolio_repository: IPortfolioRepository):
+    def __init__(self, portfolio_repository: IPortfolioRepository, uow: IUnitOfWork):
         self.portfolio_repository = portfolio_repository
+        self.uow = uow
 
     def execute(self, command: UpdatePortfolioCommand):
-        portfolio = self.portfolio_repository.find_by_id(str(command.portfolio_id))
-        if not portfolio:
-            raise PortfolioNotFound(f"Portfolio with id {command.portfolio_id} not found.")
-        
-        portfolio.name = command.name
-        portfolio.base_currency = command.base_currency
-        portfolio.updated_at = datetime.now(timezone.utc)
-        return self.portfolio_repository.save(portfolio)
+        with self.uow:
+            portfolio = self.portfolio_repository.find_by_id(str(command.portfolio_id))
+            if not portfolio:
+                raise PortfolioNotFound(f"Portfolio with id {command.portfolio_id} not found.")
+
+            portfolio.name = command.name
+            portfolio.base_currency = command.base_currency
+            portfolio.updated_at = datetime.now(timezone.utc)
+            return self.portfolio_repository.save(portfolio)
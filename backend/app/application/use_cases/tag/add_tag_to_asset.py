@@ -2,7 +2,7 @@
 from uuid import UUID
 from pydantic import BaseModel
 from app.domain.exceptions import AssetNotFound, TagNotFound
-from app.domain.ports.repository import IAssetRepository, ITagRepository
+from app.domain.ports.repository import IAssetRepository, ITagRepository, IUnitOfWork
 
 
 class AddTagToAssetCommand(BaseModel):
@@ -11,18 +11,20 @@ class AddTagToAssetCommand(BaseModel):
 
 
 class AddTagToAssetUseCase:
-    def __init__(self, asset_repository: IAssetRepository, tag_repository: ITagRepository):
+    def __init__(self, asset_repository: IAssetRepository, tag_repository: ITagRepository, uow: IUnitOfWork):
         self.asset_repository = asset_repository
         self.tag_repository = tag_repository
+        self.uow = uow
 
     def execute(self, command: AddTagToAssetCommand):
-        asset = self.asset_repository.find_by_id(str(command.asset_id))
-        if not asset:
-            raise AssetNotFound(f"Asset with id {command.asset_id} not found.")
-        
-        tag = self.tag_repository.find_by_id(str(command.tag_id))
-        if not tag:
-            raise TagNotFound(f"Tag with id {command.tag_id} not found.")
-        
-        self.asset_repository.add_tag(str(command.asset_id), str(command.tag_id))
-        return asset
+        with self.uow:
+            asset = self.asset_repository.find_by_id(str(command.asset_id))
+            if not asset:
+                raise AssetNotFound(f"Asset with id {command.asset_id} not found.")
+
+            tag = self.tag_repository.find_by_id(str(command.tag_id))
+            if not tag:
+                raise TagNotFound(f"Tag with id {command.tag_id} not found.")
+
+            self.asset_repository.add_tag(str(command.asset_id), str(command.tag_id))
+            return asset
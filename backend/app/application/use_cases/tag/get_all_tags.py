@@ -1,5 +1,7 @@
 """Use Case: Get All Tags"""
-from typing import List
+from typing import Optional
+from app.application.pagination import DEFAULT_PAGE_SIZE, Page, build_page, decode_cursor
+from app.domain.entities.tag import Tag
 from app.domain.ports.repository import ITagRepository
 
 
@@ -7,5 +9,7 @@ class GetAllTagsUseCase:
     def __init__(self, tag_repository: ITagRepository):
         self.tag_repository = tag_repository
 
-    def execute(self) -> List:
-        return self.tag_repository.find_all()
+    def execute(self, limit: int = DEFAULT_PAGE_SIZE, cursor: Optional[str] = None) -> Page[Tag]:
+        after = decode_cursor(cursor, (str, str))
+        tags = self.tag_repository.find_page(limit + 1, after)
+        return build_page(tags, limit, lambda t: (t.name, t.id))
@@ -2,7 +2,7 @@
 from uuid import UUID
 from pydantic import BaseModel
 from app.domain.exceptions import AssetNotFound, TagNotFound
-from app.domain.ports.repository import IAssetRepository, ITagRepository
+from app.domain.ports.repository import IAssetRepository, ITagRepository, IUnitOfWork
 
 
 class RemoveTagFromAssetCommand(BaseModel):
@@ -11,17 +11,19 @@ class RemoveTagFromAssetCommand(BaseModel):
 
 
 class RemoveTagFromAssetUseCase:
-    def __init__(self, asset_repository: IAssetRepository, tag_repository: ITagRepository):
+    def __init__(self, asset_repository: IAssetRepository, tag_repository: ITagRepository, uow: IUnitOfWork):
         self.asset_repository = asset_repository
         self.tag_repository = tag_repository
+        self.uow = uow
 
     def execute(self, command: RemoveTagFromAssetCommand) -> None:
-        asset = self.asset_repository.find_by_id(str(command.asset_id))
-        if not asset:
-            raise AssetNotFound(f"Asset with id {command.asset_id} not found.")
-        
-        tag = self.tag_repository.find_by_id(str(command.tag_id))
-        if not tag:
-            raise TagNotFound(f"Tag with id {command.tag_id} not found.")
-        
-        self.asset_repository.remove_tag(str(command.asset_id), str(command.tag_id))
+        with self.uow:
+            asset = self.asset_repository.find_by_id(str(command.asset_id))
+            if not asset:
+                raise AssetNotFound(f"Asset with id {command.asset_id} not found.")
+
+            tag = self.tag_repository.find_by_id(str(command.tag_id))
+            if not tag:
+                raise TagNotFound(f"Tag with id {command.tag_id} not found.")
+
+            self.asset_repository.remove_tag(str(command.asset_id), str(command.tag_id))
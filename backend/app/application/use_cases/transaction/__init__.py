@@ -0,0 +1 @@
+# transaction use cases package
@@ -0,0 +1,28 @@
+"""Use Case: Export Asset Transactions"""
+from datetime import datetime
+from typing import Iterator, Optional
+from uuid import UUID
+from app.domain.entities.transaction import Transaction
+from app.domain.exceptions import AssetNotFound
+from app.domain.ports.repository import IAssetRepository, ITransactionRepository
+
+
+class ExportAssetTransactionsUseCase:
+    """
+    Streams an asset's transactions, oldest first. The asset is checked up
+    front; transactions are only read as the returned iterator is consumed.
+    """
+
+    def __init__(self, transaction_repo: ITransactionRepository, asset_repo: IAssetRepository):
+        self.transaction_repo = transaction_repo
+        self.asset_repo = asset_repo
+
+    def execute(
+        self,
+        asset_id: UUID,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> Iterator[Transaction]:
+        if not self.asset_repo.exists(str(asset_id)):
+            raise AssetNotFound(f"Asset with id {asset_id} not found.")
+        return self.transaction_repo.iter_by_asset(asset_id, start_date, end_date)
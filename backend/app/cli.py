@@ -1,8 +1,10 @@
-"""Tiny CLI helpers to run the test suite from `poetry run`.
+"""Tiny CLI helpers exposed through `poetry run`.
 
-Provides two entry points used by poetry scripts:
+Provides the entry points used by poetry scripts:
 - `test` / `app.cli:run` - runs pytest with any forwarded args
 - `test-coverage` / `app.cli:coverage` - runs pytest with coverage and writes tests/coverage.xml
+- `import-history` / `app.cli:import_history` - streams a CSV/NDJSON history file into the database
+- `generate-dataset` / `app.cli:generate_dataset` - fills the database with a synthetic data set
 
 These wrappers keep behavior consistent whether run in CI or locally.
 """
@@ -11,6 +13,10 @@ from __future__ import annotations
 import os
 import sys
 from pathlib import Path
+from typing import Optional
+from uuid import UUID
+
+import click
 
 ROOT = Path(__file__).resolve().parents[1]
 
@@ -51,3 +57,132 @@ def coverage() -> None:
     ] + args
     os.chdir(ROOT)
     os.execvp(cmd[0], cmd)
+
+
+@click.command()
+@click.argument("kind", type=click.Choice(["snapshots", "transactions"]))
+@click.argument("path", type=click.Path(exists=True, dir_okay=False, path_type=Path))
+@click.option("--format", "fmt", type=click.Choice(["csv", "ndjson"]), default=None,
+              help="Input format; inferred from the file extension by default.")
+@click.option("--portfolio-id", type=click.UUID, default=None,
+              help="Only resolve asset names within this portfolio.")
+@click.option("--chunk-size", type=click.IntRange(min=1), default=None,
+              help="Rows written per database transaction.")
+def import_history(
+    kind: str,
+    path: Path,
+    fmt: Optional[str],
+    portfolio_id: Optional[UUID],
+    chunk_size: Optional[int],
+) -> None:
+    """Import asset snapshots or transactions from a CSV/NDJSON file.
+
+    The file is read as a stream and written in chunked transactions, so
+    memory stays bounded whatever its size. Assets are referenced by id or
+    by name in an `asset` column.
+    """
+    # Imported lazily so the test helpers above do not need a database
+    from app.adapters.incoming.importers.history_reader import ImportFormat, read_records
+    from app.adapters.outgoing.persistence.database import WriteSessionLocal
+    from app.adapters.outgoing.persistence.repository.sqlalchemy_asset_repository import SQLAlchemyAssetRepository
+    from app.adapters.outgoing.persistence.repository.sqlalchemy_asset_snapshot_repository import SQLAlchemyAssetSnapshotRepository
+    from app.adapters.outgoing.persistence.repository.sqlalchemy_transaction_repository import SQLAlchemyTransactionRepository
+    from app.adapters.outgoing.persistence.repository.sqlalchemy_unit_of_work import SQLAlchemyUnitOfWork
+    from app.application.use_cases.history.import_history import IMPORT_CHUNK_SIZE, ImportHistoryUseCase, ImportKind
+
+    try:
+        import_format = ImportFormat(fmt) if fmt else ImportFormat.from_path(path)
+    except ValueError as exc:
+        raise click.UsageError(str(exc))
+
+    def progress(report) -> None:
+        click.echo(
+            f"\r{report.rows_read:,} rows read, {report.imported:,} imported, "
+            f"{report.failed:,} failed ({report.rows_per_second:,.0f} rows/s)",
+            nl=False,
+            err=True,
+        )
+
+    with WriteSessionLocal() as session, path.open("rb") as stream:
+        use_case = ImportHistoryUseCase(
+            SQLAlchemyAssetSnapshotRepository(session),
+            SQLAlchemyTransactionRepository(session),
+            SQLAlchemyAssetRepository(session),
+            SQLAlchemyUnitOfWork(session),
+        )
+        report = use_case.execute(
+            ImportKind(kind),
+            read_records(stream, import_format),
+            portfolio_id=portfolio_id,
+            chunk_size=chunk_size or IMPORT_CHUNK_SIZE,
+            on_progress=progress,
+        )
+    click.echo(err=True)
+
+    for error in report.errors:
+        click.echo(f"line {error.line}: {error.code} {error.message}", err=True)
+    if report.failed > len(report.errors):
+        click.echo(f"... {report.failed - len(report.errors):,} more rejected rows", err=True)
+    click.echo(
+        f"Imported {report.imported:,} of {report.rows_read:,} {kind} "
+        f"in {report.elapsed_seconds:.2f}s ({report.rows_per_second:,.0f} rows/s)"
+    )
+    if report.failed:
+        sys.exit(1)
+
+
+@click.command()
+@click.option("--seed", type=int, default=0, show_default=True, help="Same seed, same data set.")
+@click.option("--portfolios", type=click.IntRange(min=0), default=10, show_default=True)
+@click.option("--assets", "assets_per_portfolio", type=click.IntRange(min=0), default=100, show_default=True,
+              help="Assets per portfolio.")
+@click.option("--snapshots", "snapshots_per_asset", type=click.IntRange(min=0), default=365, show_default=True,
+              help="Snapshots per asset, one every --step.")
+@click.option("--transactions", "transactions_per_asset", type=click.IntRange(min=0), default=4, show_default=True,
+              help="Transactions per asset.")
+@click.option("--category-depth", type=click.IntRange(min=0), default=4, show_default=True,
+              help="Levels of the category tree.")
+@click.option("--category-fanout", type=click.IntRange(min=1), default=4, show_default=True,
+              help="Roots of the category tree, and children of each category.")
+@click.option("--categories-per-asset", type=click.IntRange(min=0), default=2, show_default=True,
+              help="Leaf categories of each asset.")
+@click.option("--tags", type=click.IntRange(min=0), default=200, show_default=True)
+@click.option("--tags-per-asset", type=click.IntRange(min=0), default=5, show_default=True)
+@click.option("--disposed-ratio", type=click.FloatRange(0, 1), default=0.05, show_default=True)
+@click.option("--start", default="2015-01-01T00:00:00Z", show_default=True, help="Time of the first snapshot.")
+@click.option("--step", default="P1D", show_default=True, help="ISO 8601 duration between snapshots.")
+@click.option("--chunk-size", type=click.IntRange(min=1), default=50_000, show_default=True,
+              help="Rows written per database transaction.")
+def generate_dataset(**options) -> None:
+    """Fill the database with a deterministic synthetic data set.
+
+    Creates portfolios of assets with snapshot histories, transactions,
+    categories from a category tree and tags, using bulk inserts. Run it on
+    a migrated database that holds no generated data yet.
+    """
+    # Imported lazily so the test helpers above do not need a database
+    from pydantic import ValidationError
+    from app.adapters.outgoing.persistence.database import write_engine
+    from app.adapters.outgoing.persistence.synthetic import DatasetSpec, generate_dataset as generate
+
+    try:
+        spec = DatasetSpec(**options)
+    except ValidationError as exc:
+        raise click.UsageError("; ".join(error["msg"] for error in exc.errors()))
+
+    def progress(report) -> None:
+        click.echo(
+            f"\r{report.assets:,} of {spec.assets:,} assets, {report.snapshots:,} of {spec.snapshots:,} snapshots "
+            f"({report.rows_per_second:,.0f} rows/s)",
+            nl=False,
+            err=True,
+        )
+
+    report = generate(write_engine, spec, on_progress=progress)
+    click.echo(err=True)
+    click.echo(
+        f"Generated {report.portfolios:,} portfolios, {report.assets:,} assets, {report.snapshots:,} snapshots, "
+        f"{report.transactions:,} transactions, {report.portfolio_snapshots:,} portfolio snapshots, "
+        f"{report.categories:,} categories and {report.tags:,} tags "
+        f"in {report.elapsed_seconds:.2f}s ({report.rows_per_second:,.0f} rows/s)"
+    )
@@ -11,12 +11,17 @@ Pydantic can resolve every forward ref.
 
 from app.domain.entities.tag import Tag
 from app.domain.entities.asset_type import AssetType
-from app.domain.entities.transaction import Transaction
+from app.domain.entities.transaction import Transaction, TransactionType
 from app.domain.entities.category import Category
 from app.domain.entities.portfolio_snapshot import PortfolioSnapshot
 from app.domain.entities.asset_snapshot import AssetSnapshot
+from app.domain.entities.snapshot_timeline import SnapshotTimeline
+from app.domain.entities.snapshot_series import SnapshotSeries
 from app.domain.entities.portfolio import Portfolio
 from app.domain.entities.asset import Asset
+from app.domain.entities.portfolio_summary import PortfolioSummary
+from app.domain.entities.asset_summary import AssetSummary
+from app.domain.entities.value_series import SeriesBucket, SeriesPoint, ValuePoint
 
 # Resolve all forward references now that every class is in scope.
 Tag.model_rebuild()
@@ -27,14 +32,25 @@ PortfolioSnapshot.model_rebuild()
 AssetSnapshot.model_rebuild()
 Portfolio.model_rebuild()
 Asset.model_rebuild()
+PortfolioSummary.model_rebuild()
+SeriesPoint.model_rebuild()
+ValuePoint.model_rebuild()
 
 __all__ = [
     "Tag",
     "AssetType",
     "Transaction",
+    "TransactionType",
     "Category",
     "PortfolioSnapshot",
     "AssetSnapshot",
+    "SnapshotTimeline",
+    "SnapshotSeries",
     "Portfolio",
     "Asset",
+    "PortfolioSummary",
+    "AssetSummary",
+    "SeriesBucket",
+    "SeriesPoint",
+    "ValuePoint",
 ]
@@ -9,8 +9,9 @@ from uuid import UUID
 
 from pydantic import BaseModel, Field, ConfigDict
 
+from .snapshot_timeline import SnapshotTimeline
+
 if TYPE_CHECKING:
-    from .asset_snapshot import AssetSnapshot
     from .asset_type import AssetType
     from .category import Category
     from .portfolio import Portfolio
@@ -34,34 +35,25 @@ class Asset(BaseModel):
     categories: Set["Category"] = Field(default_factory=set)
     tags: Set["Tag"] = Field(default_factory=set)
     transactions: list["Transaction"] = Field(default_factory=list)
-    snapshots: list["AssetSnapshot"] = Field(default_factory=list)
+    # Sorted on assignment too, so lookups never depend on the order snapshots were loaded in
+    snapshots: SnapshotTimeline = Field(default_factory=SnapshotTimeline)
 
     created_at: datetime
     updated_at: datetime
     created_by: str
     updated_by: str
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, validate_assignment=True)
 
     # Business logic methods from the conceptual model
     def current_value(self, at: Optional[datetime] = None) -> Decimal:
         """
-        Calculates the value of the asset at a specific time.
-        For simplicity, it uses the most recent snapshot if available.
+        Calculates the value of the asset at a specific time: the value of
+        its latest snapshot observed at or before `at` (its latest snapshot
+        overall if `at` is omitted), or zero if it had not been valued yet.
         """
-        if not self.snapshots:
-            return Decimal("0.0")
-
-        # Assumes snapshots are pre-sorted descending by date from the repository
-        relevant_snapshot = self.snapshots[0]
-        if at:
-            # Find the latest snapshot before or at the given date
-            for snapshot in self.snapshots:
-                if snapshot.observed_at <= at:
-                    relevant_snapshot = snapshot
-                    break
-
-        return relevant_snapshot.value
+        snapshot = self.snapshots.at(at) if at else self.snapshots.latest
+        return snapshot.value if snapshot else Decimal("0.0")
 
     def dispose(self, at: Optional[datetime] = None) -> None:
         """Marks the asset as disposed."""
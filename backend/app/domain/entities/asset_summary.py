@@ -0,0 +1,47 @@
+"""
+AssetSummary Read Model
+"""
+from datetime import datetime
+from decimal import Decimal
+from typing import List, Optional
+
+from typing_extensions import TypedDict
+
+
+class AssetTypeRef(TypedDict):
+    code: str
+    label: str
+
+
+class PortfolioRef(TypedDict):
+    id: str
+    name: str
+
+
+class TagRef(TypedDict):
+    id: str
+    name: str
+
+
+class CategoryRef(TypedDict):
+    id: str
+    name: str
+    parent_id: Optional[str]
+
+
+class AssetSummary(TypedDict):
+    """
+    AssetSummary read model. The fields of an asset listing, selected column
+    by column and kept as plain dicts: listings build thousands of rows, and
+    neither the Asset aggregate nor a model per row is needed to render them.
+    """
+    id: str
+    name: str
+    disposed: bool
+    quantity: Optional[Decimal]
+    created_at: datetime
+    updated_at: datetime
+    asset_type: AssetTypeRef
+    portfolio: PortfolioRef
+    tags: List[TagRef]
+    categories: List[CategoryRef]
@@ -10,6 +10,8 @@ from uuid import UUID
 from pydantic import BaseModel, Field
 from pydantic.config import ConfigDict
 
+from .money import from_cents
+
 if TYPE_CHECKING:
     from .asset import Asset
     from .portfolio_snapshot import PortfolioSnapshot
@@ -35,14 +37,6 @@ class Portfolio(BaseModel):
         the values of all non-disposed assets.
 
         The value of each asset is determined by its most recent snapshot.
+        Values are summed in integer cents and converted back once.
         """
-        from decimal import Decimal as _Decimal
-        from typing import cast
-
-        total = sum(
-            (asset.current_value(at=at) for asset in self.assets if not asset.disposed),
-            _Decimal('0')
-        )
-
-        # Cast to Decimal for the typechecker (sum with start value is Decimal at runtime)
-        return cast(Decimal, total)
+        return from_cents(sum(asset.snapshots.cents_at(at) for asset in self.assets if not asset.disposed))
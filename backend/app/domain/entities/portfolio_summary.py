@@ -0,0 +1,26 @@
+"""
+PortfolioSummary Read Model
+"""
+from __future__ import annotations
+from datetime import datetime
+from decimal import Decimal
+from uuid import UUID
+
+from pydantic import BaseModel
+from pydantic.config import ConfigDict
+
+
+class PortfolioSummary(BaseModel):
+    """
+    PortfolioSummary read model. A flat projection of a portfolios with its
+    aggregate figures, used by listings that must not hydrate the asset graph.
+    """
+    id: UUID
+    name: str
+    base_currency: str
+    asset_count: int = 0  # Active assets, those counted in total_value
+    total_value: Decimal = Decimal("0")
+    created_at: datetime
+    updated_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
@@ -0,0 +1,69 @@
+"""
+SnapshotTimeline Value Object
+"""
+from __future__ import annotations
+from bisect import bisect_right
+from datetime import datetime
+from typing import Any, Iterable, Optional, Tuple
+
+from pydantic import GetCoreSchemaHandler
+from pydantic_core import core_schema
+
+from .asset_snapshot import AssetSnapshot
+from .money import to_cents
+from .snapshot_series import to_utc
+
+
+def _chronological(snapshot: AssetSnapshot) -> Tuple[datetime, str]:
+    return to_utc(snapshot.observed_at), str(snapshot.id)
+
+
+class SnapshotTimeline(tuple):
+    """
+    An asset's snapshots, oldest first by (observed_at, id), with O(log n)
+    point-in-time lookup. Snapshots are sorted on construction, so the
+    order they are supplied in (e.g. by a repository query) never matters.
+    Immutable: build a new timeline to add snapshots.
+    """
+
+    def __new__(cls, snapshots: Iterable[AssetSnapshot] = ()) -> "SnapshotTimeline":
+        timeline = super().__new__(cls, sorted(snapshots, key=_chronological))
+        # Bisect index: observed_at of each snapshot, in timeline order
+        timeline._moments = [to_utc(s.observed_at) for s in timeline]
+        # Values in cents, in timeline order, each converted on its first lookup
+        timeline._cents = [None] * len(timeline)
+        return timeline
+
+    @property
+    def latest(self) -> Optional[AssetSnapshot]:
+        """The most recent snapshot, or None if there is none."""
+        return self[-1] if self else None
+
+    def at(self, moment: datetime) -> Optional[AssetSnapshot]:
+        """The last snapshot observed at or before `moment`, or None if there is none yet."""
+        position = bisect_right(self._moments, to_utc(moment))
+        return self[position - 1] if position else None
+
+    def cents_at(self, moment: Optional[datetime] = None) -> int:
+        """
+        Value in cents of the snapshot `at(moment)` returns (the latest one if
+        `moment` is omitted), or 0 if there is none.
+        """
+        position = bisect_right(self._moments, to_utc(moment)) if moment else len(self)
+        if not position:
+            return 0
+        cents = self._cents[position - 1]
+        if cents is None:
+            cents = self._cents[position - 1] = to_cents(self[position - 1].value)
+        return cents
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: Any, handler: GetCoreSchemaHandler) -> core_schema.CoreSchema:
+        # Accept a timeline as is, or any list of snapshots (sorted on the way in)
+        from_snapshots = core_schema.no_info_after_validator_function(
+            cls, handler.generate_schema(list[AssetSnapshot])
+        )
+        return core_schema.union_schema(
+            [core_schema.is_instance_schema(cls), from_snapshots],
+            serialization=core_schema.plain_serializer_function_ser_schema(list),
+        )
@@ -4,17 +4,27 @@ Transaction Domain Entity
 from __future__ import annotations
 from datetime import datetime
 from decimal import Decimal
+from enum import Enum
+from typing import Optional
 from uuid import UUID
 
 from pydantic import BaseModel
 from pydantic.config import ConfigDict
 
 
+class TransactionType(str, Enum):
+    """What a transaction does to the quantity held of its asset."""
+    ACQUIRE = "ACQUIRE"  # Buying/receiving: increases the quantity
+    DISPOSE = "DISPOSE"  # Selling/giving away: decreases the quantity
+    ADJUST = "ADJUST"    # Manual correction
+
+
 class Transaction(BaseModel):
     """
     Transaction domain entity. Records acquisitions, disposals, and adjustments.
     """
     id: UUID
+    asset_id: Optional[UUID] = None
     type: str
     quantity: Decimal
     unit_price: Decimal
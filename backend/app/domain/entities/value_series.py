@@ -0,0 +1,41 @@
+"""
+Value Series Read Model
+"""
+from __future__ import annotations
+from datetime import datetime
+from decimal import Decimal
+from enum import Enum
+
+from pydantic import BaseModel
+from pydantic.config import ConfigDict
+
+
+class SeriesBucket(str, Enum):
+    """Width of the time buckets a snapshot history is downsampled into (UTC)."""
+    DAY = "day"
+    WEEK = "week"    # ISO weeks, starting on Monday
+    MONTH = "month"
+
+
+class SeriesPoint(BaseModel):
+    """
+    SeriesPoint read model. Summarises the snapshots observed within one
+    time bucket: first, highest, lowest and last value, their mean and count.
+    """
+    period_start: datetime
+    open: Decimal
+    high: Decimal
+    low: Decimal
+    close: Decimal
+    average: Decimal
+    count: int
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ValuePoint(BaseModel):
+    """ValuePoint read model. Total value held at one sampled moment."""
+    observed_at: datetime
+    value: Decimal
+
+    model_config = ConfigDict(from_attributes=True)
@@ -21,3 +21,9 @@ class DuplicateName(Exception):
 
 class CategoryHasChildren(Exception):
     """Raised when attempting to delete a category that has child categories."""
+
+class InvalidCursor(Exception):
+    """Raised when a pagination cursor cannot be decoded."""
+
+class InvalidTimeRange(Exception):
+    """Raised when a requested time range or sampling step is invalid."""
@@ -10,6 +10,8 @@ from .Exceptions import (
     TagNotFound,
     DuplicateName,
     CategoryHasChildren,
+    InvalidCursor,
+    InvalidTimeRange,
 )
 
 __all__ = [
@@ -20,5 +22,7 @@ __all__ = [
     "TagNotFound",
     "DuplicateName",
     "CategoryHasChildren",
+    "InvalidCursor",
+    "InvalidTimeRange",
 ]
 
@@ -12,6 +12,11 @@ from .asset_type_repository import IAssetTypeRepository
 from .category_repository import ICategoryRepository
 from .tag_repository import ITagRepository
 from .transaction_repository import ITransactionRepository
+from .unit_of_work import IUnitOfWork
+from .async_asset_repository import IAsyncAssetRepository
+from .async_asset_snapshot_repository import IAsyncAssetSnapshotRepository
+from .async_portfolio_repository import IAsyncPortfolioRepository
+from .async_unit_of_work import IAsyncUnitOfWork
 
 
 __all__ = [
@@ -24,4 +29,9 @@ __all__ = [
     "ICategoryRepository",
     "ITagRepository",
     "ITransactionRepository",
+    "IUnitOfWork",
+    "IAsyncAssetRepository",
+    "IAsyncAssetSnapshotRepository",
+    "IAsyncPortfolioRepository",
+    "IAsyncUnitOfWork",
 ]
\ No newline at end of file
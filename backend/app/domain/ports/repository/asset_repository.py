@@ -3,10 +3,11 @@ Asset Repository Interface
 """
 from abc import abstractmethod
 from datetime import datetime
-from typing import Optional, List
+from typing import Dict, Iterable, Optional, List, Set, Tuple
 from uuid import UUID
 
 from app.domain.entities.asset import Asset
+from app.domain.entities.asset_summary import AssetSummary
 from .base_repository import BaseRepository
 
 
@@ -29,6 +30,78 @@ class IAssetRepository(BaseRepository[Asset]):
         """
         pass
 
+    @abstractmethod
+    def find_page(
+            self,
+            limit: int,
+            after: Optional[Tuple[str, str]] = None,
+            portfolio_id: Optional[UUID] = None
+    ) -> List[Asset]:
+        """
+        Fetch one page of assets ordered by (name, id)
+
+        Args:
+            limit: Maximum number of assets to return
+            after: (name, id) of the last asset of the previous page, if any
+            portfolio_id: Optional portfolio to restrict the listing to
+
+        Returns:
+            Up to `limit` assets sorting after `after`
+        """
+        pass
+
+    @abstractmethod
+    def find_summary_page(
+            self,
+            limit: int,
+            after: Optional[Tuple[str, str]] = None,
+            portfolio_id: Optional[UUID] = None
+    ) -> List[AssetSummary]:
+        """
+        Fetch one page of asset summaries ordered by (name, id), for listings
+
+        Args:
+            limit: Maximum number of assets to return
+            after: (name, id) of the last asset of the previous page, if any
+            portfolio_id: Optional portfolio to restrict the listing to
+
+        Returns:
+            Up to `limit` summaries sorting after `after`
+        """
+        pass
+
+    @abstractmethod
+    def find_existing_ids(self, asset_ids: Iterable[UUID]) -> Set[str]:
+        """
+        Resolve which of the given asset ids exist, in a single lookup
+
+        Args:
+            asset_ids: UUIDs of assets to check
+
+        Returns:
+            Set of the ids (as strings) that exist
+        """
+        pass
+
+    @abstractmethod
+    def find_ids_by_names(
+            self,
+            names: Iterable[str],
+            portfolio_id: Optional[UUID] = None
+    ) -> Dict[str, List[str]]:
+        """
+        Resolve asset names to ids, in a single lookup
+
+        Args:
+            names: Asset names to resolve
+            portfolio_id: Optional portfolio to restrict the lookup to
+
+        Returns:
+            Mapping of each found name to the ids (as strings) of the assets
+            bearing it; names without a match are absent
+        """
+        pass
+
     @abstractmethod
     def find_by_type(self, asset_type_code: str) -> List[Asset]:
         """
@@ -5,11 +5,17 @@ Defines operations to retrieve and persist historical snapshots for Assets.
 """
 from abc import abstractmethod
 from datetime import datetime
-from typing import Optional, List
+from decimal import Decimal
+from typing import Iterator, Optional, List, Tuple
 from uuid import UUID
 
 from .base_repository import BaseRepository
 from ....domain.entities.asset_snapshot import AssetSnapshot
+from ....domain.entities.snapshot_series import SnapshotSeries
+from ....domain.entities.value_series import SeriesBucket, SeriesPoint
+
+# (id, asset_id, value, observed_at) of a new snapshot
+SnapshotValues = Tuple[str, str, Decimal, datetime]
 
 
 class IAssetSnapshotRepository(BaseRepository[AssetSnapshot]):
@@ -37,6 +43,93 @@ class IAssetSnapshotRepository(BaseRepository[AssetSnapshot]):
         """
         pass
 
+    @abstractmethod
+    def get_snapshots_page(
+            self,
+            asset_id: UUID,
+            limit: int,
+            after: Optional[Tuple[datetime, str]] = None,
+            start_date: Optional[datetime] = None,
+            end_date: Optional[datetime] = None
+    ) -> List[AssetSnapshot]:
+        """
+        Fetch one page of a asset's snapshots, newest first, ordered by (observed_at, id) descending.
+
+        Args:
+            asset_id: UUID of asset
+            limit: Maximum number of snapshots to return
+            after: (observed_at, id) of the last snapshot of the previous page, if any
+            start_date: Inclusive start date
+            end_date: Inclusive end date
+
+        Returns:
+            Up to `limit` snapshots following `after` in that order
+        """
+        pass
+
+    @abstractmethod
+    def get_series(
+            self,
+            asset_id: UUID,
+            bucket: SeriesBucket,
+            start_date: Optional[datetime] = None,
+            end_date: Optional[datetime] = None
+    ) -> List[SeriesPoint]:
+        """
+        Downsample a asset's snapshots into one point per UTC time bucket,
+        oldest bucket first. Buckets without snapshots are omitted.
+
+        Args:
+            asset_id: UUID of asset
+            bucket: Bucket width (day, week or month)
+            start_date: Inclusive start date
+            end_date: Inclusive end date
+
+        Returns:
+            List of SeriesPoint objects (may be empty)
+        """
+        pass
+
+    @abstractmethod
+    def get_snapshot_series(
+            self,
+            asset_id: UUID,
+            start_date: Optional[datetime] = None,
+            end_date: Optional[datetime] = None
+    ) -> SnapshotSeries:
+        """
+        Retrieve an asset's snapshots in a date range as a columnar series,
+        for bulk reads where building an entity per snapshot would dominate.
+
+        Args:
+            asset_id: UUID of asset
+            start_date: Inclusive start date
+            end_date: Inclusive end date
+
+        Returns:
+            SnapshotSeries ordered by (observed_at, id) (may be empty)
+        """
+        pass
+
+    @abstractmethod
+    def get_portfolio_snapshot_series(
+            self,
+            portfolio_id: UUID,
+            end_date: Optional[datetime] = None
+    ) -> List[SnapshotSeries]:
+        """
+        Retrieve the snapshots of every asset of a portfolio that has not
+        been disposed as columnar series, for bulk analytics.
+
+        Args:
+            portfolio_id: UUID of portfolio
+            end_date: Inclusive end date
+
+        Returns:
+            One SnapshotSeries per active asset with snapshots, ordered by asset name and id
+        """
+        pass
+
     @abstractmethod
     def get_latest_snapshot(self, asset_id: UUID) -> Optional[AssetSnapshot]:
         """
@@ -49,3 +142,52 @@ class IAssetSnapshotRepository(BaseRepository[AssetSnapshot]):
             AssetSnapshot or None if no snapshots exist
         """
         pass
+
+    @abstractmethod
+    def save_many(self, snapshots: List[AssetSnapshot]) -> int:
+        """
+        Insert a batch of new snapshots with one batched insert.
+
+        Args:
+            snapshots: New AssetSnapshot objects (assets must exist)
+
+        Returns:
+            Number of snapshots inserted
+        """
+        pass
+
+    @abstractmethod
+    def save_values(self, rows: List[SnapshotValues]) -> int:
+        """
+        Insert a batch of new snapshots given as plain tuples, with one
+        batched insert. For callers whose input was validated upstream:
+        no entity is built per row.
+
+        Args:
+            rows: (id, asset_id, value, observed_at) of each snapshot (assets must exist)
+
+        Returns:
+            Number of snapshots inserted
+        """
+        pass
+
+    @abstractmethod
+    def iter_snapshots(
+            self,
+            asset_id: UUID,
+            start_date: Optional[datetime] = None,
+            end_date: Optional[datetime] = None
+    ) -> Iterator[AssetSnapshot]:
+        """
+        Lazily iterate over an asset's snapshots in a date range, oldest
+        first, without loading them all in memory.
+
+        Args:
+            asset_id: UUID of asset
+            start_date: Inclusive start date
+            end_date: Inclusive end date
+
+        Returns:
+            Iterator of AssetSnapshot objects
+        """
+        pass
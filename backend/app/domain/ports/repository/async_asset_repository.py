@@ -0,0 +1,28 @@
+"""
+Async Asset Repository Interface
+"""
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from app.domain.entities.asset import Asset
+
+
+class IAsyncAssetRepository(ABC):
+    """
+    Awaitable counterpart of IAssetRepository, for the async request stack.
+
+    Only covers what the async use cases need.
+    """
+
+    @abstractmethod
+    async def find_by_id(self, entity_id: str) -> Optional[Asset]:
+        """
+        Find an asset by ID, with its portfolio, type, tags and categories
+
+        Args:
+            entity_id: UUID of the asset
+
+        Returns:
+            The asset, or None if not found
+        """
+        pass
@@ -0,0 +1,54 @@
+"""
+Async AssetSnapshot Repository Interface
+"""
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+from app.domain.entities.asset_snapshot import AssetSnapshot
+
+
+class IAsyncAssetSnapshotRepository(ABC):
+    """
+    Awaitable counterpart of IAssetSnapshotRepository, for the async request stack.
+
+    Only covers what the async use cases need.
+    """
+
+    @abstractmethod
+    async def add(self, snapshot: AssetSnapshot) -> AssetSnapshot:
+        """
+        Stage a new snapshot and advance its asset's latest value if it is the newest
+
+        Args:
+            snapshot: Snapshot not stored yet
+
+        Returns:
+            The snapshot
+        """
+        pass
+
+    @abstractmethod
+    async def get_snapshots_page(
+            self,
+            asset_id: UUID,
+            limit: int,
+            after: Optional[Tuple[datetime, str]] = None,
+            start_date: Optional[datetime] = None,
+            end_date: Optional[datetime] = None
+    ) -> List[AssetSnapshot]:
+        """
+        Fetch one page of a asset's snapshots, newest first, ordered by (observed_at, id) descending.
+
+        Args:
+            asset_id: UUID of asset
+            limit: Maximum number of snapshots to return
+            after: (observed_at, id) of the last snapshot of the previous page, if any
+            start_date: Inclusive start date
+            end_date: Inclusive end date
+
+        Returns:
+            Up to `limit` snapshots following `after` in that order
+        """
+        pass
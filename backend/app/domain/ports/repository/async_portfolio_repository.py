@@ -0,0 +1,25 @@
+"""
+Async Portfolio Repository Interface
+"""
+from abc import ABC, abstractmethod
+from typing import List
+
+from app.domain.entities.portfolio_summary import PortfolioSummary
+
+
+class IAsyncPortfolioRepository(ABC):
+    """
+    Awaitable counterpart of IPortfolioRepository, for the async request stack.
+
+    Only covers what the async use cases need.
+    """
+
+    @abstractmethod
+    async def find_all_summaries(self) -> List[PortfolioSummary]:
+        """
+        Every portfolio with its active asset count and total latest value, by name
+
+        Returns:
+            List of portfolio summaries (can be empty)
+        """
+        pass
@@ -0,0 +1,40 @@
+"""
+Async Unit of Work Interface
+
+Transaction boundary of an async use case
+"""
+from abc import ABC, abstractmethod
+
+
+class IAsyncUnitOfWork(ABC):
+    """
+    Awaitable counterpart of IUnitOfWork. Write use cases run inside it:
+
+        async with self.uow:
+            ...
+
+    The block commits once when it completes and rolls back if it raises.
+    """
+
+    async def __aenter__(self) -> "IAsyncUnitOfWork":
+        return self
+
+    async def __aexit__(self, exc_type, exc, traceback) -> None:
+        if exc_type is None:
+            await self.commit()
+        else:
+            await self.rollback()
+
+    @abstractmethod
+    async def commit(self) -> None:
+        """
+        Make every change staged so far durable, in one transaction
+        """
+        pass
+
+    @abstractmethod
+    async def rollback(self) -> None:
+        """
+        Discard every change staged since the last commit
+        """
+        pass
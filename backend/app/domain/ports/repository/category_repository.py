@@ -4,7 +4,7 @@ Category Repository Interface (Port)
 Defines operations for Category (hierarchical taxonomy)
 """
 from abc import abstractmethod
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from uuid import UUID
 
 from .base_repository import BaseRepository
@@ -29,6 +29,20 @@ class ICategoryRepository(BaseRepository[Category]):
         """
         pass
 
+    @abstractmethod
+    def find_page(self, limit: int, after: Optional[Tuple[str, str]] = None) -> List[Category]:
+        """
+        Fetch one page of categories ordered by (name, id)
+
+        Args:
+            limit: Maximum number of categories to return
+            after: (name, id) of the last category of the previous page, if any
+
+        Returns:
+            Up to `limit` categories sorting after `after`
+        """
+        pass
+
     @abstractmethod
     def find_root_categories(self) -> List[Category]:
         """
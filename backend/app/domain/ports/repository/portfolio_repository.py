@@ -3,11 +3,13 @@ Portfolio Repository Interface (Port)
 """
 from abc import abstractmethod
 from datetime import datetime
-from typing import Optional
+from decimal import Decimal
+from typing import Optional, List
 from uuid import UUID
 
 from .base_repository import BaseRepository
 from app.domain.entities.portfolio import Portfolio
+from app.domain.entities.portfolio_summary import PortfolioSummary
 
 
 class IPortfolioRepository(BaseRepository[Portfolio]):
@@ -61,6 +63,52 @@ class IPortfolioRepository(BaseRepository[Portfolio]):
         """
         pass
 
+    @abstractmethod
+    def get_total_value(self, portfolio_id: UUID, at: Optional[datetime] = None) -> Decimal:
+        """
+        Compute the total value of a portfolios without loading its assets
+
+        Sums the most recent snapshot value (at or before `at`, when given) of
+        every non-disposed asset. Implementations should resolve the latest
+        snapshot per asset in the datastore rather than in Python.
+
+        Args:
+            portfolio_id: UUID of portfolios
+            at: Optional point in time (defaults to now)
+
+        Returns:
+            Total value (Decimal("0") if the portfolios has no valued assets)
+        """
+        pass
+
+    @abstractmethod
+    def find_summary(self, portfolio_id: UUID) -> Optional[PortfolioSummary]:
+        """
+        Fetch one portfolios with its asset count and current total value
+
+        Computed like find_all_summaries, without loading assets and snapshots.
+
+        Args:
+            portfolio_id: UUID of portfolios
+
+        Returns:
+            Portfolio summary, or None if no portfolios has this ID
+        """
+        pass
+
+    @abstractmethod
+    def find_all_summaries(self) -> List[PortfolioSummary]:
+        """
+        List every portfolios with its asset count and current total value
+
+        Implementations should compute the aggregates in a single grouped
+        query instead of loading assets and snapshots.
+
+        Returns:
+            List of portfolios summaries (may be empty)
+        """
+        pass
+
     @abstractmethod
     def save_snapshot(self, snapshot) -> None:
         """
@@ -5,11 +5,12 @@ Defines operations to retrieve historical snapshots of Portfolios.
 """
 from abc import abstractmethod
 from datetime import datetime
-from typing import Optional, List
+from typing import Iterator, Optional, List, Tuple
 from uuid import UUID
 
 from .base_repository import BaseRepository
 from ....domain.entities.portfolio_snapshot import PortfolioSnapshot
+from ....domain.entities.value_series import SeriesBucket, SeriesPoint
 
 
 class IPortfolioSnapshotRepository(BaseRepository[PortfolioSnapshot]):
@@ -37,6 +38,53 @@ class IPortfolioSnapshotRepository(BaseRepository[PortfolioSnapshot]):
         """
         pass
 
+    @abstractmethod
+    def get_snapshots_page(
+            self,
+            portfolio_id: UUID,
+            limit: int,
+            after: Optional[Tuple[datetime, str]] = None,
+            start_date: Optional[datetime] = None,
+            end_date: Optional[datetime] = None
+    ) -> List[PortfolioSnapshot]:
+        """
+        Fetch one page of a portfolio's snapshots, newest first, ordered by (observed_at, id) descending.
+
+        Args:
+            portfolio_id: UUID of portfolio
+            limit: Maximum number of snapshots to return
+            after: (observed_at, id) of the last snapshot of the previous page, if any
+            start_date: Inclusive start date
+            end_date: Inclusive end date
+
+        Returns:
+            Up to `limit` snapshots following `after` in that order
+        """
+        pass
+
+    @abstractmethod
+    def get_series(
+            self,
+            portfolio_id: UUID,
+            bucket: SeriesBucket,
+            start_date: Optional[datetime] = None,
+            end_date: Optional[datetime] = None
+    ) -> List[SeriesPoint]:
+        """
+        Downsample a portfolio's snapshots into one point per UTC time bucket,
+        oldest bucket first. Buckets without snapshots are omitted.
+
+        Args:
+            portfolio_id: UUID of portfolio
+            bucket: Bucket width (day, week or month)
+            start_date: Inclusive start date
+            end_date: Inclusive end date
+
+        Returns:
+            List of SeriesPoint objects (may be empty)
+        """
+        pass
+
     @abstractmethod
     def get_latest_snapshot(self, portfolio_id: UUID) -> Optional[PortfolioSnapshot]:
         """
@@ -49,3 +97,24 @@ class IPortfolioSnapshotRepository(BaseRepository[PortfolioSnapshot]):
             PortfolioSnapshot or None if no snapshots exist
         """
         pass
+
+    @abstractmethod
+    def iter_snapshots(
+            self,
+            portfolio_id: UUID,
+            start_date: Optional[datetime] = None,
+            end_date: Optional[datetime] = None
+    ) -> Iterator[PortfolioSnapshot]:
+        """
+        Lazily iterate over a portfolio's snapshots in a date range, oldest
+        first, without loading them all in memory.
+
+        Args:
+            portfolio_id: UUID of portfolio
+            start_date: Inclusive start date
+            end_date: Inclusive end date
+
+        Returns:
+            Iterator of PortfolioSnapshot objects
+        """
+        pass
@@ -4,7 +4,7 @@ Tag Repository Interface (Port)
 Defines operations for Tag entities (simple lookup and association helpers).
 """
 from abc import abstractmethod
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from uuid import UUID
 
 from .base_repository import BaseRepository
@@ -29,6 +29,20 @@ class ITagRepository(BaseRepository[Tag]):
         """
         pass
 
+    @abstractmethod
+    def find_page(self, limit: int, after: Optional[Tuple[str, str]] = None) -> List[Tag]:
+        """
+        Fetch one page of tags ordered by (name, id)
+
+        Args:
+            limit: Maximum number of tags to return
+            after: (name, id) of the last tag of the previous page, if any
+
+        Returns:
+            Up to `limit` tags sorting after `after`
+        """
+        pass
+
     @abstractmethod
     def find_all(self) -> List[Tag]:
         """
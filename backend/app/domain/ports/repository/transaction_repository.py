@@ -5,7 +5,7 @@ Repository interface for transaction/ledger style records related to assets.
 """
 from abc import abstractmethod
 from datetime import datetime
-from typing import List
+from typing import Iterator, List, Optional
 from uuid import UUID
 
 from .base_repository import BaseRepository
@@ -39,3 +39,37 @@ class ITransactionRepository(BaseRepository[Transaction]):
             List of transactions
         """
         pass
+
+    @abstractmethod
+    def save_many(self, transactions: List[Transaction]) -> int:
+        """
+        Insert a batch of new transactions with one batched insert.
+
+        Args:
+            transactions: New Transaction objects (asset_id must be set)
+
+        Returns:
+            Number of transactions inserted
+        """
+        pass
+
+    @abstractmethod
+    def iter_by_asset(
+            self,
+            asset_id: UUID,
+            start_date: Optional[datetime] = None,
+            end_date: Optional[datetime] = None
+    ) -> Iterator[Transaction]:
+        """
+        Lazily iterate over an asset's transactions in a date range, oldest
+        first, without loading them all in memory.
+
+        Args:
+            asset_id: UUID of asset
+            start_date: Inclusive start date
+            end_date: Inclusive end date
+
+        Returns:
+            Iterator of Transaction objects
+        """
+        pass
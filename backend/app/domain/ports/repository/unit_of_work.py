@@ -0,0 +1,46 @@
+"""
+Unit of Work Interface
+
+Transaction boundary of a use case
+"""
+from abc import ABC, abstractmethod
+
+
+class IUnitOfWork(ABC):
+    """
+    Abstract unit of work shared by the repositories of a use case.
+
+    Repositories only stage their changes; the unit of work makes them
+    durable together, in one transaction. Write use cases run inside it:
+
+        with self.uow:
+            ...
+
+    The block commits once when it completes and rolls back if it raises.
+    """
+
+    def __enter__(self) -> "IUnitOfWork":
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        if exc_type is None:
+            self.commit()
+        else:
+            self.rollback()
+
+    @abstractmethod
+    def commit(self) -> None:
+        """
+        Make every change staged so far durable, in one transaction
+
+        Use inside the block only to split long-running work (such as
+        imports) into several transactions.
+        """
+        pass
+
+    @abstractmethod
+    def rollback(self) -> None:
+        """
+        Discard every change staged since the last commit
+        """
+        pass
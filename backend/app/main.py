@@ -1,7 +1,8 @@
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, Request
+from fastapi import APIRouter, FastAPI, Request
 import logging
+import os
 from fastapi.responses import JSONResponse
 
 from app.adapters.incoming.api.routes.asset_routes import AssetRoutes
@@ -9,8 +10,12 @@ from app.adapters.incoming.api.routes.portfolio_routes import PortfolioRoutes
 from app.adapters.incoming.api.routes.asset_type_routes import AssetTypeRoutes
 from app.adapters.incoming.api.routes.category_routes import CategoryRoutes
 from app.adapters.incoming.api.routes.tag_routes import TagRoutes
+from app.adapters.incoming.api.routes.snapshot_routes import SnapshotRoutes
+from app.adapters.incoming.api.routes.import_routes import ImportRoutes
 from app.adapters.incoming.api.schemas.error_response import ErrorResponse
-from app.adapters.outgoing.persistence.database import engine
+from app.adapters.incoming.api import metrics
+from app.adapters.outgoing.persistence.database import engine, replica_engine, write_engine
+from app.adapters.outgoing.persistence.query_stats import track_queries
 from app.domain.exceptions import (
     AssetNotFound,
     PortfolioNotFound,
@@ -19,8 +24,24 @@ from app.domain.exceptions import (
     TagNotFound,
     DuplicateName,
     CategoryHasChildren,
+    InvalidCursor,
+    InvalidTimeRange,
 )
 
+# "sync" runs endpoints on the thread pool; "async" serves the endpoints of
+# routes/async_*_routes.py on the event loop through the async drivers
+# (see adapters/incoming/api/dependencies/async_stack.py), the rest stay sync
+API_STACK = os.getenv("API_STACK", "sync").lower()
+if API_STACK not in ("sync", "async"):
+    raise ValueError(f"Unknown API_STACK '{API_STACK}' (expected 'sync' or 'async')")
+
+# DEBUG=1 reports the SQL statements of each request in response headers and
+# logs the statements a request repeats (see persistence/query_stats.py)
+DEBUG = os.getenv("DEBUG", "").lower() in ("1", "true", "yes")
+
+# Prometheus metrics at /metrics, on unless METRICS=0 (see adapters/incoming/api/metrics.py)
+METRICS = metrics.ENABLED
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -31,6 +52,13 @@ async def lifespan(app: FastAPI):
     # ---- shutdown ----
     print("🛑 Application shutting down")
     engine.dispose()
+    replica_engine.dispose()
+    write_engine.dispose()
+    if API_STACK == "async":
+        from app.adapters.outgoing.persistence.async_database import dispose_async_engines
+        await dispose_async_engines()
+
+
 app = FastAPI(
     title="Assets API",
     description="API for managing assets.",
@@ -42,7 +70,7 @@ app = FastAPI(
 # Domain exceptions tuple for easy checking
 DOMAIN_NOT_FOUND_EXCEPTIONS = (
     AssetNotFound, PortfolioNotFound, AssetTypeNotFound, CategoryNotFound,
-    TagNotFound, DuplicateName, CategoryHasChildren,
+    TagNotFound, DuplicateName, CategoryHasChildren, InvalidCursor, InvalidTimeRange,
 )
 
 
@@ -59,6 +87,23 @@ async def log_exceptions(request: Request, call_next):
         return JSONResponse(status_code=500, content=err.model_dump())
 
 
+@app.middleware("http")
+async def report_query_stats(request: Request, call_next):
+    if not DEBUG:
+        return await call_next(request)
+    # Statements run while a streamed body is sent come after the headers and are not counted
+    with track_queries() as stats:
+        response = await call_next(request)
+    repeated = stats.repeated()
+    response.headers["X-DB-Statements"] = str(stats.count)
+    response.headers["X-DB-Time-Ms"] = f"{stats.duration * 1000:.3f}"
+    response.headers["X-DB-Repeated-Statements"] = str(len(repeated))
+    for statement, count in repeated.items():
+        logging.warning("%s %s ran the same statement %d times (N+1?): %s",
+                        request.method, request.url.path, count, statement)
+    return response
+
+
 # Domain-specific exception handlers (map domain errors to HTTP responses)
 @app.exception_handler(AssetNotFound)
 async def handle_asset_not_found(request: Request, exc: AssetNotFound):
@@ -102,12 +147,59 @@ async def handle_category_has_children(request: Request, exc: CategoryHasChildre
     return JSONResponse(status_code=409, content=err.model_dump())
 
 
+@app.exception_handler(InvalidCursor)
+async def handle_invalid_cursor(request: Request, exc: InvalidCursor):
+    err = ErrorResponse(code="INVALID_CURSOR", message=str(exc), status=400)
+    return JSONResponse(status_code=400, content=err.model_dump())
+
+
+@app.exception_handler(InvalidTimeRange)
+async def handle_invalid_time_range(request: Request, exc: InvalidTimeRange):
+    err = ErrorResponse(code="INVALID_TIME_RANGE", message=str(exc), status=400)
+    return JSONResponse(status_code=400, content=err.model_dump())
+
+
 @app.get("/", tags=["Root"])
 def read_root():
     return {"message": "Welcome to the Asset Tree API"}
 
-app.include_router(AssetRoutes.get_router(), prefix="/api/v1")
-app.include_router(PortfolioRoutes.get_router(), prefix="/api/v1")
-app.include_router(AssetTypeRoutes.get_router(), prefix="/api/v1")
-app.include_router(CategoryRoutes.get_router(), prefix="/api/v1")
-app.include_router(TagRoutes.get_router(), prefix="/api/v1")
+if METRICS:
+    engines = {"primary": engine, "replica": replica_engine, "writer": write_engine}
+    if API_STACK == "async":
+        from app.adapters.outgoing.persistence import async_database
+        engines.update({
+            "async_primary": async_database.async_engine.sync_engine,
+            "async_replica": async_database.async_replica_engine.sync_engine,
+            "async_writer": async_database.async_write_engine.sync_engine,
+        })
+    # Without a replica or a separate writer, the primary is reported once, as "primary"
+    for name, instrumented in engines.items():
+        metrics.observe_engine(instrumented, name)
+    # Outermost, so the latency includes every other middleware
+    app.add_middleware(metrics.MetricsMiddleware)
+    app.include_router(metrics.router)
+
+
+
+def with_async_routes(router: APIRouter, async_router: APIRouter) -> APIRouter:
+    """Swap each route of `router` that `async_router` also serves (same path and methods) for its async one, in place."""
+    replacements = {(route.path, frozenset(route.methods)): route for route in async_router.routes}
+    router.routes = [
+        replacements.get((route.path, frozenset(getattr(route, "methods", None) or ())), route)
+        for route in router.routes
+    ]
+    return router
+
+
+# Routes -> the routes serving some of its endpoints on the async stack
+ASYNC_ROUTES = {}
+if API_STACK == "async":
+    from app.adapters.incoming.api.routes.async_asset_routes import AsyncAssetRoutes
+    from app.adapters.incoming.api.routes.async_portfolio_routes import AsyncPortfolioRoutes
+    ASYNC_ROUTES = {AssetRoutes: AsyncAssetRoutes, PortfolioRoutes: AsyncPortfolioRoutes}
+
+for routes in (AssetRoutes, PortfolioRoutes, AssetTypeRoutes, CategoryRoutes, TagRoutes, SnapshotRoutes, ImportRoutes):
+    router = routes.get_router()
+    if routes in ASYNC_ROUTES:
+        router = with_async_routes(router, ASYNC_ROUTES[routes].get_router())
+    app.include_router(router, prefix="/api/v1")
@@ -0,0 +1,6 @@
+"""
+Standalone performance benchmarks.
+
+Run from the backend directory, e.g. `python -m benchmarks.bench_portfolio_listing`.
+They are not collected by pytest (see tests/pytest.ini).
+"""
@@ -0,0 +1,324 @@
+"""
+Benchmark suite: end-to-end API scenarios with latency percentiles.
+
+Drives the app through httpx, in-process over its ASGI transport by
+default, or a running server with --base-url. Each scenario sends a fixed
+number of requests, with --concurrency of them in flight, and reports
+p50/p95/p99 latency, throughput and the SQL statements per request.
+Statements are only counted in-process.
+
+In-process runs cover synthetic data sets of several sizes (see SIZES).
+Each data set is generated once into --data-dir and reused. Every run
+works on a fresh copy, so bulk writes never leak into the next run. A
+size runs in its own process, with DATABASE_URL pointing at its copy, so
+the app uses its real engines and SQLite profile. Against a running server,
+seed its database with `generate-dataset` first.
+
+Results are written as JSON to --output. --compare reads a previous
+results file, such as the stored benchmarks/baseline_api.json, and exits
+with status 1 when a scenario regressed: latency or throughput worse by
+more than --tolerance (p50 and p95 only), or any extra statement per
+request. Timings only compare on the machine that recorded the baseline;
+statement counts compare anywhere.
+
+    python -m benchmarks.bench_api
+    python -m benchmarks.bench_api --sizes small --compare benchmarks/baseline_api.json
+    python -m benchmarks.bench_api --sizes large --output large.json
+    python -m benchmarks.bench_api --base-url http://127.0.0.1:8000
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Optional
+
+import httpx
+
+BASELINE = Path(__file__).parent / "baseline_api.json"
+
+# Data set of each size, as arguments of DatasetSpec
+SIZES = {
+    "small": dict(portfolios=10, assets_per_portfolio=50, snapshots_per_asset=100),  # 50k snapshots
+    "medium": dict(portfolios=20, assets_per_portfolio=100, snapshots_per_asset=500),  # 1M snapshots
+    "large": dict(portfolios=100, assets_per_portfolio=100, snapshots_per_asset=1000),  # 10M snapshots
+}
+SEED = 1
+WARMUP = 5
+PAGE_SIZE = 100
+BULK_ROWS = 100
+# Latency and throughput may vary this much before they count as a regression
+TOLERANCE = 0.3
+
+
+class Targets:
+    """Ids the scenarios pick from, discovered through the API itself, and their running state."""
+
+    def __init__(self, portfolio_ids: List[str], asset_ids: List[str]):
+        self.portfolio_ids = portfolio_ids
+        self.asset_ids = asset_ids
+        self.cursor: Optional[str] = None
+        self.writes = 0
+
+    @classmethod
+    async def discover(cls, client: httpx.AsyncClient) -> "Targets":
+        portfolios = (await client.get("/api/v1/portfolios/")).json()
+        assets = (await client.get("/api/v1/assets/", params={"limit": 1000})).json()
+        if not portfolios or not assets:
+            raise RuntimeError("The database has no portfolios or assets; seed it with generate-dataset")
+        return cls([p["id"] for p in portfolios], [a["id"] for a in assets])
+
+
+async def list_assets(client: httpx.AsyncClient, targets: Targets, rng: random.Random) -> httpx.Response:
+    """Walk the asset listing page by page, starting over after the last page."""
+    params = {"limit": PAGE_SIZE, **({"cursor": targets.cursor} if targets.cursor else {})}
+    response = await client.get("/api/v1/assets/", params=params)
+    targets.cursor = response.headers.get("X-Next-Cursor")
+    return response
+
+
+async def portfolio_detail(client: httpx.AsyncClient, targets: Targets, rng: random.Random) -> httpx.Response:
+    return await client.get(f"/api/v1/portfolios/{rng.choice(targets.portfolio_ids)}")
+
+
+async def snapshot_series(client: httpx.AsyncClient, targets: Targets, rng: random.Random) -> httpx.Response:
+    return await client.get(
+        f"/api/v1/assets/{rng.choice(targets.asset_ids)}/snapshots/series", params={"bucket": "week", "agg": "last"}
+    )
+
+
+async def bulk_writes(client: httpx.AsyncClient, targets: Targets, rng: random.Random) -> httpx.Response:
+    """BULK_ROWS snapshots of random assets, each request one second after the previous one."""
+    targets.writes += 1
+    observed_at = (datetime(2100, 1, 1, tzinfo=timezone.utc) + timedelta(seconds=targets.writes)).isoformat()
+    return await client.post("/api/v1/snapshots:bulk", json={"snapshots": [
+        {"asset_id": rng.choice(targets.asset_ids), "value": f"{rng.randint(100, 10**7) / 100:.2f}",
+         "observed_at": observed_at}
+        for _ in range(BULK_ROWS)
+    ]})
+
+
+SCENARIOS: Dict[str, Callable[[httpx.AsyncClient, Targets, random.Random], Awaitable[httpx.Response]]] = {
+    "list_assets": list_assets,
+    "portfolio_detail": portfolio_detail,
+    "snapshot_series": snapshot_series,
+    "bulk_writes": bulk_writes,
+}
+
+
+def percentiles(latencies: List[float]) -> Dict[str, float]:
+    """p50, p95 and p99 of latencies, interpolated between the nearest samples."""
+    if len(latencies) < 2:
+        value = latencies[0] if latencies else float("nan")
+        return {"p50_ms": value, "p95_ms": value, "p99_ms": value}
+    cuts = statistics.quantiles(latencies, n=100, method="inclusive")
+    return {"p50_ms": round(cuts[49], 3), "p95_ms": round(cuts[94], 3), "p99_ms": round(cuts[98], 3)}
+
+
+async def run_scenario(
+    client: httpx.AsyncClient,
+    name: str,
+    targets: Targets,
+    requests: int,
+    concurrency: int,
+    count_statements: Optional[Callable[[], int]] = None,
+) -> dict:
+    """Send `requests` requests of a scenario, `concurrency` at a time, after a warm-up."""
+    scenario, rng = SCENARIOS[name], random.Random(f"{SEED}:{name}")
+    for _ in range(WARMUP):
+        await scenario(client, targets, rng)
+
+    latencies: List[float] = []
+    errors = 0
+    remaining = iter(range(requests))
+
+    async def worker() -> None:
+        nonlocal errors
+        for _ in remaining:
+            start = time.perf_counter()
+            response = await scenario(client, targets, rng)
+            if response.status_code < 400:
+                latencies.append((time.perf_counter() - start) * 1000)
+            else:
+                errors += 1
+
+    statements = count_statements() if count_statements else 0
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    return {
+        "requests": requests,
+        "errors": errors,
+        **percentiles(latencies),
+        "throughput_rps": round(len(latencies) / elapsed, 3),
+        "statements_per_request": (count_statements() - statements) / requests if count_statements else None,
+    }
+
+
+async def run_suite(client: httpx.AsyncClient, scenarios: List[str], requests: int, concurrency: int,
+                    count_statements: Optional[Callable[[], int]] = None) -> Dict[str, dict]:
+    targets = await Targets.discover(client)
+    return {
+        name: await run_scenario(client, name, targets, requests, concurrency, count_statements)
+        for name in scenarios
+    }
+
+
+def worker_main(args: argparse.Namespace) -> None:
+    """Run the suite in-process against DATABASE_URL, which the parent points at a data set copy."""
+    from app.adapters.outgoing.persistence.query_stats import track_queries
+    from app.main import app
+
+    async def run() -> Dict[str, dict]:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+            # The app's engines record their statements in the stats tracked by its caller
+            with track_queries() as stats:
+                return await run_suite(client, args.scenarios, args.requests, args.concurrency, lambda: stats.count)
+
+    Path(args.worker_output).write_text(json.dumps(asyncio.run(run())))
+
+
+def dataset(size: str, data_dir: Path) -> Path:
+    """Path of the generated data set of a size, generated on first use."""
+    path = data_dir / f"{size}-{SEED}.db"
+    if path.exists():
+        return path
+    from sqlalchemy import create_engine
+
+    from app.adapters.outgoing.persistence.database import Base
+    from app.adapters.outgoing.persistence.synthetic import DatasetSpec, generate_dataset
+
+    data_dir.mkdir(parents=True, exist_ok=True)
+    partial = path.with_suffix(".partial")
+    partial.unlink(missing_ok=True)
+    engine = create_engine(f"sqlite:///{partial}")
+    Base.metadata.create_all(engine)
+    print(f"generating the {size} data set into {path}", file=sys.stderr)
+    generate_dataset(engine, DatasetSpec(seed=SEED, **SIZES[size]))
+    with engine.connect() as conn:
+        conn.exec_driver_sql("ANALYZE")
+    engine.dispose()
+    partial.rename(path)
+    return path
+
+
+def run_in_process(size: str, args: argparse.Namespace) -> Dict[str, dict]:
+    """Run the suite for one size in a child process, on a copy of its data set."""
+    source = dataset(size, args.data_dir)
+    with tempfile.TemporaryDirectory() as tmp:
+        copy, output = Path(tmp) / "bench.db", Path(tmp) / "results.json"
+        shutil.copyfile(source, copy)
+        env = {**os.environ, "DATABASE_URL": f"sqlite:///{copy}"}
+        subprocess.run([
+            sys.executable, "-m", "benchmarks.bench_api", "--worker-output", str(output),
+            "--requests", str(args.requests), "--concurrency", str(args.concurrency),
+            "--scenarios", *args.scenarios,
+        ], env=env, check=True, stdout=subprocess.DEVNULL)
+        return json.loads(output.read_text())
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> List[str]:
+    """Regressions of `results` against `baseline`, for the targets and scenarios both cover."""
+    regressions = []
+    for target, scenarios in results["results"].items():
+        for name, current in scenarios.items():
+            before = baseline.get("results", {}).get(target, {}).get(name)
+            if not before:
+                continue
+            # p99 of a few hundred requests is too noisy to fail on
+            for metric in ("p50_ms", "p95_ms"):
+                if current[metric] > before[metric] * (1 + tolerance):
+                    regressions.append(f"{target}/{name}: {metric} {before[metric]:.1f} -> {current[metric]:.1f}")
+            if current["throughput_rps"] < before["throughput_rps"] * (1 - tolerance):
+                regressions.append(
+                    f"{target}/{name}: throughput {before['throughput_rps']:.0f} -> {current['throughput_rps']:.0f} req/s"
+                )
+            if (current["statements_per_request"] or 0) > (before["statements_per_request"] or 0):
+                regressions.append(
+                    f"{target}/{name}: statements/request "
+                    f"{before['statements_per_request']:.2f} -> {current['statements_per_request']:.2f}"
+                )
+            if current["errors"] > before["errors"]:
+                regressions.append(f"{target}/{name}: errors {before['errors']} -> {current['errors']}")
+    return regressions
+
+
+def print_results(results: dict) -> None:
+    print(f"{'target':>24} {'scenario':>18} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} "
+          f"{'req/s':>8} {'stmts/req':>10} {'errors':>7}")
+    for target, scenarios in results["results"].items():
+        for name, r in scenarios.items():
+            statements = f"{r['statements_per_request']:.1f}" if r["statements_per_request"] is not None else "-"
+            print(f"{target:>24} {name:>18} {r['p50_ms']:>8.1f} {r['p95_ms']:>8.1f} {r['p99_ms']:>8.1f} "
+                  f"{r['throughput_rps']:>8.1f} {statements:>10} {r['errors']:>7}")
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bench_api", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", nargs="+", choices=list(SIZES), default=["small", "medium"],
+                        help="Data sets to run in-process (default: small medium).")
+    parser.add_argument("--base-url", help="Benchmark a running server instead, e.g. http://127.0.0.1:8000.")
+    parser.add_argument("--scenarios", nargs="+", choices=list(SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument("--requests", type=int, default=200, help="Requests per scenario (default: 200).")
+    parser.add_argument("--concurrency", type=int, default=1, help="Requests in flight (default: 1).")
+    parser.add_argument("--data-dir", type=Path, default=Path(tempfile.gettempdir()) / "strata-bench",
+                        help="Where generated data sets are kept between runs.")
+    parser.add_argument("--output", type=Path, help="Write the results as JSON to this file.")
+    parser.add_argument("--compare", type=Path, help="Results file to compare with, e.g. benchmarks/baseline_api.json.")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE,
+                        help=f"Relative latency/throughput change allowed by --compare (default: {TOLERANCE}).")
+    parser.add_argument("--worker-output", help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+    if args.worker_output:
+        return worker_main(args)
+
+    if args.base_url:
+        async def remote() -> Dict[str, dict]:
+            async with httpx.AsyncClient(base_url=args.base_url, timeout=None) as client:
+                return await run_suite(client, args.scenarios, args.requests, args.concurrency)
+
+        runs = {args.base_url: asyncio.run(remote())}
+    else:
+        runs = {size: run_in_process(size, args) for size in args.sizes}
+
+    results = {
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "api_stack": os.getenv("API_STACK", "sync").lower(),
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+        },
+        "results": runs,
+    }
+    print_results(results)
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2) + "\n")
+    if args.compare:
+        regressions = compare(results, json.loads(args.compare.read_text()), args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            sys.exit(1)
+        print(f"no regression against {args.compare}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Benchmark: `GET /assets` listing of 10,000 assets, walked in pages of 1000.
+
+Compares the full-graph path the endpoint used to take (find_page → Asset
+aggregates → AssetResponse models → FastAPI response validation → JSON)
+with the query side it takes now (find_summary_page → column rows as
+AssetSummary dicts → JSON, with no validation). Each asset carries TAGS
+tags and one category with a parent. The target is a 5x speedup; the new
+path is also timed through the HTTP endpoint for reference.
+
+    python -m benchmarks.bench_asset_listing
+"""
+from typing import List
+
+from pydantic import TypeAdapter
+
+from app.adapters.incoming.api.mappers.api_mapper import ApiMapper
+from app.adapters.incoming.api.schemas.asset_response import AssetResponse
+from app.adapters.outgoing.persistence.repository.sqlalchemy_asset_repository import SQLAlchemyAssetRepository
+from app.application.pagination import Page
+from benchmarks.common import api_client, measure, seed_labels, seed_portfolios, temporary_database
+
+PORTFOLIOS = 10
+ASSETS_PER_PORTFOLIO = 1000
+TAGS = 2
+LIMIT = 1000
+
+# What FastAPI does with a List[AssetResponse] return value and response_model
+_RESPONSE_LIST = TypeAdapter(List[AssetResponse])
+
+
+def _walk(fetch, key) -> int:
+    """Fetch every page; returns the number of assets seen."""
+    seen, after = 0, None
+    while True:
+        rows, _body = fetch(after)
+        seen += len(rows)
+        if len(rows) < LIMIT:
+            return seen
+        after = key(rows[-1])
+
+
+def main() -> None:
+    with temporary_database() as (engine, Session):
+        seed_portfolios(engine, PORTFOLIOS, ASSETS_PER_PORTFOLIO, 0)
+        seed_labels(engine, TAGS)
+        total = PORTFOLIOS * ASSETS_PER_PORTFOLIO
+
+        def full_graph_page(after):
+            with Session() as session:
+                assets = SQLAlchemyAssetRepository(session).find_page(LIMIT, after)
+                responses = ApiMapper.to_asset_response_list(assets)
+                validated = _RESPONSE_LIST.validate_python([r.model_dump() for r in responses])
+                return assets, _RESPONSE_LIST.dump_json(validated)
+
+        def query_side_page(after):
+            with Session() as session:
+                summaries = SQLAlchemyAssetRepository(session).find_summary_page(LIMIT, after)
+                return summaries, ApiMapper.to_asset_summary_page_response(Page(items=summaries)).body
+
+        assert _walk(full_graph_page, lambda a: (a.name, str(a.id))) == total
+        assert _walk(query_side_page, lambda a: (a["name"], a["id"])) == total
+        full_graph = measure(lambda: _walk(full_graph_page, lambda a: (a.name, str(a.id))), repeat=3)
+        query_side = measure(lambda: _walk(query_side_page, lambda a: (a["name"], a["id"])), repeat=3)
+
+        with api_client(Session) as client:
+            def http_walk():
+                params, seen = {"limit": LIMIT}, 0
+                while True:
+                    resp = client.get("/api/v1/assets/", params=params)
+                    seen += len(resp.json())
+                    cursor = resp.headers.get("X-Next-Cursor")
+                    if not cursor:
+                        return seen
+                    params["cursor"] = cursor
+
+            assert http_walk() == total
+            http = measure(http_walk, repeat=3)
+
+    print(f"{total} assets x {TAGS} tags + 1 category, pages of {LIMIT}")
+    print(f"{'path':>28} {'walk (ms)':>10} {'assets/s':>10}")
+    print(f"{'full graph':>28} {full_graph:>10.0f} {total / full_graph * 1000:>10.0f}")
+    print(f"{'query side':>28} {query_side:>10.0f} {total / query_side * 1000:>10.0f}")
+    print(f"{'query side, GET /assets':>28} {http:>10.0f} {total / http * 1000:>10.0f}")
+    print(f"speedup: {full_graph / query_side:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+Benchmark: sync vs async request stack under concurrent load.
+
+Serves the app with uvicorn once per stack (API_STACK=sync|async) on the
+same seeded SQLite file, then drives it from an asyncio load generator with
+an increasing number of concurrent clients for a fixed time each. The
+request mix is read-heavy, with a share of snapshot writes, and only uses
+the endpoints the async stack serves from the event loop.
+
+    python -m benchmarks.bench_async_stack
+"""
+import asyncio
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+from sqlalchemy import create_engine
+
+from app.adapters.outgoing.persistence.database import Base
+from benchmarks.common import seed_portfolios
+
+PORT = 8765
+CONCURRENCY = (16, 64, 256)
+DURATION_SECONDS = 10.0
+PORTFOLIOS = 10
+ASSETS_PER_PORTFOLIO = 20
+SNAPSHOTS_PER_ASSET = 365
+# Share of requests that write a snapshot
+WRITE_RATIO = 0.2
+
+
+def _request(client: httpx.AsyncClient, asset_ids):
+    asset_id = random.choice(asset_ids)
+    roll = random.random()
+    if roll < WRITE_RATIO:
+        return client.post(f"/api/v1/assets/{asset_id}/snapshots", json={
+            "value": f"{random.randint(1, 10**6) / 100:.2f}", "observed_at": "2030-01-01T00:00:00Z",
+        })
+    if roll < 0.6:
+        return client.get(f"/api/v1/assets/{asset_id}")
+    if roll < 0.9:
+        return client.get(f"/api/v1/assets/{asset_id}/snapshots", params={"limit": 50})
+    return client.get("/api/v1/portfolios/")
+
+
+async def drive(base_url: str, concurrency: int, asset_ids) -> dict:
+    latencies, errors = [], 0
+    deadline = time.perf_counter() + DURATION_SECONDS
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60) as client:
+        async def user() -> None:
+            nonlocal errors
+            while time.perf_counter() < deadline:
+                start = time.perf_counter()
+                try:
+                    resp = await _request(client, asset_ids)
+                    ok = resp.status_code < 400
+                except httpx.HTTPError:
+                    ok = False
+                if ok:
+                    latencies.append((time.perf_counter() - start) * 1000)
+                else:
+                    errors += 1
+
+        await asyncio.gather(*(user() for _ in range(concurrency)))
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": len(latencies) / DURATION_SECONDS,
+        "p50": statistics.median(latencies) if latencies else float("nan"),
+        "p99": latencies[int(len(latencies) * 0.99)] if latencies else float("nan"),
+    }
+
+
+def serve(stack: str, database_url: str) -> subprocess.Popen:
+    env = {**os.environ, "DATABASE_URL": database_url, "API_STACK": stack}
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(PORT), "--log-level", "warning"],
+        env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    for _ in range(100):
+        try:
+            httpx.get(f"http://127.0.0.1:{PORT}/", timeout=1)
+            return server
+        except httpx.HTTPError:
+            time.sleep(0.1)
+    server.terminate()
+    raise RuntimeError(f"uvicorn did not start for API_STACK={stack}")
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        database_url = f"sqlite:///{Path(tmp) / 'bench.db'}"
+        engine = create_engine(database_url)
+        Base.metadata.create_all(engine)
+        seed_portfolios(engine, PORTFOLIOS, ASSETS_PER_PORTFOLIO, SNAPSHOTS_PER_ASSET)
+        with engine.connect() as conn:
+            asset_ids = [row[0] for row in conn.exec_driver_sql("SELECT id FROM assets")]
+        engine.dispose()
+
+        print(f"{len(asset_ids)} assets, {DURATION_SECONDS:.0f}s per run, {WRITE_RATIO:.0%} writes")
+        print(f"{'stack':>6} {'clients':>8} {'requests':>9} {'req/s':>8} {'p50 ms':>8} {'p99 ms':>8} {'errors':>7}")
+        for stack in ("sync", "async"):
+            server = serve(stack, database_url)
+            try:
+                for concurrency in CONCURRENCY:
+                    r = asyncio.run(drive(f"http://127.0.0.1:{PORT}", concurrency, asset_ids))
+                    print(
+                        f"{stack:>6} {concurrency:>8} {r['requests']:>9} {r['rps']:>8.0f} "
+                        f"{r['p50']:>8.1f} {r['p99']:>8.1f} {r['errors']:>7}"
+                    )
+            finally:
+                server.terminate()
+                server.wait()
+
+
+if __name__ == "__main__":
+    main()
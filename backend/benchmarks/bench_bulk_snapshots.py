@@ -0,0 +1,53 @@
+"""
+Benchmark: snapshot ingestion throughput over HTTP.
+
+Compares one `POST /assets/{id}/snapshots` per row with a single
+`POST /snapshots:bulk` carrying the whole batch.
+
+    python -m benchmarks.bench_bulk_snapshots
+"""
+import time
+from datetime import timedelta
+
+from benchmarks.common import T0, api_client, seed_portfolios, temporary_database
+
+ASSETS = 50
+BULK_ROWS = 50_000
+SINGLE_ROWS = 1_000
+
+
+def _rows(asset_ids, count):
+    return [
+        {
+            "asset_id": asset_ids[i % len(asset_ids)],
+            "value": f"{1000 + i % 997}.25",
+            "observed_at": (T0 + timedelta(minutes=i)).isoformat(),
+        }
+        for i in range(count)
+    ]
+
+
+def main() -> None:
+    with temporary_database() as (engine, Session), api_client(Session) as client:
+        portfolio_id = seed_portfolios(engine, 1, ASSETS, 0)[0]
+        asset_ids = [a["id"] for a in client.get("/api/v1/assets/", params={"portfolio_id": portfolio_id}).json()]
+
+        start = time.perf_counter()
+        for row in _rows(asset_ids, SINGLE_ROWS):
+            resp = client.post(f"/api/v1/assets/{row['asset_id']}/snapshots", json=row)
+            assert resp.status_code == 201, resp.text
+        single = time.perf_counter() - start
+
+        payload = {"snapshots": _rows(asset_ids, BULK_ROWS)}
+        start = time.perf_counter()
+        resp = client.post("/api/v1/snapshots:bulk", json=payload)
+        bulk = time.perf_counter() - start
+        assert resp.status_code == 200 and resp.json()["created"] == BULK_ROWS, resp.text
+
+    print(f"{'path':>22} {'rows':>8} {'seconds':>9} {'rows/s':>10}")
+    print(f"{'single POST per row':>22} {SINGLE_ROWS:>8} {single:>9.2f} {SINGLE_ROWS / single:>10.0f}")
+    print(f"{'POST /snapshots:bulk':>22} {BULK_ROWS:>8} {bulk:>9.2f} {BULK_ROWS / bulk:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Benchmark: streaming history export vs. the JSON list endpoint.
+
+For one asset with a long snapshot history, compares
+`GET /assets/{id}/snapshots` (the whole history materialised as a JSON
+array) with `GET /assets/{id}/snapshots/export` (NDJSON/CSV streamed from
+a yield_per cursor): time to first byte, total time and peak Python heap
+allocated while serving the request. The app is driven through raw ASGI
+calls that discard body chunks as they arrive (TestClient would buffer the
+whole body and hide both the first byte and the memory difference).
+
+    python -m benchmarks.bench_export
+"""
+import asyncio
+import time
+import tracemalloc
+from urllib.parse import urlencode
+
+from sqlalchemy import select
+
+from app.adapters.outgoing.persistence.models import AssetModel
+from benchmarks.common import api_client, seed_portfolios, temporary_database
+
+SNAPSHOT_COUNTS = (50_000, 200_000)
+
+
+def _fetch(app, path, params=None):
+    """Serve one GET through the ASGI app; return (first byte ms, total ms, body bytes)."""
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": path, "raw_path": path.encode(), "root_path": "",
+        "query_string": urlencode(params or {}).encode(), "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 0), "server": ("bench", 80),
+    }
+    stats = {"first": None, "size": 0, "status": None}
+    requested = False
+
+    async def receive():
+        nonlocal requested
+        if requested:
+            await asyncio.Event().wait()  # client never disconnects
+        requested = True
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            stats["status"] = message["status"]
+        elif message["type"] == "http.response.body":
+            if stats["first"] is None:
+                stats["first"] = time.perf_counter()
+            stats["size"] += len(message.get("body", b""))
+
+    start = time.perf_counter()
+    asyncio.run(app(scope, receive, send))
+    end = time.perf_counter()
+    assert stats["status"] == 200, stats["status"]
+    return (stats["first"] - start) * 1000, (end - start) * 1000, stats["size"]
+
+
+def _peak_heap_mb(app, path, params=None):
+    tracemalloc.start()
+    try:
+        _fetch(app, path, params)
+        return tracemalloc.get_traced_memory()[1] / 1e6
+    finally:
+        tracemalloc.stop()
+
+
+def main() -> None:
+    print(f"{'snapshots':>10} {'endpoint':<14} {'first byte (ms)':>16} {'total (ms)':>11} "
+          f"{'body (MB)':>10} {'peak heap (MB)':>15}")
+    for count in SNAPSHOT_COUNTS:
+        with temporary_database() as (engine, Session):
+            seed_portfolios(engine, 1, 1, count)
+            with engine.connect() as conn:
+                asset_id = conn.execute(select(AssetModel.id)).scalar_one()
+
+            scenarios = [
+                ("list (JSON)", f"/api/v1/assets/{asset_id}/snapshots", None),
+                ("export ndjson", f"/api/v1/assets/{asset_id}/snapshots/export", {"format": "ndjson"}),
+                ("export csv", f"/api/v1/assets/{asset_id}/snapshots/export", {"format": "csv"}),
+            ]
+            with api_client(Session) as client:
+                for label, url, params in scenarios:
+                    first_ms, total_ms, size = _fetch(client.app, url, params)
+                    peak_mb = _peak_heap_mb(client.app, url, params)
+                    print(f"{count:>10} {label:<14} {first_ms:>16.0f} {total_ms:>11.0f} "
+                          f"{size / 1e6:>10.1f} {peak_mb:>15.1f}")
+
+
+if __name__ == "__main__":
+    main()
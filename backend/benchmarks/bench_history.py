@@ -0,0 +1,77 @@
+"""
+Benchmark: portfolio value history, vectorized as-of index vs. naive loop.
+
+For each configuration a portfolio is seeded with daily snapshots and valued
+at evenly spaced moments covering its history, two ways:
+
+- naive: load every asset with its snapshots and sum `Asset.current_value(at)`
+  over assets for every moment (a Python lookup per asset and moment)
+- vectorized: `GetPortfolioHistoryUseCase`, one query of the assets'
+  snapshot series and `AsOfIndex.totals_at` over all moments at once
+
+Both must produce the same totals. End-to-end times include loading the
+data; the compute columns time only the valuation over already loaded
+snapshots, where the vectorized path does no per-row Python work.
+
+    python -m benchmarks.bench_history
+"""
+from datetime import timedelta
+
+from app.adapters.outgoing.persistence.repository.sqlalchemy_asset_repository import SQLAlchemyAssetRepository
+from app.adapters.outgoing.persistence.repository.sqlalchemy_asset_snapshot_repository import SQLAlchemyAssetSnapshotRepository
+from app.adapters.outgoing.persistence.repository.sqlalchemy_portfolio_repository import SQLAlchemyPortfolioRepository
+from app.application.analytics.as_of import AsOfIndex, sample_moments
+from app.application.use_cases.portfolio.get_portfolio_history import GetPortfolioHistoryUseCase
+from benchmarks.common import T0, measure, seed_portfolios, temporary_database
+
+# (assets, daily snapshots per asset, sampled moments)
+CONFIGS = ((10, 1_000, 365), (50, 1_000, 365), (100, 1_000, 1_000))
+
+
+def _load_assets(session, portfolio_id):
+    snapshot_repo = SQLAlchemyAssetSnapshotRepository(session)
+    assets = SQLAlchemyAssetRepository(session).find_by_portfolio(portfolio_id)
+    for asset in assets:
+        asset.snapshots = snapshot_repo.get_snapshots(asset.id)
+    return assets
+
+
+def _naive_totals(assets, moments):
+    return [sum(asset.current_value(m) for asset in assets) for m in moments]
+
+
+def _naive_history(session, portfolio_id, moments):
+    return _naive_totals(_load_assets(session, portfolio_id), moments)
+
+
+def main() -> None:
+    print(f"{'assets':>6} {'snapshots':>10} {'moments':>8} | {'end-to-end: naive':>17} {'vectorized':>10} {'speedup':>7} "
+          f"| {'compute: naive':>14} {'vectorized':>10} {'speedup':>7}   (ms)")
+    for assets, snapshots, points in CONFIGS:
+        with temporary_database() as (engine, Session):
+            (portfolio_id,) = seed_portfolios(engine, 1, assets, snapshots)
+            end = T0 + timedelta(days=snapshots - 1)
+            step = (end - T0) / (points - 1)
+            moments = sample_moments(T0, end, step)
+
+            with Session() as session:
+                use_case = GetPortfolioHistoryUseCase(
+                    SQLAlchemyPortfolioRepository(session), SQLAlchemyAssetSnapshotRepository(session)
+                )
+                vectorized = [p.value for p in use_case.execute(portfolio_id, T0, end, step)]
+                assert vectorized == _naive_history(session, portfolio_id, moments)
+
+                naive_ms = measure(lambda: _naive_history(session, portfolio_id, moments), repeat=3)
+                vectorized_ms = measure(lambda: use_case.execute(portfolio_id, T0, end, step), repeat=5)
+
+                loaded = _load_assets(session, portfolio_id)
+                index = AsOfIndex.from_series(SQLAlchemyAssetSnapshotRepository(session).get_portfolio_snapshot_series(portfolio_id))
+                naive_compute_ms = measure(lambda: _naive_totals(loaded, moments), repeat=3)
+                vectorized_compute_ms = measure(lambda: index.totals_at(moments), repeat=5)
+        print(f"{assets:>6} {assets * snapshots:>10} {points:>8} | {naive_ms:>17.0f} {vectorized_ms:>10.0f} "
+              f"{naive_ms / vectorized_ms:>6.0f}x | {naive_compute_ms:>14.0f} {vectorized_compute_ms:>10.1f} "
+              f"{naive_compute_ms / vectorized_compute_ms:>6.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Benchmark: streaming history import throughput and memory.
+
+Writes CSV files of growing size and imports them with ImportHistoryUseCase
+(the code path behind both `POST /imports/snapshots` and `import-history`).
+Peak RSS should stay flat as the file grows, since records are consumed
+chunk by chunk (sizes run in increasing order, so the process-wide peak
+is attributable to the largest import so far).
+
+    python -m benchmarks.bench_history_import
+"""
+import csv
+import resource
+from datetime import timedelta
+from pathlib import Path
+
+from sqlalchemy import select
+
+from app.adapters.incoming.importers.history_reader import ImportFormat, read_records
+from app.adapters.outgoing.persistence.models import AssetModel
+from app.adapters.outgoing.persistence.repository.sqlalchemy_asset_repository import SQLAlchemyAssetRepository
+from app.adapters.outgoing.persistence.repository.sqlalchemy_asset_snapshot_repository import SQLAlchemyAssetSnapshotRepository
+from app.adapters.outgoing.persistence.repository.sqlalchemy_transaction_repository import SQLAlchemyTransactionRepository
+from app.adapters.outgoing.persistence.repository.sqlalchemy_unit_of_work import SQLAlchemyUnitOfWork
+from app.application.use_cases.history.import_history import ImportHistoryUseCase, ImportKind
+from benchmarks.common import T0, seed_portfolios, temporary_database
+
+ASSETS = 100
+ROW_COUNTS = (100_000, 300_000, 1_000_000)
+
+
+def _write_csv(path, asset_names, rows):
+    with path.open("w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["asset", "value", "observed_at"])
+        for i in range(rows):
+            observed_at = T0 + timedelta(minutes=i)
+            writer.writerow([asset_names[i % len(asset_names)], f"{1000 + i % 997}.25", observed_at.isoformat()])
+
+
+def main() -> None:
+    print(f"{'rows':>8} {'file (MB)':>10} {'seconds':>9} {'rows/s':>10} {'peak RSS (MB)':>14}")
+    for rows in ROW_COUNTS:
+        with temporary_database() as (engine, Session):
+            seed_portfolios(engine, 1, ASSETS, 0)
+            with engine.connect() as conn:
+                names = list(conn.execute(select(AssetModel.name)).scalars())
+            path = Path(engine.url.database).with_name("history.csv")
+            _write_csv(path, names, rows)
+
+            with Session() as session, path.open("rb") as stream:
+                use_case = ImportHistoryUseCase(
+                    SQLAlchemyAssetSnapshotRepository(session),
+                    SQLAlchemyTransactionRepository(session),
+                    SQLAlchemyAssetRepository(session),
+                    SQLAlchemyUnitOfWork(session),
+                )
+                report = use_case.execute(ImportKind.SNAPSHOTS, read_records(stream, ImportFormat.CSV))
+            peak_rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+            assert report.imported == rows, report.errors
+
+            size_mb = path.stat().st_size / 1e6
+            print(f"{rows:>8} {size_mb:>10.1f} {report.elapsed_seconds:>9.2f} "
+                  f"{report.rows_per_second:>10.0f} {peak_rss_mb:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+"""
+Micro-benchmark: PersistenceMapper throughput in rows/s, ORM → domain.
+
+Each entity is built four ways from the same transient ORM rows (built in
+memory, so no database time is included):
+
+- uuid() + validate: ids parsed with uuid.UUID in Python, then validated by
+  the entity (how the mapper used to build entities)
+- model_construct: the same typed values with validation skipped, defaults
+  passed explicitly (the trusted read path)
+- strict validate: the same typed values through model_validate(strict=True),
+  so no coercion is attempted
+- raw columns: column values handed to the validator as read, ids as
+  strings (what PersistenceMapper does)
+
+Strategies are timed in interleaved rounds after a gc.collect(), so garbage
+left by one strategy is not charged to the next.
+
+The composite asset mapping (portfolio, type, two tags and a category with
+a parent per row) is timed through PersistenceMapper, row by row and as a
+list sharing one identity map.
+
+    python -m benchmarks.bench_mapper
+"""
+import gc
+import time
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Callable, Dict, List
+from uuid import UUID, uuid4
+
+from app.adapters.outgoing.persistence.mappers.persistence_mapper import PersistenceMapper
+from app.adapters.outgoing.persistence.models import (
+    AssetModel,
+    AssetSnapshotModel,
+    AssetTypeModel,
+    CategoryModel,
+    PortfolioModel,
+    TagModel,
+    TransactionModel,
+)
+from app.domain.entities import AssetSnapshot, Portfolio, Tag, Transaction
+
+ROWS = 20_000
+STRATEGIES = ("uuid() + validate", "model_construct", "strict validate", "raw columns")
+T0 = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _leaf_mappings(now: datetime) -> dict:
+    """name: (rows, {strategy: map_row})"""
+    tags = [TagModel(id=str(uuid4()), name=f"tag-{i}") for i in range(ROWS)]
+    portfolios = [
+        PortfolioModel(id=str(uuid4()), name=f"Portfolio {i}", base_currency="EUR", created_at=now, updated_at=now)
+        for i in range(ROWS)
+    ]
+    snapshots = [
+        AssetSnapshotModel(id=str(uuid4()), asset_id=str(uuid4()), value=Decimal(i) / 100, observed_at=T0 + timedelta(hours=i))
+        for i in range(ROWS)
+    ]
+    transactions = [
+        TransactionModel(
+            id=str(uuid4()), asset_id=str(uuid4()), type="BUY", quantity=Decimal("2"),
+            unit_price=Decimal("10.50"), currency="EUR", occurred_at=T0 + timedelta(hours=i),
+        )
+        for i in range(ROWS)
+    ]
+    return {
+        "tag": (tags, {
+            "uuid() + validate": lambda m: Tag(id=UUID(m.id), name=m.name),
+            "model_construct": lambda m: Tag.model_construct(id=UUID(m.id), name=m.name),
+            "strict validate": lambda m: Tag.model_validate({"id": UUID(m.id), "name": m.name}, strict=True),
+            "raw columns": PersistenceMapper.tag_to_domain,
+        }),
+        "portfolio": (portfolios, {
+            "uuid() + validate": lambda m: Portfolio(
+                id=UUID(m.id), name=m.name, base_currency=m.base_currency,
+                created_at=m.created_at, updated_at=m.updated_at,
+            ),
+            "model_construct": lambda m: Portfolio.model_construct(
+                id=UUID(m.id), name=m.name, base_currency=m.base_currency, assets=[], snapshots=[],
+                created_at=m.created_at, updated_at=m.updated_at,
+            ),
+            "strict validate": lambda m: Portfolio.model_validate({
+                "id": UUID(m.id), "name": m.name, "base_currency": m.base_currency,
+                "created_at": m.created_at, "updated_at": m.updated_at,
+            }, strict=True),
+            "raw columns": PersistenceMapper.portfolio_to_domain,
+        }),
+        "asset_snapshot": (snapshots, {
+            "uuid() + validate": lambda m: AssetSnapshot(
+                id=UUID(m.id), asset_id=UUID(m.asset_id), value=m.value, observed_at=m.observed_at,
+            ),
+            "model_construct": lambda m: AssetSnapshot.model_construct(
+                id=UUID(m.id), asset_id=UUID(m.asset_id), value=m.value, observed_at=m.observed_at,
+            ),
+            "strict validate": lambda m: AssetSnapshot.model_validate({
+                "id": UUID(m.id), "asset_id": UUID(m.asset_id), "value": m.value, "observed_at": m.observed_at,
+            }, strict=True),
+            "raw columns": PersistenceMapper.asset_snapshot_to_domain,
+        }),
+        "transaction": (transactions, {
+            "uuid() + validate": lambda m: Transaction(
+                id=UUID(m.id), asset_id=UUID(m.asset_id), type=m.type, quantity=m.quantity,
+                unit_price=m.unit_price, currency=m.currency, occurred_at=m.occurred_at,
+            ),
+            "model_construct": lambda m: Transaction.model_construct(
+                id=UUID(m.id), asset_id=UUID(m.asset_id), type=m.type, quantity=m.quantity,
+                unit_price=m.unit_price, currency=m.currency, occurred_at=m.occurred_at,
+            ),
+            "strict validate": lambda m: Transaction.model_validate({
+                "id": UUID(m.id), "asset_id": UUID(m.asset_id), "type": m.type, "quantity": m.quantity,
+                "unit_price": m.unit_price, "currency": m.currency, "occurred_at": m.occurred_at,
+            }, strict=True),
+            "raw columns": PersistenceMapper.transaction_to_domain,
+        }),
+    }
+
+
+def _assets(now: datetime) -> List[AssetModel]:
+    portfolio = PortfolioModel(id=str(uuid4()), name="Portfolio", base_currency="EUR", created_at=now, updated_at=now)
+    asset_type = AssetTypeModel(id=str(uuid4()), code="EQUITY", label="Equity")
+    tags = [TagModel(id=str(uuid4()), name=f"tag-{i}") for i in range(20)]
+    parent = CategoryModel(id=str(uuid4()), name="Root")
+    categories = [CategoryModel(id=str(uuid4()), name=f"category-{i}", parent=parent) for i in range(9)]
+    return [
+        AssetModel(
+            id=str(uuid4()), name=f"Asset {i}", portfolio=portfolio, asset_type=asset_type,
+            quantity=Decimal("1.50000000"), disposed=False,
+            tags=[tags[i % 20], tags[(i + 1) % 20]], categories=[categories[i % 9]],
+            created_at=now, updated_at=now, created_by="bench", updated_by="bench",
+        )
+        for i in range(ROWS)
+    ]
+
+
+def _rows_per_second(map_rows: Callable[[List], object], rows: List, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        map_rows(rows)
+        best = min(best, time.perf_counter() - start)
+    return len(rows) / best
+
+
+def _interleaved(builders: Dict[str, Callable], rows: List, rounds: int = 7) -> List[float]:
+    """Best rows/s of each strategy over `rounds` rounds that run every strategy once."""
+    best = {name: 0.0 for name in STRATEGIES}
+    for _ in range(rounds):
+        for name in STRATEGIES:
+            build = builders[name]
+            best[name] = max(best[name], _rows_per_second(lambda rs: [build(r) for r in rs], rows, repeat=1))
+    return [best[name] for name in STRATEGIES]
+
+
+def main() -> None:
+    now = datetime.now(timezone.utc)
+    leaves = _leaf_mappings(now)
+    print(f"{ROWS} rows per mapping, rows/s, best of 7 interleaved rounds")
+    print(f"{'mapping':>16} " + " ".join(f"{s:>18}" for s in STRATEGIES))
+    for name, (rows, builders) in leaves.items():
+        rates = _interleaved(builders, rows)
+        print(f"{name:>16} " + " ".join(f"{rate:>18,.0f}" for rate in rates))
+
+    assets = _assets(now)
+    row_by_row = _rows_per_second(lambda rs: [PersistenceMapper.asset_to_domain(r) for r in rs], assets)
+    as_list = _rows_per_second(PersistenceMapper.assets_to_domain, assets)
+    print(f"{'asset':>16} {row_by_row:>18,.0f} row by row, {as_list:,.0f} as a list (identity map)")
+
+
+if __name__ == "__main__":
+    main()
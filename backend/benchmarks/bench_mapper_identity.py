@@ -0,0 +1,77 @@
+"""
+Benchmark: mapping 10,000 assets to domain entities, with and without the
+mapper's identity map.
+
+The assets belong to 10 portfolios and one asset type, and share 20 tags
+and 12 categories. Mapped row by row, every asset gets its own copy of its
+portfolio, type, tags and category chain; mapped as one list
+(PersistenceMapper.assets_to_domain), each of them is built once. The ORM
+rows are loaded once up front, so only the mapping itself is timed; memory
+is what the mapped list keeps alive (tracemalloc). `find_all` is timed
+end to end for reference.
+
+    python -m benchmarks.bench_mapper_identity
+"""
+import tracemalloc
+
+from sqlalchemy.orm import joinedload, subqueryload
+
+from app.adapters.outgoing.persistence.mappers.persistence_mapper import PersistenceMapper
+from app.adapters.outgoing.persistence.models import AssetModel, CategoryModel
+from app.adapters.outgoing.persistence.repository.sqlalchemy_asset_repository import SQLAlchemyAssetRepository
+from benchmarks.common import measure, seed_labels, seed_portfolios, temporary_database
+
+PORTFOLIOS = 10
+ASSETS_PER_PORTFOLIO = 1000
+TAGS = 3
+
+
+def _row_by_row(rows):
+    return [PersistenceMapper.asset_to_domain(r) for r in rows]
+
+
+def _retained_mib(map_rows, rows) -> float:
+    tracemalloc.start()
+    try:
+        assets = map_rows(rows)
+        retained, _peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del assets
+    return retained / 2**20
+
+
+def main() -> None:
+    with temporary_database() as (engine, Session):
+        seed_portfolios(engine, PORTFOLIOS, ASSETS_PER_PORTFOLIO, 0)
+        seed_labels(engine, TAGS)
+
+        with Session() as session:
+            rows = session.query(AssetModel).options(
+                joinedload(AssetModel.portfolio),
+                joinedload(AssetModel.asset_type),
+                subqueryload(AssetModel.tags),
+                subqueryload(AssetModel.categories).joinedload(CategoryModel.parent),
+            ).all()
+            results = {}
+            for label, map_rows in (("row by row", _row_by_row), ("identity map", PersistenceMapper.assets_to_domain)):
+                results[label] = (measure(lambda: map_rows(rows)), _retained_mib(map_rows, rows))
+
+        def find_all():
+            with Session() as session:
+                SQLAlchemyAssetRepository(session).find_all()
+
+        find_all_ms = measure(find_all, repeat=3)
+
+    total = PORTFOLIOS * ASSETS_PER_PORTFOLIO
+    print(f"{total} assets in {PORTFOLIOS} portfolios, {TAGS} tags + 1 category (with parent) each")
+    print(f"{'mapping':>14} {'ms':>8} {'assets/s':>10} {'retained MiB':>13}")
+    for label, (ms, mib) in results.items():
+        print(f"{label:>14} {ms:>8.0f} {total / ms * 1000:>10.0f} {mib:>13.1f}")
+    (base_ms, base_mib), (new_ms, new_mib) = results.values()
+    print(f"mapping {base_ms / new_ms:.1f}x faster, {base_mib / new_mib:.1f}x less memory")
+    print(f"find_all end to end: {find_all_ms:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
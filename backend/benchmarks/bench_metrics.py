@@ -0,0 +1,135 @@
+"""
+Benchmark: cost of the Prometheus metrics.
+
+Two measurements:
+
+- per operation, in this process: a request through MetricsMiddleware (to
+  an ASGI app that only answers 200), a statement on an instrumented
+  in-memory SQLite engine and a counted use case execution, each against
+  the same operation without metrics. Also the time to render a scrape
+  of the registry once every route has been observed;
+- end to end: the bench_api scenarios on its small data set, in-process,
+  with METRICS=0 and METRICS=1, alternated ROUNDS times. The best p50 and
+  throughput of each setting are compared.
+
+    python -m benchmarks.bench_metrics
+    python -m benchmarks.bench_metrics --requests 500
+"""
+import argparse
+import asyncio
+import os
+import time
+
+from prometheus_client import generate_latest
+from sqlalchemy import create_engine, text
+
+from app.adapters.incoming.api.metrics import (
+    HTTP_REQUEST_DURATION,
+    REGISTRY,
+    MetricsMiddleware,
+    counted,
+    observe_engine,
+)
+from app.adapters.outgoing.persistence import query_stats
+from benchmarks import bench_api
+from benchmarks.common import measure
+
+OPERATIONS = 100_000
+ROUNDS = 2
+
+
+async def _ok(scope, receive, send):
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b""})
+
+
+async def _receive():
+    return {"type": "http.request", "body": b""}
+
+
+async def _send(message):
+    pass
+
+
+def _requests_ms(app) -> float:
+    scope = {"type": "http", "method": "GET", "path": "/"}
+
+    async def run():
+        for _ in range(OPERATIONS):
+            await app(dict(scope), _receive, _send)
+
+    return measure(lambda: asyncio.run(run()), repeat=5)
+
+
+def _statements_ms(instrumented: bool) -> float:
+    # The app's engines always carry the statement statistics' listeners, and
+    # with them the cost of SQLAlchemy's event dispatch: compare on top of those
+    engine = query_stats.instrument_engine(create_engine("sqlite://"))
+    if instrumented:
+        observe_engine(engine, "bench")
+    statement = text("SELECT 1")
+    with engine.connect() as conn:
+        return measure(lambda: [conn.execute(statement) for _ in range(OPERATIONS)], repeat=5)
+
+
+class _UseCase:
+    def execute(self, value):
+        return value
+
+
+def _use_cases_ms(count: bool) -> float:
+    use_case = counted(_UseCase)() if count else _UseCase()
+    return measure(lambda: [use_case.execute(1) for _ in range(OPERATIONS)], repeat=5)
+
+
+def per_operation() -> None:
+    print(f"{'operation':>12} {'without µs':>11} {'with µs':>9} {'overhead µs':>12}")
+    for name, without, with_ in [
+        ("request", _requests_ms(_ok), _requests_ms(MetricsMiddleware(_ok))),
+        ("statement", _statements_ms(False), _statements_ms(True)),
+        ("use case", _use_cases_ms(False), _use_cases_ms(True)),
+    ]:
+        without, with_ = without * 1000 / OPERATIONS, with_ * 1000 / OPERATIONS
+        print(f"{name:>12} {without:>11.2f} {with_:>9.2f} {with_ - without:>12.2f}")
+
+    # A scrape once every route has been seen with a few status codes
+    from app.main import app
+    for route in app.routes:
+        for method in getattr(route, "methods", None) or ():
+            for status in ("200", "404", "500"):
+                HTTP_REQUEST_DURATION.labels(method, route.path_format, status).observe(0.01)
+    size = len(generate_latest(REGISTRY))
+    print(f"scrape: {measure(lambda: generate_latest(REGISTRY), repeat=20):.2f} ms, {size / 1024:.0f} KiB")
+
+
+def end_to_end(requests: int) -> None:
+    args = bench_api.parse_args(["--sizes", "small", "--requests", str(requests)])
+    best = {}
+    for _ in range(ROUNDS):
+        for setting in ("0", "1"):
+            os.environ["METRICS"] = setting
+            for name, result in bench_api.run_in_process("small", args).items():
+                previous = best.setdefault((setting, name), result)
+                previous["p50_ms"] = min(previous["p50_ms"], result["p50_ms"])
+                previous["throughput_rps"] = max(previous["throughput_rps"], result["throughput_rps"])
+
+    print(f"{'scenario':>18} {'p50 off':>8} {'p50 on':>8} {'req/s off':>10} {'req/s on':>9} {'overhead':>9}")
+    for name in args.scenarios:
+        off, on = best[("0", name)], best[("1", name)]
+        overhead = off["throughput_rps"] / on["throughput_rps"] - 1
+        print(f"{name:>18} {off['p50_ms']:>8.2f} {on['p50_ms']:>8.2f} "
+              f"{off['throughput_rps']:>10.1f} {on['throughput_rps']:>9.1f} {overhead:>+9.1%}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bench_metrics", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--requests", type=int, default=200, help="Requests per scenario end to end (default: 200).")
+    args = parser.parse_args()
+    started = time.perf_counter()
+    per_operation()
+    end_to_end(args.requests)
+    print(f"done in {time.perf_counter() - started:.0f} s")
+
+
+if __name__ == "__main__":
+    main()
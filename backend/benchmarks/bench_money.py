@@ -0,0 +1,90 @@
+"""
+Benchmark: valuing a large portfolio with Decimal arithmetic vs. integer cents.
+
+A portfolio of ASSETS assets with SNAPSHOTS daily snapshots each is loaded
+once, then valued three ways, each the old Decimal way and the current
+fixed-point way:
+
+- total value: summing `Asset.current_value` Decimals vs. `Portfolio.total_value`
+  (summing `SnapshotTimeline.cents_at` ints, converted back once). A
+  timeline converts a snapshot's value to cents the first time it is looked
+  up, so the first valuation is reported separately.
+- history: the portfolio valued at every day of its history, Decimal vs. ints
+- SQL total (`get_total_value`): SUM of the Numeric column, which SQLite
+  adds up as floats, vs. SUM of integer cents
+
+Every pair must produce identical totals.
+
+    python -m benchmarks.bench_money
+"""
+import time
+from datetime import timedelta
+from decimal import Decimal
+
+from sqlalchemy import func
+
+from app.adapters.outgoing.persistence.models import AssetLatestValueModel, AssetModel
+from app.adapters.outgoing.persistence.repository.sqlalchemy_portfolio_repository import SQLAlchemyPortfolioRepository
+from app.domain.entities.money import from_cents
+from benchmarks.common import T0, measure, seed_portfolios, temporary_database
+
+ASSETS = 20_000
+SNAPSHOTS = 10
+
+
+def _decimal_total(assets, at=None) -> Decimal:
+    return sum((asset.current_value(at=at) for asset in assets), Decimal("0"))
+
+
+def _cents_total(assets, at=None) -> Decimal:
+    return from_cents(sum(asset.snapshots.cents_at(at) for asset in assets))
+
+
+def main() -> None:
+    moments = [T0 + timedelta(days=d) for d in range(SNAPSHOTS)]
+    with temporary_database() as (engine, Session):
+        (portfolio_id,) = seed_portfolios(engine, 1, ASSETS, SNAPSHOTS)
+
+        with Session() as session:
+            repo = SQLAlchemyPortfolioRepository(session)
+            portfolio = repo.find_with_assets(portfolio_id)
+            assets = [a for a in portfolio.assets if not a.disposed]
+
+            start = time.perf_counter()
+            first = portfolio.total_value()
+            first_ms = (time.perf_counter() - start) * 1000
+            assert first == _decimal_total(assets)
+            assert [_cents_total(assets, m) for m in moments] == [_decimal_total(assets, m) for m in moments]
+
+            def float_sql_total():
+                total = session.query(func.sum(AssetLatestValueModel.value)).join(
+                    AssetModel, AssetModel.id == AssetLatestValueModel.asset_id
+                ).filter(AssetModel.portfolio_id == portfolio_id, AssetModel.disposed == False).scalar()
+                return Decimal(total) if total is not None else Decimal("0")
+
+            assert float_sql_total() == repo.get_total_value(portfolio_id) == first
+
+            results = {
+                "total value": (
+                    measure(lambda: _decimal_total(assets), repeat=9),
+                    measure(portfolio.total_value, repeat=9),
+                ),
+                f"history ({len(moments)} days)": (
+                    measure(lambda: [_decimal_total(assets, m) for m in moments], repeat=5),
+                    measure(lambda: [_cents_total(assets, m) for m in moments], repeat=5),
+                ),
+                "SQL total": (
+                    measure(float_sql_total, repeat=9),
+                    measure(lambda: repo.get_total_value(portfolio_id), repeat=9),
+                ),
+            }
+
+    print(f"{ASSETS} assets x {SNAPSHOTS} snapshots")
+    print(f"{'valuation':>20} {'Decimal (ms)':>13} {'cents (ms)':>11} {'speedup':>8}")
+    for label, (decimal_ms, cents_ms) in results.items():
+        print(f"{label:>20} {decimal_ms:>13.2f} {cents_ms:>11.2f} {decimal_ms / cents_ms:>7.1f}x")
+    print(f"first fixed-point total value, converting {ASSETS} values to cents: {first_ms:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
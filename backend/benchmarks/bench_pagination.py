@@ -0,0 +1,77 @@
+"""
+Benchmark: keyset page latency against table size and page depth.
+
+Seeds growing numbers of assets (and one long snapshot history) and times
+`GET /assets` and `GET /assets/{id}/snapshots` pages taken at the start,
+middle and end of the listing. With keyset pagination every page is an
+index seek plus `limit` rows, so latency should stay flat in both
+dimensions. The unpaginated repository listing is timed for contrast.
+
+    python -m benchmarks.bench_pagination
+"""
+from sqlalchemy import select
+
+from app.adapters.outgoing.persistence.models import AssetModel, AssetSnapshotModel
+from app.adapters.outgoing.persistence.repository.sqlalchemy_asset_repository import SQLAlchemyAssetRepository
+from app.adapters.outgoing.persistence.repository.sqlalchemy_asset_snapshot_repository import SQLAlchemyAssetSnapshotRepository
+from app.application.pagination import encode_cursor
+from benchmarks.common import api_client, measure, seed_portfolios, temporary_database
+
+ASSET_COUNTS = (1_000, 10_000, 100_000)
+SNAPSHOT_COUNTS = (10_000, 100_000, 500_000)
+LIMIT = 100
+
+
+def _cursors(keys):
+    """Cursors resuming at the start, middle and last page of a sorted key list."""
+    return {
+        "first": None,
+        "middle": encode_cursor(keys[len(keys) // 2]),
+        "last": encode_cursor(keys[-LIMIT - 1]),
+    }
+
+
+def _time_pages(client, url, cursors):
+    timings = {}
+    for depth, cursor in cursors.items():
+        params = {"limit": LIMIT}
+        if cursor:
+            params["cursor"] = cursor
+        assert len(client.get(url, params=params).json()) == LIMIT
+        timings[depth] = measure(lambda: client.get(url, params=params), repeat=7)
+    return timings
+
+
+def main() -> None:
+    print(f"{'listing':<10} {'rows':>8} {'first (ms)':>11} {'middle (ms)':>12} {'last (ms)':>10} {'unpaginated (ms)':>17}")
+    for count in ASSET_COUNTS:
+        with temporary_database() as (engine, Session):
+            seed_portfolios(engine, 1, count, 0)
+            with engine.connect() as conn:
+                keys = conn.execute(select(AssetModel.name, AssetModel.id).order_by(AssetModel.name, AssetModel.id)).all()
+            with api_client(Session) as client:
+                timings = _time_pages(client, "/api/v1/assets/", _cursors(keys))
+            with Session() as session:
+                full = measure(lambda: SQLAlchemyAssetRepository(session).find_all(), repeat=1)
+        print(f"{'assets':<10} {count:>8} {timings['first']:>11.1f} {timings['middle']:>12.1f} "
+              f"{timings['last']:>10.1f} {full:>17.0f}")
+
+    for count in SNAPSHOT_COUNTS:
+        with temporary_database() as (engine, Session):
+            seed_portfolios(engine, 1, 1, count)
+            with engine.connect() as conn:
+                asset_id = conn.execute(select(AssetModel.id)).scalar_one()
+                keys = conn.execute(
+                    select(AssetSnapshotModel.observed_at, AssetSnapshotModel.id)
+                    .order_by(AssetSnapshotModel.observed_at, AssetSnapshotModel.id)
+                ).all()
+            with api_client(Session) as client:
+                timings = _time_pages(client, f"/api/v1/assets/{asset_id}/snapshots", _cursors(keys))
+            with Session() as session:
+                full = measure(lambda: SQLAlchemyAssetSnapshotRepository(session).get_snapshots(asset_id), repeat=1)
+        print(f"{'snapshots':<10} {count:>8} {timings['first']:>11.1f} {timings['middle']:>12.1f} "
+              f"{timings['last']:>10.1f} {full:>17.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""
+Benchmark: `GET /portfolios` listing as snapshot history grows.
+
+Compares the legacy full-graph path (find_all → total_value() per portfolio)
+with the grouped projection (find_all_summaries). The projection should stay
+flat as snapshots per asset grow; the legacy path grows linearly.
+
+    python -m benchmarks.bench_portfolio_listing
+"""
+from app.adapters.incoming.api.mappers.api_mapper import ApiMapper
+from app.adapters.outgoing.persistence.repository.sqlalchemy_portfolio_repository import SQLAlchemyPortfolioRepository
+from benchmarks.common import measure, seed_portfolios, temporary_database
+
+PORTFOLIOS = 5
+ASSETS_PER_PORTFOLIO = 20
+SNAPSHOT_COUNTS = (10, 100, 1000)
+
+
+def main() -> None:
+    print(f"{PORTFOLIOS} portfolios x {ASSETS_PER_PORTFOLIO} assets")
+    print(f"{'snapshots/asset':>16} {'full graph (ms)':>16} {'projection (ms)':>16}")
+    for snapshots in SNAPSHOT_COUNTS:
+        with temporary_database() as (engine, Session):
+            seed_portfolios(engine, PORTFOLIOS, ASSETS_PER_PORTFOLIO, snapshots)
+
+            def full_graph():
+                with Session() as session:
+                    repo = SQLAlchemyPortfolioRepository(session)
+                    ApiMapper.to_portfolio_response_list(repo.find_all())
+
+            def projection():
+                with Session() as session:
+                    repo = SQLAlchemyPortfolioRepository(session)
+                    ApiMapper.to_portfolio_summary_response_list(repo.find_all_summaries())
+
+            print(f"{snapshots:>16} {measure(full_graph):>16.1f} {measure(projection):>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
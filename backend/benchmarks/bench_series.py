@@ -0,0 +1,60 @@
+"""
+Benchmark: bucketed series against shipping the raw history.
+
+Seeds one asset with a snapshot every 30 minutes and compares fetching its
+full history (the NDJSON export a chart would otherwise downsample itself)
+with `GET /assets/{id}/snapshots/series` at day, week and month buckets.
+Bucketing runs in SQL, so the series payload is proportional to the number
+of buckets and its latency to one grouped scan of the range.
+
+    python -m benchmarks.bench_series
+"""
+from datetime import timedelta
+from decimal import Decimal
+from uuid import uuid4
+
+from sqlalchemy import insert, select
+
+from app.adapters.outgoing.persistence.models import AssetModel, AssetSnapshotModel
+from benchmarks.common import T0, api_client, measure, seed_portfolios, temporary_database
+
+SNAPSHOT_COUNTS = (10_000, 100_000, 500_000)
+INTERVAL = timedelta(minutes=30)
+BUCKETS = ("day", "week", "month")
+
+
+def _seed_history(engine, asset_id: str, count: int) -> None:
+    rows = [
+        dict(id=str(uuid4()), asset_id=asset_id, value=Decimal(100_000 + i % 5_000) / 100, observed_at=T0 + i * INTERVAL)
+        for i in range(count)
+    ]
+    with engine.begin() as conn:
+        conn.execute(insert(AssetSnapshotModel), rows)
+
+
+def main() -> None:
+    print(f"{'snapshots':>9} {'endpoint':<18} {'points':>8} {'payload (KB)':>13} {'latency (ms)':>13}")
+    for count in SNAPSHOT_COUNTS:
+        with temporary_database() as (engine, Session):
+            seed_portfolios(engine, 1, 1, 0)
+            with engine.connect() as conn:
+                asset_id = conn.execute(select(AssetModel.id)).scalar_one()
+            _seed_history(engine, asset_id, count)
+
+            with api_client(Session) as client:
+                url = f"/api/v1/assets/{asset_id}/snapshots"
+                raw = client.get(f"{url}/export")
+                elapsed = measure(lambda: client.get(f"{url}/export"), repeat=3)
+                print(f"{count:>9} {'raw (export)':<18} {raw.text.count(chr(10)):>8} "
+                      f"{len(raw.content) / 1024:>13.0f} {elapsed:>13.1f}")
+
+                for bucket in BUCKETS:
+                    params = {"bucket": bucket, "agg": "ohlc"}
+                    series = client.get(f"{url}/series", params=params)
+                    elapsed = measure(lambda: client.get(f"{url}/series", params=params), repeat=5)
+                    print(f"{count:>9} {'series ' + bucket:<18} {len(series.json()):>8} "
+                          f"{len(series.content) / 1024:>13.1f} {elapsed:>13.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Benchmark: reading 1,000,000 snapshots as entities vs. as columnar series.
+
+A portfolio of ASSETS assets with SNAPSHOTS daily snapshots each is read
+back two ways:
+
+- entities: `get_snapshots` per asset, one AssetSnapshot (pydantic) per row
+- series: `get_portfolio_snapshot_series`, one SnapshotSeries per asset with
+  packed ids and int64 epoch-microsecond / cent columns
+
+Time is the median wall time of the read; memory is what the result keeps
+alive (tracemalloc, measured in a separate run). The as-of index built from
+the series is timed too, since that is what `/portfolios/{id}/history` does
+with them.
+
+    python -m benchmarks.bench_snapshot_series
+"""
+import tracemalloc
+
+from app.adapters.outgoing.persistence.repository.sqlalchemy_asset_repository import SQLAlchemyAssetRepository
+from app.adapters.outgoing.persistence.repository.sqlalchemy_asset_snapshot_repository import SQLAlchemyAssetSnapshotRepository
+from app.application.analytics.as_of import AsOfIndex
+from benchmarks.common import measure, seed_portfolios, temporary_database
+
+ASSETS = 100
+SNAPSHOTS = 10_000
+
+
+def _retained_mib(read) -> float:
+    tracemalloc.start()
+    try:
+        result = read()
+        retained, _peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return retained / 2**20
+
+
+def main() -> None:
+    total = ASSETS * SNAPSHOTS
+    with temporary_database() as (engine, Session):
+        (portfolio_id,) = seed_portfolios(engine, 1, ASSETS, SNAPSHOTS)
+
+        with Session() as session:
+            repo = SQLAlchemyAssetSnapshotRepository(session)
+            asset_ids = [a.id for a in SQLAlchemyAssetRepository(session).find_by_portfolio(portfolio_id)]
+
+            def entities():
+                return [repo.get_snapshots(asset_id) for asset_id in asset_ids]
+
+            def series():
+                return repo.get_portfolio_snapshot_series(portfolio_id)
+
+            loaded = series()
+            assert sum(map(len, loaded)) == sum(map(len, entities())) == total
+            assert [s.value for s in loaded[0]] == [s.value for s in repo.get_snapshots(loaded[0].asset_id)]
+
+            results = {}
+            for label, read in (("entities", entities), ("series", series)):
+                results[label] = (measure(read, repeat=3), _retained_mib(read))
+            index_ms = measure(lambda: AsOfIndex.from_series(loaded), repeat=5)
+
+    print(f"{total} snapshots of {ASSETS} assets")
+    print(f"{'read':>10} {'ms':>8} {'rows/s':>10} {'retained MiB':>13} {'bytes/row':>10}")
+    for label, (ms, mib) in results.items():
+        print(f"{label:>10} {ms:>8.0f} {total / ms * 1000:>10.0f} {mib:>13.1f} {mib * 2**20 / total:>10.0f}")
+    (base_ms, base_mib), (new_ms, new_mib) = results.values()
+    print(f"series: {base_ms / new_ms:.1f}x faster, {base_mib / new_mib:.0f}x less memory")
+    print(f"AsOfIndex.from_series over the loaded series: {index_ms:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
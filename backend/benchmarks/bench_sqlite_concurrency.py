@@ -0,0 +1,137 @@
+"""
+Benchmark: SQLite under concurrent readers and writers.
+
+Several processes (standing in for uvicorn workers) each run writer and
+reader threads against one database file for a fixed time. A write reads the
+asset first, then inserts a snapshot and commits, like the snapshot
+endpoints do; a read fetches a monthly value series. The driver defaults
+(rollback journal, deferred transactions) are compared with the production
+profile (WAL, pragmas, single-writer engine with BEGIN IMMEDIATE).
+
+    python -m benchmarks.bench_sqlite_concurrency
+"""
+import multiprocessing
+import random
+import statistics
+import threading
+import time
+from collections import Counter
+from datetime import timedelta
+from uuid import uuid4
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.adapters.outgoing.persistence.repository.sqlalchemy_asset_repository import SQLAlchemyAssetRepository
+from app.adapters.outgoing.persistence.repository.sqlalchemy_asset_snapshot_repository import SQLAlchemyAssetSnapshotRepository
+from app.adapters.outgoing.persistence.sqlite import SQLiteProfile, apply_sqlite_profile, create_sqlite_write_engine
+from app.domain.entities.asset_snapshot import AssetSnapshot
+from app.domain.entities.value_series import SeriesBucket
+from benchmarks.common import T0, seed_portfolios, temporary_database
+
+PROCESSES = 4
+WRITERS_PER_PROCESS = 4
+READERS_PER_PROCESS = 2
+DURATION_SECONDS = 10.0
+ASSETS = 50
+SNAPSHOTS_PER_ASSET = 365
+
+
+def _session_factories(url: str, profiled: bool):
+    connect_args = {"check_same_thread": False}
+    if not profiled:
+        Session = sessionmaker(bind=create_engine(url, connect_args=connect_args), autoflush=False)
+        return Session, Session
+    profile = SQLiteProfile()
+    read_engine = apply_sqlite_profile(create_engine(url, connect_args=connect_args), profile)
+    write_engine = create_sqlite_write_engine(url, profile, connect_args)
+    return sessionmaker(bind=read_engine, autoflush=False), sessionmaker(bind=write_engine, autoflush=False)
+
+
+def _write(Session, asset_id: str) -> None:
+    with Session() as session:
+        assert SQLAlchemyAssetRepository(session).find_existing_ids([asset_id])
+        snapshot = AssetSnapshot(
+            id=uuid4(), asset_id=asset_id, value=random.randint(1, 10**6) / 100,
+            observed_at=T0 + timedelta(days=SNAPSHOTS_PER_ASSET, seconds=random.randint(0, 10**7)),
+        )
+        SQLAlchemyAssetSnapshotRepository(session).save_many([snapshot])
+        session.commit()
+
+
+def _read(Session, asset_id: str) -> None:
+    with Session() as session:
+        SQLAlchemyAssetSnapshotRepository(session).get_series(asset_id, SeriesBucket.MONTH)
+
+
+def _worker(url: str, profiled: bool, asset_ids, results) -> None:
+    ReadSession, WriteSession = _session_factories(url, profiled)
+    deadline = time.perf_counter() + DURATION_SECONDS
+    stats = {"write": ([], []), "read": ([], [])}  # (latencies in ms, errors)
+
+    def loop(kind: str, op, Session) -> None:
+        latencies, errors = stats[kind]
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            try:
+                op(Session, random.choice(asset_ids))
+            except Exception as exc:
+                errors.append(str(exc).splitlines()[0])
+                continue
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    threads = [threading.Thread(target=loop, args=("write", _write, WriteSession)) for _ in range(WRITERS_PER_PROCESS)]
+    threads += [threading.Thread(target=loop, args=("read", _read, ReadSession)) for _ in range(READERS_PER_PROCESS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    results.put(stats)
+
+
+def run(profiled: bool) -> dict:
+    with temporary_database() as (engine, _):
+        seed_portfolios(engine, 1, ASSETS, SNAPSHOTS_PER_ASSET)
+        with engine.connect() as conn:
+            asset_ids = [row[0] for row in conn.exec_driver_sql("SELECT id FROM assets")]
+        url = engine.url.render_as_string(hide_password=False)
+        engine.dispose()
+
+        ctx = multiprocessing.get_context("spawn")
+        results = ctx.Queue()
+        processes = [ctx.Process(target=_worker, args=(url, profiled, asset_ids, results)) for _ in range(PROCESSES)]
+        for process in processes:
+            process.start()
+        merged = {"write": ([], []), "read": ([], [])}
+        for _ in processes:
+            for kind, (latencies, errors) in results.get().items():
+                merged[kind][0].extend(latencies)
+                merged[kind][1].extend(errors)
+        for process in processes:
+            process.join()
+    return merged
+
+
+def _p95(latencies) -> float:
+    return statistics.quantiles(latencies, n=20)[-1] if len(latencies) > 1 else float("nan")
+
+
+def main() -> None:
+    print(
+        f"{PROCESSES} processes x ({WRITERS_PER_PROCESS} writers + {READERS_PER_PROCESS} readers), "
+        f"{DURATION_SECONDS:.0f}s per profile"
+    )
+    print(f"{'profile':>12} {'op':>6} {'ok':>8} {'ops/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'errors':>8}")
+    for name, profiled in (("driver", False), ("production", True)):
+        for kind, (latencies, errors) in run(profiled).items():
+            p50 = statistics.median(latencies) if latencies else float("nan")
+            print(
+                f"{name:>12} {kind:>6} {len(latencies):>8} {len(latencies) / DURATION_SECONDS:>9.0f} "
+                f"{p50:>9.1f} {_p95(latencies):>9.1f} {len(errors):>8}"
+            )
+            for message, count in Counter(errors).most_common(3):
+                print(f"{'':>12} {count:>6} x {message}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+Benchmark: write throughput of a multi-step operation, one transaction per
+step vs one unit of work.
+
+The operation creates an asset carrying TAGS tags. Step by step, that is one
+CreateAssetUseCase call and one AddTagToAssetUseCase per tag, each committed
+on its own (what clients had to do before assets could be created with their
+tags). With the unit of work it is a single CreateAssetUseCase call with
+`tag_ids`, committed once. Every commit costs a WAL write and, depending on
+the durability setting, an fsync, so the gap grows with `synchronous`.
+
+Runs on SQLite with the production profile (synchronous=NORMAL) and with
+synchronous=FULL, and on the PostgreSQL database at BENCH_POSTGRES_URL when
+it is set (its tables are dropped and recreated).
+
+    python -m benchmarks.bench_unit_of_work
+"""
+import os
+import tempfile
+import time
+from pathlib import Path
+from uuid import uuid4
+
+from sqlalchemy import Engine, create_engine, event, insert, select
+from sqlalchemy.orm import sessionmaker
+
+from app.adapters.outgoing.persistence.database import Base
+from app.adapters.outgoing.persistence.models import AssetTypeModel, TagModel
+from app.adapters.outgoing.persistence.repository import (
+    SQLAlchemyAssetRepository,
+    SQLAlchemyAssetTypeRepository,
+    SQLAlchemyPortfolioRepository,
+    SQLAlchemyTagRepository,
+    SQLAlchemyUnitOfWork,
+)
+from app.adapters.outgoing.persistence.sqlite import SQLiteProfile, create_sqlite_write_engine
+from app.application.use_cases.asset.create_asset import CreateAssetRequest, CreateAssetUseCase
+from app.application.use_cases.tag.add_tag_to_asset import AddTagToAssetCommand, AddTagToAssetUseCase
+from benchmarks.common import seed_portfolios
+
+POSTGRES_URL = os.getenv("BENCH_POSTGRES_URL")
+OPERATIONS = 500
+TAGS = 3
+
+
+def _create_asset(Session, portfolio_id, asset_type_id, tag_ids) -> str:
+    with Session() as session:
+        use_case = CreateAssetUseCase(
+            SQLAlchemyAssetRepository(session),
+            SQLAlchemyPortfolioRepository(session),
+            SQLAlchemyAssetTypeRepository(session),
+            SQLAlchemyTagRepository(session),
+            SQLAlchemyUnitOfWork(session),
+        )
+        asset = use_case.execute(CreateAssetRequest(
+            portfolio_id=portfolio_id, asset_type_id=asset_type_id, name=f"Asset {uuid4()}",
+            created_by="bench", tag_ids=tag_ids,
+        ))
+        return str(asset.id)
+
+
+def _add_tag(Session, asset_id, tag_id) -> None:
+    with Session() as session:
+        use_case = AddTagToAssetUseCase(
+            SQLAlchemyAssetRepository(session), SQLAlchemyTagRepository(session), SQLAlchemyUnitOfWork(session),
+        )
+        use_case.execute(AddTagToAssetCommand(asset_id=asset_id, tag_id=tag_id))
+
+
+def _step_by_step(Session, portfolio_id, asset_type_id, tag_ids) -> None:
+    asset_id = _create_asset(Session, portfolio_id, asset_type_id, [])
+    for tag_id in tag_ids:
+        _add_tag(Session, asset_id, tag_id)
+
+
+def _unit_of_work(Session, portfolio_id, asset_type_id, tag_ids) -> None:
+    _create_asset(Session, portfolio_id, asset_type_id, tag_ids)
+
+
+def _run(engine: Engine, name: str) -> None:
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    portfolio_id = seed_portfolios(engine, 1, 0, 0)[0]
+    tag_ids = [str(uuid4()) for _ in range(TAGS)]
+    with engine.begin() as conn:
+        asset_type_id = conn.execute(select(AssetTypeModel.id)).scalar_one()
+        conn.execute(insert(TagModel), [dict(id=tag_id, name=f"tag-{tag_id}") for tag_id in tag_ids])
+
+    Session = sessionmaker(bind=engine, autoflush=False)
+    commits = []
+    event.listen(Session, "after_commit", lambda _session: commits.append(1))
+
+    for label, operation in (("one commit per step", _step_by_step), ("unit of work", _unit_of_work)):
+        commits.clear()
+        start = time.perf_counter()
+        for _ in range(OPERATIONS):
+            operation(Session, portfolio_id, asset_type_id, tag_ids)
+        elapsed = time.perf_counter() - start
+        print(
+            f"{name:>16} {label:>20} {OPERATIONS:>6} {len(commits) / OPERATIONS:>12.0f} "
+            f"{elapsed:>9.2f} {OPERATIONS / elapsed:>8.0f}"
+        )
+
+
+def main() -> None:
+    print(f"create an asset with {TAGS} tags, {OPERATIONS} times")
+    print(f"{'database':>16} {'path':>20} {'ops':>6} {'commits/op':>12} {'seconds':>9} {'ops/s':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for synchronous in ("NORMAL", "FULL"):
+            url = f"sqlite:///{Path(tmp) / f'bench-{synchronous.lower()}.db'}"
+            engine = create_sqlite_write_engine(url, SQLiteProfile(synchronous=synchronous))
+            try:
+                _run(engine, f"sqlite {synchronous}")
+            finally:
+                engine.dispose()
+    if POSTGRES_URL:
+        engine = create_engine(POSTGRES_URL)
+        try:
+            _run(engine, "postgres")
+        finally:
+            engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
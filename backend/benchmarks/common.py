@@ -0,0 +1,148 @@
+"""
+Shared helpers for the benchmark scripts: throwaway databases, bulk seeding
+and timing.
+"""
+from __future__ import annotations
+
+import statistics
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Callable, Iterator, List, Tuple
+from uuid import uuid4
+
+from fastapi.testclient import TestClient
+from sqlalchemy import Engine, create_engine, insert, select
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.adapters.incoming.api.dependencies.assets import get_db_session as assets_get_db_session
+from app.adapters.incoming.api.dependencies.portfolios import get_db_session as portfolios_get_db_session
+from app.adapters.outgoing.persistence.database import Base
+from app.adapters.outgoing.persistence.models import (
+    AssetModel,
+    AssetSnapshotModel,
+    AssetTypeModel,
+    CategoryModel,
+    PortfolioModel,
+    TagModel,
+    asset_category,
+    asset_tag,
+)
+from app.adapters.outgoing.persistence.repository.sqlalchemy_asset_snapshot_repository import SQLAlchemyAssetSnapshotRepository
+
+T0 = datetime(2015, 1, 1, tzinfo=timezone.utc)
+
+
+@contextmanager
+def temporary_database() -> Iterator[Tuple[Engine, sessionmaker]]:
+    """Yield an engine and session factory bound to a throwaway SQLite file."""
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{tmp}/bench.db")
+        Base.metadata.create_all(engine)
+        try:
+            yield engine, sessionmaker(bind=engine, autoflush=False)
+        finally:
+            engine.dispose()
+
+
+@contextmanager
+def api_client(session_factory: sessionmaker) -> Iterator[TestClient]:
+    """
+    Yield a TestClient whose requests use sessions from `session_factory`.
+    Write use cases commit them through their unit of work.
+    """
+    from app.main import app
+
+    def override_get_db():
+        session = session_factory()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    app.dependency_overrides[assets_get_db_session] = override_get_db
+    app.dependency_overrides[portfolios_get_db_session] = override_get_db
+    try:
+        yield TestClient(app)
+    finally:
+        app.dependency_overrides.clear()
+
+
+def seed_portfolios(
+    engine: Engine,
+    portfolios: int,
+    assets_per_portfolio: int,
+    snapshots_per_asset: int,
+) -> List[str]:
+    """
+    Bulk-insert portfolios, assets and one daily snapshot per asset per day.
+    Returns the portfolio ids.
+    """
+    now = datetime.now(timezone.utc)
+    asset_type_id = str(uuid4())
+    portfolio_rows, asset_rows, snapshot_rows = [], [], []
+    for p in range(portfolios):
+        portfolio_id = str(uuid4())
+        portfolio_rows.append(dict(
+            id=portfolio_id, name=f"Portfolio {p}", base_currency="EUR", created_at=now, updated_at=now,
+        ))
+        for a in range(assets_per_portfolio):
+            asset_id = str(uuid4())
+            asset_rows.append(dict(
+                id=asset_id, portfolio_id=portfolio_id, asset_type_id=asset_type_id, name=f"Asset {p}.{a}",
+                disposed=False, created_at=now, updated_at=now, created_by="bench", updated_by="bench",
+            ))
+            for day in range(snapshots_per_asset):
+                snapshot_rows.append(dict(
+                    id=str(uuid4()), asset_id=asset_id,
+                    value=Decimal(1000 + day) / 100, observed_at=T0 + timedelta(days=day),
+                ))
+
+    with engine.begin() as conn:
+        conn.execute(insert(AssetTypeModel), [dict(
+            id=asset_type_id, code="BENCH", label="Benchmark", created_at=now, updated_at=now,
+        )])
+        conn.execute(insert(PortfolioModel), portfolio_rows)
+        if asset_rows:
+            conn.execute(insert(AssetModel), asset_rows)
+        if snapshot_rows:
+            conn.execute(insert(AssetSnapshotModel), snapshot_rows)
+    with Session(engine) as session:
+        SQLAlchemyAssetSnapshotRepository(session).refresh_latest_values(row["id"] for row in asset_rows)
+        session.commit()
+    return [row["id"] for row in portfolio_rows]
+
+
+def seed_labels(engine: Engine, tags_per_asset: int) -> None:
+    """
+    Attach `tags_per_asset` of 20 tags and one of 9 categories (under 3 root
+    categories) to every asset.
+    """
+    tags = [dict(id=str(uuid4()), name=f"tag-{i:02d}") for i in range(20)]
+    parents = [dict(id=str(uuid4()), name=f"group-{i}", parent_id=None) for i in range(3)]
+    children = [dict(id=str(uuid4()), name=f"category-{i}", parent_id=parents[i % 3]["id"]) for i in range(9)]
+    with engine.begin() as conn:
+        asset_ids = conn.execute(select(AssetModel.id)).scalars().all()
+        conn.execute(insert(TagModel), tags)
+        conn.execute(insert(CategoryModel), parents + children)
+        if tags_per_asset:
+            conn.execute(insert(asset_tag), [
+                dict(asset_id=asset_id, tag_id=tags[(i + t) % len(tags)]["id"])
+                for i, asset_id in enumerate(asset_ids) for t in range(tags_per_asset)
+            ])
+        conn.execute(insert(asset_category), [
+            dict(asset_id=asset_id, category_id=children[i % len(children)]["id"])
+            for i, asset_id in enumerate(asset_ids)
+        ])
+
+
+def measure(fn: Callable[[], object], repeat: int = 5) -> float:
+    """Run fn `repeat` times and return the median wall time in milliseconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
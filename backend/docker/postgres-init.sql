@@ -0,0 +1,2 @@
+-- Database the integration suite drops and recreates (TEST_DATABASE_URL)
+CREATE DATABASE strata_test OWNER strata;
@@ -10,12 +10,41 @@ def app_client() -> TestClient:
     return TestClient(app)
 
 
+def _keyset_page(entities, key, limit, after=None, descending=False):
+    """In-memory stand-in for the repositories' keyset queries."""
+    ordered = sorted(entities, key=key, reverse=descending)
+    if after is not None:
+        ordered = [e for e in ordered if (key(e) < tuple(after) if descending else key(e) > tuple(after))]
+    return ordered[:limit]
+
+
+def _asset_summary(asset):
+    """AssetSummary of a stored Asset, as the SQL query side builds it."""
+    return {
+        "id": str(asset.id),
+        "name": asset.name,
+        "disposed": asset.disposed,
+        "quantity": asset.quantity,
+        "created_at": asset.created_at,
+        "updated_at": asset.updated_at,
+        "asset_type": {"code": asset.asset_type.code, "label": asset.asset_type.label},
+        "portfolio": {"id": str(asset.portfolio.id), "name": asset.portfolio.name},
+        "tags": [{"id": str(t.id), "name": t.name} for t in sorted(asset.tags, key=lambda t: t.name)],
+        "categories": [
+            {"id": str(c.id), "name": c.name, "parent_id": str(c.parent.id) if c.parent else None}
+            for c in sorted(asset.categories, key=lambda c: c.name)
+        ],
+    }
+
+
 @pytest.fixture
 def dummy_asset_repository(monkeypatch):
     """Provide a simple in-memory fake repository for Asset use-cases.
 
     This fake implements only the methods used by use-cases in unit tests:
     - find_all
+    - find_page
+    - find_summary_page
     - find_by_id
     - save
     - delete
@@ -28,9 +57,21 @@ def dummy_asset_repository(monkeypatch):
         def find_all(self):
             return list(self.storage.values())
 
+        def find_page(self, limit, after=None, portfolio_id=None):
+            return _keyset_page(self.storage.values(), lambda a: (a.name, str(a.id)), limit, after)
+
+        def find_summary_page(self, limit, after=None, portfolio_id=None):
+            assets = [
+                a for a in self.storage.values() if portfolio_id is None or str(a.portfolio.id) == str(portfolio_id)
+            ]
+            return [_asset_summary(a) for a in _keyset_page(assets, lambda a: (a.name, str(a.id)), limit, after)]
+
         def find_by_id(self, id_):
             return self.storage.get(str(id_))
 
+        def find_existing_ids(self, asset_ids):
+            return {str(a) for a in asset_ids if str(a) in self.storage}
+
         def save(self, asset):
             self.storage[str(asset.id)] = asset
             return asset
@@ -72,6 +113,22 @@ def dummy_portfolio_repository(monkeypatch):
         def find_all(self):
             return list(self.storage.values())
 
+        @staticmethod
+        def _summary(p):
+            from app.domain.entities.portfolio_summary import PortfolioSummary
+            return PortfolioSummary(
+                id=p.id, name=p.name, base_currency=p.base_currency,
+                asset_count=sum(1 for a in p.assets if not a.disposed), total_value=p.total_value(),
+                created_at=p.created_at, updated_at=p.updated_at,
+            )
+
+        def find_summary(self, id_):
+            portfolio = self.storage.get(str(id_))
+            return self._summary(portfolio) if portfolio else None
+
+        def find_all_summaries(self):
+            return [self._summary(p) for p in sorted(self.storage.values(), key=lambda p: (p.name, str(p.id)))]
+
         def find_by_id(self, id_):
             return self.storage.get(str(id_))
 
@@ -95,6 +152,9 @@ def dummy_category_repository():
         def find_all(self):
             return list(self.storage.values())
 
+        def find_page(self, limit, after=None):
+            return _keyset_page(self.storage.values(), lambda e: (e.name, str(e.id)), limit, after)
+
         def find_by_id(self, id_):
             return self.storage.get(str(id_))
 
@@ -123,6 +183,9 @@ def dummy_tag_repository():
         def find_all(self):
             return list(self.storage.values())
 
+        def find_page(self, limit, after=None):
+            return _keyset_page(self.storage.values(), lambda e: (e.name, str(e.id)), limit, after)
+
         def find_by_id(self, id_):
             return self.storage.get(str(id_))
 
@@ -161,8 +224,43 @@ def dummy_asset_snapshot_repository():
         def get_snapshots(self, asset_id, start_date=None, end_date=None):
             return [v for v in self.storage.values() if str(v.asset_id) == str(asset_id)]
 
+        def get_snapshots_page(self, asset_id, limit, after=None, start_date=None, end_date=None):
+            return _keyset_page(
+                self.get_snapshots(asset_id), lambda v: (v.observed_at, str(v.id)), limit, after, descending=True
+            )
+
         def get_latest_snapshot(self, asset_id):
             snapshots = self.get_snapshots(asset_id)
             return max(snapshots, key=lambda s: s.observed_at) if snapshots else None
 
+        def save_many(self, snapshots):
+            for s in snapshots:
+                self.storage[str(s.id)] = s
+            return len(snapshots)
+
+        def save_values(self, rows):
+            from app.domain.entities.asset_snapshot import AssetSnapshot
+            return self.save_many([
+                AssetSnapshot(id=id_, asset_id=asset_id, value=value, observed_at=observed_at)
+                for id_, asset_id, value, observed_at in rows
+            ])
+
     return _FakeSnapshotRepo()
+
+
+@pytest.fixture
+def dummy_unit_of_work():
+    from app.domain.ports.repository import IUnitOfWork
+
+    class _FakeUnitOfWork(IUnitOfWork):
+        def __init__(self):
+            self.commits = 0
+            self.rollbacks = 0
+
+        def commit(self):
+            self.commits += 1
+
+        def rollback(self):
+            self.rollbacks += 1
+
+    return _FakeUnitOfWork()
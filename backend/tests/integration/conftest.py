@@ -3,14 +3,27 @@ Integration test configuration.
 
 Provides a shared in-memory SQLite database for integration tests.
 The production database (strata.db) is never touched.
+
+Each test runs inside a transaction that is rolled back at teardown. The
+use cases still commit through their unit of work: the test session turns
+those commits into savepoints of the enclosing transaction.
+
+Set TEST_DATABASE_URL to run the suite against another database instead,
+e.g. the PostgreSQL service of docker-compose.yml. Its tables are dropped
+and recreated at the start of the session.
 """
+import os
+from contextlib import contextmanager
+
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session
 from sqlalchemy.pool import StaticPool
 
 from app.adapters.outgoing.persistence.database import Base
+from app.adapters.outgoing.persistence.query_stats import instrument_engine, track_queries
+from app.adapters.outgoing.persistence.sqlite import begin_immediate, enforce_foreign_keys
 
 # Import all models so they're registered with Base before create_all
 import app.adapters.outgoing.persistence.models  # noqa: F401
@@ -20,16 +33,25 @@ from app.adapters.incoming.api.dependencies.portfolios import get_db_session as
 
 from app.main import app as fastapi_app
 
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
 
 @pytest.fixture(scope="session")
 def integration_engine():
-    """Create an in-memory SQLite engine for the test session."""
-    engine = create_engine(
-        "sqlite:///:memory:",
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
-    )
+    """Create the engine for the test session: in-memory SQLite unless TEST_DATABASE_URL is set."""
+    if TEST_DATABASE_URL:
+        engine = create_engine(TEST_DATABASE_URL)
+        Base.metadata.drop_all(engine)
+    else:
+        engine = create_engine(
+            "sqlite:///:memory:",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+        # pysqlite only honours SAVEPOINT once SQLAlchemy emits BEGIN itself
+        begin_immediate(enforce_foreign_keys(engine))
     Base.metadata.create_all(engine)
+    instrument_engine(engine)
     yield engine
     engine.dispose()
 
@@ -37,13 +59,15 @@ def integration_engine():
 @pytest.fixture(scope="function")
 def integration_session(integration_engine):
     """Provide a transactional session that rolls back after each test."""
-    SessionFactory = sessionmaker(bind=integration_engine, autoflush=True, autocommit=False)
-    session = SessionFactory()
+    connection = integration_engine.connect()
+    transaction = connection.begin()
+    session = Session(bind=connection, autoflush=True, join_transaction_mode="create_savepoint")
     try:
         yield session
     finally:
-        session.rollback()
         session.close()
+        transaction.rollback()
+        connection.close()
 
 
 @pytest.fixture(scope="function")
@@ -63,6 +87,28 @@ def integration_client(integration_session):
     fastapi_app.dependency_overrides.clear()
 
 
+@pytest.fixture
+def max_queries():
+    """
+    Bound the statements a block runs:
+
+        with max_queries(3):
+            integration_client.get("/api/v1/assets/")
+
+    Fails when the block runs more than `limit` statements, or the same
+    statement REPEATED_THRESHOLD times or more (an N+1 load).
+    """
+    @contextmanager
+    def check(limit: int):
+        with track_queries() as stats:
+            yield stats
+        repeated = stats.repeated()
+        assert not repeated, f"Statements repeated (N+1): {repeated}"
+        assert stats.count <= limit, f"{stats.count} statements, expected at most {limit}: {list(stats.statements)}"
+
+    return check
+
+
 @pytest.fixture
 def seeded_asset_type(integration_session):
     """Seed a minimal asset type for tests."""
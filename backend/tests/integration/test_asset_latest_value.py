@@ -0,0 +1,146 @@
+"""
+Integration test: maintained asset_latest_values table.
+The snapshot repository must keep one row per asset pointing at its newest snapshot.
+"""
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import delete
+
+from app.adapters.outgoing.persistence.models.asset import AssetModel
+from app.adapters.outgoing.persistence.models.asset_latest_value import AssetLatestValueModel
+from app.adapters.outgoing.persistence.models.asset_snapshot import AssetSnapshotModel
+from app.adapters.outgoing.persistence.models.asset_type import AssetTypeModel
+from app.adapters.outgoing.persistence.models.portfolio import PortfolioModel
+from app.adapters.outgoing.persistence.repository.sqlalchemy_asset_repository import SQLAlchemyAssetRepository
+from app.adapters.outgoing.persistence.repository.sqlalchemy_asset_snapshot_repository import SQLAlchemyAssetSnapshotRepository
+from app.adapters.outgoing.persistence.repository.sqlalchemy_portfolio_repository import SQLAlchemyPortfolioRepository
+from app.domain.entities.asset_snapshot import AssetSnapshot
+
+T0 = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def asset(integration_session):
+    now = datetime.now(timezone.utc)
+    portfolio = PortfolioModel(id=str(uuid4()), name="Latest", base_currency="EUR", created_at=now, updated_at=now)
+    asset_type = AssetTypeModel(id=str(uuid4()), code=f"L{str(uuid4())[:6]}", label="Latest")
+    asset = AssetModel(
+        id=str(uuid4()), name="Tracked", portfolio_id=portfolio.id, asset_type_id=asset_type.id,
+        disposed=False, created_at=now, updated_at=now, created_by="u", updated_by="u",
+    )
+    integration_session.add_all([portfolio, asset_type, asset])
+    integration_session.flush()
+    return asset
+
+
+def _snapshot(asset, value, day):
+    return AssetSnapshot(id=uuid4(), asset_id=asset.id, value=Decimal(value), observed_at=T0 + timedelta(days=day))
+
+
+def _latest(session, asset):
+    return session.query(AssetLatestValueModel).filter(
+        AssetLatestValueModel.asset_id == asset.id
+    ).populate_existing().first()
+
+
+def test_first_and_newer_snapshots_advance_latest(integration_session, asset):
+    repo = SQLAlchemyAssetSnapshotRepository(integration_session)
+    repo.save(_snapshot(asset, "10.00", 0))
+    assert _latest(integration_session, asset).value == Decimal("10.00")
+
+    newer = repo.save(_snapshot(asset, "12.50", 3))
+    latest = _latest(integration_session, asset)
+    assert latest.value == Decimal("12.50")
+    assert latest.snapshot_id == str(newer.id)
+
+
+def test_backdated_snapshot_does_not_replace_latest(integration_session, asset):
+    repo = SQLAlchemyAssetSnapshotRepository(integration_session)
+    repo.save(_snapshot(asset, "12.50", 3))
+    repo.save(_snapshot(asset, "99.00", 1))
+    assert _latest(integration_session, asset).value == Decimal("12.50")
+
+
+def test_editing_latest_snapshot_into_the_past_recomputes(integration_session, asset):
+    repo = SQLAlchemyAssetSnapshotRepository(integration_session)
+    repo.save(_snapshot(asset, "10.00", 1))
+    newest = repo.save(_snapshot(asset, "12.50", 3))
+
+    repo.save(newest.model_copy(update={"observed_at": T0}))
+    assert _latest(integration_session, asset).value == Decimal("10.00")
+
+
+def test_deleting_latest_snapshot_falls_back_to_previous(integration_session, asset):
+    repo = SQLAlchemyAssetSnapshotRepository(integration_session)
+    older = repo.save(_snapshot(asset, "10.00", 1))
+    newest = repo.save(_snapshot(asset, "12.50", 3))
+
+    repo.delete(str(newest.id))
+    assert _latest(integration_session, asset).value == Decimal("10.00")
+
+    repo.delete(str(older.id))
+    assert _latest(integration_session, asset) is None
+
+
+def test_portfolio_total_reads_maintained_values(integration_session, asset):
+    repo = SQLAlchemyAssetSnapshotRepository(integration_session)
+    repo.save(_snapshot(asset, "10.00", 1))
+    repo.save(_snapshot(asset, "5.00", 0))
+    portfolio_repo = SQLAlchemyPortfolioRepository(integration_session)
+    assert portfolio_repo.get_total_value(asset.portfolio_id) == Decimal("10.00")
+    assert portfolio_repo.get_total_value(asset.portfolio_id, at=T0) == Decimal("5.00")
+
+
+def test_save_many_advances_latest_from_batch_without_regressing(integration_session, asset):
+    repo = SQLAlchemyAssetSnapshotRepository(integration_session)
+    repo.save(_snapshot(asset, "50.00", 5))
+
+    repo.save_many([_snapshot(asset, "10.00", 1), _snapshot(asset, "30.00", 3)])
+    assert _latest(integration_session, asset).value == Decimal("50.00")
+
+    newest = _snapshot(asset, "70.00", 7)
+    repo.save_many([_snapshot(asset, "60.00", 6), newest, _snapshot(asset, "40.00", 4)])
+    latest = _latest(integration_session, asset)
+    assert latest.value == Decimal("70.00")
+    assert latest.snapshot_id == str(newest.id)
+
+
+@pytest.mark.parametrize("batch", [False, True])
+def test_mixed_offsets_compare_as_utc(integration_session, asset, batch):
+    # 11:00+05:00 is 06:00 UTC: older than 10:00 UTC, although its wall time is later
+    newest = AssetSnapshot(id=uuid4(), asset_id=asset.id, value=Decimal("10.00"),
+                           observed_at=datetime(2024, 1, 1, 10, tzinfo=timezone.utc))
+    older = AssetSnapshot(id=uuid4(), asset_id=asset.id, value=Decimal("99.00"),
+                          observed_at=datetime(2024, 1, 1, 11, tzinfo=timezone(timedelta(hours=5))))
+    repo = SQLAlchemyAssetSnapshotRepository(integration_session)
+    if batch:
+        repo.save_many([older, newest])
+    else:
+        repo.save(newest)
+        repo.save(older)
+    assert _latest(integration_session, asset).snapshot_id == str(newest.id)
+
+    # Recomputing from history agrees
+    repo.refresh_latest_values([asset.id])
+    assert _latest(integration_session, asset).snapshot_id == str(newest.id)
+
+
+def test_deleting_the_asset_drops_its_latest_value(integration_session, asset):
+    SQLAlchemyAssetSnapshotRepository(integration_session).save(_snapshot(asset, "10.00", 1))
+
+    assert SQLAlchemyAssetRepository(integration_session).delete(asset.id)
+    assert _latest(integration_session, asset) is None
+    assert SQLAlchemyPortfolioRepository(integration_session).get_total_value(asset.portfolio_id) == Decimal("0")
+
+
+def test_bulk_asset_delete_cascades_to_latest_value(integration_session, asset):
+    # Core deletes skip the ORM cascades: the database's ON DELETE CASCADE must do it
+    SQLAlchemyAssetSnapshotRepository(integration_session).save(_snapshot(asset, "10.00", 1))
+    integration_session.execute(delete(AssetSnapshotModel).where(AssetSnapshotModel.asset_id == asset.id))
+    integration_session.execute(delete(AssetModel).where(AssetModel.id == asset.id))
+
+    assert _latest(integration_session, asset) is None
+    assert SQLAlchemyPortfolioRepository(integration_session).get_total_value(asset.portfolio_id) == Decimal("0")
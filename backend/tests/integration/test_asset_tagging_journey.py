@@ -34,3 +34,40 @@ def test_create_and_assign_tag(integration_client, seeded_asset_type, seeded_por
     # Remove tag
     resp = integration_client.delete(f"/api/v1/assets/{asset_id}/tags/{tag_id}")
     assert resp.status_code == 204
+
+
+def test_create_asset_with_tags(integration_client, seeded_asset_type, seeded_portfolio):
+    """Tags passed on creation are attached in the same request."""
+    tag_ids = [
+        integration_client.post("/api/v1/tags/", json={"name": name}).json()["id"]
+        for name in ("core", "long-term")
+    ]
+
+    resp = integration_client.post("/api/v1/assets/", json={
+        "portfolio_id": seeded_portfolio["id"],
+        "asset_type_id": str(seeded_asset_type.id),
+        "name": "Tagged on creation",
+        "created_by": "test_user",
+        "tag_ids": tag_ids,
+    })
+    assert resp.status_code == 201
+    assert sorted(t["name"] for t in resp.json()["tags"]) == ["core", "long-term"]
+
+    resp = integration_client.get(f"/api/v1/assets/{resp.json()['id']}")
+    assert sorted(t["id"] for t in resp.json()["tags"]) == sorted(tag_ids)
+
+
+def test_create_asset_with_unknown_tag_creates_nothing(integration_client, seeded_asset_type, seeded_portfolio):
+    """The asset and its tags are written together or not at all."""
+    resp = integration_client.post("/api/v1/assets/", json={
+        "portfolio_id": seeded_portfolio["id"],
+        "asset_type_id": str(seeded_asset_type.id),
+        "name": "Never created",
+        "created_by": "test_user",
+        "tag_ids": ["00000000-0000-0000-0000-000000000000"],
+    })
+    assert resp.status_code == 404
+    assert resp.json()["code"] == "TAG_NOT_FOUND"
+
+    resp = integration_client.get("/api/v1/assets/", params={"portfolio_id": seeded_portfolio["id"]})
+    assert [a["name"] for a in resp.json()] == []
@@ -0,0 +1,116 @@
+"""
+Integration test: bulk snapshot ingestion via POST /api/v1/snapshots:bulk.
+Valid rows are inserted in one transaction, unknown assets are reported per row.
+"""
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from uuid import UUID, uuid4
+
+import pytest
+
+from app.adapters.outgoing.persistence.models.asset_latest_value import AssetLatestValueModel
+from app.adapters.outgoing.persistence.models.asset_snapshot import AssetSnapshotModel
+from app.adapters.outgoing.persistence.repository.sqlalchemy_asset_snapshot_repository import SQLAlchemyAssetSnapshotRepository
+
+T0 = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def two_assets(integration_client, seeded_portfolio, seeded_asset_type):
+    ids = []
+    for name in ("Bulk A", "Bulk B"):
+        resp = integration_client.post("/api/v1/assets/", json={
+            "name": name,
+            "portfolio_id": seeded_portfolio["id"],
+            "asset_type_id": seeded_asset_type.id,
+            "created_by": "test",
+        })
+        assert resp.status_code == 201
+        ids.append(resp.json()["id"])
+    return ids
+
+
+def _row(asset_id, value, day):
+    return {"asset_id": asset_id, "value": value, "observed_at": (T0 + timedelta(days=day)).isoformat()}
+
+
+def test_bulk_insert_all_rows(integration_client, integration_session, two_assets):
+    a, b = two_assets
+    rows = [_row(a, f"{100 + d}.00", d) for d in range(10)] + [_row(b, "5.00", 0)]
+
+    resp = integration_client.post("/api/v1/snapshots:bulk", json={"snapshots": rows})
+
+    assert resp.status_code == 200
+    assert resp.json() == {"created": 11, "errors": []}
+    count = integration_session.query(AssetSnapshotModel).filter(AssetSnapshotModel.asset_id.in_([a, b])).count()
+    assert count == 11
+
+
+def test_bulk_insert_refreshes_latest_values(integration_client, integration_session, two_assets):
+    a, b = two_assets
+    rows = [_row(a, "3.00", 3), _row(a, "9.00", 9), _row(a, "1.00", 1), _row(b, "7.50", 2)]
+
+    resp = integration_client.post("/api/v1/snapshots:bulk", json={"snapshots": rows})
+    assert resp.status_code == 200
+
+    latest = {
+        r.asset_id: r.value
+        for r in integration_session.query(AssetLatestValueModel).filter(
+            AssetLatestValueModel.asset_id.in_([a, b])
+        ).populate_existing()
+    }
+    assert latest == {a: Decimal("9.00"), b: Decimal("7.50")}
+
+
+def test_bulk_insert_reports_unknown_assets(integration_client, integration_session, two_assets):
+    a, _ = two_assets
+    unknown = str(uuid4())
+    rows = [_row(a, "1.00", 0), _row(unknown, "2.00", 0), _row(a, "3.00", 1)]
+
+    resp = integration_client.post("/api/v1/snapshots:bulk", json={"snapshots": rows})
+
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["created"] == 2
+    assert body["errors"] == [{
+        "index": 1,
+        "asset_id": unknown,
+        "code": "ASSET_NOT_FOUND",
+        "message": f"Asset with id {unknown} not found.",
+    }]
+    assert integration_session.query(AssetSnapshotModel).filter(AssetSnapshotModel.asset_id == unknown).count() == 0
+
+
+def test_bulk_insert_rejects_empty_batch(integration_client):
+    resp = integration_client.post("/api/v1/snapshots:bulk", json={"snapshots": []})
+    assert resp.status_code == 422
+
+
+def test_bulk_insert_rejects_malformed_rows(integration_client, two_assets):
+    a, _ = two_assets
+    resp = integration_client.post("/api/v1/snapshots:bulk", json={"snapshots": [{"asset_id": a, "value": "abc"}]})
+    assert resp.status_code == 422
+
+
+def _columns(snapshots):
+    """(id, asset_id, value, observed_at) of each snapshot; SQLite returns naive UTC times."""
+    return [
+        (s.id, s.asset_id, s.value, s.observed_at.replace(tzinfo=s.observed_at.tzinfo or timezone.utc))
+        for s in snapshots
+    ]
+
+
+def test_snapshot_series_match_entity_reads(integration_client, integration_session, seeded_portfolio, two_assets):
+    a, b = two_assets
+    rows = [_row(a, f"{100 + d}.25", d) for d in range(5)] + [_row(b, "-7.50", 2), _row(b, "7.50", 2)]
+    assert integration_client.post("/api/v1/snapshots:bulk", json={"snapshots": rows}).status_code == 200
+    repo = SQLAlchemyAssetSnapshotRepository(integration_session)
+
+    series = repo.get_snapshot_series(UUID(a), T0 + timedelta(days=1), T0 + timedelta(days=3))
+    assert _columns(series) == _columns(repo.get_snapshots(UUID(a), T0 + timedelta(days=1), T0 + timedelta(days=3)))
+    assert [s.value for s in series] == [Decimal("101.25"), Decimal("102.25"), Decimal("103.25")]
+
+    by_asset = repo.get_portfolio_snapshot_series(UUID(seeded_portfolio["id"]), end_date=T0 + timedelta(days=2))
+    assert sorted(str(s.asset_id) for s in by_asset) == sorted([a, b])
+    for s in by_asset:
+        assert _columns(s) == _columns(repo.get_snapshots(s.asset_id, end_date=T0 + timedelta(days=2)))
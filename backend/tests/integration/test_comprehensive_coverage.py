@@ -376,7 +376,7 @@ class TestPortfolioRepository:
         from app.domain.entities.portfolio_snapshot import PortfolioSnapshot
         repo = SQLAlchemyPortfolioRepository(repo_session)
         snap = PortfolioSnapshot(
-            id=uuid4(), portfolio_id=uuid4(),
+            id=uuid4(), portfolio_id=seeded_data["portfolio"].id,
             value=Decimal("300.0"), observed_at=datetime.now(timezone.utc)
         )
         repo.save_snapshot(snap)
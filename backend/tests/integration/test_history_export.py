@@ -0,0 +1,101 @@
+"""
+Integration test: streaming NDJSON/CSV exports of asset snapshots,
+asset transactions and portfolio snapshots.
+"""
+import csv
+import io
+import json
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+
+T0 = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def asset(integration_client, seeded_portfolio, seeded_asset_type):
+    resp = integration_client.post("/api/v1/assets/", json={
+        "name": "Exported Savings",
+        "portfolio_id": seeded_portfolio["id"],
+        "asset_type_id": seeded_asset_type.id,
+        "created_by": "test",
+    })
+    assert resp.status_code == 201
+    asset = resp.json()
+    rows = [
+        {"asset_id": asset["id"], "value": f"{100 + day}.00", "observed_at": (T0 + timedelta(days=day)).isoformat()}
+        for day in (2, 0, 1)
+    ]
+    assert integration_client.post("/api/v1/snapshots:bulk", json={"snapshots": rows}).status_code == 200
+    return asset
+
+
+def _ndjson(resp):
+    return [json.loads(line) for line in resp.text.splitlines()]
+
+
+def test_export_asset_snapshots_ndjson_oldest_first(integration_client, asset):
+    resp = integration_client.get(f"/api/v1/assets/{asset['id']}/snapshots/export")
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+    assert "attachment" in resp.headers["content-disposition"]
+    rows = _ndjson(resp)
+    assert [r["value"] for r in rows] == ["100.00", "101.00", "102.00"]
+    assert set(rows[0]) == {"id", "asset_id", "value", "observed_at"}
+
+
+def test_export_asset_snapshots_csv_with_date_range(integration_client, asset):
+    resp = integration_client.get(
+        f"/api/v1/assets/{asset['id']}/snapshots/export",
+        params={"format": "csv", "start_date": (T0 + timedelta(days=1)).isoformat()},
+    )
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/csv")
+    rows = list(csv.DictReader(io.StringIO(resp.text)))
+    assert [r["value"] for r in rows] == ["101.00", "102.00"]
+
+
+def test_export_asset_transactions(integration_client, asset):
+    body = "".join(
+        json.dumps({"asset": asset["id"], "type": t, "quantity": "1", "unit_price": "10",
+                    "currency": "EUR", "occurred_at": f"2024-0{m}-01T00:00:00Z"}) + "\n"
+        for t, m in (("DISPOSE", 3), ("ACQUIRE", 1))
+    )
+    assert integration_client.post(
+        "/api/v1/imports/transactions", params={"format": "ndjson"}, content=body.encode()
+    ).status_code == 200
+
+    resp = integration_client.get(f"/api/v1/assets/{asset['id']}/transactions/export", params={"format": "csv"})
+
+    assert resp.status_code == 200
+    rows = list(csv.DictReader(io.StringIO(resp.text)))
+    assert [r["type"] for r in rows] == ["ACQUIRE", "DISPOSE"]
+
+
+def test_export_portfolio_snapshots(integration_client, seeded_portfolio, asset):
+    pid = seeded_portfolio["id"]
+    assert integration_client.post(f"/api/v1/portfolios/{pid}/snapshots").status_code == 201
+
+    resp = integration_client.get(f"/api/v1/portfolios/{pid}/snapshots/export")
+
+    assert resp.status_code == 200
+    (row,) = _ndjson(resp)
+    assert row["portfolio_id"] == pid
+
+
+@pytest.mark.parametrize("path", [
+    "/api/v1/assets/{id}/snapshots/export",
+    "/api/v1/assets/{id}/transactions/export",
+    "/api/v1/portfolios/{id}/snapshots/export",
+])
+def test_export_unknown_owner_returns_404(integration_client, path):
+    resp = integration_client.get(path.format(id=uuid4()))
+    assert resp.status_code == 404
+
+
+def test_export_rejects_unknown_format(integration_client, asset):
+    resp = integration_client.get(f"/api/v1/assets/{asset['id']}/snapshots/export", params={"format": "xml"})
+    assert resp.status_code == 422
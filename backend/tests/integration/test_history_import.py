@@ -0,0 +1,130 @@
+"""
+Integration test: streaming history import (POST /api/v1/imports/{kind} and the CLI).
+"""
+import json
+from decimal import Decimal
+
+import pytest
+from click.testing import CliRunner
+from sqlalchemy.orm import sessionmaker
+
+from app.cli import import_history
+from app.adapters.outgoing.persistence.models.asset_latest_value import AssetLatestValueModel
+from app.adapters.outgoing.persistence.models.asset_snapshot import AssetSnapshotModel
+from app.adapters.outgoing.persistence.models.transaction import TransactionModel
+
+
+@pytest.fixture
+def asset(integration_client, seeded_portfolio, seeded_asset_type):
+    resp = integration_client.post("/api/v1/assets/", json={
+        "name": "Imported Savings",
+        "portfolio_id": seeded_portfolio["id"],
+        "asset_type_id": seeded_asset_type.id,
+        "created_by": "test",
+    })
+    assert resp.status_code == 201
+    return resp.json()
+
+
+def test_import_snapshots_csv_by_name_and_id(integration_client, integration_session, seeded_portfolio, asset):
+    body = (
+        "asset,value,observed_at\n"
+        "Imported Savings,100.00,2023-01-01T00:00:00+00:00\n"
+        f"{asset['id']},150.00,2023-03-01T00:00:00+00:00\n"
+        "Imported Savings,120.00,2023-02-01T00:00:00+00:00\n"
+        "Nowhere,1.00,2023-01-01T00:00:00+00:00\n"
+        "Imported Savings,not-a-number,2023-01-01T00:00:00+00:00\n"
+    )
+
+    resp = integration_client.post(
+        "/api/v1/imports/snapshots",
+        params={"format": "csv", "portfolio_id": seeded_portfolio["id"]},
+        content=body.encode(),
+        headers={"Content-Type": "text/csv"},
+    )
+
+    assert resp.status_code == 200
+    report = resp.json()
+    assert (report["rows_read"], report["imported"], report["failed"]) == (5, 3, 2)
+    assert {(e["line"], e["code"]) for e in report["errors"]} == {(5, "ASSET_NOT_FOUND"), (6, "INVALID_ROW")}
+    count = integration_session.query(AssetSnapshotModel).filter(AssetSnapshotModel.asset_id == asset["id"]).count()
+    assert count == 3
+    latest = integration_session.query(AssetLatestValueModel).filter(
+        AssetLatestValueModel.asset_id == asset["id"]
+    ).populate_existing().one()
+    assert latest.value == Decimal("150.00")
+
+
+def test_import_reports_undecodable_rows_and_keeps_going(integration_client, integration_session, asset):
+    body = (
+        b"asset,value,observed_at\n"
+        b"Imported Savings,100.00,2023-01-01T00:00:00+00:00\n"
+        b"Imported Savings,\xff\xfe,2023-02-01T00:00:00+00:00\n"
+        b"Imported Savings,120.00,2023-03-01T00:00:00+00:00\n"
+    )
+
+    resp = integration_client.post(
+        "/api/v1/imports/snapshots", params={"format": "csv"}, content=body, headers={"Content-Type": "text/csv"}
+    )
+
+    assert resp.status_code == 200
+    report = resp.json()
+    assert (report["rows_read"], report["imported"], report["failed"]) == (3, 2, 1)
+    assert [(e["line"], e["code"]) for e in report["errors"]] == [(3, "INVALID_ROW")]
+    count = integration_session.query(AssetSnapshotModel).filter(AssetSnapshotModel.asset_id == asset["id"]).count()
+    assert count == 2
+
+
+def test_import_transactions_ndjson(integration_client, integration_session, asset):
+    lines = [
+        {"asset": asset["id"], "type": "ACQUIRE", "quantity": "2", "unit_price": "10.5",
+         "currency": "EUR", "occurred_at": "2023-01-01T00:00:00Z"},
+        {"asset": asset["id"], "type": "DISPOSE", "quantity": "1", "unit_price": "12",
+         "currency": "EUR", "occurred_at": "2023-06-01T00:00:00Z"},
+    ]
+    body = "\n".join(json.dumps(line) for line in lines) + "\n"
+
+    resp = integration_client.post("/api/v1/imports/transactions", params={"format": "ndjson"}, content=body.encode())
+
+    assert resp.status_code == 200
+    assert resp.json()["imported"] == 2
+    types = {t.type for t in integration_session.query(TransactionModel).filter(TransactionModel.asset_id == asset["id"])}
+    assert types == {"ACQUIRE", "DISPOSE"}
+
+
+def test_import_rejects_unknown_kind(integration_client):
+    resp = integration_client.post("/api/v1/imports/prices", content=b"asset,value\n")
+    assert resp.status_code == 422
+
+
+def test_cli_import_snapshots(integration_session, asset, tmp_path, monkeypatch):
+    # Joined to the test session's transaction, so the CLI sees the uncommitted asset
+    monkeypatch.setattr(
+        "app.adapters.outgoing.persistence.database.WriteSessionLocal",
+        sessionmaker(bind=integration_session.connection()),
+    )
+    path = tmp_path / "history.ndjson"
+    path.write_text(
+        json.dumps({"asset": asset["id"], "value": "42.00", "observed_at": "2022-01-01T00:00:00Z"}) + "\n"
+        + json.dumps({"asset": asset["id"], "value": "43.00", "observed_at": "2022-01-02T00:00:00Z"}) + "\n"
+    )
+
+    result = CliRunner().invoke(import_history, ["snapshots", str(path), "--chunk-size", "1"])
+
+    assert result.exit_code == 0, result.output
+    assert "Imported 2 of 2 snapshots" in result.output
+    values = {s.value for s in integration_session.query(AssetSnapshotModel).filter(AssetSnapshotModel.asset_id == asset["id"])}
+    assert values == {Decimal("42.00"), Decimal("43.00")}
+
+
+def test_cli_import_fails_on_rejected_rows(integration_engine, tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        "app.adapters.outgoing.persistence.database.WriteSessionLocal", sessionmaker(bind=integration_engine)
+    )
+    path = tmp_path / "history.csv"
+    path.write_text("asset,value,observed_at\nNowhere,1.00,2022-01-01T00:00:00Z\n")
+
+    result = CliRunner().invoke(import_history, ["snapshots", str(path)])
+
+    assert result.exit_code == 1
+    assert "line 2: ASSET_NOT_FOUND" in result.output
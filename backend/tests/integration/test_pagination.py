@@ -0,0 +1,162 @@
+"""
+Integration test: keyset pagination of the listing endpoints.
+Pages are walked through the X-Next-Cursor header until it disappears.
+"""
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+
+T0 = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _walk(client, url, limit, **params):
+    """Collect every page of a listing; returns (pages, items)."""
+    pages, cursor = [], None
+    while True:
+        query = dict(params, limit=limit)
+        if cursor:
+            query["cursor"] = cursor
+        resp = client.get(url, params=query)
+        assert resp.status_code == 200, resp.text
+        pages.append(resp.json())
+        cursor = resp.headers.get("X-Next-Cursor")
+        if not cursor:
+            return pages, [item for page in pages for item in page]
+
+
+@pytest.fixture
+def assets(integration_client, seeded_portfolio, seeded_asset_type):
+    ids = []
+    # Duplicate names exercise the id tie-breaker
+    for name in ("Delta", "alpha", "Charlie", "Bravo", "Bravo"):
+        resp = integration_client.post("/api/v1/assets/", json={
+            "name": name,
+            "portfolio_id": seeded_portfolio["id"],
+            "asset_type_id": seeded_asset_type.id,
+            "created_by": "test",
+        })
+        assert resp.status_code == 201
+        ids.append(resp.json()["id"])
+    return ids
+
+
+def test_assets_page_by_name_then_id(integration_client, seeded_portfolio, assets):
+    pages, items = _walk(integration_client, "/api/v1/assets/", 2, portfolio_id=seeded_portfolio["id"])
+
+    assert [len(page) for page in pages] == [2, 2, 1]
+    assert len({a["id"] for a in items}) == 5
+    keys = [(a["name"], a["id"]) for a in items]
+    assert keys == sorted(keys)
+
+
+
+def test_asset_listing_matches_asset_detail(integration_client, seeded_portfolio, assets):
+    """The column-level listing renders every asset exactly as the detail endpoint does."""
+    tag_ids = [integration_client.post("/api/v1/tags/", json={"name": n}).json()["id"] for n in ("zeta", "eta")]
+    parent = integration_client.post("/api/v1/categories/", json={"name": "Savings"}).json()
+    child = integration_client.post("/api/v1/categories/", json={"name": "Cash", "parent_id": parent["id"]}).json()
+    for tag_id in tag_ids:
+        assert integration_client.post(f"/api/v1/assets/{assets[0]}/tags/{tag_id}").status_code == 200
+    assert integration_client.post(f"/api/v1/assets/{assets[0]}/categories/{child['id']}").status_code == 200
+    assert integration_client.put(f"/api/v1/assets/{assets[1]}/dispose").status_code == 200
+
+    _, items = _walk(integration_client, "/api/v1/assets/", 2)
+
+    assert len(items) == 5
+    for item in items:
+        detail = integration_client.get(f"/api/v1/assets/{item['id']}").json()
+        detail["tags"].sort(key=lambda t: t["name"])
+        # The detail endpoint leaves category parent_id unset; the listing fills it in
+        without_parents = [{"id": c["id"], "name": c["name"]} for c in item["categories"]]
+        assert {**item, "categories": without_parents} == {
+            **detail, "categories": [{"id": c["id"], "name": c["name"]} for c in detail["categories"]],
+        }
+    tagged = next(a for a in items if a["id"] == assets[0])
+    assert [t["name"] for t in tagged["tags"]] == ["eta", "zeta"]
+    assert tagged["categories"] == [{"id": child["id"], "name": "Cash", "parent_id": parent["id"]}]
+
+def test_asset_snapshots_page_newest_first(integration_client, assets):
+    asset_id = assets[0]
+    rows = [
+        {"asset_id": asset_id, "value": f"{day}.00", "observed_at": (T0 + timedelta(days=day)).isoformat()}
+        for day in (4, 0, 2, 1, 3)
+    ]
+    # Same instant twice: only the id orders them
+    rows.append({"asset_id": asset_id, "value": "2.50", "observed_at": (T0 + timedelta(days=2)).isoformat()})
+    assert integration_client.post("/api/v1/snapshots:bulk", json={"snapshots": rows}).status_code == 200
+
+    pages, items = _walk(integration_client, f"/api/v1/assets/{asset_id}/snapshots", 4)
+
+    assert [len(page) for page in pages] == [4, 2]
+    assert [s["value"] for s in items][:2] == ["4.00", "3.00"]
+    assert sorted(s["value"] for s in items[2:4]) == ["2.00", "2.50"]
+    assert [s["value"] for s in items][4:] == ["1.00", "0.00"]
+
+
+def test_snapshot_pages_honour_the_date_range(integration_client, integration_session, seeded_portfolio, assets):
+    from app.adapters.outgoing.persistence.models import PortfolioSnapshotModel
+
+    rows = [
+        {"asset_id": assets[0], "value": f"{day}.00", "observed_at": (T0 + timedelta(days=day)).isoformat()}
+        for day in range(5)
+    ]
+    assert integration_client.post("/api/v1/snapshots:bulk", json={"snapshots": rows}).status_code == 200
+    for day in range(5):
+        integration_session.add(PortfolioSnapshotModel(
+            id=str(uuid4()), portfolio_id=seeded_portfolio["id"], value=day, observed_at=T0 + timedelta(days=day),
+        ))
+    integration_session.flush()
+    window = {"start_date": (T0 + timedelta(days=1)).isoformat(), "end_date": (T0 + timedelta(days=3)).isoformat()}
+
+    _, asset_items = _walk(integration_client, f"/api/v1/assets/{assets[0]}/snapshots", 2, **window)
+    _, portfolio_items = _walk(integration_client, f"/api/v1/portfolios/{seeded_portfolio['id']}/snapshots", 2, **window)
+
+    assert [s["value"] for s in asset_items] == ["3.00", "2.00", "1.00"]
+    assert [s["value"] for s in portfolio_items] == ["3.00", "2.00", "1.00"]
+
+
+def test_portfolio_snapshots_page_newest_first(integration_client, integration_session, seeded_portfolio):
+    from app.adapters.outgoing.persistence.models import PortfolioSnapshotModel
+
+    for day in range(5):
+        integration_session.add(PortfolioSnapshotModel(
+            id=str(uuid4()), portfolio_id=seeded_portfolio["id"], value=day, observed_at=T0 + timedelta(days=day),
+        ))
+    integration_session.flush()
+
+    pages, items = _walk(integration_client, f"/api/v1/portfolios/{seeded_portfolio['id']}/snapshots", 2)
+
+    assert [len(page) for page in pages] == [2, 2, 1]
+    assert [s["value"] for s in items] == ["4.00", "3.00", "2.00", "1.00", "0.00"]
+
+
+def test_tags_and_categories_page_by_name(integration_client):
+    prefix = f"page-{uuid4().hex[:8]}"
+    names = [f"{prefix}-{n}" for n in ("c", "a", "b")]
+    for name in names:
+        assert integration_client.post("/api/v1/tags/", json={"name": name}).status_code == 201
+        assert integration_client.post("/api/v1/categories/", json={"name": name}).status_code == 201
+
+    for url in ("/api/v1/tags/", "/api/v1/categories/"):
+        _, items = _walk(integration_client, url, 1)
+        ours = [item["name"] for item in items if item["name"].startswith(prefix)]
+        assert ours == sorted(names)
+        assert len({item["id"] for item in items}) == len(items)
+
+
+def test_last_page_has_no_cursor(integration_client, seeded_portfolio, assets):
+    resp = integration_client.get("/api/v1/assets/", params={"portfolio_id": seeded_portfolio["id"], "limit": 5})
+    assert len(resp.json()) == 5
+    assert "X-Next-Cursor" not in resp.headers
+
+
+def test_invalid_cursor_is_rejected(integration_client):
+    resp = integration_client.get("/api/v1/tags/", params={"cursor": "definitely-not-a-cursor"})
+    assert resp.status_code == 400
+    assert resp.json()["code"] == "INVALID_CURSOR"
+
+
+@pytest.mark.parametrize("limit", [0, 1001])
+def test_limit_is_bounded(integration_client, limit):
+    assert integration_client.get("/api/v1/tags/", params={"limit": limit}).status_code == 422
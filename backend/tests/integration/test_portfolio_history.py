@@ -0,0 +1,86 @@
+"""
+Integration test: portfolio value history (GET /api/v1/portfolios/{id}/history).
+"""
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+
+T0 = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def portfolio_with_history(integration_client, seeded_portfolio, seeded_asset_type):
+    ids = []
+    for name in ("History A", "History B"):
+        resp = integration_client.post("/api/v1/assets/", json={
+            "name": name,
+            "portfolio_id": seeded_portfolio["id"],
+            "asset_type_id": seeded_asset_type.id,
+            "created_by": "test",
+        })
+        assert resp.status_code == 201
+        ids.append(resp.json()["id"])
+    a, b = ids
+    rows = [
+        (a, "100.00", T0),
+        (a, "150.00", T0 + timedelta(days=2, hours=12)),
+        (b, "10.25", T0 + timedelta(days=1)),
+    ]
+    resp = integration_client.post("/api/v1/snapshots:bulk", json={"snapshots": [
+        {"asset_id": asset_id, "value": value, "observed_at": at.isoformat()} for asset_id, value, at in rows
+    ]})
+    assert resp.status_code == 200
+    return seeded_portfolio["id"]
+
+
+def test_history_daily(integration_client, portfolio_with_history):
+    resp = integration_client.get(f"/api/v1/portfolios/{portfolio_with_history}/history", params={
+        "from": "2023-12-31T00:00:00Z", "to": "2024-01-04T00:00:00Z", "step": "P1D",
+    })
+
+    assert resp.status_code == 200
+    assert [(p["observed_at"], p["value"]) for p in resp.json()] == [
+        ("2023-12-31T00:00:00Z", "0.00"),
+        ("2024-01-01T00:00:00Z", "100.00"),
+        ("2024-01-02T00:00:00Z", "110.25"),
+        ("2024-01-03T00:00:00Z", "110.25"),
+        ("2024-01-04T00:00:00Z", "160.25"),
+    ]
+
+
+def test_history_intraday_step(integration_client, portfolio_with_history):
+    resp = integration_client.get(f"/api/v1/portfolios/{portfolio_with_history}/history", params={
+        "from": "2024-01-03T00:00:00Z", "to": "2024-01-03T12:00:00Z", "step": "PT6H",
+    })
+
+    assert resp.status_code == 200
+    assert [p["value"] for p in resp.json()] == ["110.25", "110.25", "160.25"]
+
+
+def test_history_rejects_too_many_points(integration_client, portfolio_with_history):
+    resp = integration_client.get(f"/api/v1/portfolios/{portfolio_with_history}/history", params={
+        "from": "2000-01-01T00:00:00Z", "to": "2024-01-01T00:00:00Z", "step": "PT1M",
+    })
+
+    assert resp.status_code == 400
+    assert resp.json()["code"] == "INVALID_TIME_RANGE"
+
+
+def test_history_unknown_portfolio(integration_client):
+    resp = integration_client.get(f"/api/v1/portfolios/{uuid4()}/history")
+    assert resp.status_code == 404
+
+
+def test_history_ends_at_the_portfolio_valuation(integration_client, portfolio_with_history):
+    """Disposed assets drop out of the history as they do out of the valuation."""
+    disposed = integration_client.get("/api/v1/assets/", params={"portfolio_id": portfolio_with_history}).json()[0]
+    assert integration_client.put(f"/api/v1/assets/{disposed['id']}/dispose").status_code == 200
+
+    history = integration_client.get(f"/api/v1/portfolios/{portfolio_with_history}/history", params={
+        "from": "2024-01-01T00:00:00Z", "to": "2024-01-04T00:00:00Z", "step": "P1D",
+    }).json()
+    portfolio = integration_client.get(f"/api/v1/portfolios/{portfolio_with_history}").json()
+
+    assert disposed["name"] == "History A"
+    assert history[-1]["value"] == portfolio["total_value"] == "10.25"
@@ -0,0 +1,126 @@
+"""
+Integration test: statements per endpoint and repository call.
+
+Each call runs over several labelled assets and must stay within a fixed
+number of statements, whatever the number of rows: a relationship loaded
+row by row (N+1) repeats a statement and fails the test.
+"""
+import pytest
+
+import app.main
+from app.adapters.outgoing.persistence.repository.sqlalchemy_asset_repository import SQLAlchemyAssetRepository
+from app.adapters.outgoing.persistence.repository.sqlalchemy_portfolio_repository import (
+    SQLAlchemyPortfolioRepository,
+)
+
+ASSETS = 6
+
+
+@pytest.fixture
+def labelled_assets(integration_client, seeded_asset_type, seeded_portfolio):
+    """ASSETS assets, each with two tags, two child categories and three snapshots; every other one disposed."""
+    client = integration_client
+    tags = [client.post("/api/v1/tags/", json={"name": f"tag {i}"}).json()["id"] for i in range(3)]
+    root = client.post("/api/v1/categories/", json={"name": "Root"}).json()["id"]
+    categories = [
+        client.post("/api/v1/categories/", json={"name": f"Child {i}", "parent_id": root}).json()["id"]
+        for i in range(3)
+    ]
+    assets = []
+    for i in range(ASSETS):
+        asset_id = client.post("/api/v1/assets/", json={
+            "portfolio_id": seeded_portfolio["id"],
+            "asset_type_id": str(seeded_asset_type.id),
+            "name": f"Asset {i}",
+            "created_by": "test_user",
+            "tag_ids": [tags[i % 3], tags[(i + 1) % 3]],
+        }).json()["id"]
+        for category_id in (categories[i % 3], categories[(i + 1) % 3]):
+            assert client.post(f"/api/v1/assets/{asset_id}/categories/{category_id}").status_code == 200
+        for day in range(1, 4):
+            client.post(f"/api/v1/assets/{asset_id}/snapshots",
+                        json={"value": f"{100 * day}.00", "observed_at": f"2024-01-0{day}T00:00:00Z"})
+        if i % 2:
+            assert client.put(f"/api/v1/assets/{asset_id}/dispose").status_code == 200
+        assets.append(asset_id)
+    return {
+        "portfolio_id": seeded_portfolio["id"], "asset_type_code": seeded_asset_type.code,
+        "assets": assets, "tags": tags, "categories": categories,
+    }
+
+
+@pytest.mark.parametrize("method,path,limit", [
+    ("GET", "/api/v1/assets/", 3),
+    ("GET", "/api/v1/assets/{asset}", 3),
+    ("GET", "/api/v1/assets/{asset}/snapshots", 4),
+    ("GET", "/api/v1/assets/{asset}/snapshots/series?bucket=week&agg=last", 2),
+    ("GET", "/api/v1/portfolios/", 1),
+    ("GET", "/api/v1/portfolios/{portfolio}", 2),
+    ("GET", "/api/v1/portfolios/{portfolio}/history?from=2024-01-01T00:00:00Z&to=2024-01-04T00:00:00Z", 2),
+    ("GET", "/api/v1/portfolios/{portfolio}/snapshots/series?bucket=day&agg=last", 2),
+    ("GET", "/api/v1/tags/", 1),
+    ("GET", "/api/v1/categories/", 1),
+    ("POST", "/api/v1/assets/{asset}/snapshots", 8),
+])
+def test_endpoint_statement_budget(integration_client, labelled_assets, max_queries, method, path, limit):
+    url = path.format(asset=labelled_assets["assets"][0], portfolio=labelled_assets["portfolio_id"])
+    body = {"value": "500.00", "observed_at": "2024-02-01T00:00:00Z"} if method == "POST" else None
+
+    with max_queries(limit):
+        resp = integration_client.request(method, url, json=body)
+
+    assert resp.status_code < 300, resp.text
+
+
+def test_bulk_snapshots_statement_budget(integration_client, labelled_assets, max_queries):
+    rows = [
+        {"asset_id": asset_id, "value": "1.00", "observed_at": f"2024-03-0{day}T00:00:00Z"}
+        for asset_id in labelled_assets["assets"] for day in range(1, 6)
+    ]
+
+    with max_queries(5):
+        resp = integration_client.post("/api/v1/snapshots:bulk", json={"snapshots": rows})
+
+    assert resp.json()["created"] == len(rows)
+
+
+@pytest.mark.parametrize("find", [
+    lambda repo, data: repo.find_all(),
+    lambda repo, data: repo.find_by_portfolio(data["portfolio_id"]),
+    lambda repo, data: repo.find_by_type(data["asset_type_code"]),
+    lambda repo, data: repo.find_by_category(data["categories"][0]),
+    lambda repo, data: repo.find_by_tag(data["tags"][0]),
+    lambda repo, data: repo.find_active(data["portfolio_id"]),
+    lambda repo, data: repo.find_disposed(data["portfolio_id"]),
+    lambda repo, data: repo.find_page(100),
+], ids=["find_all", "find_by_portfolio", "find_by_type", "find_by_category", "find_by_tag",
+        "find_active", "find_disposed", "find_page"])
+def test_asset_queries_load_labels_up_front(integration_session, labelled_assets, max_queries, find):
+    integration_session.expire_all()
+    repo = SQLAlchemyAssetRepository(integration_session)
+
+    with max_queries(3):
+        assets = find(repo, labelled_assets)
+
+    assert len(assets) >= 3 and all(a.tags and a.categories for a in assets)
+
+
+def test_portfolio_find_all_loads_asset_labels_up_front(integration_session, labelled_assets, max_queries):
+    integration_session.expire_all()
+
+    with max_queries(5):
+        portfolios = SQLAlchemyPortfolioRepository(integration_session).find_all()
+
+    assert all(a.tags and a.categories for p in portfolios for a in p.assets)
+
+
+def test_debug_mode_reports_statements_in_headers(integration_client, labelled_assets, monkeypatch):
+    resp = integration_client.get("/api/v1/assets/")
+    assert "X-DB-Statements" not in resp.headers
+
+    monkeypatch.setattr(app.main, "DEBUG", True)
+    resp = integration_client.get("/api/v1/assets/")
+
+    assert resp.headers["X-DB-Statements"] == "3"
+    assert float(resp.headers["X-DB-Time-Ms"]) > 0
+    assert resp.headers["X-DB-Repeated-Statements"] == "0"
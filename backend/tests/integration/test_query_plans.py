@@ -0,0 +1,275 @@
+"""
+Integration test: every repository query is served by an index.
+
+Each case runs one repository call against a bulk-seeded SQLite database,
+captures the statements it issues and EXPLAINs them. A plan that scans a
+whole table or sorts through a temporary B-tree fails the case, unless the
+case allows that step: full listings scan, and a few sorts are bounded by a
+page or by one owner's rows.
+
+EXPLAIN QUERY PLAN is SQLite's, so this module always runs on its own
+SQLite file, whatever TEST_DATABASE_URL says.
+"""
+import re
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.orm import Session
+
+from app.adapters.outgoing.persistence.database import Base
+from app.adapters.outgoing.persistence.models import (
+    AssetModel,
+    AssetSnapshotModel,
+    AssetTypeModel,
+    CategoryModel,
+    PortfolioModel,
+    PortfolioSnapshotModel,
+    TagModel,
+    TransactionModel,
+    asset_category,
+    asset_tag,
+)
+from app.adapters.outgoing.persistence.repository.sqlalchemy_asset_repository import SQLAlchemyAssetRepository
+from app.adapters.outgoing.persistence.repository.sqlalchemy_asset_snapshot_repository import SQLAlchemyAssetSnapshotRepository
+from app.adapters.outgoing.persistence.repository.sqlalchemy_asset_type_repository import SQLAlchemyAssetTypeRepository
+from app.adapters.outgoing.persistence.repository.sqlalchemy_category_repository import SQLAlchemyCategoryRepository
+from app.adapters.outgoing.persistence.repository.sqlalchemy_portfolio_repository import SQLAlchemyPortfolioRepository
+from app.adapters.outgoing.persistence.repository.sqlalchemy_portfolio_snapshot_repository import SQLAlchemyPortfolioSnapshotRepository
+from app.adapters.outgoing.persistence.repository.sqlalchemy_tag_repository import SQLAlchemyTagRepository
+from app.adapters.outgoing.persistence.repository.sqlalchemy_transaction_repository import SQLAlchemyTransactionRepository
+from app.domain.entities import AssetSnapshot, SeriesBucket
+
+T0 = datetime(2020, 1, 1, tzinfo=timezone.utc)
+
+PORTFOLIOS = 20
+ASSETS_PER_PORTFOLIO = 50
+SNAPSHOTS_PER_ASSET = 60
+TRANSACTIONS_PER_ASSET = 4
+TAGS = 40
+TAGS_PER_ASSET = 3
+
+TABLES = set(Base.metadata.tables)
+
+# Plan steps a case may be allowed, with the reason it is fine
+FULL_LISTING = "SCAN"  # the call returns the whole table
+PAGE_SORT = "USE TEMP B-TREE FOR ORDER BY"  # sorts one page of labels
+LISTING_SORT = "USE TEMP B-TREE FOR ORDER BY"  # sorts a listing's grouped rows, one per owner
+BUCKET_SORT = "USE TEMP B-TREE"  # groups one owner's history into buckets
+PER_ASSET_SORT = "USE TEMP B-TREE FOR RIGHT PART OF ORDER BY"  # SQLite sorts each asset's rows apart
+
+
+def _violations(plan):
+    """Plan steps that read a whole table or sort through a temporary B-tree."""
+    for detail in plan:
+        scan = re.match(r"SCAN (\w+)", detail)
+        # ORM aliases (assets_1) scan their table; subqueries and CTEs are not tables
+        if scan and re.sub(r"_\d+$", "", scan.group(1)) in TABLES:
+            yield detail
+        elif "TEMP B-TREE" in detail:
+            yield detail
+
+
+@pytest.fixture(scope="module")
+def plan_engine(tmp_path_factory):
+    """A SQLite file of some 70,000 rows, analyzed like a production database."""
+    engine = create_engine(f"sqlite:///{tmp_path_factory.mktemp('plans')}/plans.db")
+    Base.metadata.create_all(engine)
+    now = datetime.now(timezone.utc)
+
+    asset_types = [dict(id=str(uuid4()), code=code, label=code, created_at=now, updated_at=now)
+                   for code in ("STOCK", "BOND", "CASH", "REAL_ESTATE")]
+    tags = [dict(id=str(uuid4()), name=f"tag-{i:02d}") for i in range(TAGS)]
+    # Three levels: 4 roots, 12 children, 36 grandchildren
+    categories, parents = [], [None]
+    for depth in range(3):
+        level = [dict(id=str(uuid4()), name=f"category-{depth}-{i}", parent_id=parent)
+                 for i, parent in enumerate(parents * 4 if depth == 0 else parents * 3)]
+        categories += level
+        parents = [c["id"] for c in level]
+    leaves = parents
+
+    portfolios, assets, snapshots, transactions, portfolio_snapshots, tagging, categorizing = [], [], [], [], [], [], []
+    for p in range(PORTFOLIOS):
+        portfolio_id = str(uuid4())
+        portfolios.append(dict(id=portfolio_id, name=f"Portfolio {p}", base_currency="EUR",
+                               created_at=now, updated_at=now))
+        portfolio_snapshots += [dict(id=str(uuid4()), portfolio_id=portfolio_id, value=Decimal(day),
+                                     observed_at=T0 + timedelta(days=day)) for day in range(SNAPSHOTS_PER_ASSET)]
+        for a in range(ASSETS_PER_PORTFOLIO):
+            asset_id, n = str(uuid4()), len(assets)
+            assets.append(dict(id=asset_id, portfolio_id=portfolio_id, name=f"Asset {p}.{a}",
+                               asset_type_id=asset_types[n % len(asset_types)]["id"], disposed=a % 10 == 0,
+                               created_at=now, updated_at=now, created_by="test", updated_by="test"))
+            snapshots += [dict(id=str(uuid4()), asset_id=asset_id, value=Decimal(n + day) / 100,
+                               observed_at=T0 + timedelta(days=day)) for day in range(SNAPSHOTS_PER_ASSET)]
+            transactions += [dict(id=str(uuid4()), asset_id=asset_id, type="ACQUIRE", quantity=Decimal(1),
+                                  unit_price=Decimal(10), currency="EUR", occurred_at=T0 + timedelta(days=30 * t))
+                             for t in range(TRANSACTIONS_PER_ASSET)]
+            tagging += [dict(asset_id=asset_id, tag_id=tags[(n + t) % TAGS]["id"]) for t in range(TAGS_PER_ASSET)]
+            categorizing.append(dict(asset_id=asset_id, category_id=leaves[n % len(leaves)]))
+
+    with engine.begin() as conn:
+        for model, rows in [
+            (AssetTypeModel, asset_types), (TagModel, tags), (CategoryModel, categories),
+            (PortfolioModel, portfolios), (AssetModel, assets), (AssetSnapshotModel, snapshots),
+            (TransactionModel, transactions), (PortfolioSnapshotModel, portfolio_snapshots),
+            (asset_tag, tagging), (asset_category, categorizing),
+        ]:
+            conn.execute(insert(model), rows)
+    with Session(engine) as session:
+        SQLAlchemyAssetSnapshotRepository(session).refresh_latest_values(a["id"] for a in assets)
+        session.commit()
+    with engine.begin() as conn:
+        conn.exec_driver_sql("ANALYZE")
+
+    engine.ids = SimpleNamespace(
+        portfolio=portfolios[1]["id"],
+        asset=assets[ASSETS_PER_PORTFOLIO + 1]["id"],
+        snapshot=snapshots[len(snapshots) // 2]["id"],
+        tag=tags[1]["id"],
+        root=categories[0]["id"],
+        leaf=leaves[1],
+    )
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def plan_session(plan_engine):
+    """A session whose writes are rolled back after the case."""
+    connection = plan_engine.connect()
+    transaction = connection.begin()
+    session = Session(bind=connection, autoflush=True, join_transaction_mode="create_savepoint")
+    try:
+        yield session
+    finally:
+        session.close()
+        transaction.rollback()
+        connection.close()
+
+
+def _snapshot(asset_id, day):
+    return AssetSnapshot(id=uuid4(), asset_id=UUID(asset_id), value=Decimal("1.00"),
+                         observed_at=T0 + timedelta(days=day, hours=12))
+
+
+MID = T0 + timedelta(days=SNAPSHOTS_PER_ASSET // 2)
+
+CASES = [
+    # Assets
+    ("assets.find_by_id", lambda r, i: r.assets.find_by_id(i.asset), ()),
+    ("assets.exists", lambda r, i: r.assets.exists(i.asset), ()),
+    ("assets.find_page", lambda r, i: r.assets.find_page(50, ("Asset 3.1", i.asset)), ()),
+    ("assets.find_page_in_portfolio", lambda r, i: r.assets.find_page(50, portfolio_id=i.portfolio), ()),
+    ("assets.find_summary_page", lambda r, i: r.assets.find_summary_page(50, ("Asset 3.1", i.asset)), (PAGE_SORT,)),
+    ("assets.find_summary_page_in_portfolio",
+     lambda r, i: r.assets.find_summary_page(50, portfolio_id=i.portfolio), (PAGE_SORT,)),
+    ("assets.find_existing_ids", lambda r, i: r.assets.find_existing_ids([i.asset, str(uuid4())]), ()),
+    ("assets.find_ids_by_names", lambda r, i: r.assets.find_ids_by_names(["Asset 1.1"], i.portfolio), ()),
+    ("assets.find_by_portfolio", lambda r, i: r.assets.find_by_portfolio(i.portfolio), ()),
+    ("assets.find_by_type", lambda r, i: r.assets.find_by_type("BOND"), ()),
+    ("assets.find_by_category", lambda r, i: r.assets.find_by_category(i.leaf), ()),
+    ("assets.find_by_tag", lambda r, i: r.assets.find_by_tag(i.tag), ()),
+    ("assets.find_active", lambda r, i: r.assets.find_active(i.portfolio), ()),
+    ("assets.find_disposed", lambda r, i: r.assets.find_disposed(i.portfolio), ()),
+    ("assets.find_with_snapshots", lambda r, i: r.assets.find_with_snapshots(i.asset, T0, MID), ()),
+    ("assets.add_tag", lambda r, i: r.assets.add_tag(i.asset, i.tag), ()),
+    ("assets.remove_category", lambda r, i: r.assets.remove_category(i.asset, i.leaf), ()),
+    ("assets.delete", lambda r, i: r.assets.delete(i.asset), ()),
+    # Asset snapshots
+    ("snapshots.find_by_id", lambda r, i: r.snapshots.find_by_id(i.snapshot), ()),
+    ("snapshots.get_snapshots", lambda r, i: r.snapshots.get_snapshots(UUID(i.asset), T0, MID), ()),
+    ("snapshots.get_snapshots_page",
+     lambda r, i: r.snapshots.get_snapshots_page(UUID(i.asset), 10, (MID, i.snapshot)), ()),
+    ("snapshots.iter_snapshots", lambda r, i: list(r.snapshots.iter_snapshots(UUID(i.asset), MID)), ()),
+    ("snapshots.get_series", lambda r, i: r.snapshots.get_series(UUID(i.asset), SeriesBucket.WEEK), (BUCKET_SORT,)),
+    ("snapshots.get_snapshot_series", lambda r, i: r.snapshots.get_snapshot_series(UUID(i.asset), T0, MID), ()),
+    ("snapshots.get_portfolio_snapshot_series",
+     lambda r, i: r.snapshots.get_portfolio_snapshot_series(UUID(i.portfolio), MID), (PER_ASSET_SORT,)),
+    ("snapshots.get_latest_snapshot", lambda r, i: r.snapshots.get_latest_snapshot(UUID(i.asset)), ()),
+    ("snapshots.save", lambda r, i: r.snapshots.save(_snapshot(i.asset, 100)), ()),
+    ("snapshots.save_many", lambda r, i: r.snapshots.save_many([_snapshot(i.asset, d) for d in (5, 100)]), ()),
+    ("snapshots.save_values", lambda r, i: r.snapshots.save_values(
+        [(str(uuid4()), i.asset, Decimal("1.00"), T0 + timedelta(days=d, hours=12)) for d in (5, 100)]), ()),
+    ("snapshots.delete", lambda r, i: r.snapshots.delete(i.snapshot), ()),
+    # Portfolios
+    ("portfolios.find_by_id", lambda r, i: r.portfolios.find_by_id(i.portfolio), ()),
+    ("portfolios.find_by_name", lambda r, i: r.portfolios.find_by_name("Portfolio 1"), ()),
+    ("portfolios.find_with_assets", lambda r, i: r.portfolios.find_with_assets(i.portfolio), ()),
+    ("portfolios.find_with_snapshots", lambda r, i: r.portfolios.find_with_snapshots(i.portfolio, T0, MID), ()),
+    ("portfolios.get_total_value", lambda r, i: r.portfolios.get_total_value(i.portfolio), ()),
+    ("portfolios.get_total_value_at", lambda r, i: r.portfolios.get_total_value(i.portfolio, MID), ()),
+    ("portfolios.find_summary", lambda r, i: r.portfolios.find_summary(i.portfolio), ()),
+    ("portfolios.find_all_summaries", lambda r, i: r.portfolios.find_all_summaries(), (FULL_LISTING, LISTING_SORT)),
+    ("portfolios.count_assets", lambda r, i: r.portfolios.count_assets(i.portfolio), ()),
+    # Portfolio snapshots
+    ("portfolio_snapshots.get_snapshots",
+     lambda r, i: r.portfolio_snapshots.get_snapshots(UUID(i.portfolio), T0, MID), ()),
+    ("portfolio_snapshots.get_snapshots_page",
+     lambda r, i: r.portfolio_snapshots.get_snapshots_page(UUID(i.portfolio), 10, (MID, str(uuid4()))), ()),
+    ("portfolio_snapshots.iter_snapshots",
+     lambda r, i: list(r.portfolio_snapshots.iter_snapshots(UUID(i.portfolio))), ()),
+    ("portfolio_snapshots.get_series",
+     lambda r, i: r.portfolio_snapshots.get_series(UUID(i.portfolio), SeriesBucket.MONTH), (BUCKET_SORT,)),
+    ("portfolio_snapshots.get_latest_snapshot",
+     lambda r, i: r.portfolio_snapshots.get_latest_snapshot(UUID(i.portfolio)), ()),
+    # Transactions
+    ("transactions.find_by_asset", lambda r, i: r.transactions.find_by_asset(i.asset), ()),
+    ("transactions.find_between_dates", lambda r, i: r.transactions.find_between_dates(T0, T0 + timedelta(days=1)), ()),
+    ("transactions.iter_by_asset", lambda r, i: list(r.transactions.iter_by_asset(UUID(i.asset), T0, MID)), ()),
+    # Labels and reference data
+    ("asset_types.find_by_code", lambda r, i: r.asset_types.find_by_code("BOND"), ()),
+    ("asset_types.find_all_codes", lambda r, i: r.asset_types.find_all_codes(), (FULL_LISTING,)),
+    ("tags.find_by_name", lambda r, i: r.tags.find_by_name("tag-01"), ()),
+    ("tags.find_page", lambda r, i: r.tags.find_page(10, ("tag-01", i.tag)), ()),
+    ("tags.find_by_asset", lambda r, i: r.tags.find_by_asset(i.asset), ()),
+    ("tags.detach_from_asset", lambda r, i: r.tags.detach_from_asset(i.asset, i.tag), ()),
+    ("tags.delete", lambda r, i: r.tags.delete(i.tag), ()),
+    ("categories.find_by_name", lambda r, i: r.categories.find_by_name("category-2-1"), ()),
+    ("categories.find_page", lambda r, i: r.categories.find_page(10, ("category-1-0", i.leaf)), ()),
+    ("categories.find_by_asset", lambda r, i: r.categories.find_by_asset(i.asset), ()),
+    ("categories.find_children", lambda r, i: r.categories.find_children(i.root), ()),
+    ("categories.count_assets", lambda r, i: r.categories.count_assets(i.leaf), ()),
+    ("categories.attach_to_asset", lambda r, i: r.categories.attach_to_asset(i.asset, i.root), ()),
+    ("categories.detach_from_asset", lambda r, i: r.categories.detach_from_asset(i.asset, i.leaf), ()),
+    ("categories.delete", lambda r, i: r.categories.delete(i.leaf), ()),
+]
+
+
+@pytest.mark.parametrize("call, allowed", [
+    pytest.param(call, allowed, id=name) for name, call, allowed in CASES
+])
+def test_repository_query_uses_indexes(plan_engine, plan_session, call, allowed):
+    repos = SimpleNamespace(
+        assets=SQLAlchemyAssetRepository(plan_session),
+        snapshots=SQLAlchemyAssetSnapshotRepository(plan_session),
+        asset_types=SQLAlchemyAssetTypeRepository(plan_session),
+        categories=SQLAlchemyCategoryRepository(plan_session),
+        portfolios=SQLAlchemyPortfolioRepository(plan_session),
+        portfolio_snapshots=SQLAlchemyPortfolioSnapshotRepository(plan_session),
+        tags=SQLAlchemyTagRepository(plan_session),
+        transactions=SQLAlchemyTransactionRepository(plan_session),
+    )
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if not executemany and statement.lstrip().upper().startswith(("SELECT", "WITH", "INSERT", "UPDATE", "DELETE")):
+            statements.append((statement, parameters))
+
+    event.listen(plan_engine, "before_cursor_execute", capture)
+    try:
+        call(repos, plan_engine.ids)
+        plan_session.flush()
+    finally:
+        event.remove(plan_engine, "before_cursor_execute", capture)
+
+    assert statements
+    cursor = plan_session.connection().connection.dbapi_connection
+    for statement, parameters in statements:
+        plan = [row[3] for row in cursor.execute("EXPLAIN QUERY PLAN " + statement, parameters)]
+        violations = [v for v in _violations(plan) if not any(v.startswith(a) for a in allowed)]
+        assert not violations, f"{' '.join(statement.split())}\n" + "\n".join(plan)
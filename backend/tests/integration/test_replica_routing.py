@@ -0,0 +1,91 @@
+"""
+Integration test: read/write routing between a primary and a replica.
+
+Two SQLite files stand in for the primary and its replica. Replication is
+simulated by copying the primary over the replica, so until then the
+replica lags behind and every read it serves shows it.
+"""
+import shutil
+from uuid import uuid4
+
+import pytest
+from fastapi import Request
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import app.adapters.outgoing.persistence.models  # noqa: F401
+from app.adapters.incoming.api.dependencies.assets import get_db_session as assets_get_db_session
+from app.adapters.incoming.api.dependencies.portfolios import get_db_session as portfolios_get_db_session
+from app.adapters.outgoing.persistence.database import READ_ONLY_METHODS, Base
+from app.adapters.outgoing.persistence.models.asset_type import AssetTypeModel
+from app.adapters.outgoing.persistence.routing import RoutingSession
+from app.main import app as fastapi_app
+
+
+@pytest.fixture
+def replicated(tmp_path):
+    primary_path, replica_path = tmp_path / "primary.db", tmp_path / "replica.db"
+    primary = create_engine(f"sqlite:///{primary_path}")
+    replica = create_engine(f"sqlite:///{replica_path}")
+    Base.metadata.create_all(primary)
+    asset_type_id = str(uuid4())
+    with sessionmaker(bind=primary)() as session:
+        session.add(AssetTypeModel(id=asset_type_id, code="REPLICA", label="Replica"))
+        session.commit()
+
+    def replicate():
+        replica.dispose()
+        shutil.copyfile(primary_path, replica_path)
+
+    replicate()
+    Session = sessionmaker(class_=RoutingSession, primary=primary, replica=replica, autoflush=False)
+
+    def override_get_db(request: Request):
+        session = Session(read_only=request.method in READ_ONLY_METHODS)
+        try:
+            yield session
+            session.commit()
+        finally:
+            session.close()
+
+    fastapi_app.dependency_overrides[assets_get_db_session] = override_get_db
+    fastapi_app.dependency_overrides[portfolios_get_db_session] = override_get_db
+    yield TestClient(fastapi_app), asset_type_id, replicate
+    fastapi_app.dependency_overrides.clear()
+    primary.dispose()
+    replica.dispose()
+
+
+def test_reads_are_served_by_the_replica(replicated):
+    client, _, replicate = replicated
+    portfolio_id = client.post("/api/v1/portfolios/", json={"name": "Replicated"}).json()["id"]
+
+    # Not replicated yet
+    assert client.get(f"/api/v1/portfolios/{portfolio_id}").status_code == 404
+    replicate()
+    assert client.get(f"/api/v1/portfolios/{portfolio_id}").json()["name"] == "Replicated"
+
+
+def test_write_requests_read_from_the_primary(replicated):
+    client, asset_type_id, replicate = replicated
+    portfolio_id = client.post("/api/v1/portfolios/", json={"name": "Fresh"}).json()["id"]
+
+    # The asset's portfolio only exists on the primary, which the write request reads
+    resp = client.post("/api/v1/assets/", json={
+        "name": "Fresh Asset",
+        "portfolio_id": portfolio_id,
+        "asset_type_id": asset_type_id,
+        "created_by": "test",
+    })
+    assert resp.status_code == 201
+    asset_id = resp.json()["id"]
+
+    resp = client.post(f"/api/v1/assets/{asset_id}/snapshots", json={
+        "value": "10.00", "observed_at": "2024-01-01T00:00:00Z",
+    })
+    assert resp.status_code == 201
+
+    assert client.get(f"/api/v1/assets/{asset_id}").status_code == 404
+    replicate()
+    assert client.get(f"/api/v1/assets/{asset_id}/snapshots").json()[0]["value"] == "10.00"
@@ -0,0 +1,99 @@
+"""
+Integration test: bucketed snapshot series (GET .../snapshots/series), aggregated in SQL.
+"""
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+
+from app.adapters.outgoing.persistence.models.portfolio_snapshot import PortfolioSnapshotModel
+
+# Monday
+T0 = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def asset_with_history(integration_client, seeded_portfolio, seeded_asset_type):
+    resp = integration_client.post("/api/v1/assets/", json={
+        "name": "Series Asset",
+        "portfolio_id": seeded_portfolio["id"],
+        "asset_type_id": seeded_asset_type.id,
+        "created_by": "test",
+    })
+    assert resp.status_code == 201
+    asset_id = resp.json()["id"]
+    # Two snapshots a day, 12h apart, from Mon 1 Jan to Wed 10 Jan (values 1..20)
+    rows = [
+        {"asset_id": asset_id, "value": f"{i + 1}.00", "observed_at": (T0 + timedelta(hours=12 * i)).isoformat()}
+        for i in range(20)
+    ]
+    assert integration_client.post("/api/v1/snapshots:bulk", json={"snapshots": rows}).status_code == 200
+    return asset_id
+
+
+def test_asset_series_daily_last(integration_client, asset_with_history):
+    resp = integration_client.get(f"/api/v1/assets/{asset_with_history}/snapshots/series")
+
+    assert resp.status_code == 200
+    points = resp.json()
+    assert len(points) == 10
+    assert points[0] == {"period_start": "2024-01-01T00:00:00Z", "count": 2, "value": "2.00"}
+    assert points[-1]["value"] == "20.00"
+
+
+def test_asset_series_weekly_ohlc(integration_client, asset_with_history):
+    resp = integration_client.get(
+        f"/api/v1/assets/{asset_with_history}/snapshots/series", params={"bucket": "week", "agg": "ohlc"}
+    )
+
+    assert resp.status_code == 200
+    assert resp.json() == [
+        {"period_start": "2024-01-01T00:00:00Z", "count": 14,
+         "open": "1.00", "high": "14.00", "low": "1.00", "close": "14.00"},
+        {"period_start": "2024-01-08T00:00:00Z", "count": 6,
+         "open": "15.00", "high": "20.00", "low": "15.00", "close": "20.00"},
+    ]
+
+
+def test_asset_series_monthly_avg_in_range(integration_client, asset_with_history):
+    resp = integration_client.get(
+        f"/api/v1/assets/{asset_with_history}/snapshots/series",
+        params={"bucket": "month", "agg": "avg", "start_date": "2024-01-06T00:00:00Z"},
+    )
+
+    assert resp.status_code == 200
+    # Values 11..20
+    assert resp.json() == [{"period_start": "2024-01-01T00:00:00Z", "count": 10, "value": "15.50"}]
+
+
+def test_asset_series_unknown_asset(integration_client):
+    resp = integration_client.get(f"/api/v1/assets/{uuid4()}/snapshots/series")
+    assert resp.status_code == 404
+
+
+def test_asset_series_rejects_unknown_bucket(integration_client, asset_with_history):
+    resp = integration_client.get(f"/api/v1/assets/{asset_with_history}/snapshots/series", params={"bucket": "hour"})
+    assert resp.status_code == 422
+
+
+def test_portfolio_series_monthly(integration_client, integration_session, seeded_portfolio):
+    for day, value in ((0, "100.00"), (15, "300.00"), (40, "50.00")):
+        integration_session.add(PortfolioSnapshotModel(
+            id=str(uuid4()), portfolio_id=seeded_portfolio["id"], value=value, observed_at=T0 + timedelta(days=day)
+        ))
+    integration_session.flush()
+
+    resp = integration_client.get(
+        f"/api/v1/portfolios/{seeded_portfolio['id']}/snapshots/series", params={"bucket": "month", "agg": "avg"}
+    )
+
+    assert resp.status_code == 200
+    assert resp.json() == [
+        {"period_start": "2024-01-01T00:00:00Z", "count": 2, "value": "200.00"},
+        {"period_start": "2024-02-01T00:00:00Z", "count": 1, "value": "50.00"},
+    ]
+
+
+def test_portfolio_series_unknown_portfolio(integration_client):
+    resp = integration_client.get(f"/api/v1/portfolios/{uuid4()}/snapshots/series")
+    assert resp.status_code == 404
@@ -20,3 +20,14 @@ def test_get_asset_repository_returns_object():
     repo = assets_deps.get_asset_repository()
     assert repo is not None
 
+
+
+def test_get_db_session_routes_by_http_method():
+    from types import SimpleNamespace
+    from app.adapters.outgoing.persistence import database
+
+    for method, engine in (("GET", database.engine), ("POST", database.write_engine), ("DELETE", database.write_engine)):
+        gen = assets_deps.get_db_session(SimpleNamespace(method=method))
+        session = next(gen)
+        assert session.get_bind() is engine
+        gen.close()
@@ -3,13 +3,14 @@ from unittest.mock import MagicMock
 from fastapi.testclient import TestClient
 
 from app.main import app
+from app.application.pagination import Page
 from app.adapters.incoming.api.dependencies.assets import get_all_assets_use_case, get_asset_use_case
 from app.domain.exceptions import AssetNotFound
 
 
 def test_get_all_assets():
     mock_use_case = MagicMock()
-    mock_use_case.execute.return_value = []
+    mock_use_case.execute.return_value = Page(items=[])
     app.dependency_overrides[get_all_assets_use_case] = lambda: mock_use_case
     client = TestClient(app)
     try:
@@ -5,6 +5,7 @@ from uuid import uuid4
 from fastapi.testclient import TestClient
 
 from app.main import app
+from app.application.pagination import Page
 from app.adapters.incoming.api.dependencies.categories import (
     get_all_categories_use_case,
     create_category_use_case,
@@ -12,7 +13,7 @@ from app.adapters.incoming.api.dependencies.categories import (
     delete_category_use_case,
 )
 from app.domain.entities.category import Category
-from app.domain.exceptions import CategoryNotFound, CategoryHasChildren, DuplicateName
+from app.domain.exceptions import CategoryNotFound, CategoryHasChildren
 
 
 def make_category(name="Test"):
@@ -21,7 +22,7 @@ def make_category(name="Test"):
 
 def test_get_all_categories():
     mock_use_case = MagicMock()
-    mock_use_case.execute.return_value = []
+    mock_use_case.execute.return_value = Page(items=[])
     app.dependency_overrides[get_all_categories_use_case] = lambda: mock_use_case
     client = TestClient(app)
     try:
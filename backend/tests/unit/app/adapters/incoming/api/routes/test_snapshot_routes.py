@@ -0,0 +1,34 @@
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.adapters.incoming.api.dependencies.asset_snapshots import bulk_create_asset_snapshots_use_case
+from app.application.use_cases.asset_snapshot.bulk_create_asset_snapshots import (
+    BulkSnapshotError,
+    BulkSnapshotResult,
+)
+
+
+def test_bulk_create_snapshots_returns_report():
+    asset_id = uuid4()
+    mock_use_case = MagicMock()
+    mock_use_case.execute.return_value = BulkSnapshotResult(
+        created=1,
+        errors=[BulkSnapshotError(index=1, asset_id=asset_id, code="ASSET_NOT_FOUND", message="missing")],
+    )
+    app.dependency_overrides[bulk_create_asset_snapshots_use_case] = lambda: mock_use_case
+    client = TestClient(app)
+    try:
+        resp = client.post('/api/v1/snapshots:bulk', json={"snapshots": [
+            {"asset_id": str(uuid4()), "value": "1.00"},
+            {"asset_id": str(asset_id), "value": "2.00"},
+        ]})
+        assert resp.status_code == 200
+        assert resp.json()["created"] == 1
+        assert resp.json()["errors"][0]["index"] == 1
+        items = mock_use_case.execute.call_args.args[0]
+        assert [str(i.asset_id) for i in items][1] == str(asset_id)
+    finally:
+        app.dependency_overrides.clear()
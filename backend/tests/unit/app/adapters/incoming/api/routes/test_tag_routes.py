@@ -5,6 +5,7 @@ from uuid import uuid4
 from fastapi.testclient import TestClient
 
 from app.main import app
+from app.application.pagination import Page
 from app.adapters.incoming.api.dependencies.tags import (
     get_all_tags_use_case,
     create_tag_use_case,
@@ -22,7 +23,7 @@ def make_tag(name="test-tag"):
 
 def test_get_all_tags():
     mock_use_case = MagicMock()
-    mock_use_case.execute.return_value = []
+    mock_use_case.execute.return_value = Page(items=[])
     app.dependency_overrides[get_all_tags_use_case] = lambda: mock_use_case
     client = TestClient(app)
     try:
@@ -0,0 +1,146 @@
+"""Tests for the Prometheus metrics adapter."""
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from fastapi import APIRouter, Depends, FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+from app.adapters.incoming.api.metrics import REGISTRY, counted, observe_engine
+from app.application.use_cases.portfolio.create_portfolio import CreatePortfolioUseCase
+
+
+def _sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def test_requests_are_observed_under_their_route_template(app_client):
+    root = dict(method="GET", route="/", status="200")
+    unmatched = dict(method="GET", route="unmatched", status="404")
+    before = (_sample("strata_http_request_duration_seconds_count", **root),
+              _sample("strata_http_request_duration_seconds_count", **unmatched))
+
+    app_client.get("/")
+    app_client.get(f"/no-such-path/{uuid4()}")
+
+    assert _sample("strata_http_request_duration_seconds_count", **root) == before[0] + 1
+    assert _sample("strata_http_request_duration_seconds_count", **unmatched) == before[1] + 1
+    assert _sample("strata_http_requests_in_progress") == 0
+
+
+def test_metrics_endpoint_serves_the_text_format(app_client):
+    resp = app_client.get("/metrics")
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/plain")
+    assert "# TYPE strata_http_request_duration_seconds histogram" in resp.text
+    assert "# TYPE strata_use_case_executions_total counter" in resp.text
+    assert "_created" not in resp.text
+
+
+class EchoUseCase:
+    def execute(self, value):
+        if value < 0:
+            raise ValueError("negative")
+        return value
+
+
+def offset() -> int:
+    return 0
+
+
+@counted
+def echo_use_case(start: int = Depends(offset)) -> EchoUseCase:
+    return EchoUseCase()
+
+
+def _echo_client():
+    router = APIRouter()
+
+    @router.get("/echo/{value}")
+    def echo(value: int, use_case: EchoUseCase = Depends(echo_use_case)):
+        return use_case.execute(value)
+
+    app = FastAPI()
+    app.include_router(router)
+    return app, TestClient(app, raise_server_exceptions=False)
+
+
+def test_use_case_executions_are_counted_by_outcome():
+    success = dict(use_case="EchoUseCase", outcome="success")
+    error = dict(use_case="EchoUseCase", outcome="error")
+    before = (_sample("strata_use_case_executions_total", **success),
+              _sample("strata_use_case_executions_total", **error))
+    _, client = _echo_client()
+
+    assert client.get("/echo/1").json() == 1
+    assert client.get("/echo/-1").status_code == 500
+
+    assert _sample("strata_use_case_executions_total", **success) == before[0] + 1
+    assert _sample("strata_use_case_executions_total", **error) == before[1] + 1
+
+
+def test_counted_providers_keep_their_dependencies():
+    app, client = _echo_client()
+    calls = []
+    app.dependency_overrides[offset] = lambda: calls.append(1) or 0
+
+    assert client.get("/echo/1").json() == 1
+    assert calls == [1]
+
+
+class AsyncEchoUseCase:
+    async def execute(self, value):
+        if value < 0:
+            raise ValueError("negative")
+        return value
+
+
+def test_async_use_case_executions_are_counted_when_awaited():
+    success = dict(use_case="AsyncEchoUseCase", outcome="success")
+    error = dict(use_case="AsyncEchoUseCase", outcome="error")
+    before = (_sample("strata_use_case_executions_total", **success),
+              _sample("strata_use_case_executions_total", **error))
+    use_case = counted(AsyncEchoUseCase)()
+
+    async def run():
+        pending = use_case.execute(1)
+        assert _sample("strata_use_case_executions_total", **success) == before[0]
+        assert await pending == 1
+        with pytest.raises(ValueError):
+            await use_case.execute(-1)
+
+    asyncio.run(run())
+    assert _sample("strata_use_case_executions_total", **success) == before[0] + 1
+    assert _sample("strata_use_case_executions_total", **error) == before[1] + 1
+
+
+def test_counted_use_cases_keep_their_class():
+    assert isinstance(echo_use_case(), EchoUseCase)
+
+
+def test_use_case_classes_are_left_untouched(app_client):
+    # Importing the app (conftest does) counts executions without wrapping the classes
+    assert CreatePortfolioUseCase.execute.__qualname__ == "CreatePortfolioUseCase.execute"
+    assert not hasattr(CreatePortfolioUseCase.execute, "__wrapped__")
+
+
+def test_engine_statements_and_pool_are_observed(tmp_path):
+    engine = observe_engine(create_engine(f"sqlite:///{tmp_path / 'metrics.db'}"), "unit")
+
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        conn.execute(text("SELECT 2"))
+        assert _sample("strata_db_pool_checked_out", engine="unit") == 1
+    conn = engine.connect()
+    conn.exec_driver_sql("CREATE TABLE t (id INTEGER)")
+    conn.close()
+
+    assert _sample("strata_db_query_duration_seconds_count", engine="unit", operation="select") == 2
+    assert _sample("strata_db_query_duration_seconds_count", engine="unit", operation="other") == 1
+    assert _sample("strata_db_pool_checkouts_total", engine="unit") == 2
+    assert _sample("strata_db_pool_checked_out", engine="unit") == 0
+    assert _sample("strata_db_pool_size", engine="unit") == 5
+    engine.dispose()
@@ -3,12 +3,18 @@ from datetime import datetime, timezone
 from decimal import Decimal
 from uuid import uuid4
 
+import json
+
+from app.application.pagination import Page
 from app.adapters.incoming.api.mappers.api_mapper import ApiMapper
+from app.adapters.incoming.api.schemas.asset_response import AssetResponse
+from app.adapters.incoming.api.schemas.series_response import SeriesAggregate
 from app.domain.entities.asset import Asset
 from app.domain.entities.asset_snapshot import AssetSnapshot
 from app.domain.entities.asset_type import AssetType
 from app.domain.entities.portfolio import Portfolio
 from app.domain.entities.portfolio_snapshot import PortfolioSnapshot
+from app.domain.entities.value_series import SeriesPoint
 
 
 def _now():
@@ -59,3 +65,40 @@ def test_to_asset_snapshot_response_list():
     ]
     result = ApiMapper.to_asset_snapshot_response_list(snaps)
     assert len(result) == 2
+
+
+def test_to_series_response_list_projects_requested_aggregate():
+    point = SeriesPoint(
+        period_start=_now(), open=Decimal("1"), high=Decimal("4"), low=Decimal("1"),
+        close=Decimal("3"), average=Decimal("2.50"), count=4,
+    )
+
+    (last,) = ApiMapper.to_series_response_list([point], SeriesAggregate.LAST)
+    (avg,) = ApiMapper.to_series_response_list([point], SeriesAggregate.AVG)
+    (ohlc,) = ApiMapper.to_series_response_list([point], SeriesAggregate.OHLC)
+
+    assert (last.value, last.open) == (Decimal("3"), None)
+    assert avg.value == Decimal("2.50")
+    assert (ohlc.open, ohlc.high, ohlc.low, ohlc.close, ohlc.value) == (1, 4, 1, 3, None)
+    assert ohlc.count == 4
+
+
+def test_to_asset_summary_page_response_renders_asset_response_json():
+    asset = Asset(
+        id=uuid4(), name="A", quantity=Decimal("1.50000000"),
+        asset_type=AssetType(id=uuid4(), code="EQ", label="Equity"),
+        portfolio=make_portfolio(),
+        created_at=_now(), updated_at=_now(),
+        created_by="u", updated_by="u",
+    )
+    summary = {
+        "id": str(asset.id), "name": asset.name, "disposed": False, "quantity": asset.quantity,
+        "created_at": asset.created_at, "updated_at": asset.updated_at,
+        "asset_type": {"code": "EQ", "label": "Equity"},
+        "portfolio": {"id": str(asset.portfolio.id), "name": asset.portfolio.name},
+        "tags": [], "categories": [],
+    }
+    response = ApiMapper.to_asset_summary_page_response(Page(items=[summary], next_cursor="abc"))
+    assert response.media_type == "application/json"
+    assert response.headers["X-Next-Cursor"] == "abc"
+    assert json.loads(response.body) == [AssetResponse.model_validate(asset).model_dump(mode="json")]
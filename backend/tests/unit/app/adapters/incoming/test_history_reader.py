@@ -0,0 +1,76 @@
+"""Unit tests for the streaming CSV/NDJSON history readers."""
+import csv
+import io
+from pathlib import Path
+
+import pytest
+
+from app.adapters.incoming.importers.history_reader import ImportFormat, read_records
+
+
+def test_read_csv_records_with_line_numbers():
+    data = b"\xef\xbb\xbfasset,value,observed_at\nSavings,10.00,2024-01-01\nStocks,20.50,2024-01-02\n"
+    records = list(read_records(io.BytesIO(data), ImportFormat.CSV))
+    assert records == [
+        (2, {"asset": "Savings", "value": "10.00", "observed_at": "2024-01-01"}),
+        (3, {"asset": "Stocks", "value": "20.50", "observed_at": "2024-01-02"}),
+    ]
+
+
+def test_read_csv_ignores_extra_cells():
+    data = b"asset,value\nSavings,10.00,unexpected\n"
+    assert list(read_records(io.BytesIO(data), ImportFormat.CSV)) == [(2, {"asset": "Savings", "value": "10.00"})]
+
+
+def test_read_csv_flags_undecodable_and_malformed_rows():
+    data = (
+        b'asset,value\nSavings,1\nSt\xf6cks,2\n"Multi\nline \xff",3\n'
+        + b"x" * 32 + b",4\nBonds,5\n"
+    )
+    limit = csv.field_size_limit(16)
+    try:
+        records = list(read_records(io.BytesIO(data), ImportFormat.CSV))
+    finally:
+        csv.field_size_limit(limit)
+    assert records == [
+        (2, {"asset": "Savings", "value": "1"}),
+        (3, None),
+        (5, None),
+        (6, None),
+        (7, {"asset": "Bonds", "value": "5"}),
+    ]
+
+
+def test_read_ndjson_skips_blank_lines_and_flags_malformed_ones():
+    data = (
+        b'{"asset": "Savings", "value": "1"}\n\nnot json\n[1, 2]\n{"asset": "St\xf6cks", "value": 2}\n'
+        b'{"asset": "Stocks", "value": 2}\n'
+    )
+    records = list(read_records(io.BytesIO(data), ImportFormat.NDJSON))
+    assert records == [
+        (1, {"asset": "Savings", "value": "1"}),
+        (3, None),
+        (4, None),
+        (5, None),
+        (6, {"asset": "Stocks", "value": 2}),
+    ]
+
+
+def test_read_records_leaves_stream_open():
+    stream = io.BytesIO(b"asset,value\nSavings,1\n")
+    list(read_records(stream, ImportFormat.CSV))
+    assert not stream.closed
+
+
+@pytest.mark.parametrize("name, expected", [
+    ("history.csv", ImportFormat.CSV),
+    ("history.NDJSON", ImportFormat.NDJSON),
+    ("history.jsonl", ImportFormat.NDJSON),
+])
+def test_format_from_path(name, expected):
+    assert ImportFormat.from_path(Path(name)) is expected
+
+
+def test_format_from_path_unknown_extension():
+    with pytest.raises(ValueError):
+        ImportFormat.from_path(Path("history.xlsx"))
@@ -0,0 +1,57 @@
+"""Unit tests for the streaming CSV/NDJSON history writers."""
+import json
+from datetime import datetime, timezone
+from decimal import Decimal
+from uuid import uuid4
+
+from app.adapters.incoming.exporters import history_writer
+from app.adapters.incoming.exporters.history_writer import ExportFormat, write_records
+from app.domain.entities.asset_snapshot import AssetSnapshot
+
+FIELDS = ["id", "asset_id", "value", "observed_at"]
+
+
+def _snapshots(count):
+    asset_id = uuid4()
+    return [
+        AssetSnapshot(
+            id=uuid4(),
+            asset_id=asset_id,
+            value=Decimal(f"{i}.10"),
+            observed_at=datetime(2024, 1, 1 + i, tzinfo=timezone.utc),
+        )
+        for i in range(count)
+    ]
+
+
+def test_write_ndjson_keeps_exact_amounts():
+    snapshots = _snapshots(2)
+    body = b"".join(write_records(iter(snapshots), FIELDS, ExportFormat.NDJSON)).decode()
+    rows = [json.loads(line) for line in body.splitlines()]
+    assert rows[1] == {
+        "id": str(snapshots[1].id),
+        "asset_id": str(snapshots[1].asset_id),
+        "value": "1.10",
+        "observed_at": "2024-01-02T00:00:00+00:00",
+    }
+
+
+def test_write_csv_starts_with_header():
+    body = b"".join(write_records(iter(_snapshots(1)), FIELDS, ExportFormat.CSV)).decode()
+    header, row = body.splitlines()
+    assert header == "id,asset_id,value,observed_at"
+    assert row.endswith(",0.10,2024-01-01T00:00:00+00:00")
+
+
+def test_write_csv_of_nothing_is_just_the_header():
+    assert b"".join(write_records(iter([]), FIELDS, ExportFormat.CSV)) == b"id,asset_id,value,observed_at\n"
+    assert list(write_records(iter([]), FIELDS, ExportFormat.NDJSON)) == []
+
+
+def test_writers_emit_bounded_chunks(monkeypatch):
+    monkeypatch.setattr(history_writer, "ROWS_PER_CHUNK", 2)
+    ndjson = list(write_records(iter(_snapshots(5)), FIELDS, ExportFormat.NDJSON))
+    csv_chunks = list(write_records(iter(_snapshots(5)), FIELDS, ExportFormat.CSV))
+    assert [chunk.count(b"\n") for chunk in ndjson] == [2, 2, 1]
+    # Header travels with the first chunk
+    assert [chunk.count(b"\n") for chunk in csv_chunks] == [3, 2, 1]
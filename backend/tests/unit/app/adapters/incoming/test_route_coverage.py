@@ -7,6 +7,7 @@ from uuid import uuid4
 from fastapi.testclient import TestClient
 
 from app.main import app
+from app.application.pagination import Page
 
 
 def _now():
@@ -36,15 +37,16 @@ def make_mock_snapshot():
     return s
 
 
-def make_mock_portfolio():
-    p = MagicMock()
-    p.id = uuid4()
-    p.name = "P"
-    p.base_currency = "EUR"
-    p.created_at = _now()
-    p.updated_at = _now()
-    p.total_value = MagicMock(return_value=Decimal("0"))
-    return p
+def make_mock_portfolio_summary():
+    s = MagicMock()
+    s.id = uuid4()
+    s.name = "P"
+    s.base_currency = "EUR"
+    s.asset_count = 0
+    s.total_value = Decimal("0")
+    s.created_at = _now()
+    s.updated_at = _now()
+    return s
 
 
 def make_mock_portfolio_snapshot():
@@ -75,7 +77,7 @@ class TestAssetRouteCoverage:
     def test_get_all_assets_with_portfolio_filter(self):
         from app.adapters.incoming.api.dependencies.assets import get_assets_by_portfolio_use_case
         mock_uc = MagicMock()
-        mock_uc.execute.return_value = []
+        mock_uc.execute.return_value = Page(items=[])
         app.dependency_overrides[get_assets_by_portfolio_use_case] = lambda: mock_uc
         try:
             client = TestClient(app)
@@ -100,7 +102,7 @@ class TestAssetRouteCoverage:
         from app.adapters.incoming.api.dependencies.asset_snapshots import get_asset_snapshots_use_case
         mock_uc = MagicMock()
         snap = make_mock_snapshot()
-        mock_uc.execute.return_value = [snap]
+        mock_uc.execute.return_value = Page(items=[snap])
         app.dependency_overrides[get_asset_snapshots_use_case] = lambda: mock_uc
         try:
             client = TestClient(app)
@@ -162,9 +164,7 @@ class TestPortfolioRouteCoverage:
     def test_get_portfolio_snapshots_success(self):
         from app.adapters.incoming.api.dependencies.portfolios import get_portfolio_snapshots_use_case
         mock_uc = MagicMock()
-        mock_portfolio = make_mock_portfolio()
-        mock_portfolio.snapshots = [make_mock_portfolio_snapshot()]
-        mock_uc.execute.return_value = mock_portfolio
+        mock_uc.execute.return_value = Page(items=[make_mock_portfolio_snapshot()])
         app.dependency_overrides[get_portfolio_snapshots_use_case] = lambda: mock_uc
         try:
             client = TestClient(app)
@@ -176,7 +176,7 @@ class TestPortfolioRouteCoverage:
     def test_get_all_portfolios_success(self):
         from app.adapters.incoming.api.dependencies.portfolios import get_all_portfolios_use_case
         mock_uc = MagicMock()
-        mock_uc.execute.return_value = [make_mock_portfolio()]
+        mock_uc.execute.return_value = [make_mock_portfolio_summary()]
         app.dependency_overrides[get_all_portfolios_use_case] = lambda: mock_uc
         try:
             client = TestClient(app)
@@ -229,7 +229,7 @@ class TestCategoryRouteCoverage:
     def test_get_all_categories_success(self):
         from app.adapters.incoming.api.dependencies.categories import get_all_categories_use_case
         mock_uc = MagicMock()
-        mock_uc.execute.return_value = []
+        mock_uc.execute.return_value = Page(items=[])
         app.dependency_overrides[get_all_categories_use_case] = lambda: mock_uc
         try:
             client = TestClient(app)
@@ -267,7 +267,7 @@ class TestTagRouteCoverage:
     def test_get_all_tags_success(self):
         from app.adapters.incoming.api.dependencies.tags import get_all_tags_use_case
         mock_uc = MagicMock()
-        mock_uc.execute.return_value = [make_mock_tag()]
+        mock_uc.execute.return_value = Page(items=[make_mock_tag()])
         app.dependency_overrides[get_all_tags_use_case] = lambda: mock_uc
         try:
             client = TestClient(app)
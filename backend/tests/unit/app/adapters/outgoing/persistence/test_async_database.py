@@ -0,0 +1,20 @@
+"""Tests for async_database.py."""
+import pytest
+
+from app.adapters.outgoing.persistence.async_database import to_async_url
+
+
+@pytest.mark.parametrize("url, expected", [
+    ("sqlite:////app/.data/strata.db", "sqlite+aiosqlite:////app/.data/strata.db"),
+    ("sqlite+pysqlite:///strata.db", "sqlite+aiosqlite:///strata.db"),
+    ("postgresql://user:pw@db:5432/strata", "postgresql+asyncpg://user:pw@db:5432/strata"),
+    ("postgresql+psycopg2://db/strata", "postgresql+asyncpg://db/strata"),
+])
+def test_to_async_url(url, expected):
+    assert to_async_url(url) == expected
+
+
+@pytest.mark.parametrize("url", ["mysql://db/strata", "strata.db"])
+def test_to_async_url_rejects_unsupported(url):
+    with pytest.raises(ValueError, match="No async driver"):
+        to_async_url(url)
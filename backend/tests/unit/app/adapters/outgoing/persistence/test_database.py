@@ -62,3 +62,59 @@ def test_database_invalid_sqlite_raises_value_error():
         os.environ["DATABASE_URL"] = restore_url
         importlib.reload(db_module)
         os.environ.pop("DATABASE_URL", None)
+
+
+def test_open_session_routes_writes_to_the_writer_engine():
+    from app.adapters.outgoing.persistence import database
+
+    with database.open_session(read_only=True) as reader, database.open_session(read_only=False) as writer:
+        assert reader.get_bind() is database.engine
+        assert writer.get_bind() is database.write_engine
+
+
+def test_database_legacy_sqlite_profile_writes_through_main_engine(monkeypatch):
+    import app.adapters.outgoing.persistence.database as db_module
+
+    monkeypatch.setenv("SQLITE_PROFILE", "legacy")
+    try:
+        importlib.reload(db_module)
+        assert db_module.SQLITE_PROFILE is None
+        assert db_module.write_engine is db_module.engine
+    finally:
+        monkeypatch.delenv("SQLITE_PROFILE")
+        importlib.reload(db_module)
+
+
+def test_database_postgres_url_uses_pool_settings(monkeypatch):
+    import app.adapters.outgoing.persistence.database as db_module
+
+    monkeypatch.setenv("DATABASE_URL", "postgres://strata@db.internal:5432/strata")
+    monkeypatch.setenv("DB_POOL_SIZE", "3")
+    monkeypatch.setenv("DB_POOL_RECYCLE", "600")
+    try:
+        importlib.reload(db_module)
+        # No connection is opened: engines connect lazily
+        assert db_module.DATABASE_URL == "postgresql://strata@db.internal:5432/strata"
+        assert db_module.SQLITE_PROFILE is None
+        assert db_module.write_engine is db_module.engine
+        pool = db_module.engine.pool
+        assert (pool.size(), pool._recycle, pool._pre_ping) == (3, 600, True)
+    finally:
+        for var in ("DATABASE_URL", "DB_POOL_SIZE", "DB_POOL_RECYCLE"):
+            monkeypatch.delenv(var)
+        importlib.reload(db_module)
+
+
+def test_database_replica_url_routes_reads_to_the_replica(monkeypatch, tmp_path):
+    import app.adapters.outgoing.persistence.database as db_module
+
+    monkeypatch.setenv("DATABASE_REPLICA_URL", f"sqlite:///{tmp_path / 'replica.db'}")
+    try:
+        importlib.reload(db_module)
+        assert db_module.replica_engine is not db_module.engine
+        with db_module.open_session(read_only=True) as reader, db_module.open_session(read_only=False) as writer:
+            assert reader.get_bind() is db_module.replica_engine
+            assert writer.get_bind() is db_module.write_engine
+    finally:
+        monkeypatch.delenv("DATABASE_REPLICA_URL")
+        importlib.reload(db_module)
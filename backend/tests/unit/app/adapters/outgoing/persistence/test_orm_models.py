@@ -80,3 +80,12 @@ def test_generate_uuid():
     result = generate_uuid()
     assert isinstance(result, str)
     assert len(result) == 36
+
+
+def test_ids_are_native_uuid_on_postgresql_only():
+    from sqlalchemy.dialects import postgresql, sqlite
+    from app.adapters.outgoing.persistence.models.asset import AssetModel
+
+    id_type = AssetModel.__table__.c.portfolio_id.type
+    assert id_type.compile(dialect=postgresql.dialect()) == "UUID"
+    assert id_type.compile(dialect=sqlite.dialect()) == "VARCHAR(36)"
@@ -2,9 +2,12 @@
 from datetime import datetime, timezone
 from decimal import Decimal
 from unittest.mock import MagicMock
-from uuid import uuid4
+from uuid import UUID, uuid4
 
-from app.adapters.outgoing.persistence.mappers.persistence_mapper import PersistenceMapper
+import pytest
+from pydantic import ValidationError
+
+from app.adapters.outgoing.persistence.mappers.persistence_mapper import MappingContext, PersistenceMapper
 
 
 def _now():
@@ -71,6 +74,27 @@ def test_asset_with_portfolio_load_snapshots_true():
     assert len(asset.snapshots) == 1
 
 
+def test_asset_with_portfolio_indexes_unordered_snapshots():
+    """ORM snapshots in arbitrary order come out as a sorted timeline."""
+    from app.domain.entities.portfolio import Portfolio
+    from app.domain.entities.snapshot_timeline import SnapshotTimeline
+    portfolio = Portfolio(
+        id=uuid4(), name="P", base_currency="EUR",
+        created_at=_now(), updated_at=_now()
+    )
+    asset_orm = make_asset_orm()
+    older, newer = make_asset_snapshot_orm(), make_asset_snapshot_orm()
+    older.observed_at = datetime(2024, 1, 1)
+    newer.value, newer.observed_at = Decimal("250.00"), datetime(2024, 2, 1)
+    asset_orm.snapshots = [newer, older]
+
+    asset = PersistenceMapper._asset_with_portfolio(asset_orm, portfolio, load_snapshots=True)
+
+    assert isinstance(asset.snapshots, SnapshotTimeline)
+    assert [s.observed_at.month for s in asset.snapshots] == [1, 2]
+    assert asset.current_value() == Decimal("250.00")
+
+
 def test_asset_with_portfolio_load_snapshots_false():
     """No snapshots loaded when load_snapshots=False."""
     from app.domain.entities.portfolio import Portfolio
@@ -102,3 +126,108 @@ def test_portfolio_to_domain_load_assets_false():
 
     portfolio = PersistenceMapper.portfolio_to_domain(portfolio_orm, load_assets=False)
     assert len(portfolio.assets) == 0
+
+
+def test_series_point_to_domain_parses_sqlite_text_period():
+    row = MagicMock()
+    row.period_start = "2024-03-04 00:00:00"
+    row.open, row.high, row.low, row.close = Decimal("1.00"), Decimal("3.00"), Decimal("1.00"), Decimal("2.00")
+    row.total_cents = 500
+    row.count = 3
+
+    point = PersistenceMapper.series_point_to_domain(row)
+
+    assert point.period_start == datetime(2024, 3, 4, tzinfo=timezone.utc)
+    assert point.average == Decimal("1.67")
+    assert point.count == 3
+
+
+def make_tag_orm():
+    m = MagicMock()
+    m.id = str(uuid4())
+    m.name = "tag"
+    return m
+
+
+def make_category_orm(parent=None):
+    m = MagicMock()
+    m.id = str(uuid4())
+    m.name = "Category"
+    m.parent = parent
+    return m
+
+
+def test_assets_to_domain_builds_shared_entities_once():
+    portfolio_orm, asset_type_orm, tag_orm = make_portfolio_orm(), make_asset_type_orm(), make_tag_orm()
+    root = make_category_orm()
+    children = [make_category_orm(parent=root), make_category_orm(parent=root)]
+    rows = [make_asset_orm(portfolio_orm=portfolio_orm) for _ in range(3)]
+    for i, row in enumerate(rows):
+        row.asset_type = asset_type_orm
+        row.tags = [tag_orm]
+        row.categories = [children[i % 2]]
+
+    assets = PersistenceMapper.assets_to_domain(rows)
+
+    assert len({id(a.portfolio) for a in assets}) == 1
+    assert len({id(a.asset_type) for a in assets}) == 1
+    assert len({id(t) for a in assets for t in a.tags}) == 1
+    categories = [next(iter(a.categories)) for a in assets]
+    assert categories[0] is categories[2]
+    assert categories[0].parent is categories[1].parent
+    assert str(categories[0].parent.id) == root.id
+
+
+def test_asset_to_domain_without_context_builds_fresh_entities():
+    portfolio_orm = make_portfolio_orm()
+    first = PersistenceMapper.asset_to_domain(make_asset_orm(portfolio_orm=portfolio_orm))
+    second = PersistenceMapper.asset_to_domain(make_asset_orm(portfolio_orm=portfolio_orm))
+    assert first.portfolio == second.portfolio
+    assert first.portfolio is not second.portfolio
+
+
+def test_mapping_context_keys_by_type_and_id():
+    context = MappingContext()
+    tag_orm = make_tag_orm()
+    tag = PersistenceMapper.tag_to_domain(tag_orm, context)
+    assert PersistenceMapper.tag_to_domain(tag_orm, context) is tag
+    # Same id, other entity type: not confused with the tag
+    category_orm = make_category_orm()
+    category_orm.id = tag_orm.id
+    assert PersistenceMapper.category_to_domain(category_orm, context) is not tag
+    assert len(context) == 2
+
+
+def test_portfolio_to_domain_load_assets_shares_asset_types():
+    portfolio_orm = make_portfolio_orm()
+    asset_type_orm = make_asset_type_orm()
+    portfolio_orm.assets = [make_asset_orm(portfolio_orm=portfolio_orm) for _ in range(2)]
+    for asset_orm in portfolio_orm.assets:
+        asset_orm.asset_type = asset_type_orm
+
+    portfolio = PersistenceMapper.portfolio_to_domain(portfolio_orm, load_assets=True)
+    assert portfolio.assets[0].asset_type is portfolio.assets[1].asset_type
+
+
+
+def test_column_ids_are_converted_by_validation():
+    asset_orm = make_asset_orm(with_snapshots=True)
+    asset_orm.tags = [make_tag_orm()]
+    asset_orm.categories = [make_category_orm(parent=make_category_orm())]
+
+    asset = PersistenceMapper.asset_to_domain(asset_orm, load_snapshots=True)
+
+    assert asset.id == UUID(asset_orm.id)
+    assert asset.portfolio.id == UUID(asset_orm.portfolio.id)
+    assert asset.asset_type.id == UUID(asset_orm.asset_type.id)
+    assert next(iter(asset.tags)).id == UUID(asset_orm.tags[0].id)
+    category = next(iter(asset.categories))
+    assert category.parent.id == UUID(asset_orm.categories[0].parent.id)
+    assert asset.snapshots[0].asset_id == UUID(asset_orm.snapshots[0].asset_id)
+
+
+def test_malformed_column_values_are_rejected():
+    tag_orm = make_tag_orm()
+    tag_orm.id = "not-a-uuid"
+    with pytest.raises(ValidationError):
+        PersistenceMapper.tag_to_domain(tag_orm)
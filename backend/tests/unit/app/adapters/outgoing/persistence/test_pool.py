@@ -0,0 +1,32 @@
+"""Tests for the server database pool settings."""
+import pytest
+
+from app.adapters.outgoing.persistence.pool import PoolSettings
+
+
+def test_from_env_defaults(monkeypatch):
+    for var in ("DB_POOL_SIZE", "DB_MAX_OVERFLOW", "DB_POOL_TIMEOUT", "DB_POOL_RECYCLE", "DB_POOL_PRE_PING"):
+        monkeypatch.delenv(var, raising=False)
+    settings = PoolSettings.from_env()
+    assert settings == PoolSettings()
+    assert settings.engine_options() == {
+        "pool_size": 10,
+        "max_overflow": 20,
+        "pool_timeout": 30.0,
+        "pool_recycle": 1800,
+        "pool_pre_ping": True,
+    }
+
+
+def test_from_env_overrides(monkeypatch):
+    monkeypatch.setenv("DB_POOL_SIZE", "4")
+    monkeypatch.setenv("DB_MAX_OVERFLOW", "0")
+    monkeypatch.setenv("DB_POOL_PRE_PING", "false")
+    settings = PoolSettings.from_env()
+    assert (settings.pool_size, settings.max_overflow, settings.pool_pre_ping) == (4, 0, False)
+
+
+def test_from_env_invalid_override_raises(monkeypatch):
+    monkeypatch.setenv("DB_POOL_RECYCLE", "hourly")
+    with pytest.raises(ValueError):
+        PoolSettings.from_env()
@@ -0,0 +1,56 @@
+"""Tests for the per-request SQL statement statistics."""
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+
+from app.adapters.outgoing.persistence.query_stats import instrument_engine, track_queries
+
+
+def _engine():
+    return instrument_engine(create_engine("sqlite://"))
+
+
+def test_counts_and_times_statements_within_the_block():
+    engine = _engine()
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        with track_queries() as stats:
+            conn.execute(text("SELECT 2"))
+            conn.execute(text("SELECT 3"))
+        conn.execute(text("SELECT 4"))
+
+    assert stats.count == 2
+    assert list(stats.statements) == ["SELECT 2", "SELECT 3"]
+    assert stats.duration > 0
+
+
+def test_nested_blocks_each_count_their_statements():
+    engine = _engine()
+    with engine.connect() as conn, track_queries() as outer:
+        conn.execute(text("SELECT 1"))
+        with track_queries() as inner:
+            conn.execute(text("SELECT 2"))
+
+    assert (outer.count, inner.count) == (2, 1)
+
+
+def test_repeated_statements_are_reported_from_the_threshold():
+    engine = _engine()
+    with engine.connect() as conn, track_queries() as stats:
+        for value in range(3):
+            conn.execute(text("SELECT :value"), {"value": value})
+        for value in range(2):
+            conn.execute(text("SELECT :value + 1"), {"value": value})
+
+    assert stats.repeated() == {"SELECT ?": 3}
+    assert stats.repeated(threshold=2) == {"SELECT ?": 3, "SELECT ? + 1": 2}
+
+
+def test_failed_statements_are_not_counted():
+    engine = _engine()
+    with engine.connect() as conn, track_queries() as stats:
+        with pytest.raises(OperationalError):
+            conn.execute(text("SELECT * FROM missing"))
+        conn.execute(text("SELECT 1"))
+
+    assert list(stats.statements) == ["SELECT 1"]
@@ -0,0 +1,86 @@
+"""Tests for the primary/replica routing session, on two SQLite files."""
+import pytest
+from sqlalchemy import create_engine, insert, select, update
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, sessionmaker
+
+from app.adapters.outgoing.persistence.routing import RoutingSession
+
+
+class _Base(DeclarativeBase):
+    pass
+
+
+class Item(_Base):
+    __tablename__ = "items"
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str]
+
+
+items = Item.__table__
+metadata = _Base.metadata
+
+
+@pytest.fixture
+def databases(tmp_path):
+    primary = create_engine(f"sqlite:///{tmp_path / 'primary.db'}")
+    replica = create_engine(f"sqlite:///{tmp_path / 'replica.db'}")
+    # Same schema, diverging data, so each read tells which database answered it
+    for engine, name in ((primary, "primary"), (replica, "replica")):
+        metadata.create_all(engine)
+        with engine.begin() as conn:
+            conn.execute(insert(items).values(id=1, name=name))
+    yield sessionmaker(class_=RoutingSession, primary=primary, replica=replica), primary, replica
+    primary.dispose()
+    replica.dispose()
+
+
+def _name(session, item_id=1):
+    return session.execute(select(items.c.name).where(items.c.id == item_id)).scalar()
+
+
+def test_read_only_session_reads_the_replica(databases):
+    Session, _, replica = databases
+    with Session(read_only=True) as session:
+        assert _name(session) == "replica"
+        assert session.get_bind() is replica
+
+
+def test_write_session_starts_on_the_primary(databases):
+    Session, primary, _ = databases
+    with Session(read_only=False) as session:
+        assert _name(session) == "primary"
+        assert session.get_bind() is primary
+
+
+def test_session_reads_its_own_writes(databases):
+    Session, primary, replica = databases
+    with Session(read_only=True) as session:
+        assert _name(session) == "replica"
+        session.execute(insert(items).values(id=2, name="written"))
+        # The write went to the primary, and reads follow it there
+        assert _name(session, 2) == "written"
+        assert _name(session) == "primary"
+        session.commit()
+
+    with primary.connect() as conn:
+        assert conn.execute(select(items.c.name).where(items.c.id == 2)).scalar() == "written"
+    with replica.connect() as conn:
+        assert conn.execute(select(items.c.name).where(items.c.id == 2)).scalar() is None
+
+
+def test_update_pins_the_session_to_the_primary(databases):
+    Session, primary, _ = databases
+    with Session(read_only=True) as session:
+        session.execute(update(items).where(items.c.id == 1).values(name="renamed"))
+        assert session.on_primary
+        assert _name(session) == "renamed"
+
+
+def test_flush_pins_the_session_to_the_primary(databases):
+    Session, primary, _ = databases
+    with Session(read_only=True) as session:
+        assert session.get(Item, 1).name == "replica"
+        session.add(Item(id=3, name="flushed"))
+        session.flush()
+        assert session.get_bind() is primary
+        assert _name(session, 3) == "flushed"
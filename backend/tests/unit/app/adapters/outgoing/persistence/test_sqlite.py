@@ -0,0 +1,122 @@
+"""Tests for the SQLite engine profile and the single-writer engine."""
+import sqlite3
+import threading
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from app.adapters.outgoing.persistence.sqlite import (
+    SQLiteProfile,
+    apply_sqlite_profile,
+    create_sqlite_write_engine,
+    enforce_foreign_keys,
+)
+
+
+@pytest.fixture
+def db_url(tmp_path):
+    url = f"sqlite:///{tmp_path / 'profile.db'}"
+    with create_engine(url).begin() as conn:
+        conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)"))
+    return url
+
+
+def test_from_env_defaults(monkeypatch):
+    for var in ("SQLITE_PROFILE", "SQLITE_JOURNAL_MODE", "SQLITE_BUSY_TIMEOUT_MS"):
+        monkeypatch.delenv(var, raising=False)
+    profile = SQLiteProfile.from_env()
+    assert profile == SQLiteProfile()
+    assert profile.journal_mode == "WAL"
+
+
+def test_from_env_overrides(monkeypatch):
+    monkeypatch.setenv("SQLITE_SYNCHRONOUS", "full")
+    monkeypatch.setenv("SQLITE_BUSY_TIMEOUT_MS", "250")
+    profile = SQLiteProfile.from_env()
+    assert (profile.synchronous, profile.busy_timeout_ms) == ("FULL", 250)
+    assert "PRAGMA busy_timeout=250" in profile.pragmas()
+
+
+def test_from_env_legacy_disables_profile(monkeypatch):
+    monkeypatch.setenv("SQLITE_PROFILE", "legacy")
+    assert SQLiteProfile.from_env() is None
+
+
+@pytest.mark.parametrize("var, value", [("SQLITE_PROFILE", "turbo"), ("SQLITE_JOURNAL_MODE", "WAL; DROP TABLE x")])
+def test_from_env_rejects_invalid_values(monkeypatch, var, value):
+    monkeypatch.setenv(var, value)
+    with pytest.raises(ValueError):
+        SQLiteProfile.from_env()
+
+
+def test_pragmas_applied_on_connect(db_url):
+    profile = SQLiteProfile(busy_timeout_ms=1234, cache_size=-2048, mmap_size=1 << 20)
+    engine = apply_sqlite_profile(create_engine(db_url), profile)
+
+    with engine.connect() as conn:
+        pragma = lambda name: conn.exec_driver_sql(f"PRAGMA {name}").scalar()
+        assert pragma("journal_mode") == "wal"
+        assert pragma("synchronous") == 1  # NORMAL
+        assert pragma("busy_timeout") == 1234
+        assert pragma("cache_size") == -2048
+        assert pragma("mmap_size") == 1 << 20
+        assert pragma("temp_store") == 2  # MEMORY
+    engine.dispose()
+
+
+def test_foreign_keys_enforced_on_connect(db_url):
+    engine = enforce_foreign_keys(create_engine(db_url))
+    with engine.begin() as conn:
+        conn.exec_driver_sql("CREATE TABLE children (item_id INTEGER REFERENCES items (id) ON DELETE CASCADE)")
+        conn.exec_driver_sql("INSERT INTO items (id, name) VALUES (1, 'parent')")
+        conn.exec_driver_sql("INSERT INTO children (item_id) VALUES (1)")
+        conn.exec_driver_sql("DELETE FROM items")
+        assert conn.exec_driver_sql("SELECT count(*) FROM children").scalar() == 0
+    engine.dispose()
+
+    write_engine = create_sqlite_write_engine(db_url, SQLiteProfile())
+    with write_engine.connect() as conn:
+        assert conn.exec_driver_sql("PRAGMA foreign_keys").scalar() == 1
+    write_engine.dispose()
+
+
+def test_write_engine_takes_the_write_lock_at_begin(db_url):
+    write_engine = create_sqlite_write_engine(db_url, SQLiteProfile())
+    session = sessionmaker(bind=write_engine)()
+    session.execute(text("SELECT count(*) FROM items"))  # a read only, yet the lock is held
+
+    other = sqlite3.connect(db_url.replace("sqlite:///", ""), timeout=0)
+    with pytest.raises(sqlite3.OperationalError, match="database is locked"):
+        other.execute("BEGIN IMMEDIATE")
+    session.commit()
+    other.execute("BEGIN IMMEDIATE")
+    other.rollback()
+    other.close()
+    session.close()
+    write_engine.dispose()
+
+
+def test_concurrent_writers_queue_instead_of_failing(db_url):
+    Session = sessionmaker(bind=create_sqlite_write_engine(db_url, SQLiteProfile()))
+    errors = []
+
+    def writer(worker: int) -> None:
+        try:
+            for i in range(20):
+                with Session() as session:
+                    count = session.execute(text("SELECT count(*) FROM items")).scalar()
+                    session.execute(text("INSERT INTO items (name) VALUES (:n)"), {"n": f"{worker}-{i}-{count}"})
+                    session.commit()
+        except Exception as exc:  # pragma: no cover - reported below
+            errors.append(exc)
+
+    threads = [threading.Thread(target=writer, args=(w,)) for w in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    with Session() as session:
+        assert session.execute(text("SELECT count(*) FROM items")).scalar() == 160
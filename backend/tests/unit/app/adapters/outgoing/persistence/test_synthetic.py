@@ -0,0 +1,130 @@
+"""Tests for the synthetic data set generator."""
+from datetime import timedelta
+from decimal import Decimal
+
+import pytest
+from pydantic import ValidationError
+from sqlalchemy import create_engine, func, insert, select
+from sqlalchemy.pool import StaticPool
+
+from app.adapters.outgoing.persistence.database import Base
+from app.adapters.outgoing.persistence.models import (
+    AssetLatestValueModel,
+    AssetModel,
+    AssetSnapshotModel,
+    AssetTypeModel,
+    CategoryModel,
+    PortfolioSnapshotModel,
+)
+from app.adapters.outgoing.persistence.synthetic import DatasetSpec, generate_dataset
+
+SMALL = dict(
+    portfolios=2, assets_per_portfolio=5, snapshots_per_asset=10, transactions_per_asset=3,
+    category_depth=3, category_fanout=2, categories_per_asset=2, tags=6, tags_per_asset=2, disposed_ratio=0.5,
+)
+
+
+def _engine():
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    return engine
+
+
+def _dump(engine):
+    """Every row of every table, in a comparable order."""
+    with engine.connect() as conn:
+        return {
+            name: sorted(tuple(str(v) for v in row) for row in conn.execute(table.select()))
+            for name, table in Base.metadata.tables.items()
+        }
+
+
+def test_counts_match_the_spec():
+    engine = _engine()
+    spec = DatasetSpec(**SMALL)
+
+    report = generate_dataset(engine, spec)
+
+    assert (report.portfolios, report.assets, report.snapshots) == (2, 10, 100)
+    assert (report.transactions, report.portfolio_snapshots) == (30, 20)
+    assert (report.categories, report.tags, report.labels) == (2 + 4 + 8, 6, 40)
+    assert report.rows == sum(len(rows) for name, rows in _dump(engine).items()
+                              if name not in ("asset_types", "asset_latest_values"))
+
+
+def test_same_seed_same_rows_whatever_the_chunk_size():
+    first, second, other = _engine(), _engine(), _engine()
+
+    generate_dataset(first, DatasetSpec(**SMALL))
+    generate_dataset(second, DatasetSpec(**SMALL, chunk_size=7))
+    generate_dataset(other, DatasetSpec(**SMALL, seed=1))
+
+    assert _dump(first) == _dump(second)
+    assert _dump(first)["asset_snapshots"] != _dump(other)["asset_snapshots"]
+
+
+def test_category_tree_and_labels():
+    engine = _engine()
+    generate_dataset(engine, DatasetSpec(**SMALL))
+
+    with engine.connect() as conn:
+        parents = dict(conn.execute(select(CategoryModel.id, CategoryModel.parent_id)).all())
+        names = dict(conn.execute(select(CategoryModel.id, CategoryModel.name)).all())
+        filed = conn.execute(select(Base.metadata.tables["asset_categories"].c.category_id)).scalars().all()
+
+    def depth(category_id):
+        return 0 if parents[category_id] is None else 1 + depth(parents[category_id])
+
+    assert {names[c] for c in parents if parents[c] is None} == {"Category 1", "Category 2"}
+    assert {depth(c) for c in filed} == {2}
+    assert all(names[c].startswith(names[parents[c]] + ".") for c in parents if parents[c])
+
+
+def test_latest_values_and_portfolio_totals_follow_the_snapshots():
+    engine = _engine()
+    spec = DatasetSpec(**SMALL, step=timedelta(hours=6))
+    generate_dataset(engine, spec)
+
+    with engine.connect() as conn:
+        latest = conn.execute(select(AssetLatestValueModel.snapshot_id, AssetLatestValueModel.value)).all()
+        newest = conn.execute(
+            select(AssetSnapshotModel.id, AssetSnapshotModel.value).where(
+                AssetSnapshotModel.observed_at == spec.start + spec.step * 9
+            )
+        ).all()
+        totals = dict(conn.execute(
+            select(PortfolioSnapshotModel.portfolio_id, func.sum(PortfolioSnapshotModel.value)).where(
+                PortfolioSnapshotModel.observed_at == spec.start
+            ).group_by(PortfolioSnapshotModel.portfolio_id)
+        ).all())
+        sums = dict(conn.execute(
+            select(AssetModel.portfolio_id, func.sum(AssetSnapshotModel.value)).join(AssetModel).where(
+                AssetSnapshotModel.observed_at == spec.start
+            ).group_by(AssetModel.portfolio_id)
+        ).all())
+
+    assert sorted(latest) == sorted(newest)
+    assert {p: round(Decimal(v), 2) for p, v in totals.items()} == {p: round(Decimal(v), 2) for p, v in sums.items()}
+
+
+def test_existing_asset_types_are_reused():
+    engine = _engine()
+    with engine.begin() as conn:
+        conn.execute(insert(AssetTypeModel), [dict(id="00000000-0000-4000-8000-000000000001", code="ONLY", label="Only")])
+
+    generate_dataset(engine, DatasetSpec(**SMALL))
+
+    with engine.connect() as conn:
+        assert conn.execute(select(func.count()).select_from(AssetTypeModel)).scalar() == 1
+        assert set(conn.execute(select(AssetModel.asset_type_id)).scalars()) == {"00000000-0000-4000-8000-000000000001"}
+
+
+@pytest.mark.parametrize("overrides", [
+    dict(tags=2, tags_per_asset=3),
+    dict(category_depth=1, category_fanout=2, categories_per_asset=3),
+    dict(category_depth=0, categories_per_asset=1),
+    dict(step=timedelta(0)),
+])
+def test_spec_rejects_impossible_shapes(overrides):
+    with pytest.raises(ValidationError):
+        DatasetSpec(**{**SMALL, **overrides})
@@ -0,0 +1,68 @@
+"""Tests for the SQLAlchemy unit of work, on a SQLite file."""
+import pytest
+from sqlalchemy import create_engine, event, insert, select
+from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column
+
+from app.adapters.outgoing.persistence.repository import SQLAlchemyUnitOfWork
+
+
+class _Base(DeclarativeBase):
+    pass
+
+
+class Item(_Base):
+    __tablename__ = "items"
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str]
+
+
+items = Item.__table__
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'uow.db'}")
+    _Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+def _names(engine):
+    # Read on a connection of its own: only committed rows are visible
+    with engine.connect() as conn:
+        return conn.execute(select(items.c.name).order_by(items.c.id)).scalars().all()
+
+
+def test_block_commits_flushed_changes_once(engine):
+    with Session(engine) as session:
+        commits = []
+        event.listen(session, "after_commit", lambda _session: commits.append(1))
+        with SQLAlchemyUnitOfWork(session):
+            session.add(Item(id=1, name="first"))
+            session.flush()
+            session.execute(insert(items).values(id=2, name="second"))
+            session.flush()
+        assert len(commits) == 1
+    assert _names(engine) == ["first", "second"]
+
+
+def test_block_rolls_back_when_it_raises(engine):
+    with Session(engine) as session:
+        with pytest.raises(ValueError):
+            with SQLAlchemyUnitOfWork(session):
+                session.add(Item(id=1, name="discarded"))
+                session.flush()
+                raise ValueError("use case failed")
+        assert session.execute(select(items.c.name)).first() is None
+    assert _names(engine) == []
+
+
+def test_commit_splits_work_into_transactions(engine):
+    with Session(engine) as session:
+        uow = SQLAlchemyUnitOfWork(session)
+        session.add(Item(id=1, name="kept"))
+        uow.commit()
+        session.add(Item(id=2, name="discarded"))
+        session.flush()
+        uow.rollback()
+    assert _names(engine) == ["kept"]
@@ -0,0 +1,72 @@
+"""Unit tests for the vectorized as-of index."""
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from app.application.analytics import as_of
+from app.application.analytics.as_of import AsOfIndex, sample_moments
+from app.domain.entities import SnapshotSeries
+
+
+def _day(d):
+    return datetime(2024, 1, d, tzinfo=timezone.utc)
+
+
+def _index(points):
+    """AsOfIndex of (asset, observed_at, value) points, given oldest first within an asset."""
+    rows = {}
+    for asset, observed_at, value in points:
+        rows.setdefault(asset, []).append((uuid4(), observed_at, value))
+    return AsOfIndex.from_series([SnapshotSeries.from_rows(uuid4(), r) for r in rows.values()])
+
+
+def test_totals_use_each_assets_last_snapshot_at_or_before_moment():
+    index = _index([
+        ("a", _day(2), Decimal("10.00")),
+        ("a", _day(4), Decimal("20.50")),
+        ("b", _day(1), Decimal("1.01")),
+        ("b", _day(3), Decimal("2.00")),
+    ])
+
+    totals = index.totals_at([_day(1), _day(2), _day(3), _day(4), _day(5)])
+
+    assert totals == [Decimal("1.01"), Decimal("11.01"), Decimal("12.00"), Decimal("22.50"), Decimal("22.50")]
+
+
+def test_totals_before_any_snapshot_are_zero():
+    index = _index([("a", _day(5), Decimal("3.00")), ("b", _day(2), Decimal("4.00"))])
+    assert index.totals_at([_day(1), _day(3)]) == [Decimal("0.00"), Decimal("4.00")]
+
+
+def test_same_moment_snapshots_resolve_to_the_last_given():
+    index = _index([("a", _day(1), Decimal("1.00")), ("a", _day(1), Decimal("2.00"))])
+    assert index.totals_at([_day(1)]) == [Decimal("2.00")]
+
+
+@pytest.mark.parametrize("block_pairs", [1, 2, 3, 5, 1000])
+def test_totals_are_the_same_whatever_the_block_size(monkeypatch, block_pairs):
+    series = [
+        SnapshotSeries.from_rows(uuid4(), [(uuid4(), _day(2), Decimal("10.00")), (uuid4(), _day(4), Decimal("20.50"))]),
+        SnapshotSeries(uuid4()),
+        SnapshotSeries.from_rows(uuid4(), [(uuid4(), _day(1), Decimal("1.01")), (uuid4(), _day(3), Decimal("2.00"))]),
+        SnapshotSeries.from_rows(uuid4(), [(uuid4(), _day(3), Decimal("0.50"))]),
+    ]
+    monkeypatch.setattr(as_of, "BLOCK_PAIRS", block_pairs)
+
+    totals = AsOfIndex.from_series(series).totals_at([_day(1), _day(2), _day(3), _day(4), _day(5)])
+
+    assert totals == [Decimal("1.01"), Decimal("11.01"), Decimal("12.50"), Decimal("23.00"), Decimal("23.00")]
+
+
+def test_empty_index():
+    assert _index([]).totals_at([_day(1), _day(2)]) == [Decimal("0.00")] * 2
+    assert _index([("a", _day(1), Decimal("1.00"))]).totals_at([]) == []
+    assert AsOfIndex.from_series([SnapshotSeries(uuid4())]).totals_at([_day(1)]) == [Decimal("0.00")]
+
+
+def test_sample_moments_include_both_ends():
+    assert sample_moments(_day(1), _day(3), timedelta(days=1)) == [_day(1), _day(2), _day(3)]
+    assert sample_moments(_day(1), _day(3), timedelta(days=5)) == [_day(1)]
+
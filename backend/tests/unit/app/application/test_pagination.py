@@ -0,0 +1,34 @@
+"""Unit tests for the keyset pagination helpers."""
+from datetime import datetime, timezone
+
+import pytest
+
+from app.application.pagination import build_page, decode_cursor, encode_cursor
+from app.domain.exceptions import InvalidCursor
+
+
+def test_cursor_round_trip():
+    key = (datetime(2024, 5, 1, 12, 30, tzinfo=timezone.utc), "5b0c1c0e-8a57-4a43-9c6c-3b1f0b1f2a11")
+    token = encode_cursor(key)
+    assert "=" not in token
+    assert decode_cursor(token, (datetime, str)) == key
+
+
+def test_decode_without_cursor():
+    assert decode_cursor(None, (str, str)) is None
+
+
+@pytest.mark.parametrize("token", ["not a cursor", encode_cursor(("only-one",)), encode_cursor(("x", "y"))])
+def test_decode_rejects_malformed_cursors(token):
+    with pytest.raises(InvalidCursor):
+        decode_cursor(token, (datetime, str))
+
+
+def test_build_page_uses_extra_row_as_more_marker():
+    page = build_page([1, 2, 3], 2, lambda n: (str(n), "id"))
+    assert page.items == [1, 2]
+    assert decode_cursor(page.next_cursor, (str, str)) == ("2", "id")
+
+    last = build_page([1, 2], 2, lambda n: (str(n), "id"))
+    assert last.items == [1, 2]
+    assert last.next_cursor is None
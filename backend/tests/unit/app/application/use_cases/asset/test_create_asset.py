@@ -8,7 +8,8 @@ from uuid import uuid4
 from app.application.use_cases.asset.create_asset import CreateAssetUseCase, CreateAssetRequest
 from app.domain.entities.asset_type import AssetType
 from app.domain.entities.portfolio import Portfolio
-from app.domain.exceptions import PortfolioNotFound, AssetTypeNotFound
+from app.domain.entities.tag import Tag
+from app.domain.exceptions import PortfolioNotFound, AssetTypeNotFound, TagNotFound
 
 
 def make_fake_portfolio(id_=None):
@@ -21,7 +22,9 @@ def make_fake_asset_type(id_=None):
     return AssetType(id=id_ or uuid4(), code="EQUITY", label="Equity")
 
 
-def test_create_asset_success(dummy_asset_repository, dummy_portfolio_repository):
+def test_create_asset_success(
+    dummy_asset_repository, dummy_portfolio_repository, dummy_tag_repository, dummy_unit_of_work
+):
     asset_type_repo = MagicMock()
 
     portfolio_id = uuid4()
@@ -33,7 +36,9 @@ def test_create_asset_success(dummy_asset_repository, dummy_portfolio_repository
     asset_type = make_fake_asset_type(asset_type_id)
     asset_type_repo.find_by_id.return_value = asset_type
 
-    use_case = CreateAssetUseCase(dummy_asset_repository, dummy_portfolio_repository, asset_type_repo)
+    use_case = CreateAssetUseCase(
+        dummy_asset_repository, dummy_portfolio_repository, asset_type_repo, dummy_tag_repository, dummy_unit_of_work
+    )
     command = CreateAssetRequest(
         portfolio_id=portfolio_id,
         asset_type_id=asset_type_id,
@@ -47,11 +52,16 @@ def test_create_asset_success(dummy_asset_repository, dummy_portfolio_repository
     assert result.name == "Test Asset"
     assert result.portfolio.id == portfolio_id
     assert result.asset_type.id == asset_type_id
+    assert dummy_unit_of_work.commits == 1
 
 
-def test_create_asset_portfolio_not_found(dummy_asset_repository, dummy_portfolio_repository):
+def test_create_asset_portfolio_not_found(
+    dummy_asset_repository, dummy_portfolio_repository, dummy_tag_repository, dummy_unit_of_work
+):
     asset_type_repo = MagicMock()
-    use_case = CreateAssetUseCase(dummy_asset_repository, dummy_portfolio_repository, asset_type_repo)
+    use_case = CreateAssetUseCase(
+        dummy_asset_repository, dummy_portfolio_repository, asset_type_repo, dummy_tag_repository, dummy_unit_of_work
+    )
     command = CreateAssetRequest(
         portfolio_id=uuid4(),
         asset_type_id=uuid4(),
@@ -60,9 +70,12 @@ def test_create_asset_portfolio_not_found(dummy_asset_repository, dummy_portfoli
     )
     with pytest.raises(PortfolioNotFound):
         use_case.execute(command)
+    assert (dummy_unit_of_work.commits, dummy_unit_of_work.rollbacks) == (0, 1)
 
 
-def test_create_asset_asset_type_not_found(dummy_asset_repository, dummy_portfolio_repository):
+def test_create_asset_asset_type_not_found(
+    dummy_asset_repository, dummy_portfolio_repository, dummy_tag_repository, dummy_unit_of_work
+):
     asset_type_repo = MagicMock()
     asset_type_repo.find_by_id.return_value = None
 
@@ -70,7 +83,9 @@ def test_create_asset_asset_type_not_found(dummy_asset_repository, dummy_portfol
     portfolio = make_fake_portfolio(portfolio_id)
     dummy_portfolio_repository.save(portfolio)
 
-    use_case = CreateAssetUseCase(dummy_asset_repository, dummy_portfolio_repository, asset_type_repo)
+    use_case = CreateAssetUseCase(
+        dummy_asset_repository, dummy_portfolio_repository, asset_type_repo, dummy_tag_repository, dummy_unit_of_work
+    )
     command = CreateAssetRequest(
         portfolio_id=portfolio_id,
         asset_type_id=uuid4(),
@@ -79,3 +94,50 @@ def test_create_asset_asset_type_not_found(dummy_asset_repository, dummy_portfol
     )
     with pytest.raises(AssetTypeNotFound):
         use_case.execute(command)
+
+
+def test_create_asset_with_tags_commits_once(
+    dummy_asset_repository, dummy_portfolio_repository, dummy_tag_repository, dummy_unit_of_work
+):
+    asset_type_repo = MagicMock()
+    asset_type_repo.find_by_id.return_value = make_fake_asset_type()
+    portfolio = dummy_portfolio_repository.save(make_fake_portfolio())
+    tags = [dummy_tag_repository.save(Tag(id=uuid4(), name=name)) for name in ("growth", "tech")]
+
+    use_case = CreateAssetUseCase(
+        dummy_asset_repository, dummy_portfolio_repository, asset_type_repo, dummy_tag_repository, dummy_unit_of_work
+    )
+    result = use_case.execute(CreateAssetRequest(
+        portfolio_id=portfolio.id,
+        asset_type_id=uuid4(),
+        name="Tagged",
+        created_by="test-user",
+        tag_ids=[tags[0].id, tags[1].id, tags[0].id],
+    ))
+
+    assert {t.name for t in result.tags} == {"growth", "tech"}
+    assert dummy_asset_repository.find_by_id(result.id)._tags == {str(t.id) for t in tags}
+    assert (dummy_unit_of_work.commits, dummy_unit_of_work.rollbacks) == (1, 0)
+
+
+def test_create_asset_unknown_tag_rolls_back(
+    dummy_asset_repository, dummy_portfolio_repository, dummy_tag_repository, dummy_unit_of_work
+):
+    asset_type_repo = MagicMock()
+    asset_type_repo.find_by_id.return_value = make_fake_asset_type()
+    portfolio = dummy_portfolio_repository.save(make_fake_portfolio())
+
+    use_case = CreateAssetUseCase(
+        dummy_asset_repository, dummy_portfolio_repository, asset_type_repo, dummy_tag_repository, dummy_unit_of_work
+    )
+    with pytest.raises(TagNotFound):
+        use_case.execute(CreateAssetRequest(
+            portfolio_id=portfolio.id,
+            asset_type_id=uuid4(),
+            name="Tagged",
+            created_by="test-user",
+            tag_ids=[uuid4()],
+        ))
+
+    assert dummy_asset_repository.find_all() == []
+    assert (dummy_unit_of_work.commits, dummy_unit_of_work.rollbacks) == (0, 1)
@@ -28,15 +28,15 @@ def make_asset():
 
 
 class TestDeleteAssetUseCase:
-    def test_delete_success(self, dummy_asset_repository):
+    def test_delete_success(self, dummy_asset_repository, dummy_unit_of_work):
         asset = make_asset()
         dummy_asset_repository.save(asset)
-        use_case = DeleteAssetUseCase(dummy_asset_repository)
+        use_case = DeleteAssetUseCase(dummy_asset_repository, dummy_unit_of_work)
         result = use_case.execute(asset.id)
         assert result is None
 
-    def test_delete_not_found(self, dummy_asset_repository):
-        use_case = DeleteAssetUseCase(dummy_asset_repository)
+    def test_delete_not_found(self, dummy_asset_repository, dummy_unit_of_work):
+        use_case = DeleteAssetUseCase(dummy_asset_repository, dummy_unit_of_work)
         with pytest.raises(AssetNotFound):
             use_case.execute(uuid4())
 
@@ -44,11 +44,23 @@ class TestDeleteAssetUseCase:
 class TestGetAllAssetsUseCase:
     def test_empty(self, dummy_asset_repository):
         use_case = GetAllAssetsUseCase(dummy_asset_repository)
-        assert use_case.execute() == []
+        assert use_case.execute().items == []
 
     def test_with_items(self, dummy_asset_repository):
         asset = make_asset()
         dummy_asset_repository.save(asset)
         use_case = GetAllAssetsUseCase(dummy_asset_repository)
         result = use_case.execute()
-        assert len(result) == 1
+        assert [a["id"] for a in result.items] == [str(asset.id)]
+        assert result.next_cursor is None
+
+    def test_pages_follow_cursor(self, dummy_asset_repository):
+        for _ in range(3):
+            dummy_asset_repository.save(make_asset())
+        use_case = GetAllAssetsUseCase(dummy_asset_repository)
+        first = use_case.execute(limit=2)
+        second = use_case.execute(limit=2, cursor=first.next_cursor)
+        assert len(first.items) == 2
+        assert len(second.items) == 1
+        assert second.next_cursor is None
+        assert {a["id"] for a in first.items + second.items} == set(dummy_asset_repository.storage)
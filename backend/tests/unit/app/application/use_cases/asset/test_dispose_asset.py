@@ -14,29 +14,29 @@ def make_fake_asset(id_=None, disposed=False):
     return asset
 
 
-def test_dispose_asset_success(dummy_asset_repository):
+def test_dispose_asset_success(dummy_asset_repository, dummy_unit_of_work):
     asset_id = uuid4()
     asset = make_fake_asset(asset_id, disposed=False)
     dummy_asset_repository.save(asset)
 
-    use_case = DisposeAssetUseCase(dummy_asset_repository)
+    use_case = DisposeAssetUseCase(dummy_asset_repository, dummy_unit_of_work)
     result = use_case.execute(asset_id)
 
     assert result.disposed is True
 
 
-def test_dispose_asset_idempotent(dummy_asset_repository):
+def test_dispose_asset_idempotent(dummy_asset_repository, dummy_unit_of_work):
     asset_id = uuid4()
     asset = make_fake_asset(asset_id, disposed=True)
     dummy_asset_repository.save(asset)
 
-    use_case = DisposeAssetUseCase(dummy_asset_repository)
+    use_case = DisposeAssetUseCase(dummy_asset_repository, dummy_unit_of_work)
     result = use_case.execute(asset_id)
 
     assert result.disposed is True
 
 
-def test_dispose_asset_not_found(dummy_asset_repository):
-    use_case = DisposeAssetUseCase(dummy_asset_repository)
+def test_dispose_asset_not_found(dummy_asset_repository, dummy_unit_of_work):
+    use_case = DisposeAssetUseCase(dummy_asset_repository, dummy_unit_of_work)
     with pytest.raises(AssetNotFound):
         use_case.execute(uuid4())
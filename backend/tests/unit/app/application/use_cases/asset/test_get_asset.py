@@ -1,9 +1,11 @@
-"""Unit tests for GetAssetUseCase (not-found path)."""
+"""Unit tests for GetAssetUseCase and its async counterpart (not-found path)."""
+import asyncio
+from unittest.mock import AsyncMock
 from uuid import uuid4
 
 import pytest
 
-from app.application.use_cases.asset.get_asset import GetAssetUseCase
+from app.application.use_cases.asset.get_asset import AsyncGetAssetUseCase, GetAssetUseCase
 from app.domain.exceptions import AssetNotFound
 
 
@@ -11,3 +13,11 @@ def test_get_asset_not_found(dummy_asset_repository):
     use_case = GetAssetUseCase(dummy_asset_repository)
     with pytest.raises(AssetNotFound):
         use_case.execute(uuid4())
+
+
+def test_async_get_asset_not_found():
+    asset_repository = AsyncMock()
+    asset_repository.find_by_id.return_value = None
+    use_case = AsyncGetAssetUseCase(asset_repository)
+    with pytest.raises(AssetNotFound):
+        asyncio.run(use_case.execute(uuid4()))
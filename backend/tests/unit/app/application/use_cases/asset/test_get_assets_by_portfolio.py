@@ -21,7 +21,7 @@ class FakeAssetRepoWithPortfolio:
     def find_by_id(self, id_):
         return self.storage.get(str(id_))
 
-    def find_by_portfolio(self, portfolio_id):
+    def find_summary_page(self, limit, after=None, portfolio_id=None):
         return []
 
 
@@ -38,4 +38,4 @@ def test_get_assets_by_portfolio_success(dummy_portfolio_repository):
     asset_repo = FakeAssetRepoWithPortfolio()
     use_case = GetAssetsByPortfolioUseCase(asset_repo, dummy_portfolio_repository)
     result = use_case.execute(portfolio.id)
-    assert result == []
+    assert result.items == []
@@ -7,8 +7,8 @@ from app.application.use_cases.asset.update_asset import UpdateAssetUseCase, Upd
 from app.domain.exceptions import AssetNotFound
 
 
-def test_update_asset_not_found(dummy_asset_repository):
-    use_case = UpdateAssetUseCase(dummy_asset_repository)
+def test_update_asset_not_found(dummy_asset_repository, dummy_unit_of_work):
+    use_case = UpdateAssetUseCase(dummy_asset_repository, dummy_unit_of_work)
     cmd = UpdateAssetCommand(asset_id=uuid4(), name="New", updated_by="user")
     with pytest.raises(AssetNotFound):
         use_case.execute(cmd)
@@ -0,0 +1,82 @@
+"""Unit tests for BulkCreateAssetSnapshotsUseCase."""
+from datetime import datetime, timezone
+from decimal import Decimal
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+from app.application.use_cases.asset_snapshot.bulk_create_asset_snapshots import (
+    BulkCreateAssetSnapshotsUseCase,
+    BulkSnapshotItem,
+)
+
+
+def make_fake_asset(id_=None):
+    asset = MagicMock()
+    asset.id = str(id_ or uuid4())
+    return asset
+
+
+def test_bulk_create_all_rows_valid(dummy_asset_repository, dummy_asset_snapshot_repository, dummy_unit_of_work):
+    asset_id = uuid4()
+    dummy_asset_repository.save(make_fake_asset(asset_id))
+    observed_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    use_case = BulkCreateAssetSnapshotsUseCase(dummy_asset_snapshot_repository, dummy_asset_repository, dummy_unit_of_work)
+    result = use_case.execute([
+        BulkSnapshotItem(asset_id=asset_id, value=Decimal("10.00"), observed_at=observed_at),
+        BulkSnapshotItem(asset_id=asset_id, value=Decimal("20.00")),
+    ])
+
+    assert result.created == 2
+    assert result.errors == []
+    saved = dummy_asset_snapshot_repository.get_snapshots(asset_id)
+    assert sorted(s.value for s in saved) == [Decimal("10.00"), Decimal("20.00")]
+    assert observed_at in {s.observed_at for s in saved}
+
+
+def test_bulk_create_reports_unknown_assets_per_row(dummy_asset_repository, dummy_asset_snapshot_repository, dummy_unit_of_work):
+    known, unknown = uuid4(), uuid4()
+    dummy_asset_repository.save(make_fake_asset(known))
+
+    use_case = BulkCreateAssetSnapshotsUseCase(dummy_asset_snapshot_repository, dummy_asset_repository, dummy_unit_of_work)
+    result = use_case.execute([
+        BulkSnapshotItem(asset_id=unknown, value=Decimal("1.00")),
+        BulkSnapshotItem(asset_id=known, value=Decimal("2.00")),
+        BulkSnapshotItem(asset_id=unknown, value=Decimal("3.00")),
+    ])
+
+    assert result.created == 1
+    assert [e.index for e in result.errors] == [0, 2]
+    assert dummy_unit_of_work.commits == 1
+    assert all(e.code == "ASSET_NOT_FOUND" and e.asset_id == unknown for e in result.errors)
+
+
+def test_bulk_create_resolves_assets_with_one_lookup(dummy_asset_snapshot_repository, dummy_unit_of_work):
+    asset_repo = MagicMock()
+    a, b = uuid4(), uuid4()
+    asset_repo.find_existing_ids.return_value = {str(a), str(b)}
+
+    use_case = BulkCreateAssetSnapshotsUseCase(dummy_asset_snapshot_repository, asset_repo, dummy_unit_of_work)
+    result = use_case.execute([
+        BulkSnapshotItem(asset_id=asset_id, value=Decimal("1.00")) for asset_id in (a, b, a, b)
+    ])
+
+    assert result.created == 4
+    asset_repo.find_existing_ids.assert_called_once_with({str(a), str(b)})
+    asset_repo.find_by_id.assert_not_called()
+
+
+def test_bulk_create_hands_plain_values_to_the_repository(dummy_asset_repository, dummy_unit_of_work):
+    asset_id = uuid4()
+    dummy_asset_repository.save(make_fake_asset(asset_id))
+    snapshot_repo = MagicMock()
+    snapshot_repo.save_values.side_effect = len
+    observed_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    use_case = BulkCreateAssetSnapshotsUseCase(snapshot_repo, dummy_asset_repository, dummy_unit_of_work)
+    result = use_case.execute([BulkSnapshotItem(asset_id, Decimal("10.00"), observed_at)])
+
+    assert result.created == 1
+    ((snapshot_id, saved_asset_id, value, saved_at),) = snapshot_repo.save_values.call_args.args[0]
+    assert (saved_asset_id, value, saved_at) == (str(asset_id), Decimal("10.00"), observed_at)
+    snapshot_repo.save_many.assert_not_called()
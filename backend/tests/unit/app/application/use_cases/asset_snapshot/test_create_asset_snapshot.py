@@ -1,11 +1,16 @@
-"""Unit tests for CreateAssetSnapshotUseCase."""
+"""Unit tests for CreateAssetSnapshotUseCase and its async counterpart."""
+import asyncio
 import pytest
 from decimal import Decimal
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
-from app.application.use_cases.asset_snapshot.create_asset_snapshot import CreateAssetSnapshotUseCase
+from app.application.use_cases.asset_snapshot.create_asset_snapshot import (
+    AsyncCreateAssetSnapshotUseCase,
+    CreateAssetSnapshotUseCase,
+)
 from app.domain.exceptions import AssetNotFound
+from app.domain.ports.repository import IAsyncUnitOfWork
 
 
 def make_fake_asset(id_=None):
@@ -14,12 +19,12 @@ def make_fake_asset(id_=None):
     return asset
 
 
-def test_create_snapshot_success(dummy_asset_repository, dummy_asset_snapshot_repository):
+def test_create_snapshot_success(dummy_asset_repository, dummy_asset_snapshot_repository, dummy_unit_of_work):
     asset_id = uuid4()
     asset = make_fake_asset(asset_id)
     dummy_asset_repository.save(asset)
 
-    use_case = CreateAssetSnapshotUseCase(dummy_asset_snapshot_repository, dummy_asset_repository)
+    use_case = CreateAssetSnapshotUseCase(dummy_asset_snapshot_repository, dummy_asset_repository, dummy_unit_of_work)
     result = use_case.execute(str(asset_id), Decimal("1234.56"))
 
     assert result.id is not None
@@ -27,7 +32,44 @@ def test_create_snapshot_success(dummy_asset_repository, dummy_asset_snapshot_re
     assert result.value == Decimal("1234.56")
 
 
-def test_create_snapshot_asset_not_found(dummy_asset_repository, dummy_asset_snapshot_repository):
-    use_case = CreateAssetSnapshotUseCase(dummy_asset_snapshot_repository, dummy_asset_repository)
+def test_create_snapshot_asset_not_found(dummy_asset_repository, dummy_asset_snapshot_repository, dummy_unit_of_work):
+    use_case = CreateAssetSnapshotUseCase(dummy_asset_snapshot_repository, dummy_asset_repository, dummy_unit_of_work)
     with pytest.raises(AssetNotFound):
         use_case.execute(str(uuid4()), Decimal("100.00"))
+
+
+class RecordingAsyncUnitOfWork(IAsyncUnitOfWork):
+    def __init__(self):
+        self.calls = []
+
+    async def commit(self):
+        self.calls.append("commit")
+
+    async def rollback(self):
+        self.calls.append("rollback")
+
+
+def test_async_create_snapshot_adds_it_in_one_transaction():
+    asset_id = uuid4()
+    asset_repo, snapshot_repo, uow = AsyncMock(), AsyncMock(), RecordingAsyncUnitOfWork()
+    asset_repo.find_by_id.return_value = make_fake_asset(asset_id)
+    snapshot_repo.add.side_effect = lambda snapshot: snapshot
+
+    use_case = AsyncCreateAssetSnapshotUseCase(snapshot_repo, asset_repo, uow)
+    result = asyncio.run(use_case.execute(str(asset_id), Decimal("1234.56")))
+
+    assert str(result.asset_id) == str(asset_id)
+    assert result.value == Decimal("1234.56")
+    snapshot_repo.add.assert_awaited_once_with(result)
+    assert uow.calls == ["commit"]
+
+
+def test_async_create_snapshot_asset_not_found_rolls_back():
+    asset_repo, snapshot_repo, uow = AsyncMock(), AsyncMock(), RecordingAsyncUnitOfWork()
+    asset_repo.find_by_id.return_value = None
+
+    use_case = AsyncCreateAssetSnapshotUseCase(snapshot_repo, asset_repo, uow)
+    with pytest.raises(AssetNotFound):
+        asyncio.run(use_case.execute(str(uuid4()), Decimal("100.00")))
+    snapshot_repo.add.assert_not_awaited()
+    assert uow.calls == ["rollback"]
@@ -0,0 +1,32 @@
+"""Unit tests for ExportAssetSnapshotsUseCase."""
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+
+from app.application.use_cases.asset_snapshot.export_asset_snapshots import ExportAssetSnapshotsUseCase
+from app.domain.exceptions import AssetNotFound
+
+
+def test_export_returns_repository_iterator():
+    snapshot_repo, asset_repo = MagicMock(), MagicMock()
+    asset_repo.exists.return_value = True
+    snapshot_repo.iter_snapshots.return_value = iter(["s1", "s2"])
+    asset_id = uuid4()
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    result = ExportAssetSnapshotsUseCase(snapshot_repo, asset_repo).execute(asset_id, start)
+
+    assert list(result) == ["s1", "s2"]
+    asset_repo.exists.assert_called_once_with(str(asset_id))
+    snapshot_repo.iter_snapshots.assert_called_once_with(asset_id, start, None)
+
+
+def test_export_unknown_asset_raises_before_reading():
+    snapshot_repo, asset_repo = MagicMock(), MagicMock()
+    asset_repo.exists.return_value = False
+
+    with pytest.raises(AssetNotFound):
+        ExportAssetSnapshotsUseCase(snapshot_repo, asset_repo).execute(uuid4())
+    snapshot_repo.iter_snapshots.assert_not_called()
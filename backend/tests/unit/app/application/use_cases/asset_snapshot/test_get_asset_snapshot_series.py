@@ -0,0 +1,32 @@
+"""Unit tests for GetAssetSnapshotSeriesUseCase."""
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+
+from app.application.use_cases.asset_snapshot.get_asset_snapshot_series import GetAssetSnapshotSeriesUseCase
+from app.domain.entities.value_series import SeriesBucket
+from app.domain.exceptions import AssetNotFound
+
+
+def test_series_delegates_bucketing_to_repository():
+    snapshot_repo, asset_repo = MagicMock(), MagicMock()
+    asset_repo.exists.return_value = True
+    snapshot_repo.get_series.return_value = ["p1"]
+    asset_id = uuid4()
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    result = GetAssetSnapshotSeriesUseCase(snapshot_repo, asset_repo).execute(asset_id, SeriesBucket.WEEK, start)
+
+    assert result == ["p1"]
+    snapshot_repo.get_series.assert_called_once_with(str(asset_id), SeriesBucket.WEEK, start, None)
+
+
+def test_series_unknown_asset_raises():
+    snapshot_repo, asset_repo = MagicMock(), MagicMock()
+    asset_repo.exists.return_value = False
+
+    with pytest.raises(AssetNotFound):
+        GetAssetSnapshotSeriesUseCase(snapshot_repo, asset_repo).execute(uuid4())
+    snapshot_repo.get_series.assert_not_called()
@@ -1,5 +1,6 @@
 """Unit tests for GetAssetSnapshotsUseCase."""
 import pytest
+from datetime import datetime, timezone
 from decimal import Decimal
 from unittest.mock import MagicMock
 from uuid import uuid4
@@ -15,23 +16,36 @@ def make_fake_asset(id_=None):
     return asset
 
 
-def test_get_snapshots_returns_list(dummy_asset_repository, dummy_asset_snapshot_repository):
+def test_get_snapshots_returns_list(dummy_asset_repository, dummy_asset_snapshot_repository, dummy_unit_of_work):
     asset_id = uuid4()
     asset = make_fake_asset(asset_id)
     dummy_asset_repository.save(asset)
 
     # Create a snapshot first
-    create_uc = CreateAssetSnapshotUseCase(dummy_asset_snapshot_repository, dummy_asset_repository)
+    create_uc = CreateAssetSnapshotUseCase(dummy_asset_snapshot_repository, dummy_asset_repository, dummy_unit_of_work)
     create_uc.execute(str(asset_id), Decimal("500.00"))
 
     use_case = GetAssetSnapshotsUseCase(dummy_asset_snapshot_repository, dummy_asset_repository)
     results = use_case.execute(asset_id)
 
-    assert isinstance(results, list)
-    assert len(results) == 1
+    assert isinstance(results.items, list)
+    assert len(results.items) == 1
+    assert results.next_cursor is None
 
 
 def test_get_snapshots_asset_not_found(dummy_asset_repository, dummy_asset_snapshot_repository):
     use_case = GetAssetSnapshotsUseCase(dummy_asset_snapshot_repository, dummy_asset_repository)
     with pytest.raises(AssetNotFound):
         use_case.execute(uuid4())
+
+
+def test_get_snapshots_passes_the_date_range():
+    snapshot_repo, asset_repo = MagicMock(), MagicMock()
+    snapshot_repo.get_snapshots_page.return_value = []
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    end = datetime(2024, 12, 31, tzinfo=timezone.utc)
+    asset_id = uuid4()
+
+    GetAssetSnapshotsUseCase(snapshot_repo, asset_repo).execute(asset_id, start_date=start, end_date=end, limit=10)
+
+    snapshot_repo.get_snapshots_page.assert_called_once_with(str(asset_id), 11, None, start, end)
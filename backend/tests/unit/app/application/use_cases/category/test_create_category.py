@@ -11,8 +11,8 @@ def make_fake_category(id_=None, name="Parent", parent=None):
     return Category(id=id_ or uuid4(), name=name, parent=parent)
 
 
-def test_create_category_no_parent(dummy_category_repository):
-    use_case = CreateCategoryUseCase(dummy_category_repository)
+def test_create_category_no_parent(dummy_category_repository, dummy_unit_of_work):
+    use_case = CreateCategoryUseCase(dummy_category_repository, dummy_unit_of_work)
     command = CreateCategoryCommand(name="Equities")
     result = use_case.execute(command)
 
@@ -21,12 +21,12 @@ def test_create_category_no_parent(dummy_category_repository):
     assert result.parent is None
 
 
-def test_create_category_with_parent(dummy_category_repository):
+def test_create_category_with_parent(dummy_category_repository, dummy_unit_of_work):
     parent_id = uuid4()
     parent = make_fake_category(parent_id, name="Parent")
     dummy_category_repository.save(parent)
 
-    use_case = CreateCategoryUseCase(dummy_category_repository)
+    use_case = CreateCategoryUseCase(dummy_category_repository, dummy_unit_of_work)
     command = CreateCategoryCommand(name="Child", parent_id=parent_id)
     result = use_case.execute(command)
 
@@ -35,18 +35,18 @@ def test_create_category_with_parent(dummy_category_repository):
     assert str(result.parent.id) == str(parent_id)
 
 
-def test_create_category_duplicate_name(dummy_category_repository):
+def test_create_category_duplicate_name(dummy_category_repository, dummy_unit_of_work):
     existing = make_fake_category(name="Equities")
     dummy_category_repository.save(existing)
 
-    use_case = CreateCategoryUseCase(dummy_category_repository)
+    use_case = CreateCategoryUseCase(dummy_category_repository, dummy_unit_of_work)
     command = CreateCategoryCommand(name="Equities")
     with pytest.raises(DuplicateName):
         use_case.execute(command)
 
 
-def test_create_category_parent_not_found(dummy_category_repository):
-    use_case = CreateCategoryUseCase(dummy_category_repository)
+def test_create_category_parent_not_found(dummy_category_repository, dummy_unit_of_work):
+    use_case = CreateCategoryUseCase(dummy_category_repository, dummy_unit_of_work)
     command = CreateCategoryCommand(name="Child", parent_id=uuid4())
     with pytest.raises(CategoryNotFound):
         use_case.execute(command)
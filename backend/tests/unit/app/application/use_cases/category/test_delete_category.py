@@ -15,24 +15,24 @@ def make_fake_category(id_=None, name="Test", parent_id=None):
     return cat
 
 
-def test_delete_category_success(dummy_category_repository):
+def test_delete_category_success(dummy_category_repository, dummy_unit_of_work):
     cat_id = uuid4()
     cat = make_fake_category(cat_id, name="Leaf")
     dummy_category_repository.save(cat)
 
-    use_case = DeleteCategoryUseCase(dummy_category_repository)
+    use_case = DeleteCategoryUseCase(dummy_category_repository, dummy_unit_of_work)
     use_case.execute(cat_id)
 
     assert dummy_category_repository.find_by_id(str(cat_id)) is None
 
 
-def test_delete_category_not_found(dummy_category_repository):
-    use_case = DeleteCategoryUseCase(dummy_category_repository)
+def test_delete_category_not_found(dummy_category_repository, dummy_unit_of_work):
+    use_case = DeleteCategoryUseCase(dummy_category_repository, dummy_unit_of_work)
     with pytest.raises(CategoryNotFound):
         use_case.execute(uuid4())
 
 
-def test_delete_category_has_children(dummy_category_repository):
+def test_delete_category_has_children(dummy_category_repository, dummy_unit_of_work):
     parent_id = uuid4()
     parent = make_fake_category(parent_id, name="Parent")
     dummy_category_repository.save(parent)
@@ -40,6 +40,6 @@ def test_delete_category_has_children(dummy_category_repository):
     child = make_fake_category(name="Child", parent_id=parent_id)
     dummy_category_repository.save(child)
 
-    use_case = DeleteCategoryUseCase(dummy_category_repository)
+    use_case = DeleteCategoryUseCase(dummy_category_repository, dummy_unit_of_work)
     with pytest.raises(CategoryHasChildren):
         use_case.execute(parent_id)
@@ -7,7 +7,7 @@ from app.domain.entities.category import Category
 
 def test_get_all_categories_empty(dummy_category_repository):
     use_case = GetAllCategoriesUseCase(dummy_category_repository)
-    assert use_case.execute() == []
+    assert use_case.execute().items == []
 
 
 def test_get_all_categories_with_items(dummy_category_repository):
@@ -17,4 +17,18 @@ def test_get_all_categories_with_items(dummy_category_repository):
     dummy_category_repository.save(c2)
     use_case = GetAllCategoriesUseCase(dummy_category_repository)
     result = use_case.execute()
-    assert len(result) == 2
+    assert len(result.items) == 2
+    assert result.next_cursor is None
+
+
+def test_get_all_categories_pages_by_name(dummy_category_repository):
+    for name in ("Stocks", "Bonds", "Crypto"):
+        dummy_category_repository.save(Category(id=uuid4(), name=name))
+    use_case = GetAllCategoriesUseCase(dummy_category_repository)
+
+    first = use_case.execute(limit=2)
+    second = use_case.execute(limit=2, cursor=first.next_cursor)
+
+    assert [c.name for c in first.items] == ["Bonds", "Crypto"]
+    assert [c.name for c in second.items] == ["Stocks"]
+    assert second.next_cursor is None
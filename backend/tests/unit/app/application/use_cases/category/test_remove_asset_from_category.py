@@ -31,29 +31,29 @@ def make_category():
     return Category(id=uuid4(), name="Stocks")
 
 
-def test_remove_asset_from_category_success(dummy_asset_repository, dummy_category_repository):
+def test_remove_asset_from_category_success(dummy_asset_repository, dummy_category_repository, dummy_unit_of_work):
     asset = make_asset()
     dummy_asset_repository.save(asset)
     category = make_category()
     dummy_category_repository.save(category)
 
-    use_case = RemoveAssetFromCategoryUseCase(dummy_asset_repository, dummy_category_repository)
+    use_case = RemoveAssetFromCategoryUseCase(dummy_asset_repository, dummy_category_repository, dummy_unit_of_work)
     cmd = RemoveAssetFromCategoryCommand(asset_id=asset.id, category_id=category.id)
     use_case.execute(cmd)  # should not raise
 
 
-def test_remove_asset_from_category_asset_not_found(dummy_asset_repository, dummy_category_repository):
-    use_case = RemoveAssetFromCategoryUseCase(dummy_asset_repository, dummy_category_repository)
+def test_remove_asset_from_category_asset_not_found(dummy_asset_repository, dummy_category_repository, dummy_unit_of_work):
+    use_case = RemoveAssetFromCategoryUseCase(dummy_asset_repository, dummy_category_repository, dummy_unit_of_work)
     cmd = RemoveAssetFromCategoryCommand(asset_id=uuid4(), category_id=uuid4())
     with pytest.raises(AssetNotFound):
         use_case.execute(cmd)
 
 
-def test_remove_asset_from_category_category_not_found(dummy_asset_repository, dummy_category_repository):
+def test_remove_asset_from_category_category_not_found(dummy_asset_repository, dummy_category_repository, dummy_unit_of_work):
     asset = make_asset()
     dummy_asset_repository.save(asset)
 
-    use_case = RemoveAssetFromCategoryUseCase(dummy_asset_repository, dummy_category_repository)
+    use_case = RemoveAssetFromCategoryUseCase(dummy_asset_repository, dummy_category_repository, dummy_unit_of_work)
     cmd = RemoveAssetFromCategoryCommand(asset_id=asset.id, category_id=uuid4())
     with pytest.raises(CategoryNotFound):
         use_case.execute(cmd)
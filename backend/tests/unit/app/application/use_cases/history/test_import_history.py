@@ -0,0 +1,126 @@
+"""Unit tests for ImportHistoryUseCase."""
+from decimal import Decimal
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+
+from app.application.use_cases.history import import_history
+from app.application.use_cases.history.import_history import ImportHistoryUseCase, ImportKind
+
+
+@pytest.fixture
+def repos():
+    snapshot_repo, transaction_repo, asset_repo = MagicMock(), MagicMock(), MagicMock()
+    snapshot_repo.save_many.side_effect = len
+    transaction_repo.save_many.side_effect = len
+    asset_repo.find_existing_ids.return_value = set()
+    asset_repo.find_ids_by_names.return_value = {}
+    return snapshot_repo, transaction_repo, asset_repo
+
+
+def _snapshot(line, asset, value="10.00", observed_at="2024-01-01T00:00:00+00:00"):
+    return line, {"asset": asset, "value": value, "observed_at": observed_at}
+
+
+def test_import_snapshots_by_id_and_name(repos, dummy_unit_of_work):
+    snapshot_repo, transaction_repo, asset_repo = repos
+    by_id, by_name = str(uuid4()), str(uuid4())
+    asset_repo.find_existing_ids.return_value = {by_id}
+    asset_repo.find_ids_by_names.return_value = {"Savings": [by_name]}
+
+    report = ImportHistoryUseCase(*repos, dummy_unit_of_work).execute(
+        ImportKind.SNAPSHOTS, [_snapshot(2, by_id, "1.50"), _snapshot(3, "Savings", "2.50")]
+    )
+
+    assert (report.rows_read, report.imported, report.failed) == (2, 2, 0)
+    saved = snapshot_repo.save_many.call_args.args[0]
+    assert {(str(s.asset_id), s.value) for s in saved} == {(by_id, Decimal("1.50")), (by_name, Decimal("2.50"))}
+    asset_repo.find_ids_by_names.assert_called_once_with(["Savings"], None)
+    transaction_repo.save_many.assert_not_called()
+
+
+def test_import_reports_unresolved_and_invalid_rows(repos, dummy_unit_of_work):
+    snapshot_repo, _, asset_repo = repos
+    asset_repo.find_ids_by_names.return_value = {"Twin": [str(uuid4()), str(uuid4())]}
+
+    report = ImportHistoryUseCase(*repos, dummy_unit_of_work).execute(ImportKind.SNAPSHOTS, [
+        _snapshot(2, "Twin"),
+        _snapshot(3, "Missing"),
+        _snapshot(4, "Twin", value="abc"),
+        (5, None),
+    ])
+
+    assert (report.rows_read, report.imported, report.failed) == (4, 0, 4)
+    assert [(e.line, e.code) for e in report.errors] == [
+        (4, "INVALID_ROW"),
+        (5, "INVALID_ROW"),
+        (2, "AMBIGUOUS_ASSET"),
+        (3, "ASSET_NOT_FOUND"),
+    ]
+    snapshot_repo.save_many.assert_called_once_with([])
+
+
+def test_import_writes_one_transaction_per_chunk_and_caches_assets(repos, dummy_unit_of_work):
+    snapshot_repo, _, asset_repo = repos
+    asset_repo.find_ids_by_names.return_value = {"Savings": [str(uuid4())]}
+    progress = []
+
+    report = ImportHistoryUseCase(*repos, dummy_unit_of_work).execute(
+        ImportKind.SNAPSHOTS,
+        (_snapshot(line, "Savings") for line in range(7)),
+        chunk_size=3,
+        on_progress=lambda r: progress.append(r.rows_read),
+    )
+
+    assert report.imported == 7
+    assert [len(c.args[0]) for c in snapshot_repo.save_many.call_args_list] == [3, 3, 1]
+    assert dummy_unit_of_work.commits == 3
+    assert progress == [3, 6, 7]
+    # Resolved on the first chunk, then served from the cache
+    asset_repo.find_ids_by_names.assert_called_once()
+    assert report.rows_per_second > 0
+
+
+def test_import_transactions(repos, dummy_unit_of_work):
+    _, transaction_repo, asset_repo = repos
+    asset_id = str(uuid4())
+    portfolio_id = uuid4()
+    asset_repo.find_ids_by_names.return_value = {"Stocks": [asset_id]}
+
+    report = ImportHistoryUseCase(*repos, dummy_unit_of_work).execute(ImportKind.TRANSACTIONS, [(2, {
+        "asset": "Stocks", "type": "acquire", "quantity": "3", "unit_price": "101.5",
+        "currency": "eur", "occurred_at": "2024-02-01T10:00:00Z",
+    })], portfolio_id=portfolio_id)
+
+    assert report.imported == 1
+    (transaction,) = transaction_repo.save_many.call_args.args[0]
+    assert str(transaction.asset_id) == asset_id
+    assert (transaction.type, transaction.currency) == ("ACQUIRE", "EUR")
+    assert transaction.quantity == Decimal("3")
+    asset_repo.find_ids_by_names.assert_called_once_with(["Stocks"], portfolio_id)
+
+
+def test_import_rejects_unknown_transaction_types(repos, dummy_unit_of_work):
+    _, transaction_repo, asset_repo = repos
+    asset_repo.find_ids_by_names.return_value = {"Stocks": [str(uuid4())]}
+    fields = {"asset": "Stocks", "quantity": "1", "unit_price": "1", "currency": "EUR",
+              "occurred_at": "2024-02-01T10:00:00Z"}
+
+    report = ImportHistoryUseCase(*repos, dummy_unit_of_work).execute(ImportKind.TRANSACTIONS, [
+        (2, {**fields, "type": "adjust"}),
+        (3, {**fields, "type": "BUY"}),
+    ])
+
+    assert (report.imported, report.failed) == (1, 1)
+    assert (report.errors[0].line, report.errors[0].code) == (3, "INVALID_ROW")
+    assert "type" in report.errors[0].message
+    (transaction,) = transaction_repo.save_many.call_args.args[0]
+    assert transaction.type == "ADJUST"
+
+
+def test_import_caps_reported_errors(repos, monkeypatch, dummy_unit_of_work):
+    monkeypatch.setattr(import_history, "MAX_REPORTED_ERRORS", 2)
+    report = ImportHistoryUseCase(*repos, dummy_unit_of_work).execute(ImportKind.SNAPSHOTS, [(line, None) for line in range(5)])
+    assert report.failed == 5
+    assert len(report.errors) == 2
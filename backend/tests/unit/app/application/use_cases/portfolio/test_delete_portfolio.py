@@ -7,19 +7,19 @@ from app.application.use_cases.portfolio.delete_portfolio import DeletePortfolio
 from app.domain.exceptions import PortfolioNotFound
 
 
-def test_delete_portfolio_success(dummy_portfolio_repository):
+def test_delete_portfolio_success(dummy_portfolio_repository, dummy_unit_of_work):
     from datetime import datetime, timezone
     from app.domain.entities.portfolio import Portfolio
     now = datetime.now(timezone.utc)
     portfolio = Portfolio(id=uuid4(), name="P", base_currency="EUR", created_at=now, updated_at=now)
     dummy_portfolio_repository.save(portfolio)
 
-    use_case = DeletePortfolioUseCase(dummy_portfolio_repository)
+    use_case = DeletePortfolioUseCase(dummy_portfolio_repository, dummy_unit_of_work)
     result = use_case.execute(portfolio.id)
     assert result is None
 
 
-def test_delete_portfolio_not_found(dummy_portfolio_repository):
-    use_case = DeletePortfolioUseCase(dummy_portfolio_repository)
+def test_delete_portfolio_not_found(dummy_portfolio_repository, dummy_unit_of_work):
+    use_case = DeletePortfolioUseCase(dummy_portfolio_repository, dummy_unit_of_work)
     with pytest.raises(PortfolioNotFound):
         use_case.execute(uuid4())
@@ -0,0 +1,31 @@
+"""Unit tests for ExportPortfolioSnapshotsUseCase."""
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+
+from app.application.use_cases.portfolio.export_portfolio_snapshots import ExportPortfolioSnapshotsUseCase
+from app.domain.exceptions import PortfolioNotFound
+
+
+def test_export_returns_repository_iterator():
+    portfolio_repo, snapshot_repo = MagicMock(), MagicMock()
+    portfolio_repo.exists.return_value = True
+    snapshot_repo.iter_snapshots.return_value = iter(["s1"])
+    portfolio_id = uuid4()
+    end = datetime(2024, 6, 1, tzinfo=timezone.utc)
+
+    result = ExportPortfolioSnapshotsUseCase(portfolio_repo, snapshot_repo).execute(portfolio_id, end_date=end)
+
+    assert list(result) == ["s1"]
+    snapshot_repo.iter_snapshots.assert_called_once_with(portfolio_id, None, end)
+
+
+def test_export_unknown_portfolio_raises_before_reading():
+    portfolio_repo, snapshot_repo = MagicMock(), MagicMock()
+    portfolio_repo.exists.return_value = False
+
+    with pytest.raises(PortfolioNotFound):
+        ExportPortfolioSnapshotsUseCase(portfolio_repo, snapshot_repo).execute(uuid4())
+    snapshot_repo.iter_snapshots.assert_not_called()
@@ -25,3 +25,11 @@ def test_get_all_portfolios_with_items(dummy_portfolio_repository):
     use_case = GetAllPortfoliosUseCase(dummy_portfolio_repository)
     result = use_case.execute()
     assert len(result) == 2
+
+
+def test_get_all_portfolios_returns_summaries(dummy_portfolio_repository):
+    p = make_portfolio()
+    dummy_portfolio_repository.save(p)
+    result = GetAllPortfoliosUseCase(dummy_portfolio_repository).execute()
+    assert result[0].id == p.id
+    assert result[0].asset_count == 0
@@ -0,0 +1,26 @@
+"""Unit tests for GetPortfolioUseCase."""
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+
+from app.application.use_cases.portfolio.get_portfolio import GetPortfolioUseCase
+from app.domain.entities.portfolio import Portfolio
+from app.domain.entities.portfolio_summary import PortfolioSummary
+from app.domain.exceptions import PortfolioNotFound
+
+
+def test_get_portfolio_returns_summary(dummy_portfolio_repository):
+    now = datetime.now(timezone.utc)
+    portfolio = Portfolio(id=uuid4(), name="P", base_currency="EUR", created_at=now, updated_at=now)
+    dummy_portfolio_repository.save(portfolio)
+
+    result = GetPortfolioUseCase(dummy_portfolio_repository).execute(portfolio.id)
+
+    assert isinstance(result, PortfolioSummary)
+    assert (result.id, result.asset_count) == (portfolio.id, 0)
+
+
+def test_get_portfolio_not_found(dummy_portfolio_repository):
+    with pytest.raises(PortfolioNotFound):
+        GetPortfolioUseCase(dummy_portfolio_repository).execute(uuid4())
@@ -0,0 +1,67 @@
+"""Unit tests for GetPortfolioHistoryUseCase."""
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+
+from app.application.use_cases.portfolio.get_portfolio_history import GetPortfolioHistoryUseCase
+from app.domain.entities import SnapshotSeries
+from app.domain.exceptions import InvalidTimeRange, PortfolioNotFound
+
+T0 = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def repos():
+    portfolio_repo, snapshot_repo = MagicMock(), MagicMock()
+    portfolio_repo.exists.return_value = True
+    snapshot_repo.get_portfolio_snapshot_series.return_value = [
+        SnapshotSeries.from_rows(uuid4(), [
+            (uuid4(), T0, Decimal("100.00")),
+            (uuid4(), T0 + timedelta(days=2), Decimal("150.00")),
+        ]),
+        SnapshotSeries.from_rows(uuid4(), [(uuid4(), T0 + timedelta(days=1), Decimal("25.00"))]),
+    ]
+    return portfolio_repo, snapshot_repo
+
+
+def test_history_values_each_step(repos):
+    portfolio_id = uuid4()
+    end = T0 + timedelta(days=3)
+
+    points = GetPortfolioHistoryUseCase(*repos).execute(portfolio_id, T0, end, timedelta(days=1))
+
+    assert [(p.observed_at, p.value) for p in points] == [
+        (T0, Decimal("100.00")),
+        (T0 + timedelta(days=1), Decimal("125.00")),
+        (T0 + timedelta(days=2), Decimal("175.00")),
+        (T0 + timedelta(days=3), Decimal("175.00")),
+    ]
+    repos[1].get_portfolio_snapshot_series.assert_called_once_with(portfolio_id, end)
+
+
+def test_history_defaults_to_a_daily_year_until_now(repos):
+    points = GetPortfolioHistoryUseCase(*repos).execute(uuid4())
+
+    assert len(points) == 366
+    assert points[-1].observed_at - points[0].observed_at == timedelta(days=365)
+    assert points[-1].value == Decimal("175.00")
+
+
+@pytest.mark.parametrize("start, end, step", [
+    (T0, T0 + timedelta(days=1), timedelta(0)),
+    (T0 + timedelta(days=1), T0, timedelta(days=1)),
+    (T0, T0 + timedelta(days=365), timedelta(minutes=1)),
+])
+def test_history_rejects_invalid_ranges(repos, start, end, step):
+    with pytest.raises(InvalidTimeRange):
+        GetPortfolioHistoryUseCase(*repos).execute(uuid4(), start, end, step)
+    repos[1].get_portfolio_snapshot_series.assert_not_called()
+
+
+def test_history_unknown_portfolio_raises(repos):
+    repos[0].exists.return_value = False
+    with pytest.raises(PortfolioNotFound):
+        GetPortfolioHistoryUseCase(*repos).execute(uuid4(), T0, T0)
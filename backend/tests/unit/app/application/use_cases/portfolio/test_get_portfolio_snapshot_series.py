@@ -0,0 +1,34 @@
+"""Unit tests for GetPortfolioSnapshotSeriesUseCase."""
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+
+from app.application.use_cases.portfolio.get_portfolio_snapshot_series import GetPortfolioSnapshotSeriesUseCase
+from app.domain.entities.value_series import SeriesBucket
+from app.domain.exceptions import PortfolioNotFound
+
+
+def test_series_delegates_bucketing_to_repository():
+    portfolio_repo, snapshot_repo = MagicMock(), MagicMock()
+    portfolio_repo.exists.return_value = True
+    snapshot_repo.get_series.return_value = ["p1"]
+    portfolio_id = uuid4()
+    end = datetime(2024, 6, 1, tzinfo=timezone.utc)
+
+    result = GetPortfolioSnapshotSeriesUseCase(portfolio_repo, snapshot_repo).execute(
+        portfolio_id, SeriesBucket.MONTH, end_date=end
+    )
+
+    assert result == ["p1"]
+    snapshot_repo.get_series.assert_called_once_with(portfolio_id, SeriesBucket.MONTH, None, end)
+
+
+def test_series_unknown_portfolio_raises():
+    portfolio_repo, snapshot_repo = MagicMock(), MagicMock()
+    portfolio_repo.exists.return_value = False
+
+    with pytest.raises(PortfolioNotFound):
+        GetPortfolioSnapshotSeriesUseCase(portfolio_repo, snapshot_repo).execute(uuid4())
+    snapshot_repo.get_series.assert_not_called()
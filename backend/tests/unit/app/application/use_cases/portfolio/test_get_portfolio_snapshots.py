@@ -1,45 +1,63 @@
 """Unit tests for GetPortfolioSnapshotsUseCase."""
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
 from unittest.mock import MagicMock
 from uuid import uuid4
 
 import pytest
 
+from app.application.pagination import decode_cursor
 from app.application.use_cases.portfolio.get_portfolio_snapshots import GetPortfolioSnapshotsUseCase
-from app.domain.entities.portfolio import Portfolio
+from app.domain.entities.portfolio_snapshot import PortfolioSnapshot
 from app.domain.exceptions import PortfolioNotFound
 
 
-def make_portfolio():
-    now = datetime.now(timezone.utc)
-    return Portfolio(id=uuid4(), name="P", base_currency="EUR", created_at=now, updated_at=now)
+def make_snapshot(day):
+    return PortfolioSnapshot(
+        id=uuid4(), portfolio_id=uuid4(), value=Decimal("1.00"),
+        observed_at=datetime(2024, 1, 1, tzinfo=timezone.utc) + timedelta(days=day),
+    )
 
 
 def test_get_snapshots_not_found():
-    repo = MagicMock()
-    repo.find_with_snapshots.return_value = None
-    use_case = GetPortfolioSnapshotsUseCase(repo)
+    portfolio_repo, snapshot_repo = MagicMock(), MagicMock()
+    portfolio_repo.exists.return_value = False
+    use_case = GetPortfolioSnapshotsUseCase(portfolio_repo, snapshot_repo)
     with pytest.raises(PortfolioNotFound):
         use_case.execute(uuid4())
+    snapshot_repo.get_snapshots_page.assert_not_called()
 
 
 def test_get_snapshots_success():
-    repo = MagicMock()
-    portfolio = make_portfolio()
-    repo.find_with_snapshots.return_value = portfolio
-    use_case = GetPortfolioSnapshotsUseCase(repo)
-    result = use_case.execute(portfolio.id)
-    assert result is portfolio
-    repo.find_with_snapshots.assert_called_once_with(portfolio.id, start_date=None, end_date=None)
+    portfolio_repo, snapshot_repo = MagicMock(), MagicMock()
+    snapshots = [make_snapshot(1), make_snapshot(0)]
+    snapshot_repo.get_snapshots_page.return_value = snapshots
+    portfolio_id = uuid4()
+    use_case = GetPortfolioSnapshotsUseCase(portfolio_repo, snapshot_repo)
+    result = use_case.execute(portfolio_id)
+    assert result.items == snapshots
+    assert result.next_cursor is None
+    snapshot_repo.get_snapshots_page.assert_called_once_with(portfolio_id, 101, None, start_date=None, end_date=None)
 
 
 def test_get_snapshots_with_dates():
-    repo = MagicMock()
-    portfolio = make_portfolio()
-    repo.find_with_snapshots.return_value = portfolio
+    portfolio_repo, snapshot_repo = MagicMock(), MagicMock()
+    snapshot_repo.get_snapshots_page.return_value = []
     start = datetime(2024, 1, 1, tzinfo=timezone.utc)
     end = datetime(2024, 12, 31, tzinfo=timezone.utc)
-    use_case = GetPortfolioSnapshotsUseCase(repo)
-    result = use_case.execute(portfolio.id, start_date=start, end_date=end)
-    assert result is portfolio
-    repo.find_with_snapshots.assert_called_once_with(portfolio.id, start_date=start, end_date=end)
+    portfolio_id = uuid4()
+    use_case = GetPortfolioSnapshotsUseCase(portfolio_repo, snapshot_repo)
+    use_case.execute(portfolio_id, start_date=start, end_date=end, limit=10)
+    snapshot_repo.get_snapshots_page.assert_called_once_with(portfolio_id, 11, None, start_date=start, end_date=end)
+
+
+def test_get_snapshots_returns_cursor_of_last_item_when_more_remain():
+    portfolio_repo, snapshot_repo = MagicMock(), MagicMock()
+    snapshots = [make_snapshot(day) for day in (3, 2, 1)]
+    snapshot_repo.get_snapshots_page.return_value = snapshots
+    use_case = GetPortfolioSnapshotsUseCase(portfolio_repo, snapshot_repo)
+
+    page = use_case.execute(uuid4(), limit=2)
+
+    assert page.items == snapshots[:2]
+    assert decode_cursor(page.next_cursor, (datetime, str)) == (snapshots[1].observed_at, str(snapshots[1].id))
@@ -17,23 +17,37 @@ def make_portfolio(with_assets=False):
     return p
 
 
-def test_take_snapshot_portfolio_not_found():
+def test_take_snapshot_portfolio_not_found(dummy_unit_of_work):
     repo = MagicMock()
-    repo.find_with_assets.return_value = None
-    use_case = TakePortfolioSnapshotUseCase(repo)
+    repo.exists.return_value = False
+    use_case = TakePortfolioSnapshotUseCase(repo, dummy_unit_of_work)
     with pytest.raises(PortfolioNotFound):
         use_case.execute(uuid4())
 
 
-def test_take_snapshot_success():
+def test_take_snapshot_success(dummy_unit_of_work):
     repo = MagicMock()
     portfolio = make_portfolio()
-    repo.find_with_assets.return_value = portfolio
+    repo.exists.return_value = True
+    repo.get_total_value.return_value = Decimal("0")
     repo.save_snapshot.return_value = None
 
-    use_case = TakePortfolioSnapshotUseCase(repo)
+    use_case = TakePortfolioSnapshotUseCase(repo, dummy_unit_of_work)
     snapshot = use_case.execute(portfolio.id)
 
     assert snapshot.portfolio_id == portfolio.id
     assert snapshot.value == Decimal("0")
     repo.save_snapshot.assert_called_once_with(snapshot)
+
+
+def test_take_snapshot_uses_repository_valuation(dummy_unit_of_work):
+    repo = MagicMock()
+    portfolio = make_portfolio()
+    repo.exists.return_value = True
+    repo.get_total_value.return_value = Decimal("1234.56")
+
+    snapshot = TakePortfolioSnapshotUseCase(repo, dummy_unit_of_work).execute(portfolio.id)
+
+    assert snapshot.value == Decimal("1234.56")
+    repo.get_total_value.assert_called_once_with(portfolio.id)
+    repo.find_with_assets.assert_not_called()
@@ -14,17 +14,17 @@ def make_portfolio():
     return Portfolio(id=uuid4(), name="Old Name", base_currency="EUR", created_at=now, updated_at=now)
 
 
-def test_update_portfolio_not_found(dummy_portfolio_repository):
-    use_case = UpdatePortfolioUseCase(dummy_portfolio_repository)
+def test_update_portfolio_not_found(dummy_portfolio_repository, dummy_unit_of_work):
+    use_case = UpdatePortfolioUseCase(dummy_portfolio_repository, dummy_unit_of_work)
     cmd = UpdatePortfolioCommand(portfolio_id=uuid4(), name="New", base_currency="USD")
     with pytest.raises(PortfolioNotFound):
         use_case.execute(cmd)
 
 
-def test_update_portfolio_success(dummy_portfolio_repository):
+def test_update_portfolio_success(dummy_portfolio_repository, dummy_unit_of_work):
     portfolio = make_portfolio()
     dummy_portfolio_repository.save(portfolio)
-    use_case = UpdatePortfolioUseCase(dummy_portfolio_repository)
+    use_case = UpdatePortfolioUseCase(dummy_portfolio_repository, dummy_unit_of_work)
     cmd = UpdatePortfolioCommand(portfolio_id=portfolio.id, name="New Name", base_currency="USD")
     result = use_case.execute(cmd)
     assert result.name == "New Name"
@@ -14,20 +14,22 @@ def make_fake_tag(id_=None, name="test-tag"):
     return tag
 
 
-def test_create_tag_success(dummy_tag_repository):
-    use_case = CreateTagUseCase(dummy_tag_repository)
+def test_create_tag_success(dummy_tag_repository, dummy_unit_of_work):
+    use_case = CreateTagUseCase(dummy_tag_repository, dummy_unit_of_work)
     command = CreateTagCommand(name="growth")
     result = use_case.execute(command)
 
     assert result.id is not None
     assert result.name == "growth"
+    assert dummy_unit_of_work.commits == 1
 
 
-def test_create_tag_duplicate_name(dummy_tag_repository):
+def test_create_tag_duplicate_name(dummy_tag_repository, dummy_unit_of_work):
     existing = make_fake_tag(name="growth")
     dummy_tag_repository.save(existing)
 
-    use_case = CreateTagUseCase(dummy_tag_repository)
+    use_case = CreateTagUseCase(dummy_tag_repository, dummy_unit_of_work)
     command = CreateTagCommand(name="growth")
     with pytest.raises(DuplicateName):
         use_case.execute(command)
+    assert (dummy_unit_of_work.commits, dummy_unit_of_work.rollbacks) == (0, 1)
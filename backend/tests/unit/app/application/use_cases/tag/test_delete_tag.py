@@ -14,18 +14,18 @@ def make_fake_tag(id_=None, name="test-tag"):
     return tag
 
 
-def test_delete_tag_success(dummy_tag_repository):
+def test_delete_tag_success(dummy_tag_repository, dummy_unit_of_work):
     tag_id = uuid4()
     tag = make_fake_tag(tag_id, name="growth")
     dummy_tag_repository.save(tag)
 
-    use_case = DeleteTagUseCase(dummy_tag_repository)
+    use_case = DeleteTagUseCase(dummy_tag_repository, dummy_unit_of_work)
     use_case.execute(tag_id)
 
     assert dummy_tag_repository.find_by_id(str(tag_id)) is None
 
 
-def test_delete_tag_not_found(dummy_tag_repository):
-    use_case = DeleteTagUseCase(dummy_tag_repository)
+def test_delete_tag_not_found(dummy_tag_repository, dummy_unit_of_work):
+    use_case = DeleteTagUseCase(dummy_tag_repository, dummy_unit_of_work)
     with pytest.raises(TagNotFound):
         use_case.execute(uuid4())
@@ -7,7 +7,7 @@ from app.domain.entities.tag import Tag
 
 def test_get_all_tags_empty(dummy_tag_repository):
     use_case = GetAllTagsUseCase(dummy_tag_repository)
-    assert use_case.execute() == []
+    assert use_case.execute().items == []
 
 
 def test_get_all_tags_with_items(dummy_tag_repository):
@@ -17,4 +17,16 @@ def test_get_all_tags_with_items(dummy_tag_repository):
     dummy_tag_repository.save(t2)
     use_case = GetAllTagsUseCase(dummy_tag_repository)
     result = use_case.execute()
-    assert len(result) == 2
+    assert len(result.items) == 2
+
+
+def test_get_all_tags_pages_by_name(dummy_tag_repository):
+    for name in ("growth", "crypto", "income"):
+        dummy_tag_repository.save(Tag(id=uuid4(), name=name))
+    use_case = GetAllTagsUseCase(dummy_tag_repository)
+
+    first = use_case.execute(limit=2)
+    second = use_case.execute(limit=2, cursor=first.next_cursor)
+
+    assert [t.name for t in first.items + second.items] == ["crypto", "growth", "income"]
+    assert second.next_cursor is None
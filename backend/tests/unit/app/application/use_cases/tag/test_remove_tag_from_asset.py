@@ -20,7 +20,7 @@ def make_fake_tag(id_=None, name="test-tag"):
     return tag
 
 
-def test_remove_tag_from_asset_success(dummy_asset_repository, dummy_tag_repository):
+def test_remove_tag_from_asset_success(dummy_asset_repository, dummy_tag_repository, dummy_unit_of_work):
     asset_id = uuid4()
     tag_id = uuid4()
 
@@ -29,29 +29,29 @@ def test_remove_tag_from_asset_success(dummy_asset_repository, dummy_tag_reposit
     tag = make_fake_tag(tag_id)
     dummy_tag_repository.save(tag)
 
-    use_case = RemoveTagFromAssetUseCase(dummy_asset_repository, dummy_tag_repository)
+    use_case = RemoveTagFromAssetUseCase(dummy_asset_repository, dummy_tag_repository, dummy_unit_of_work)
     command = RemoveTagFromAssetCommand(asset_id=asset_id, tag_id=tag_id)
     # Should complete without raising
     use_case.execute(command)
 
 
-def test_remove_tag_from_asset_asset_not_found(dummy_asset_repository, dummy_tag_repository):
+def test_remove_tag_from_asset_asset_not_found(dummy_asset_repository, dummy_tag_repository, dummy_unit_of_work):
     tag_id = uuid4()
     tag = make_fake_tag(tag_id)
     dummy_tag_repository.save(tag)
 
-    use_case = RemoveTagFromAssetUseCase(dummy_asset_repository, dummy_tag_repository)
+    use_case = RemoveTagFromAssetUseCase(dummy_asset_repository, dummy_tag_repository, dummy_unit_of_work)
     command = RemoveTagFromAssetCommand(asset_id=uuid4(), tag_id=tag_id)
     with pytest.raises(AssetNotFound):
         use_case.execute(command)
 
 
-def test_remove_tag_from_asset_tag_not_found(dummy_asset_repository, dummy_tag_repository):
+def test_remove_tag_from_asset_tag_not_found(dummy_asset_repository, dummy_tag_repository, dummy_unit_of_work):
     asset_id = uuid4()
     asset = make_fake_asset(asset_id)
     dummy_asset_repository.save(asset)
 
-    use_case = RemoveTagFromAssetUseCase(dummy_asset_repository, dummy_tag_repository)
+    use_case = RemoveTagFromAssetUseCase(dummy_asset_repository, dummy_tag_repository, dummy_unit_of_work)
     command = RemoveTagFromAssetCommand(asset_id=asset_id, tag_id=uuid4())
     with pytest.raises(TagNotFound):
         use_case.execute(command)
@@ -0,0 +1,29 @@
+"""Unit tests for ExportAssetTransactionsUseCase."""
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+
+from app.application.use_cases.transaction.export_transactions import ExportAssetTransactionsUseCase
+from app.domain.exceptions import AssetNotFound
+
+
+def test_export_returns_repository_iterator():
+    transaction_repo, asset_repo = MagicMock(), MagicMock()
+    asset_repo.exists.return_value = True
+    transaction_repo.iter_by_asset.return_value = iter(["t1"])
+    asset_id = uuid4()
+
+    result = ExportAssetTransactionsUseCase(transaction_repo, asset_repo).execute(asset_id)
+
+    assert list(result) == ["t1"]
+    transaction_repo.iter_by_asset.assert_called_once_with(asset_id, None, None)
+
+
+def test_export_unknown_asset_raises_before_reading():
+    transaction_repo, asset_repo = MagicMock(), MagicMock()
+    asset_repo.exists.return_value = False
+
+    with pytest.raises(AssetNotFound):
+        ExportAssetTransactionsUseCase(transaction_repo, asset_repo).execute(uuid4())
+    transaction_repo.iter_by_asset.assert_not_called()
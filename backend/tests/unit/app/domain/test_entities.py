@@ -73,6 +73,20 @@ class TestAssetCurrentValue:
         at = datetime(2024, 3, 1, tzinfo=timezone.utc)
         assert asset.current_value(at=at) == Decimal("100")
 
+    def test_supplied_order_does_not_matter(self):
+        asset_id = uuid4()
+        s1 = make_snapshot(asset_id, 100, datetime(2024, 1, 1, tzinfo=timezone.utc))
+        s2 = make_snapshot(asset_id, 200, datetime(2024, 6, 1, tzinfo=timezone.utc))
+        asset = make_asset(snapshots=[s1, s2])
+        assert asset.current_value() == Decimal("200")
+        # Re-sorted on assignment as well
+        asset.snapshots = [s2, s1]
+        assert asset.current_value(at=datetime(2024, 3, 1, tzinfo=timezone.utc)) == Decimal("100")
+
+    def test_before_first_snapshot_returns_zero(self):
+        asset = make_asset(snapshots=[make_snapshot(uuid4(), 100, datetime(2024, 1, 1, tzinfo=timezone.utc))])
+        assert asset.current_value(at=datetime(2023, 1, 1, tzinfo=timezone.utc)) == Decimal("0.0")
+
 
 class TestAssetDispose:
     def test_dispose_sets_disposed_true(self):
@@ -0,0 +1,75 @@
+"""Unit tests for fixed-point money arithmetic."""
+import random
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from app.domain.entities.asset import Asset
+from app.domain.entities.asset_snapshot import AssetSnapshot
+from app.domain.entities.asset_type import AssetType
+from app.domain.entities.money import from_cents, to_cents
+from app.domain.entities.portfolio import Portfolio
+from app.domain.entities.snapshot_timeline import SnapshotTimeline
+
+T0 = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.mark.parametrize("value, cents", [
+    (Decimal("12.34"), 1234),
+    (Decimal("-0.05"), -5),
+    (Decimal("10"), 1000),
+    (Decimal("1E+2"), 10000),
+    (Decimal("1.005"), 101),
+    (Decimal("-1.005"), -101),
+    (Decimal("99999999999999999.99"), 9999999999999999999),
+])
+def test_to_cents(value, cents):
+    assert to_cents(value) == cents
+
+
+def test_from_cents_has_two_decimal_places():
+    assert str(from_cents(123456)) == "1234.56"
+    assert str(from_cents(0)) == "0.00"
+    assert str(from_cents(-5)) == "-0.05"
+
+
+def test_timeline_cents_at():
+    asset_id = uuid4()
+    timeline = SnapshotTimeline([
+        AssetSnapshot(id=uuid4(), asset_id=asset_id, value=Decimal("1.50"), observed_at=T0),
+        AssetSnapshot(id=uuid4(), asset_id=asset_id, value=Decimal("2.25"), observed_at=T0 + timedelta(days=2)),
+    ])
+    assert timeline.cents_at() == 225
+    assert timeline.cents_at(T0 + timedelta(days=1)) == 150
+    assert timeline.cents_at(T0 - timedelta(days=1)) == 0
+    assert SnapshotTimeline().cents_at() == 0
+
+
+def test_total_value_is_bit_identical_to_decimal_sum():
+    rng = random.Random(42)
+    portfolio = Portfolio(id=uuid4(), name="P", base_currency="EUR", created_at=T0, updated_at=T0)
+    asset_type = AssetType(id=uuid4(), code="EQUITY", label="Equity")
+    values = []
+    for i in range(1000):
+        asset_id = uuid4()
+        history = [Decimal(rng.randint(-10**17, 10**17)).scaleb(-2) for _ in range(3)]
+        portfolio.assets.append(Asset(
+            id=asset_id, name=f"Asset {i}", asset_type=asset_type, portfolio=portfolio,
+            disposed=i % 10 == 0,
+            snapshots=[
+                AssetSnapshot(id=uuid4(), asset_id=asset_id, value=v, observed_at=T0 + timedelta(days=d))
+                for d, v in enumerate(history)
+            ],
+            created_at=T0, updated_at=T0, created_by="u", updated_by="u",
+        ))
+        values.append(history)
+    active = [history for i, history in enumerate(values) if i % 10]
+
+    expected_latest = sum((history[-1] for history in active), Decimal("0.00"))
+    expected_day_one = sum((history[1] for history in active), Decimal("0.00"))
+
+    assert portfolio.total_value().as_tuple() == expected_latest.as_tuple()
+    assert portfolio.total_value(at=T0 + timedelta(days=1)).as_tuple() == expected_day_one.as_tuple()
+    assert Portfolio(id=uuid4(), name="E", base_currency="EUR", created_at=T0, updated_at=T0).total_value() == 0
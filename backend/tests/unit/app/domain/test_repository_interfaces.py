@@ -1,7 +1,9 @@
 """Tests to cover abstract method pass-bodies in repository interfaces."""
+import asyncio
 from datetime import datetime, timezone
 from uuid import uuid4
 
+from app.domain.entities.value_series import SeriesBucket
 from app.domain.ports.repository.base_repository import BaseRepository
 from app.domain.ports.repository.asset_repository import IAssetRepository
 from app.domain.ports.repository.asset_snapshot_repository import IAssetSnapshotRepository
@@ -11,6 +13,11 @@ from app.domain.ports.repository.portfolio_repository import IPortfolioRepositor
 from app.domain.ports.repository.portfolio_snapshot_repository import IPortfolioSnapshotRepository
 from app.domain.ports.repository.tag_repository import ITagRepository
 from app.domain.ports.repository.transaction_repository import ITransactionRepository
+from app.domain.ports.repository.unit_of_work import IUnitOfWork
+from app.domain.ports.repository.async_asset_repository import IAsyncAssetRepository
+from app.domain.ports.repository.async_asset_snapshot_repository import IAsyncAssetSnapshotRepository
+from app.domain.ports.repository.async_portfolio_repository import IAsyncPortfolioRepository
+from app.domain.ports.repository.async_unit_of_work import IAsyncUnitOfWork
 
 
 # ---------------------------------------------------------------------------
@@ -32,6 +39,10 @@ class ConcreteAssetRepo(IAssetRepository):
     def delete(self, entity_id): return super().delete(entity_id)
     def exists(self, entity_id): return super().exists(entity_id)
     def find_by_portfolio(self, portfolio_id): return super().find_by_portfolio(portfolio_id)
+    def find_page(self, limit, after=None, portfolio_id=None): return super().find_page(limit, after, portfolio_id)
+    def find_summary_page(self, limit, after=None, portfolio_id=None): return super().find_summary_page(limit, after, portfolio_id)
+    def find_existing_ids(self, asset_ids): return super().find_existing_ids(asset_ids)
+    def find_ids_by_names(self, names, portfolio_id=None): return super().find_ids_by_names(names, portfolio_id)
     def find_by_type(self, asset_type_code): return super().find_by_type(asset_type_code)
     def find_by_category(self, category_id): return super().find_by_category(category_id)
     def find_by_tag(self, tag_id): return super().find_by_tag(tag_id)
@@ -51,7 +62,14 @@ class ConcreteAssetSnapshotRepo(IAssetSnapshotRepository):
     def delete(self, entity_id): return super().delete(entity_id)
     def exists(self, entity_id): return super().exists(entity_id)
     def get_snapshots(self, asset_id, start_date=None, end_date=None): return super().get_snapshots(asset_id, start_date, end_date)
+    def get_snapshots_page(self, asset_id, limit, after=None, start_date=None, end_date=None): return super().get_snapshots_page(asset_id, limit, after, start_date, end_date)
+    def get_series(self, asset_id, bucket, start_date=None, end_date=None): return super().get_series(asset_id, bucket, start_date, end_date)
+    def get_snapshot_series(self, asset_id, start_date=None, end_date=None): return super().get_snapshot_series(asset_id, start_date, end_date)
+    def get_portfolio_snapshot_series(self, portfolio_id, end_date=None): return super().get_portfolio_snapshot_series(portfolio_id, end_date)
     def get_latest_snapshot(self, asset_id): return super().get_latest_snapshot(asset_id)
+    def save_many(self, snapshots): return super().save_many(snapshots)
+    def save_values(self, rows): return super().save_values(rows)
+    def iter_snapshots(self, asset_id, start_date=None, end_date=None): return super().iter_snapshots(asset_id, start_date, end_date)
 
 
 class ConcreteAssetTypeRepo(IAssetTypeRepository):
@@ -71,6 +89,7 @@ class ConcreteCategoryRepo(ICategoryRepository):
     def delete(self, entity_id): return super().delete(entity_id)
     def exists(self, entity_id): return super().exists(entity_id)
     def find_by_name(self, name): return super().find_by_name(name)
+    def find_page(self, limit, after=None): return super().find_page(limit, after)
     def find_root_categories(self): return super().find_root_categories()
     def find_children(self, parent_id): return super().find_children(parent_id)
     def count_assets(self, category_id): return super().count_assets(category_id)
@@ -85,6 +104,9 @@ class ConcretePortfolioRepo(IPortfolioRepository):
     def find_by_name(self, name): return super().find_by_name(name)
     def find_with_assets(self, portfolio_id): return super().find_with_assets(portfolio_id)
     def find_with_snapshots(self, portfolio_id, start_date=None, end_date=None): return super().find_with_snapshots(portfolio_id, start_date, end_date)
+    def get_total_value(self, portfolio_id, at=None): return super().get_total_value(portfolio_id, at)
+    def find_summary(self, portfolio_id): return super().find_summary(portfolio_id)
+    def find_all_summaries(self): return super().find_all_summaries()
     def save_snapshot(self, snapshot): return super().save_snapshot(snapshot)
     def count_assets(self, portfolio_id): return super().count_assets(portfolio_id)
 
@@ -96,7 +118,10 @@ class ConcretePortfolioSnapshotRepo(IPortfolioSnapshotRepository):
     def delete(self, entity_id): return super().delete(entity_id)
     def exists(self, entity_id): return super().exists(entity_id)
     def get_snapshots(self, portfolio_id, start_date=None, end_date=None): return super().get_snapshots(portfolio_id, start_date, end_date)
+    def get_snapshots_page(self, portfolio_id, limit, after=None, start_date=None, end_date=None): return super().get_snapshots_page(portfolio_id, limit, after, start_date, end_date)
+    def get_series(self, portfolio_id, bucket, start_date=None, end_date=None): return super().get_series(portfolio_id, bucket, start_date, end_date)
     def get_latest_snapshot(self, portfolio_id): return super().get_latest_snapshot(portfolio_id)
+    def iter_snapshots(self, portfolio_id, start_date=None, end_date=None): return super().iter_snapshots(portfolio_id, start_date, end_date)
 
 
 class ConcreteTagRepo(ITagRepository):
@@ -106,6 +131,7 @@ class ConcreteTagRepo(ITagRepository):
     def delete(self, entity_id): return super().delete(entity_id)
     def exists(self, entity_id): return super().exists(entity_id)
     def find_by_name(self, name): return super().find_by_name(name)
+    def find_page(self, limit, after=None): return super().find_page(limit, after)
     def find_by_asset(self, asset_id): return super().find_by_asset(asset_id)
     def attach_to_asset(self, asset_id, tag_id): return super().attach_to_asset(asset_id, tag_id)
     def detach_from_asset(self, asset_id, tag_id): return super().detach_from_asset(asset_id, tag_id)
@@ -119,6 +145,33 @@ class ConcreteTransactionRepo(ITransactionRepository):
     def exists(self, entity_id): return super().exists(entity_id)
     def find_by_asset(self, asset_id): return super().find_by_asset(asset_id)
     def find_between_dates(self, start_date, end_date): return super().find_between_dates(start_date, end_date)
+    def save_many(self, transactions): return super().save_many(transactions)
+    def iter_by_asset(self, asset_id, start_date=None, end_date=None): return super().iter_by_asset(asset_id, start_date, end_date)
+
+
+class ConcreteUnitOfWork(IUnitOfWork):
+    def __init__(self): self.calls = []
+    def commit(self): self.calls.append("commit"); return super().commit()
+    def rollback(self): self.calls.append("rollback"); return super().rollback()
+
+
+class ConcreteAsyncAssetRepo(IAsyncAssetRepository):
+    async def find_by_id(self, entity_id): return await super().find_by_id(entity_id)
+
+
+class ConcreteAsyncAssetSnapshotRepo(IAsyncAssetSnapshotRepository):
+    async def add(self, snapshot): return await super().add(snapshot)
+    async def get_snapshots_page(self, asset_id, limit, after=None, start_date=None, end_date=None): return await super().get_snapshots_page(asset_id, limit, after, start_date, end_date)
+
+
+class ConcreteAsyncPortfolioRepo(IAsyncPortfolioRepository):
+    async def find_all_summaries(self): return await super().find_all_summaries()
+
+
+class ConcreteAsyncUnitOfWork(IAsyncUnitOfWork):
+    def __init__(self): self.calls = []
+    async def commit(self): self.calls.append("commit"); return await super().commit()
+    async def rollback(self): self.calls.append("rollback"); return await super().rollback()
 
 
 # ---------------------------------------------------------------------------
@@ -147,6 +200,10 @@ def test_asset_repository_abstract_methods():
     repo.delete(_ID)
     repo.exists(_ID)
     repo.find_by_portfolio(_UUID)
+    repo.find_page(10)
+    repo.find_summary_page(10)
+    repo.find_existing_ids([_UUID])
+    repo.find_ids_by_names(["Savings"])
     repo.find_by_type("EQUITY")
     repo.find_by_category(_UUID)
     repo.find_by_tag(_UUID)
@@ -167,7 +224,14 @@ def test_asset_snapshot_repository_abstract_methods():
     repo.delete(_ID)
     repo.exists(_ID)
     repo.get_snapshots(_UUID)
+    repo.get_snapshots_page(_UUID, 10)
+    repo.get_series(_UUID, SeriesBucket.DAY)
+    repo.get_snapshot_series(_UUID)
+    repo.get_portfolio_snapshot_series(_UUID)
     repo.get_latest_snapshot(_UUID)
+    repo.save_many([])
+    repo.save_values([])
+    repo.iter_snapshots(_UUID)
 
 
 def test_asset_type_repository_abstract_methods():
@@ -189,6 +253,7 @@ def test_category_repository_abstract_methods():
     repo.delete(_ID)
     repo.exists(_ID)
     repo.find_by_name("Stocks")
+    repo.find_page(10)
     repo.find_root_categories()
     repo.find_children(_UUID)
     repo.count_assets(_UUID)
@@ -204,6 +269,9 @@ def test_portfolio_repository_abstract_methods():
     repo.find_by_name("My Portfolio")
     repo.find_with_assets(_UUID)
     repo.find_with_snapshots(_UUID)
+    repo.get_total_value(_UUID)
+    repo.find_summary(_UUID)
+    repo.find_all_summaries()
     repo.save_snapshot(None)
     repo.count_assets(_UUID)
 
@@ -216,7 +284,10 @@ def test_portfolio_snapshot_repository_abstract_methods():
     repo.delete(_ID)
     repo.exists(_ID)
     repo.get_snapshots(_UUID)
+    repo.get_snapshots_page(_UUID, 10)
+    repo.get_series(_UUID, SeriesBucket.DAY)
     repo.get_latest_snapshot(_UUID)
+    repo.iter_snapshots(_UUID)
 
 
 def test_tag_repository_abstract_methods():
@@ -227,6 +298,7 @@ def test_tag_repository_abstract_methods():
     repo.delete(_ID)
     repo.exists(_ID)
     repo.find_by_name("green")
+    repo.find_page(10)
     repo.find_by_asset(_UUID)
     repo.attach_to_asset(_UUID, _UUID)
     repo.detach_from_asset(_UUID, _UUID)
@@ -241,3 +313,44 @@ def test_transaction_repository_abstract_methods():
     repo.exists(_ID)
     repo.find_by_asset(_UUID)
     repo.find_between_dates(_NOW, _NOW)
+    repo.save_many([])
+    repo.iter_by_asset(_UUID)
+
+
+def test_unit_of_work_abstract_methods():
+    uow = ConcreteUnitOfWork()
+    with uow as entered:
+        assert entered is uow
+    try:
+        with uow:
+            raise RuntimeError
+    except RuntimeError:
+        pass
+    assert uow.calls == ["commit", "rollback"]
+
+
+def test_async_repository_abstract_methods():
+    async def run():
+        assert await ConcreteAsyncAssetRepo().find_by_id(_ID) is None
+        snapshots = ConcreteAsyncAssetSnapshotRepo()
+        assert await snapshots.add(None) is None
+        assert await snapshots.get_snapshots_page(_UUID, 10) is None
+        assert await ConcreteAsyncPortfolioRepo().find_all_summaries() is None
+
+    asyncio.run(run())
+
+
+def test_async_unit_of_work_abstract_methods():
+    uow = ConcreteAsyncUnitOfWork()
+
+    async def run():
+        async with uow as entered:
+            assert entered is uow
+        try:
+            async with uow:
+                raise RuntimeError
+        except RuntimeError:
+            pass
+
+    asyncio.run(run())
+    assert uow.calls == ["commit", "rollback"]
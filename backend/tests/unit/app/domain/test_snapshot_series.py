@@ -0,0 +1,78 @@
+"""Unit tests for the SnapshotSeries value object."""
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from app.domain.entities.asset_snapshot import AssetSnapshot
+from app.domain.entities.snapshot_series import SnapshotSeries, to_micros, to_utc
+
+ASSET_ID = uuid4()
+
+
+def _day(d):
+    return datetime(2024, 1, d, tzinfo=timezone.utc)
+
+
+def test_rows_round_trip_to_entities():
+    id1, id2 = uuid4(), uuid4()
+    series = SnapshotSeries.from_rows(ASSET_ID, [
+        (str(id1), _day(1), Decimal("10.50")),
+        (id2, datetime(2024, 1, 2, 6, 30, 0, 123456), Decimal("-3.01")),
+    ])
+
+    assert len(series) == 2
+    assert list(series) == [
+        AssetSnapshot(id=id1, asset_id=ASSET_ID, value=Decimal("10.50"), observed_at=_day(1)),
+        AssetSnapshot(
+            id=id2, asset_id=ASSET_ID, value=Decimal("-3.01"),
+            observed_at=datetime(2024, 1, 2, 6, 30, 0, 123456, tzinfo=timezone.utc),
+        ),
+    ]
+    assert series[-1].id == id2
+    assert series[0].observed_at.tzinfo is timezone.utc
+
+
+def test_columns_hold_epoch_micros_and_cents():
+    series = SnapshotSeries.from_rows(ASSET_ID, [(uuid4(), datetime(1970, 1, 1, 0, 0, 1), Decimal("1.23"))])
+    assert list(series.micros) == [1_000_000]
+    assert list(series.cents) == [123]
+
+
+def test_at_returns_last_snapshot_at_or_before_moment():
+    series = SnapshotSeries.from_rows(ASSET_ID, [
+        (uuid4(), _day(1), Decimal("1.00")),
+        (uuid4(), _day(3), Decimal("3.00")),
+    ])
+    assert series.at(_day(1)).value == Decimal("1.00")
+    assert series.at(_day(2)).value == Decimal("1.00")
+    assert series.at(_day(3) + timedelta(hours=1)).value == Decimal("3.00")
+    assert series.at(datetime(2023, 12, 31)) is None
+    assert series.latest.observed_at == _day(3)
+
+
+def test_empty_series():
+    series = SnapshotSeries(ASSET_ID)
+    assert len(series) == 0
+    assert list(series) == []
+    assert series.latest is None
+    assert series.at(_day(1)) is None
+    with pytest.raises(IndexError):
+        series[0]
+
+
+def test_series_has_no_instance_dict():
+    with pytest.raises(AttributeError):
+        SnapshotSeries(ASSET_ID).extra = 1
+
+
+def test_naive_datetimes_are_read_as_utc():
+    assert to_utc(datetime(2024, 1, 1)) == _day(1)
+    assert to_micros(datetime(1970, 1, 1, 0, 0, 1)) == 1_000_000
+    assert to_micros(datetime(1970, 1, 1, 1, tzinfo=timezone(timedelta(hours=1)))) == 0
+
+
+def test_aware_datetimes_are_converted_to_utc():
+    moment = to_utc(datetime(2024, 1, 1, 5, tzinfo=timezone(timedelta(hours=5))))
+    assert (moment, moment.utcoffset()) == (_day(1), timedelta(0))
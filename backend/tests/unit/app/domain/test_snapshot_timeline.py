@@ -0,0 +1,53 @@
+"""Unit tests for the SnapshotTimeline value object."""
+from datetime import datetime, timezone
+from decimal import Decimal
+from uuid import UUID, uuid4
+
+from app.domain.entities.asset_snapshot import AssetSnapshot
+from app.domain.entities.snapshot_timeline import SnapshotTimeline
+
+ASSET_ID = uuid4()
+
+
+def _snapshot(value, observed_at, id_=None):
+    return AssetSnapshot(id=id_ or uuid4(), asset_id=ASSET_ID, value=Decimal(value), observed_at=observed_at)
+
+
+def _day(d):
+    return datetime(2024, 1, d, tzinfo=timezone.utc)
+
+
+def test_sorted_oldest_first_whatever_the_input_order():
+    s1, s2, s3 = _snapshot("1", _day(1)), _snapshot("2", _day(2)), _snapshot("3", _day(3))
+    timeline = SnapshotTimeline([s3, s1, s2])
+    assert list(timeline) == [s1, s2, s3]
+    assert timeline.latest is s3
+
+
+def test_at_returns_last_snapshot_at_or_before_moment():
+    s1, s3 = _snapshot("1", _day(1)), _snapshot("3", _day(3))
+    timeline = SnapshotTimeline([s3, s1])
+    assert timeline.at(_day(1)) is s1
+    assert timeline.at(_day(2)) is s1
+    assert timeline.at(_day(3)) is s3
+    assert timeline.at(datetime(2023, 12, 31, tzinfo=timezone.utc)) is None
+
+
+def test_naive_datetimes_are_read_as_utc():
+    naive, aware = _snapshot("1", datetime(2024, 1, 2)), _snapshot("2", _day(1))
+    timeline = SnapshotTimeline([naive, aware])
+    assert list(timeline) == [aware, naive]
+    assert timeline.at(datetime(2024, 1, 1, 12)) is aware
+
+
+def test_same_moment_ordered_by_id():
+    low = _snapshot("1", _day(1), UUID(int=1))
+    high = _snapshot("2", _day(1), UUID(int=2))
+    assert SnapshotTimeline([high, low]).at(_day(1)) is high
+
+
+def test_empty_timeline():
+    timeline = SnapshotTimeline()
+    assert len(timeline) == 0
+    assert timeline.latest is None
+    assert timeline.at(_day(1)) is None